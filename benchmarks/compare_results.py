@@ -0,0 +1,47 @@
+"""
+Compare two benchmark result files written by run_benchmarks.py.
+
+Prints the p50/p95 latency and peak RSS of every operation measured in both runs
+with the relative change, so a regression between two commits stands out.
+
+Usage:
+    python benchmarks/compare_results.py results/before.json results/after.json
+"""
+
+
+import argparse
+import json
+
+
+def change(before, after):
+    if not before or after is None:
+        return ""
+    return f"{(after - before) / before * 100:+.1f}%"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("before")
+    parser.add_argument("after")
+    args = parser.parse_args()
+
+    with open(args.before) as file:
+        before = json.load(file)
+    with open(args.after) as file:
+        after = json.load(file)
+
+    print(f"before: {(before.get('commit') or 'unknown')[:8]}  after: {(after.get('commit') or 'unknown')[:8]}")
+    print(f"{'rows':>9} {'operation':<20} {'p50 ms':>21} {'':>8} {'p95 ms':>21} {'':>8} {'peak RSS MB':>17}")
+    for size, operations in after["sizes"].items():
+        for name, result in operations.items():
+            baseline = before["sizes"].get(size, {}).get(name)
+            if not baseline:
+                continue
+            print(f"{int(size):>9,} {name:<20}"
+                  f" {baseline['p50_ms']:>10.2f}{result['p50_ms']:>11.2f} {change(baseline['p50_ms'], result['p50_ms']):>8}"
+                  f" {baseline['p95_ms']:>10.2f}{result['p95_ms']:>11.2f} {change(baseline['p95_ms'], result['p95_ms']):>8}"
+                  f" {baseline['peak_rss_mb'] or 0:>8.1f}{result['peak_rss_mb'] or 0:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,305 @@
+"""
+Benchmark suite for the Asset Management Portal's hot paths.
+
+Seeds a scratch PostgreSQL database with synthetic assets (see synthetic_data) at
+each requested size and times the queries behind the portal's screens through
+AssetRepository: the first Manage Assets page, scrolling in id and in name order,
+the substring filters, the in-process search index, the dashboard counters, report
+export, adding an asset and a bulk CSV import. Every operation runs in its own process so its peak RSS
+is its own.
+
+Results are written as JSON to benchmarks/results/ so runs on different commits
+can be compared with compare_results.py.
+
+Usage:
+    python benchmarks/run_benchmarks.py --sizes 10000 100000 1000000
+"""
+
+
+import argparse
+import csv
+import json
+import math
+import multiprocessing
+import os
+import platform
+import queue
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+
+import psycopg2
+
+from asset_fields import REPORT_HEADER
+from asset_import import IMPORT_COLUMNS
+from asset_repository import DEFAULT_PAGE_SIZE, AssetRepository, sort_key
+from db_pool import load_db_config
+from migrations import SEARCH_COLUMNS, migrate, trigram_indexes_ready
+from ngram_index import NgramIndex
+from synthetic_data import generate_assets, seed_assets
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+DEFAULT_SIZES = (10000, 100000, 1000000)
+DEFAULT_REPEAT = 20
+# Report export reads the whole table; fewer rounds keep a 1M-row run reasonable.
+EXPORT_REPEAT = 5
+SCROLL_PAGES = 10
+# Rows per import round; every IMPORT_UPDATE_EVERY-th one updates a seeded asset, the rest are new.
+IMPORT_ROWS = 10000
+IMPORT_UPDATE_EVERY = 5
+BENCH_DATABASE = "asset_management_bench"
+RESULTS_DIR = os.path.join(ROOT, "benchmarks", "results")
+
+NEW_ASSET = {
+    "employee_name": "Benchmark User", "employee_id": "BENCH-0000001", "email_id": "benchmark.user@example.com",
+    "location": "Pune", "hostname": "LT-BENCH", "processor": "Intel Core i7-1255U", "ram": "16 GB",
+    "hd_size": "512 GB SSD", "mouse": "Yes", "adaptor": "Yes", "headset": "No", "monitor": "Dell P2422H",
+    "it_others": "None", "software_licenses": "Office 365", "asset_entry_date": "2024-07-31",
+}
+
+
+def load_assets(repository, state):
+    return len(repository.search(limit=DEFAULT_PAGE_SIZE))
+
+
+def scroll_assets(repository, state, sort_by=None):
+    rows, after = 0, None
+    for _ in range(SCROLL_PAGES):
+        page = repository.search(after=after, limit=DEFAULT_PAGE_SIZE, sort_by=sort_by)
+        if not page:
+            break
+        rows += len(page)
+        after = sort_key(page[-1], sort_by)
+    return rows
+
+
+def scroll_sorted_assets(repository, state):
+    return scroll_assets(repository, state, sort_by="employee_name")
+
+
+def search_by_name(repository, state):
+    return len(repository.search({"employee_name": "shar"}, limit=DEFAULT_PAGE_SIZE))
+
+
+def search_by_location(repository, state):
+    # "Kochi" sits in the long tail of the location distribution.
+    return len(repository.search({"location": "Kochi"}, limit=DEFAULT_PAGE_SIZE))
+
+
+def load_search_index(repository, state):
+    index = NgramIndex(SEARCH_COLUMNS)
+    index.ensure_loaded(repository)
+    return len(index.values)
+
+
+def search_index(repository, state):
+    if "index" not in state:
+        state["index"] = NgramIndex(SEARCH_COLUMNS)
+        state["index"].ensure_loaded(repository)
+    matches = state["index"].search({"employee_name": "shar", "location": "Kochi"})
+    return len(repository.search_ids(matches, limit=DEFAULT_PAGE_SIZE))
+
+
+def dashboard_metrics(repository, state):
+    repository.metrics()
+    return 1
+
+
+def download_report(repository, state):
+    with open(os.devnull, "w", newline="") as file:
+        return repository.export_report("All Assets", file)
+
+
+def add_asset(repository, state):
+    # Rolled back so every round inserts into the same table.
+    repository.create_asset(NEW_ASSET, "benchmark@example.com")
+    repository.conn.rollback()
+    return 1
+
+
+def import_assets(repository, state):
+    # Rolled back like add_asset; the file is written once, outside the timed rounds.
+    if "import_file" not in state:
+        state["import_file"] = write_import_file(state)
+    result = repository.bulk_create(state["import_file"], "benchmark@example.com")
+    repository.conn.rollback()
+    return result.inserted + result.updated
+
+
+def write_import_file(state):
+    directory = state["import_dir"] = tempfile.TemporaryDirectory()
+    path = os.path.join(directory.name, "assets.csv")
+    with open(path, "w", newline="") as file:
+        writer = csv.writer(file)
+        writer.writerow(REPORT_HEADER[1:])
+        for number, record in enumerate(generate_assets(IMPORT_ROWS, seed=1)):
+            if number % IMPORT_UPDATE_EVERY:
+                record["employee_id"] = f"IMP{number:07d}"
+            writer.writerow([record[column] or "" for column in IMPORT_COLUMNS])
+    return path
+
+
+OPERATIONS = {
+    "load_assets": load_assets,
+    "scroll_assets": scroll_assets,
+    "scroll_sorted_assets": scroll_sorted_assets,
+    "search_by_name": search_by_name,
+    "search_by_location": search_by_location,
+    "load_search_index": load_search_index,
+    "search_index": search_index,
+    "dashboard_metrics": dashboard_metrics,
+    "download_report": download_report,
+    "add_asset": add_asset,
+    "import_assets": import_assets,
+}
+
+
+def percentile(values, fraction):
+    # Nearest-rank percentile; with few rounds p95 is simply the slowest one.
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(fraction * len(ordered)) - 1)]
+
+
+def peak_rss_mb():
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in kilobytes on Linux and in bytes on macOS.
+    return peak / (1024 * 1024 if sys.platform == "darwin" else 1024)
+
+
+def measure(config, name, repeat, results):
+    """Child process: time `repeat` rounds of one operation after a warm-up round."""
+    operation = OPERATIONS[name]
+    conn = psycopg2.connect(**config)
+    try:
+        repository = AssetRepository(conn)
+        state = {}
+        operation(repository, state)
+        conn.rollback()
+        baseline = peak_rss_mb()
+
+        timings, rows = [], 0
+        for _ in range(repeat):
+            started = time.perf_counter()
+            rows += operation(repository, state)
+            timings.append(time.perf_counter() - started)
+            conn.rollback()
+    finally:
+        conn.close()
+
+    peak = peak_rss_mb()
+    total = sum(timings)
+    results.put({
+        "rounds": repeat,
+        "p50_ms": percentile(timings, 0.5) * 1000,
+        "p95_ms": percentile(timings, 0.95) * 1000,
+        "mean_ms": total / repeat * 1000,
+        "rows_per_round": rows / repeat,
+        "rows_per_second": rows / total if total else None,
+        "peak_rss_mb": peak,
+        "rss_growth_mb": peak - baseline if peak is not None else None,
+    })
+
+
+def run_operation(config, name, repeat):
+    context = multiprocessing.get_context("spawn")
+    results = context.Queue()
+    process = context.Process(target=measure, args=(config, name, repeat, results))
+    process.start()
+    try:
+        while True:
+            try:
+                return results.get(timeout=1)
+            except queue.Empty:
+                if not process.is_alive():
+                    raise RuntimeError(f"Benchmark {name} exited with code {process.exitcode}")
+    finally:
+        process.join()
+
+
+def git_revision():
+    try:
+        revision = subprocess.run(["git", "rev-parse", "HEAD"], cwd=ROOT, capture_output=True, text=True,
+                                  check=True).stdout.strip()
+        dirty = bool(subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"], cwd=ROOT,
+                                    capture_output=True, text=True, check=True).stdout.strip())
+        return revision, dirty
+    except (OSError, subprocess.CalledProcessError):
+        return None, None
+
+
+def bench_config(dbname):
+    config = load_db_config()
+    if dbname == config["dbname"] and not os.environ.get("ASSET_BENCH_ALLOW_APP_DATABASE"):
+        sys.exit(f"Refusing to benchmark against the portal's own database {dbname!r}: seeding truncates assets.")
+    config["dbname"] = dbname
+    return {key: value for key, value in config.items()
+            if key not in ("min_connections", "max_connections") and value != ""}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="asset counts to seed and measure")
+    parser.add_argument("--operations", nargs="+", choices=OPERATIONS, default=list(OPERATIONS))
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="timed rounds per operation")
+    parser.add_argument("--dbname", default=os.environ.get("ASSET_BENCH_DB", BENCH_DATABASE),
+                        help="scratch database to seed (its assets table is truncated)")
+    parser.add_argument("--skip-seed", action="store_true", help="measure the data already in the database")
+    parser.add_argument("--output", help="result file (default: benchmarks/results/<time>-<commit>.json)")
+    args = parser.parse_args()
+
+    config = bench_config(args.dbname)
+    conn = psycopg2.connect(**config)
+    migrate(conn, log=print)
+    revision, dirty = git_revision()
+    report = {
+        "commit": revision,
+        "dirty": dirty,
+        "started_at": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "server_version": conn.server_version,
+        "trigram_indexes": trigram_indexes_ready(conn),
+        "repeat": args.repeat,
+        "sizes": {},
+    }
+
+    for size in args.sizes:
+        if not args.skip_seed:
+            print(f"Seeding {size:,} assets...")
+            started = time.perf_counter()
+            seed_assets(conn, size, progress=lambda rows: print(f"  {rows:,} rows", end="\r"))
+            print(f"  seeded in {time.perf_counter() - started:.1f}s")
+
+        results = report["sizes"][str(size)] = {}
+        for name in args.operations:
+            repeat = (min(args.repeat, EXPORT_REPEAT) if name in ("download_report", "load_search_index", "import_assets")
+                      else args.repeat)
+            result = results[name] = run_operation(config, name, repeat)
+            print(f"{size:>9,} {name:<20} p50 {result['p50_ms']:9.2f} ms  p95 {result['p95_ms']:9.2f} ms"
+                  f"  {result['rows_per_second'] or 0:12,.0f} rows/s  peak RSS {result['peak_rss_mb'] or 0:7.1f} MB")
+    conn.close()
+
+    output = args.output
+    if not output:
+        os.makedirs(RESULTS_DIR, exist_ok=True)
+        stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+        output = os.path.join(RESULTS_DIR, f"{stamp}-{(revision or 'unknown')[:8]}.json")
+    with open(output, "w") as file:
+        json.dump(report, file, indent=2)
+    print(f"Results written to {output}")
+
+
+if __name__ == "__main__":
+    main()
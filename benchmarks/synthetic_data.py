@@ -0,0 +1,133 @@
+"""
+Synthetic asset data for the benchmark suite.
+
+Rows look like what the portal holds in practice: a few offices own most of the
+assets, hardware comes from a short catalogue so processor/RAM/disk values repeat
+a lot, and a share of the assets has been removed. Generation is seeded, so the
+same size always produces the same table.
+"""
+
+
+import csv
+import io
+import random
+from datetime import date, timedelta
+
+from asset_fields import stored_column, stored_value
+from asset_import import DATE_FIELDS, IMPORT_COLUMNS, STAGING_TABLE_SQL
+from migrations import backfill_asset_events
+from monthly_rollup import rebuild_rollup
+
+
+SEED_BATCH_SIZE = 50000
+REMOVED_SHARE = 0.15
+UPDATED_SHARE = 0.3
+HISTORY_DAYS = 3 * 365
+
+# Location weights follow a Zipf-like curve: the first office holds a third of the assets.
+LOCATIONS = ("Bengaluru", "Hyderabad", "Chennai", "Pune", "Mumbai", "Delhi", "Kolkata", "Noida", "Gurugram",
+             "Ahmedabad", "Kochi", "Coimbatore", "Jaipur", "Indore", "Remote")
+LOCATION_WEIGHTS = tuple(1 / rank for rank in range(1, len(LOCATIONS) + 1))
+
+PROCESSORS = ("Intel Core i5-8250U", "Intel Core i5-1135G7", "Intel Core i7-1165G7", "Intel Core i7-1255U",
+              "AMD Ryzen 5 5500U", "AMD Ryzen 7 5800U", "Apple M1", "Apple M2")
+PROCESSOR_WEIGHTS = (8, 20, 25, 15, 10, 8, 9, 5)
+RAM_SIZES = ("8 GB", "16 GB", "32 GB")
+RAM_WEIGHTS = (30, 60, 10)
+DISK_SIZES = ("256 GB SSD", "512 GB SSD", "1 TB SSD", "1 TB HDD")
+DISK_WEIGHTS = (25, 55, 15, 5)
+MONITORS = ("None", "Dell P2419H", "Dell P2422H", "LG 24MK600", "Samsung S24R350")
+ACCESSORIES = ("Yes", "No")
+SOFTWARE = ("Office 365", "Office 365, Visual Studio", "Office 365, Adobe CC", "Office 365, JetBrains", "None")
+
+FIRST_NAMES = ("Aarav", "Aditi", "Akash", "Ananya", "Arjun", "Divya", "Farhan", "Gaurav", "Ishaan", "Kavya",
+               "Meera", "Nikhil", "Priya", "Rahul", "Riya", "Rohan", "Sanjay", "Sneha", "Tanvi", "Vikram")
+LAST_NAMES = ("Agarwal", "Bhat", "Das", "Gupta", "Iyer", "Joshi", "Kapoor", "Khan", "Kumar", "Menon", "Nair",
+              "Patel", "Rao", "Reddy", "Shah", "Sharma", "Singh", "Verma")
+
+ENTERED_BY = ("it.admin@example.com", "helpdesk@example.com", "asset.desk@example.com")
+
+
+def generate_assets(count, seed=0, today=None):
+    """Yield count asset records as {column: value} dicts in IMPORT_COLUMNS order."""
+    rng = random.Random(seed)
+    today = today or date.today()
+
+    for number in range(1, count + 1):
+        first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+        entry_date = today - timedelta(days=rng.randrange(HISTORY_DAYS))
+        update_date = remove_date = None
+        if rng.random() < UPDATED_SHARE:
+            update_date = entry_date + timedelta(days=rng.randrange((today - entry_date).days + 1))
+        if rng.random() < REMOVED_SHARE:
+            remove_date = entry_date + timedelta(days=rng.randrange((today - entry_date).days + 1))
+
+        yield {
+            "employee_name": f"{first} {last}",
+            "employee_id": f"EMP{number:07d}",
+            "email_id": f"{first}.{last}.{number}@example.com".lower(),
+            "location": rng.choices(LOCATIONS, LOCATION_WEIGHTS)[0],
+            "hostname": f"LT-{number:07d}",
+            "processor": rng.choices(PROCESSORS, PROCESSOR_WEIGHTS)[0],
+            "ram": rng.choices(RAM_SIZES, RAM_WEIGHTS)[0],
+            "hd_size": rng.choices(DISK_SIZES, DISK_WEIGHTS)[0],
+            "mouse": rng.choice(ACCESSORIES),
+            "adaptor": rng.choice(ACCESSORIES),
+            "headset": rng.choice(ACCESSORIES),
+            "monitor": rng.choice(MONITORS),
+            "it_others": rng.choice(("None", "Docking station", "Keyboard")),
+            "software_licenses": rng.choice(SOFTWARE),
+            "asset_entry_date": entry_date.isoformat(),
+            "entered_by": rng.choice(ENTERED_BY),
+            "updated_by": rng.choice(ENTERED_BY) if update_date else None,
+            "update_date": update_date.isoformat() if update_date else None,
+            "remove_date": remove_date.isoformat() if remove_date else None,
+        }
+
+
+def seed_assets(conn, count, seed=0, progress=None):
+    """
+    Replace the contents of assets with count synthetic rows, loaded with COPY, and analyze
+    the table. The schema must be migrated first. The rows are loaded with the change
+    triggers off and then given an event history dated like the rows themselves, so the
+    monthly counters look like a table that grew over HISTORY_DAYS.
+    """
+    with conn.cursor() as cursor:
+        cursor.execute("TRUNCATE assets, assets_archive, asset_deletions, asset_events, asset_monthly_rollup RESTART IDENTITY")
+        cursor.execute("ALTER TABLE assets DISABLE TRIGGER USER")
+        cursor.execute(STAGING_TABLE_SQL)
+
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        written = 0
+        for record in generate_assets(count, seed):
+            writer.writerow([record[column] for column in IMPORT_COLUMNS])
+            written += 1
+            if written % SEED_BATCH_SIZE == 0 or written == count:
+                buffer.seek(0)
+                cursor.copy_expert(f"COPY asset_import_staging ({', '.join(IMPORT_COLUMNS)}) FROM STDIN WITH CSV",
+                                   buffer)
+                # Hardware attributes go through their lookup tables.
+                cursor.execute(f"""
+                    INSERT INTO assets ({', '.join(stored_column(column) for column in IMPORT_COLUMNS)})
+                    SELECT {', '.join(stored_value(column, f"{column}::date" if column in DATE_FIELDS else column)
+                                      for column in IMPORT_COLUMNS)}
+                    FROM asset_import_staging
+                """)
+                cursor.execute("TRUNCATE asset_import_staging")
+                buffer.seek(0)
+                buffer.truncate()
+                if progress:
+                    progress(written)
+        cursor.execute("ALTER TABLE assets ENABLE TRIGGER USER")
+    conn.commit()
+    backfill_asset_events(conn)
+    rebuild_rollup(conn)
+
+    # Fresh statistics, or the planner judges the new table by its old size.
+    conn.autocommit = True
+    try:
+        with conn.cursor() as cursor:
+            cursor.execute("VACUUM ANALYZE assets, asset_events, asset_monthly_rollup")
+    finally:
+        conn.autocommit = False
@@ -0,0 +1,238 @@
+"""
+Window icon of the Asset Management Portal: database.png, base64-encoded so it also
+works from a frozen (PyInstaller) build. Imported only when the icon is applied,
+after the login screen is up, so decoding it stays off the startup path.
+"""
+
+
+ICON_PNG = (
+    b'iVBORw0KGgoAAAANSUhEUgAAAgAAAAIACAYAAAD0eNT6AAAACXBIWXMAAA7DAAAOwwHHb6hkAAAAGXRFWHRTb2Z0d2FyZQB3d3cuaW5rc2NhcGUu'
+    b'b3Jnm+48GgAAIABJREFUeJzs3Xl8XHW9//HX58wkbbqXbmlpi10pLbco5SqbC4p3xe1Cy47KUjYRxH0lV7lyFQWvCAIiYIECrYJed38gXgFRoAhi'
+    b'WZpS6JqkbaB7mmXO5/fHJGmWmWyznJnM+/l4DMn5nnO+55NJ6Pc9ZwURERERERERERERERERERERERERERERERERERERERERERERERERERERERER'
+    b'ERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERkbyyqAuQIlXlcfZvGEmsbBRhYwXx'
+    b'YHj7vNCGY15+YOEgThCO7LS+20jwePu0WRkwlMB3d96Q7cI80WG6Cfe9XZbZQeCe/D7RQhjbTXn5bppiDVRN3JPJjykiMlgpAJSaT9UOx8PxlDWP'
+    b'JxFMwBiHcxAxhuGMASpwKggYC1QAw8BGYz68dXoUMAKj7ECn3v0vqb/TKdu8H8v22LYTaMDYh7Oj9fsG8Ddwb8CCfVi4E2wvRgPO67jXQ1BPEG6H'
+    b'lnqaZtdTZWGKLYiIFCUFgKLmxhXrKwnKKrHERMzG4YwDxgPjMBsHTEx+z3jwccBQIPMBu9N0wQeANG3e83Kd2x2nnoB6YDt4PWb1ONuBbQS+HWL1'
+    b'JLweC+pobNlE1Yz9aXoVEYmcAkAhu3j9WMrKZhLzKeCTMZ+C22RgJuZTwA4Bkrve+zTg9jDgKQCkNuDtOBhv4NSAbcGoAd+CsQ7zGiy2hZaWtXxu'
+    b'1s40WxYRySkFgKhUeZydm95Ec3wOQTgbsxmYH4xzMDAd88lAh2PkXdYf0LQCQOe2nAeAvqz7OrAZ8w24bcZ8E1g1YbgWp1oBQURyRQEg1z62YQoW'
+    b'm4/ZTNxnHvjKfJLH1JO6DZDeZbrr/IFMKwB0biuIANBbn28A68DWYb4O/AU8XE25V/PxObvS9CYi0isFgGy4rH4UicaFBOHheDAbfA7GXGAmkDwb'
+    b'vt8DpAKAAkC6tva6a4BqjGrwtVjwEi32HJ865DWs6x+QiEhnCgD99bENUwhji3Dmgy0g8EU48zCCTstlPMAqACgApGvr5W8DdmO2Jrm3wFYRC1cR'
+    b'3/8sly7QJZEi0k4BIJ3Fq8uZeNAcWliE+aLWXfZvAcYB3QeRrA6oKAC09dvnZQfSNmgDQLq2GmAV7qswW02YeIFPzH5BewtESpMCAMBij3HQ5sPx'
+    b'2LHgx2AcjTELOnyqTzuAKQAoAKRqK8gAkMoOjKdx/xMWPEHIn/nEjB1pqhSRQaQ0A8C520YSbz4C8+OA43E7DmNsp2X6PIApACgApGormgDQ/XeJ'
+    b'rcPCxzFbReiP8casv+omSCKDT2kEgHPrZhKEx4MvwjgOeAtZO2avAKAAkKqtmANAt2V3AU9iPI7bKhL2qPYSiBS/wRkAzt18KEHwbpz3YLwLGJeb'
+    b'ARUUAFr7VQDoYlAFgK5tLeBPY/we52FGxP7ER3XXQ5FiMzgCwNm1EykP/xmzE3HeDUzNz4AKCgCt/SoAdDGoA0DXtv3A42C/Jwh/y8WzntGJhSKF'
+    b'rzgDQJUHbKp5C24n4va+1hP3etmlrwCgANC1TQGge3tW3vPtwCPgv8DKfs4lh7yRZssiEqHiCQAfeXUoQcU/4X4y8K8YEzrNj2RABQWA1n4VALoo'
+    b'6QDQUQvwBMZPCe0nfGzm+jRViEieFXYAWLyxguFlJ4IvxvgAyUfRJhXEgAoKAK39KgB0oQCQus1fwH0lFruXS2a+nKYiEcmDwgsAS7cMoyl4D/hi'
+    b'4IPASKBAB1RQAGjtVwGgCwWA1G2dan8B85UYK7hozgtpqhORHCmMAPCRV4dCxX/gnAa8F3xocQyooADQ2q8CQBcKAKnb0tRurMb9x7gv45K569JU'
+    b'KiJZFG0AOLNmPrHgHPDzMMYfmJGFAUUBIMW0AkDnNgWA7u0RBYCOBRh/wlhGxd57OOeIvSl6E5EsyH8AWPz6aIY2n4r5OcBxqStRAFAAaO23z8sO'
+    b'pE0BoHt75AGgY9tO4H7M7uLCWY+lWFJEMpCnAODG2XUnAOcCJwO97OJXAFAAaO23z8sOpE0BoHt7QQWAjo3Pgt9OWHa3LisUyY7cBoDLqofwxqhT'
+    b'wT+NcXiPW1YA6DKtAKAAkK6tFANAe3sjsALzb7B0zuo0S4pIH+QmAJxeN4mYfxy4kG6Pz02zZQWALtMKAAoA6dpKOgAc6Mj4Nca3uWD279OsISI9'
+    b'yG4AOL1uEjE+gftlGMN63JICQC/TCgAKAOnaFAC6eIKYX8N5s3+hWxCL9F12AsBZ2ybj4ZcwPw9nSMqeFQD6Oa0AoACQrk0BIM28VZh9hQtm/aqH'
+    b'JUWkVWYBYPHWEZQlLgX7ItZ6w550PSsA9HNaAUABIF2bAkCP84wnIPgsF8x8tIc1RErewAJAlQe8vPUCzK+G1uv3C21AUQBIMa0A0LlNAaB7+yAI'
+    b'AG0bclYQJj7JxYdu7mFNkZLV/wBw2ta3YH4jxjEFPaAoAKSYLuDfV8o2BYDUbQoA/Zi3D/drGdv0dZYsaOqhB5GS0/cA8JFXh9I47GrgCiBW8AOK'
+    b'AkCK6QL+faVsUwBI3aYA0K95yfl/IwjO4byZz/WypEjJ6FsAOL1uIbAMOKLzmgU8oCgApJgu4N9XyjYFgNRtCgD9mndgfjPm15HY+WUuPKq5lzVE'
+    b'Br2g1yVOq1uK8xQdB38RkeJThvNZgtEP8YN1k6IuRiRq6XPzR14dyv5hNwMfTrlkoX+i1B6AFNMF/PtK2aY9AKnbtAegX/NSb38DQXAy5816upc1'
+    b'RQat1HsAFm8dQeOwn9M2+IuIDC7TCcP/47a1/xJ1ISJR6R4ATt8ynpj/AefECOoREcmXYbj/jB9UnxJ1ISJR6BwAFm+sIIz9DGdRRPWIiORTOcZy'
+    b'flj9T1EXIpJvHQKAG0H53cCxkVUjIpJ/ZTgrueOVf4i6EJF8OhAATtt2GfAf0ZUiIhKZUSTC+1mxsSLqQkTyJRkATt46B/drIq5FRCRKh7GrsSrq'
+    b'IkTyJRkA4l4FXR7fKyJScvxyflA9NeoqRPIh4NS6WTinRl2IiEgBGAJ8MuoiRPIhILTFQCzqQkRECoLZqbj3dmshkaIXYKFuhCEi0s4nc/uahVFX'
+    b'IZJrAdjsqIsQESkoYTAn6hJEci0AJkZdhIhIQTGrjLoEkVwLgJaoixARKShGY9QliORaAPb3qIsQESkoIc9EXYJIrgUYf4q6CBGRArKL0Y3PR12E'
+    b'SK4FYMuiLkJEpGC4LWfJgqaoyxDJtYD7JzwDPBZ1ISIiBSBB3G6KugiRfEjeCtiCy4Ew2lJERKJmt/HRWdr9LyUhGQDun/AMuFKviJSyLZQ1fzHq'
+    b'IkTy5cDjgEdPuhJ0QqCIlKQWPDyNDx9WH3UhIvlyIADcas1Yy2nA+ujKERHJO8ftUi449NGoCxHJp6DT1H0HbyS0E4Et0ZQjIpJv/jkumH1r1FWI'
+    b'5FvQrWXlxLWEwbuBdfkvR0QkbxK4fZzz534z6kJEotA9AACsnPAy5c1vBR7PbzkiInmxH+cMls6+IepCRKKSOgAALJtaT6Lpvbjdlsd6RERybS0h'
+    b'x7F0zoqoCxGJkvVpqdNqz8DsZmBk5zU9fU8ZTXuW+wPMe5k/0GnPcn9t07mot4B/Xynb0ry3WWvr4f3IeDsp3pOsbaeXv43+tHVrz+N73p/1e2rv'
+    b'bV7n+fdS4Rdx1pxdvawhMuj1LQAAnFbzJiy4FXjvgTULeEBRAEgxXcC/r5RtCgCp2xQA+jUvOX87Zpdz/qzlvSwpUjL6HgAAcOOMunNxuxZjbEEP'
+    b'KAoAKaYL+PeVsk0BIHWbAkC/5sF9xP3jnDtnW49LiZSYfgaAVos3HkRZ2VXApUAsZU9RDygKACmmFQA6tykAdG8fTAHAXwK7kqWzf93DmiIla2AB'
+    b'oM1ZdUcQ+reB9xTcgKIAkGJaAaBzmwJA9/ZBEQC24lbF2Jm3ssQSPawlUtIyCwBtTt96PLHwapx3pu1ZAaCf0woACgDp2hQA0szbDX4T+/k6H9dJ'
+    b'fiK9yU4AaHNm7UlgnwF/e+QDigJAimkFgM5tCgDd24syALyB+Q2Uxa/nozN2pF1KRDrJbgBoc9aWI3G7ArPTgXjKLSkA9DKtAKAAkK5NAaBVHfjN'
+    b'lMe/o4FfpP9yEwDanLHlEAL7ONj5GKN63LICQJdpBQAFgHRtJR8AVgE3MLbxXpYsaEqztIj0IrcBoM3i10cztPl88MuAQ1JuWQGgy7QCgAJAuraS'
+    b'DADNGD/BuIGls/XYcpEsyE8AaFPlAeu2HYuHZ2OcCQxPXYkCgAJAa799XnYgbQoA3dsLLgC8ALaMmN3JBTPrUiwtIgNkLKmrYuvEq/mDteR1y0tf'
+    b'H01D0xKMjwDHKgB0nVYAUABI1zboA8BW8OUE/iOWzn02xRK5ddvLb8WDyVww52d537ZIHhlL6hx4ErczWTlxbSRVnLNlOtjpmF0IzFAAQAGgrd8+'
+    b'LzuQNgWA7u2RBYAm8N/hLCO286dceFRzmmpzp8oDplZfBvZN4HOcP+f6vNcgkkdtAQCMXTiXsmLS3ZFVU+UB6+vehfvJYB8AP7h9XkEOqKAA0Nqv'
+    b'AkAXCgCp2zrV3oz5H7DgAVqaVvKxw+rTVJh7t607BMK7wN/e2nKlAoAMdh0DQJL7Lwn8Y9w3+bXIqmrz4ZoFGIsxlgCHdZpXEAMqKAC09qsA0IUC'
+    b'QOo2bwB/GOznGD/l4tlb01SVH1UecPAr52N+LXS6UkkBQAa97gEgaR/GtSS2f52VBXKZzbl1Mwn9fQQsxv1YrEvFCgB9mFYA6NymANC9PSfv+RsY'
+    b'D+H+C2h8gEsX7ElTSX7duubNmN2C8dYUcxUAZNBLFwCS086zBFzCvZOeyHtlPTm/dgYJ3of5e4F3ASMUAPoyrQDQuU0BoHt71t7zv2M8RMgv2L7h'
+    b'/6g6Ib8nGffkpvVjKWuuAk8+zCz1+6IAIINezwHgwMQvCLiS5ROr81VYny32GKNr3ozbiZifiNs7gHIFgFTTCgCd2xQAurcP+D2vxXgU94cwfs2l'
+    b'szem2Vp0bnm6jGDMR8G/Bkxsb1cAkBLVxwAAGM04d2B8hXsnFe71uGfXDqfMjsHCEzFOBI4ETAEAFAC6tikAdG/v83u+B/gzxkME/hAXz3oG6/pH'
+    b'WyDcjR+uPQW3a8BndZuvACAlqj8BoM1O4H9oafofVk57PafVZcPSbZNJNJ9IwDuBo0meTBgoAGSjvzYKACUQAN7A+DNujwEPUTljVcE/atfduG3t'
+    b'+3H7CsaRrY3dl1MAkBI1kADQNr0H/HaC2H9z94SaXBWYdZdsHUFLy5sxPw44Hre3ARMUADKZVgAYZAEggfEy+Cqcx4j542yf/SJVFqbpobBUecDU'
+    b'tf9OaFcBi4DUv/M2CgBSojIJALT+z7QXuBVruY57pm7KQY25d/HmQwmDt2F+NM4xwOFY61MM2ygA9DCtAFDkAaAG87/gwRO4/5nmYav4dOXeNEsX'
+    b'rlueLsNGnwZ8AWxep3kKACLdZCMAtE03Aw8Q2v8U3FUD/XV27XBG+FG4H4nbP2C+EGM+UNG+jAJABwoARRMAnPUYz2P2PPiz4H/m8lkb0lRVHL6/'
+    b'diIxlgIXA1NSLqMAINJNNgNAx5nPEHALsX3LuHPG/mwUWhA+tmEKYWwRsAiz+cAC3OeR1XMK2qYVABQA0rX1KQDsAqsGfwG3VVi4mlj4HB+fsy1N'
+    b'BcXn+9VvIbCLgLOxDuE8FQUAkW5yFADap2vAlhEEt7NswprMSi1Q524bSUXj4TgLCWwh+ALcDsWo7LScAkDP0ynbFABSt3X622jAWIvxAqE/h9nf'
+    b'MXueT8x4Lc2WituNq0cQG7oY8/OBY9vb072v3eYrAIi0yXUA6DBtq4Bb2W/LWTmxMO4ElkuXVQ+hZdTBxFsWEDIf85mYzcR9JmZvwgg6La8AoACQ'
+    b'vq0R2Ay2DvMXcFYTC9dBfB07p79WNCfnZeKmtYtad/OfDozsNl8BQKTf8hgA2r/bBdyP+b3MrPy/kvjHq6ulW4ZRkZhNGJsNPgdjNmazwd8ETAaG'
+    b'KAC09tvnZQfSVlABYBuwCbO1uK/FbS1BuJZEfC2fnb4lzVqD2y2vTAc/FecjwPweB3kFAJF+iyIAdJyux/kJFtzFsgmPd//YW6IuXj+WoUyB+GRC'
+    b'nwI+mcBmkjzBaTIwE2Nsp3UUAAo5ALyBsQ63Gsy34NRgbMHCdSTiNVjDBj47b3eaCkrLbRsPoqXxJJyzMd5Dx3dRAUAkq6IOAB2nX8W5H/xBllU+'
+    b'pTDQi8vqR1HeNBXCgwl9CgEHY4zDGQeMw1q/0j6NAkDXtgEHgH1g9ZjX42zH2U5APXg9BNsh3ICHWwhjm2g+pK4k93L1x3erJ1DO+3FOBXs3Rizl'
+    b'cgoAIllVSAGgA9+C8b/gP2Pk3ke4YU5j18KlH6o8oLF2HE0+jsDHYYkDISG0CQSMJ3lcdRRQATYc89bvGQ6MpsdzFoouAOwBbwB2A7sx9mPsxtkN'
+    b'7E0O5FaPU0/M68G2YWE9Vl5Pmddz5bSGFL1Kf9y4djYBHwA+QPJkvgODfn/CWF/mdZqvACDSplADQMfpXRi/wf0XxGO/47YCfg7BYHZZ9RCGlw+D'
+    b'cDShVRDYMILYGGAolhiGBWPwMPlbSz6qeUyn9Y1hWDDkwLTHwEbREwsbgX1d+nmjy1L7MDoERN+DsR9sFxbuIfQGwthuaN5DRUuDdrVHpOqROBOm'
+    b'vRXj30kO+guA/p4nkZ4CgEi/xXtfJHKjcJZgtoRECB+teQHj5xA8xO7tf2TlgqaoCywJyb0wjdBtABZJ7aY1MyE4MfmkTt4LjEk5AItIJIohAHQ1'
+    b'H2c+Fn6WkQft4tyaP2D2e8we4baJz+vcAZGIfLd6KoG9B7MTgffgTI66JBFJrxgDQEejgPfj/n5wOK92O17zB4xHCPkDd1S+qEAgkiPXvzqGeOJd'
+    b'7QM+zOttFREpHMUeALoaj3EKcAox4Pza3VD7N9wfg/BxhvqfuHFqfdRFihSlm9bMpCU4niBYBH4cHr4Fs6D3FUWkEA22ANDVSPDjMI7DDJoMlm5Z'
+    b'h/M4kHzU6dTJf9VlWiJd3PLKaBr5R5zjgUUYx5LgIAxw7VQTGQwGewDozplJ8kY6Z2PAlppdLN3yJAFP4PZnypqf5Xsleuc1KU3frR6C2+EQHA3h'
+    b'28COppE5QO9n14tI0Sq9ANDdKOBEnBPBoTkOF27ZgbEaZzXwAs4q4BlunbKvl75ECtsNG6bQ0jyfIFhA6MmnWrofDrReoqkRX6RUKACkNgZIHjqA'
+    b'5L+JRoKLt6wHfwFjFR6sJuAFJlS+qEMIUnC+8dJIhsbn4sECQhZhzMc4gkTLBMySu/G73stDREqKAkDfxYCZYDNxTsI8+W/n1pqdXLL5eQJeBNYS'
+    b'2lqCRDVlrOV63TFOcsjduO6VqRCfDeFs8NmYHQr8A8YMQtpuzCQi0o0CQMZ8NHB868lSyasOPYBm4GOb3wCSj3DFVuO+jiBYR0v8ZW4qgUciS3Zc'
+    b's34sZczEEgvA5oMng+h1rx4KwQjad0BppBeRvlMAyK2xwCLcFiUPI7Tueo01O5dt3kRANe5rgQ0YG3E2EwabaWKDzjcoESs8xqsbJxEkpoFNAZ8G'
+    b'Ng18FmZzwGdDOBQAt55vaSsi0g8KANEwjGk408De3aEVYp58BM/lm/ZjbAHWATWYbYEw+dWCdcRaavjmtBrd6KiAVa0up2LkeEKfTCwxE2wKxmSw'
+    b'Kcm75PlMXls/HfPW/w/bfpVdv4qIZJ8CQKEyhkLrJYtAcjCw5BcPk4cZrtzcAJs2Atsx6pNfvfVrsA2nHrd6YtQTBvWMmLRdJyxmoGrrCOJ7xlEW'
+    b'n0CYGA82DrdxEI7DbDyBjcN9As54zCsxJkICApKf3tt5mu9FRPJHAaC4VQBzW19J7QNN26N0HULAQti7CT69sb49LLjXEwT1eLiDgAawnYTsBRoI'
+    b'bBfuezAaINyNxXYTWAOJlj28Mn0XKy2R1580E994aSQN8QooG0FZOApnKB6MAB+FUYHZcPDRmFXg4TAIxmB+UOtAnhzoYRzsGwIBhCHt++KtNZh1'
+    b'vEGODsWLSBFQACg943DGYcxtPyehbc8CdD7G3P59kJwOHSyA2ZvgCxvbHtW7A7whGRTa7cU48JRGoxms80mPFu7Agg4ff30fZo04Yw+0hWAMB8o7'
+    b'LFcGNoKON6B1xtD2EGIjhjMKGAFUYIykiQNPmw+Dtss6O6zvHQZwS/6s7ZVpNBeRwUkBQAZqSOtrbG8LJo9edN3VbXS/pWyK3eFtY3LH9dIs2mO7'
+    b'iIh0ogd5iIiIlCAFABERkRKkACAiIlKCFABERERKkAKAiIhICVIAEBERKUG6DFBE+ms/ztMYm8B2dZub6lLMdM8wyNZtFnq7/LOnZyikqsF4PrOC'
+    b'RAqfAoCI9FUtxlex/Xdx6QI9zVKkyCkAiEjvjL8QBB/k0hm1UZciItmhACAivammufzfuHLa61EXIiLZo5MARaQ3l2jwFxl8tAdARNIznuWyWQ9F'
+    b'XYaIZJ/2AIhID/yXUVcgIrmhACAi6bmti7oEEckNBQARSc9Nl/uJDFIKACIiIiVIAUBERKQEKQCIiIiUIAUAERGREqQAICIiUoIUAEREREqQ7gQo'
+    b'Irlx47pP4T4e6PBRI+y8TH8+gmTycWWg62ayzYE+6jjo7dnGPa2bg/WieN977Mv/j8WH/jqLPZcsBQARyRG/AGNu57Yuo2KqsS7dwNnTuNjbYOvd'
+    b'vunbuplssycDXTeKbaZ8Dzo05uv9a+vLDEABIAt0CEBERKQEKQCIiIiUIAUAERGREqQAICIiUoIUAEREREqQAoCIiEgJUgAQEREpQQoAIiIiJUgB'
+    b'QERESoN7JrdSGnQUAEREpDT8eM1XuPelKVGXUSgUAEREpDSYz6XMHlEISNKzACQXmoCtOE0YCWBXL8s7zg4MksvbLvAWnN2YNYPvAWvCfC+wH6cB'
+    b'aABrwRiLh0eBvQ8Yn+OfS0SKnTOXuD3MT154NyfPr4m6nCgpAEg2PYj7jWzf9kduPao5r1u+tnY4Dfs/AXYV+rsWkZ7NI4z9vtRDgP6hlCzw3Rhn'
+    b'cPUhv4ishE9X7gWu5j/XP4HxS2BIZLWISDEo+RCgcwAkU02YnRTp4N/RVYc8jPulUZchIkWhLQRMjrqQKCgASKau4b+m/zHqIjr5yiG3A09FXYaI'
+    b'FIWSDQEKAJKJvbQM/XbURXRj5hg/jLoMESkaJRkCFAAkEw/xzQm7oy4ipQSPRl2CiBSVkgsBCgCSiZeiLiC9pk1RVyAiRaekQoACgAyc+56oS0ir'
+    b'rGx41CWISFEqmRCgACADZ0Hh3k2rhTdHXYKIFK2SCAEB0BJ1EVK03hV1AWkF9qGoSxCRojboQ0AA1EVdhBQrP4wvrj8+6iq6qVo/E+ecqMsQkaI3'
+    b'qENAgLMu6iKkiHlwPZdVF85d96q2DMO4F90JUESyYx4+OENAgPlvoi5CitpRjBjyI6pWl0ddCFWbpmItD2O8NepSRGRQSYaAFasroy4kmwI89hMg'
+    b'jLoQKWLGqTSPeoQvbMr/iXdVHuer647gP9f/N0HiJcyPznsNIlIK5hHEHxlMISDOygkvs6TuJ8DiqIuRYubHYr6KL214HLeHIFwP7AMgCEZD2OWK'
+    b'E4tjPrJbW2AjweN461fzkWBx6PjVyzAbAZTBhko8VpaXH1FESl1bCDiBJQtqoy4mU8mnAVriKoi9Hx03lcwEOG8HfztmB1rd6TQNYO3/6dzm3rZS'
+    b'8uWAdWxLsZ6ISP4MmhCQ/FR2/5QXMb4UcS0iIiLFYB5B/P/42UuFey+UPjiwW3bexOvAfxVhLSIiIsViLs32cDGfE3AgAFRZyL5wMfCX6MoREREp'
+    b'GvMIYkW7JyDeaernU/Zxet0HCPl/wD9EU5KICOBsw+y3EK6DYF/7KSCp9HZaiHf7pm/r9rTNTG6k3mO9PczM5PSXga6b8j3ocOFY2n6tAjgEeC9w'
+    b'8AC3nmWx+yDxt36v1tPfAUCzvRX46YBKilC8W8u9k+o4Y8c7CRt/BeiSKhHJt61gn2PczGUssUTUxUiG3I37Xz4F+BbY9EhrOWXOz4GfR1pDAUmd'
+    b'YZePeYMyPxF8RZ7rEZHS9iJm/8hFs+7Q4D9ImDmnzVtJEDsK58moy5ED0u/EuqtyL/dNOg34NKD/EUUkx/x14i3/zoWzNkRdieTAkjnb8LL3A5uj'
+    b'LkWSejmKZc59k75FyDuBV/JSkYiUKPs6F8x7NeoqJIfOmFkHfCHqMiSpb6exrJj0OC32Zoyb6f10CBGR/mqkvOXWqIuQPJi0ZTnwetRlSH/OY105'
+    b'cQ/LJ12M2zuB53NXkoiUHvsL583bHXUVkgcnnNAC/kjUZchALmS5b+Kj1Ew8EvNPADuzX5KIlJ5wY9QVSD4FA/99h7oXeLYM7ErWP1gL91R+h+bm'
+    b'mWDfAPZntywRKSkWRP84ackfD4cOfOVwdPYKKW2Z3MoCVk57neWTPkfoh+G+DGjJTlkiUmLmRF2A5JHZ7AzW1d9KlmQWANrcN/k1lk/+MG6H4twG'
+    b'NGWlXxEpDe5H8L11h0RdhuTBg6+OAd6RQQ9vZ8Xqg7JVTinLTgBos3zSOpZXXkAsnIPxHWBXVvsXkcHKCMLPRV2E5EFj46eATA75lOHxT2WrnFKW'
+    b'3QDQZtmUDdxV+QnKY1OBK3Bey8l2RGTwMJby/VdOiroMyaEV1ceAZT54G59i5Yvvyryg0pabANDm9gm7ubvyf2iaNBvnA8DP0HkCIpJaAL6cm6s/'
+    b'EHUhkgP3v3QCifDnwJAs9FaGxx7g/jUnZqGvkpX/yyk+srWSROIcLDgX/NDUlXj3yjKe9l7mD3Tas9xf23Qu6vVe5g90Ogu/r5Rtad7brLX18H5k'
+    b'vJ0U70nWttPL30Z/2rq1d3nP3U7l8pkDeybIja+8DMztvI0+1e4Y95PgW1w86xms6/8MUlTue+FwiF3MM74RAAAgAElEQVQBfASItbf3d/RJvXwC'
+    b'92XE+A6nzOv/U/5KnLGk7i7K4pdyz7j8H68/Z+vxEJ4LLMYYcWCGAoACQGu/fV52IG0KAN3bCyIAdLQVZy2wr8f9lb0NJgP9qJPJNge6f9XCHubl'
+    b'apv9ndeHTGZUYMwApvR7mwNbvgZ4FdjXz5571+P72sPvC1LUHfsGJ899KLOCsiMOnEVLy7GcWnsm91f+Oa9bXzbxMeAxzt12OYnEEuB04F10TIki'
+    b'UsomYkzMXncpBq5c7QftaYwcTNssnNvyTG59dZfTGvvbuS/LSRkDkMw1zkywRzmt7su8y+N5r+L2Cbv5UeUP+VHliTSFlbhdAPwGaM57LSIiIiWg'
+    b'446NOM5XmbR1FafWHh1ZRfdO2c6yytu4c/K/wv6JOB8GVpKL3ToiIiIlKtWRjYVgj3Na7Q2cWT8q7xV1dOeMHfxo8jLunLyEpvLJmJ8FPADooSEi'
+    b'IiIZSHdqQwD2MRItL3B63VlUeW4vF+yLe8bt4vYp93DH5JM5pPIgQn8HblcDfwESUZcnIiJSTHob2A/GuYuXtj7JGTUn5KWivqiyFu6c8ih3VH6Z'
+    b'2ycfzdDYGLD343Yr6KZDIiIivenrCX+L8OD3nL7154Qtn+X+KS/mtKr+umniHuDnrS+4YNNcwtg/Ae/FOAEYGWF1IiIiBaefZ/z7+whi/85pW38F'
+    b'fIX7Jv41J1Vl6gdT1wBrgO+x2GOMqZ2H2yICPw7neOAwCuniFRERkTwbyCV/AeYnYfwbZ9b+GLiaeyqfz3ZhWbPSEsDq1lfy+stLtlbS0nI05scR'
+    b'2jEYi4AMnk8tMqhsBp4Ce4p4+ETUxYhIbmRyzX+AswRYzBm1P4PwepZP+WO2CsupmybWAj9tfcHi1eWMHfcWCI/B/Biwo4HpUZYokic7gKcwnsLt'
+    b'SYL4U1w2fUvURYlI7mXjpj8GfBALPsiZdc8A19O0fQUrFzRloe/8SNb6l9bXdwC4eP1YvPwI8IUYCzGOwDkc7SmQ4rUN7HkI/4bzNCFPceXMat1r'
+    b'X6Q0GUvqvPW7rnP6MJ32Xuo1BNyEx37I3RNqslBnYVjsMSbUzAVfCPZmYGHye6bqWQAZ9peyTc8CSN3W6/30GzBWY/Y8Hv4d+BvNwd/5zIzaNFvP'
+    b'jew8C6D39t7m9bT9TPrN5PkDPc7rIY/lbJv9ndeH/3cymZeN5bO1bq/r95Kfu61r53DyoXdlVlB25Oq2v5NxvgaJqzir9hfgt9FY+ZvW4/HFK1n/'
+    b'i62v+9vbz9t4EBX2ZkKbjzEXmAM2B/wQcvcei+wCX4tZNaG/BDxPnL8xeeY6lhT5/2siknO5HpziwAfBPsjQuo2cU3M7LX4Hy6esz/F28+uH014H'
+    b'ft/6OmDp02WUVc4gYA7OXAKbDczBmUPyHIPob7Akhc3Yh1MNVg2+Fqwa82oC1nDFzLqoyxOR4pWrQwA9TTv44xDcgzWvZNnU+n5VPFhcVj0ERszC'
+    b'wjnAHAKmA9NxDgY7GAsr6fiu6RDAANbvra0gDgE0AOuBjQRsxNmAsx7jNcKWtXx2zqY0lRU+HQIY4DwdAsjK8tlat9f1dQigPwzseMyPh/h3+XDt'
+    b'bwhZTkX4v9w6pXQe+HPDnEbghdZXd1Wry9k9djItTCPwqeAHA9OAqSSfrz0dqESPTi5ke4FaoA7YiNlGzDcC63HbSEvzRr4wZ1u0JYpIqYr6+HQZ'
+    b'zvsw3kdjsI8P1/4WtwcI9v2CO2fsiLi2aFUtaCL5yTD94ZLFHmPqpkpiTCVkHNh4jHEY44DxwASw8Xhbm48DyvLzAwxKIc7rGNvAtuFhLVhd63Qt'
+    b'ZnUkwm2UUcveIXVUlVCgzb4NmH2fMPwtQ9jE/vKWqAvqZnTUBeRJyg+4O3uZPwiVDR+JJY7C/FTgFAbBIdyoA0BHw4APYf4hfGgzH6l9BAsfwOM/'
+    b'486J+T17uVgkT0rc3Prqm8++MpqwfCJYMhSEjCMIxwPDcBuB2SigAnw4yX/iKsCGgY9Nfk8FMCb7P0xOJYBdQBPGXmAfRiPOLpLXwSdfZjsI2YG1'
+    b'fd+SbI/5DvaHO6iasyvCn6GUXEuTf5mPz26MuhCRDt4ANgAP8JPqI/FwJTAz4poyEsU5AH2Y7nT81IFnMPs12K/ZM/EvRX81wWBQtWUYjWEFnhhN'
+    b'EIwgFib3LHgwEsKOwXIoTsWBAxUW4N7ls5ONwvzAoYzAmsH3dF4EJzlQd2G7cE8QBM0Q7gH2E9IAzXsYUtbM56bv0HXuERnIOQDGp7lo9rdyXJlI'
+    b'5lZUTyAInwCf1eNyBXwOQDEEgK7zX8f4HcZvaG55iGXT+v7pV0Typ78BwPgpF83+UB4qE8mOH1e/BRJP09PhgAIOAIV0CKCvDsI5DTiNeBzOrXkJ'
+    b'+D2BP4wn/tB6SZ6IFBfHYp+PugiRfjllzl/58Uv3AWdEXcpAFGMA6GoeMA+3SyAecl7NXzF7FPMn8MSfuG1q8V5GJVI6nuXCGS9FXYRI//l9YAoA'
+    b'BSAAFuG+CLgCYnB+TQ2wCgsfw+xxhux9qvUSPBEpHE9HXYDIgJTZKpqjLmJgBlsASGUycBLYSTiwf/g+zt/yNAF/wvxPNAV/5o7JuhZbpM0tT5fR'
+    b'OPpwPLaIwP/CZbNy/7hv73hdmUgRaRz+BsHeqKsYkFIIAF0Nw3gH8A7coMxh6ZY1GE/i9jcsfBaLPcfNlVujLlQk5255uozG8Yfj4SLwRcAi9rMQ'
+    b'YwjmENqpQO4DgDE+59sQyYldE4r1fmylGABSmQvMTd6C08BDuGhLLfAc2HOYP4cHf6Ny0ktUWeHdkESkL77x0kjKyg/DWEhgR4IvooEjsHBIcgEj'
+    b'uru6+NERbVgkM0GsaP92FQDSq0y+/J9xwEKoq2nkoi2rMXuOwP+G23M0tjynKw+koNyyZRj79x1GInY4Fs7HgsNxn4/xpvZlvNBujWDzuPGVf+TS'
+    b'WU9FXYlI/9jZxXo7RAWA/hmCcST4kcnft8OQAC7ZXE9ANdgaPKzGrBq3aoaXVfPNCbujLloGqWvXTiQenwXhbLDDwBeALWDv/hlYEBzYo1Uk/zgF'
+    b'fi0r/D16lLEUjQdeejehnxR1GQOlAJAd43DGJXdjWjIMmsO+JvjY5lpgDQHV7Y919UQ1Zazl+mkNURcuBczd+ObagymLzyJhswl8FthsSLR+ZRRh'
+    b'2OWmXEUy2Kf2Tl5f+y3cr9TdG6XgPVg9i0R4bzH/P6cAkHvJQwnOO5KTDhZAAueyzZsI2ICzEbPNeNsjYRObSfhGxk+rpcrCSKuX3Plu9RD2lh9M'
+    b'WWIqznTcphL4VNymg83g26/NJhYfSkgyULYFy4yfbVrA3K7gllcmc3v1ZZyrJyVKgfrJS+8nEd4OjIu6lEwoAETHMKbhTEtOeodzsAKIO+zY3MwV'
+    b'm2pJPoBiE7CZgI2Erd+bb6Bl/3bd16DAuBvfemUCVjaeMJwATCH0gzGbhjEdbCr4VPZTSSyE0JK/ewO8bXAv3k8VWXAqTfZv3Lz2HpzfEfh6Et7z'
+    b'00GH5qmyqA2JuoAsKqbfWSIsw2wixlHAEpyiPfGvIwWAwlYGTAOm0XFcaBssMCirgCs37cZ8O9g2jO049QStX51tmG/DvZ641xNLbKd8Rr2uZuiH'
+    b'6zZW0JAYg/loQjuIuE8gDCYS+CTcJ+A2noBKjIk44/nG+gkQi9Fx5411/NRe0oN7X40ELsK4CDcIrOcdH739Nad7FkGneT2t1895GfXbw99Hb2dH'
+    b'5OJnSTmvh+fA9LXf/v4LlMmOr0x3mgWDc6+bAsDgMBJsJDCj26HgtqAQGIQOYQDNm+AzG98AtuHsJPCdYHtwGoDdGLswawDfC7YTZx9GA9gbGA04'
+    b'+6BlJ0FiLy0j9xXciY5Vr46BeADhGMpjcVoSI8HLMRuOUQEMxWw4Ho7AGI0zBhhNwBhgbOvTCsdglvy6P1F+4H0k+Sm9bZc8HQYmjesiUkQUAErX'
+    b'WGBs+27n9r0KbTokifZ5rW1G8jwGAojvhy9saFu3CdjbvgyE7Xd4a3tWlvsuzBIdtrUPp7HTMkDr44FHdS/bR4LFuyT64UA5xkja/6ZbP30nEgdC'
+    b'UNuPYBw4M75jUGofwLssKyIyCCkASDaVt74OsC4nyViKETXVIOsdRmTrbWEREemv9M8wFhERkUFLAUBERKQEKQCIiIiUIAUAERGREqQAICIiUoIU'
+    b'AEREREqQAoCIiEgJUgAQEREpQQoAIiIiJUgBQEREpAQpAIiIiJQgBQAREZESpIcBiUihagGeAl4Den7kdG+PYm5/hlSKBXP1fKmeauppm6ontUzq'
+    b'yPRnMC/DGQ92JHBwhr0VDAUAESk0u4FvMiT2PT46Y0fUxYi0czdWrjmOmF+N2zujLidTCgAiUjjcXsXCk7hozgtRlyLSjZkDj1Hl7+Yf1nwN5wtR'
+    b'l5QJnQMgIoViJ7Hg3zT4S8GrspCTD/0i2PejLiUTCgAiUhjcqrhwxktRlyHSZ2HFJ4FNUZcxUAoAIlII9rC//JaoixDplyXTGoCboy5joBQARCR6'
+    b'bo9w5bSGqMsQ6b/Yr6KuYKAUAEQkeubroi5BZEDCoGj/dhUARERESpACgIgUgjdFXYDIgMRb3hR1CQOlACAiheDdfLd6SNRFiPRbyL9GXcJAKQCI'
+    b'SCEYSZldGHURIv1yx6tDwS+JuoyBUgAQkQLhV3Hj2tlRVyHSZyOb/xuYFnUZA6UAICIFwg7C+CU3vzIn6kpEeuRu/HjNF8Evj7qUTCgAiEjhMOaC'
+    b'P8ktaz/JsueGR12OSDcrXlzET17+DfjVUZeSKT0MSEQKzRicb7Fv+NXcvPZxYCPQlNEjXds/6oQ9zOunrNTTz3m9GWhN/a6nj8/yzeajhDN5X7Lz'
+    b'UXcMsAiYlZXeCoACgIgUqqHAe/q0ZJ8HmhQL9jSWRfEMeu+hoEjqyVG/2QwHveljXkkrn7XmkQ4BiIiIlCAFABERkRKkACAiIlKCFABERERKkAKA'
+    b'iIhICVIAEBERKUEKACIiIiVIAUBERKQE6UZAUtiMvUATsAtoAXaAt2C2GwBnDHA4yZvGiIhIHykASDbtBf8pbr/HrYYgbAbA2Y/R0GnJrnfm8vge'
+    b'4i3NUNbC/ubdNAb7uX56A31RtWUYQfN/AFcBepqciEgfKABIlvg9eOKTfH1mXd43XTVlH3A319Y+SEPj7cCSvNcgIlJkFAAkG77Gfx3ylaiL4NOV'
+    b'e6nyMwnWjwL7l6jLEREpZDoJUDL1AF+fdlXURbSrshbC+AXAnqhLEREpZAoAkolmgsSnwDJ91lZ2VU3dhHNP1GWIiBQyBQAZOOMRrn7Tq1GXkZr/'
+    b'POoKREQKmQKADFzoj0ZdQloeeznqEkRECpkCgGTA8n/Gv4iIZIUCgAyc+aioS0grlpgedQkiIoVMAUAysTDqAtIK7cSoSxARKWQBsDvqIqRY2b9T'
+    b'tWVY1FV0c23tcIwLoi5DRKSQBUBN1EVI0RpHY3hF1EV009B4HTA+6jJERApZgPF01EVIETO/ii9ueEfUZbT76vr/BJZGXYaISKELdL20ZKgc55d8'
+    b'cf3iSKv46roj+Or63wHR35JYRKQIxAmbf4aV1wKVURcjRWsE2Aq+uPFhLLyZROwRrplan3bpxR5j1obOVxAMtQrw5CN9E4wFIMZYQowYY3AMGAMW'
+    b'YD6a5OGr0ST/bhfhHI7l5GcTERmU4qyc1sDiumsxvh11MVLs/D24vYcghC9taAD2t84YhRE7sNxGsC6jdciBtrZrU9zB6PLoYE9Oa7AXEclI8p/a'
+    b'sRNvwFgVcS0yuFQAY1tfsV6WFRGRPEsGgFutmYR/FGiMthwRERHJhwM3AlpZ+Txu55DcGSsiIiKDWOc7Aa6YuALnMxHVIiIiInnS/VbAKyZ9G+wy'
+    b'tCdARERk0Er9LID7J34Pt/OB5vyWIyIiIvkQTzvn/ol3cNrWteAr0D0CRDpqBh4Hew0Lt+Ktdynoi/5cvph2We88meklkZ6izdrnvZRh7yJSoNIH'
+    b'AID7Jj7K4u1HEUvcC7w9PyWJFKz9wLfAruPzh7wRdTEiIpnoOQAArBy/mcV+AvGtnwS+CgzJeVUihWcrYfg+vjTzyagLERHJhtTnAHS10hLcO+mb'
+    b'BP6PwF9yW5JIwWki5EMa/EVkMOl9D0BH91Q+T5Ufy8t154Jdgx65KqXA/Pt8acafoi5DpECtAdYBm4FEn9dKde5JTzI51yWntw7vb+eJ6pyUMQD9'
+    b'CwAAVRYCt3HOpgdpiX8FuAgoz3ZhIgUj4ddHXYJIwTHuJBFex1mHPR91KTIwmeeiM+pmYn41cFqn/rr23K9pz3D9VNO9nDk94GnPcn9t07mo13uZ'
+    b'P9DpLPy+UraleW+z1tbD+3HAi3zxTfPTzpX0bnzlZWAukPo979TeS1tP7b3N62n7mfTb5232d14PH41zts1+zHP2AWdz5twHeqlGClzfzgHoyfJJ'
+    b'67in8gw8OBL3n6AbCMlgYqyPugSRgmJ2oQb/wSHzANBm+cRnWT75FEJfCCynP8eCRAqVszfqEkQKhy3jjDl3R12FZEf2AkCbeyev5p7KMzHmgH0D'
+    b'TNdLi4gUv10kmj8XdRGSPdkPAG3uqnyVuyd9Do+/CeNKjII581FERPrLPs/Z82uirkKyJ3cBoM0943ZxV+X1LKucSxAeBdwK2q0qIlI0nGeIz74l'
+    b'6jIkuwJOrZuVt639aMoq7qq8kP3lB4NdhPNU3rYtIiIDEYJfzBLTeV2DTIDzVxbXLc3rVlcetJNlk27hrsq34uH85LkCbMtrDSIi0jvjNs48VHfB'
+    b'HIQCYCTGLZxadw+LXx+d9wrumvIiyyZ9jn31U8FPArsTeD3vdYiISFfbaUp8IeoiJDc63gnwDILmY1lSdxErJv0275WsXNAE/BL4JUu9jOaad+PB'
+    b'yeAfBCbkvR6RTH3ztZNx/6dObf259VaqM3QC6NM9VLOyHSAMb+Xy2av60ZsMJuaf58OH1UddhuRG11sBvwnjN5y69ReEwUWsHL85kqputWbgt8Bv'
+    b'WewXM7LmGJzFYKcAUyKpSaS/nLcBfTu81tcBO9XY39d1+7Scd9lO8DCgAFCanmLN3NujLkJyJ81VAH4SscTznFZ7HnhOH6PQq5WW4PYpj3HHlMs5'
+    b'pHIa7u8Avgn8LdK6REQGrwSBXdj67BcZpHp6GNBYsNs4re4iqPk0903+Q76KSiv5x/ho6+uznL9pKmHwr7j9C8aJwKhoCxQRGQzs+5w+569RVyG5'
+    b'1YenAdpRYI9wet3/Quyz3Dv+pdyX1Ue3Td0E/AD4AVUeZ/PWt+Lhe3DeDRwDDIm2QBGRolNHU/zLGfVQ5QFzX/5vAsveieWZ3LUm93e8SS/Kfegd'
+    b'f273N8CeZWf5T/nojP3Qv8cBvx8S/8YZdbfRnLiGlVM2ZLfSDFVZC/Cn1tfXWLplGGHsOCxxAm7HA0cBFZHWKCJS8OzTfHTGjoy6OHTNeWCf7nkz'
+    b'GW2hf/pw3myPeqw1084z2XZ/+3EY07ieB19ewocOfbI/AQAgjnMR8di5nFl3B564huVTCvNpabdO2Qf8v9YXLPUyErVvIfBjMDsG/FhgWpQliogU'
+    b'mD9yxuy7OTODHpa/PB64JlsFSdYdAv4bHnzxyP4GgDblOBdCcC5n1P4I7BqWT1qX1RKzLXllwZOtr/8B4KKNBxPGj02GAT8a7EigPMIqRUSi0kwi'
+    b'uBSzzD7SBlyDMy5LNUlujAX70kADQJsy4Hzwj3Jmzc8w/w53T3k0G9Xlxc3TNgMrW1/wkVeHUj7kKLC3gb8Zs4Xgh5H8OUVEBi+z73LO7L9n1Md9'
+    b'1Ufj4blZqkhy618zDQBtYmD/gdt/cGbdKpzrGTFxReun7uJx54z9wGOtr6TFq8uZMHo+xBaCL8Q5AlgITIyoShGR7DI205D4z4z6WOExEmtuItpT'
+    b'7qTvKrMVADrwRRh3s6/um5xZezsBt3NX5avZ306eJO9Q+Gzr64BLtlZCy0LgzcBCsIXAPHDtLRCRImNXct683Rl1Ea65GHhLduqRPAhyEADaTcH4'
+    b'Es4XOLP295jdRWPTSlZOa8jhNvPnpom1QC3wu/a2Ko9Tt3U68ZaZuM3EPPkVXwDMpX9XXYiI5MNDnDFnRUY9LF83CZq/lqV6JE/yMSAFGCdifiJD'
+    b'y67lrJq7we/h7inP5GHb+ZW8FHFd66vLvNXlvDFmBiFzMZ8DwRzw2cAcklcjaLeZiORbEx5+LONerPlanDFZqEfyKN+fSCdidiXYlZxT+xLYckK7'
+    b'l7snrs1zHflXtaAJeLn11dll1UOIVxxCCwdDMJWAqRAeDDYNmIrbFMwr812yiAxyZt/irHnd/03qj/vXvIPQz8pSRZJHUe6Sngf+VQL/KufU/gXj'
+    b'fswf5M7Jr0VYUzRumNMIrGl9pXZZ9RCGjJyChwcTJqZDMAWYhvtUAiYD40g+NXFsXmoWkSLn69kz4r8y6uKWp8sIuZFo73cnA1Qox6TfBrwNt+v4'
+    b'cN0zWPhTYvYgP6zM7JKUwSQZEl5tfaW32GNM2TqeeDiOwMcRMg4S4wlsAth4wnAcZuNIBobxrS+Fhs6agZ3ALoIUh3NEBgPnCi6csi+jPkaNuhz8'
+    b'8CxVJHlWKAGgAz8S50gS/lU+sqUaswdxfk155eNFd1lhFFZaAqhrffXdZ18ZTSw2jNAqgLE4FTgVBLExGMMgHIbbKMxG4FRgPhJnJEYFzggCH45b'
+    b'x5soleGMaJ9Kfj4YTedzHSqAoX2oLgHs6tK2H2g9odR2g7fgOMaO9vlGA8ZO3BrB92C+B6ypdZn9hLYP2IHbTuLNO4kHu4jHd3LlIDlRVSQd51ec'
+    b'fehPM+rj7uqpeHiVPvsXrwIMAB3ZHJzPAJ+huXYvH93yBB78Aks8wB0Hb4y6ukHlG7N2kvzUKyKDmdNImPhExv3E/LpOIV+KToEHgE6GgyWvJiD4'
+    b'DufW/A2zh8EfxuN/5PYJmV3DKiJSCgK7hrMPS3++UV8sX/Ne3BdnqSKJSDEFgK4W4r4Q+AS0tHBe7V9w/z3Ow+xpeXLQ3G9ARCRbnFdojn8joz5+'
+    b'VT2EHeH3slSRRKiYA0BHcfDjMI7D+DKj4i1cULMGt8fAHwd7lNuK+G6EIiLZcXnbs+AHbId/iuSNzaTIDZYA0FUcZz74fGApOFywpQZ8FfAYZo8z'
+    b'ZO9TrWfWi4iUggc5e+4vM+phxSvTaUl8Pkv1SMQGawBIZTLYScBJONA4fB9LtzyN8Tj4EyTiT3LbpP6dOS8iUhz2EsauyLiXlsQNwPDMy5FCUEoB'
+    b'oKthwDtw3gEGsQRcuOUN4AWMVbitIvDVxPf+XXsKRKSomV3N2bM2ZNTH8rX/AuH7s1SRFIBSDgCpjAWOwzkOc3CgeXgzF22pxlgFvhrjBZq0t0BE'
+    b'ikY1r3N9Rj2s2FhBS8ONWapHCoQCQO/KgPnJlyVDQVkCLtmyEffnCPx5Ql4mYA3NQTW3Ttkecb0iIgeYX8zH52a2FzPR8HlgZnYKkkKhADBw0zCb'
+    b'hnNS+52wyhwu3bwD4xWwdZivw1u/Jsr+3voIYRGRfLmPsw59OKMe7lo7Gw8/naV6pIAoAGTfGJxFmC/CAVoPJcSa4bLN24BqYA2BVUNYTchGPNxA'
+    b'3bS61tv4iohkw27i4Scz7iUWfo++3bJbiowCQH5NaH0diztgyXvkWwymbIHLN78BrANqMN+C+zqwGgLbAi3rGD19A1XWEuUPICJFwu0qTp+3JaM+'
+    b'7q4+Bfyfs1SRFBgFgMIyFljUPmWtxxbckyFh5+YEn9hUC6zH2AxsxtgGvhVi2wmoJ7R6zLazflK99iiIlCp7nmmbbsioixWrR9Ds12WpIClACgDF'
+    b'JQYc3PpKckjuSQgh7NB2yGb41KZ6YDtQj7Edpx58O+ZbMeqx2HZCXgdrINa8gyCxl/JEA1Vzuj55b/C7tnY4YdNoEolRhD4Ki43GGYPxOl88JLNj'
+    b'qCL55RBeygknZLa3sKXsy8C07JQkhUgBYHAb1/pKMm/7JvnFw/Zv8QASAf+/vXuPkas67Dj+PXd2/VrhR2yzD2r8Nq2N1EY2DZC0agpUUQlpqgba'
+    b'IqFAFYGatkQkQJyShHWbFEysVhFFSFZLwc8EK1WrkBbRtCoqULVJaKAhTcA28Vo1DuD6sdh47Z17+sfs2mt7d73e2ZkzO/f7ka40O3vvPb9Zr3x/'
+    b'987sPbzbCp/dC4FeKtPtvkNllsB3CfEYIRwkj++ScQzCYYhHIZ4gC+8Q49DpmvuA03ONByKcmqq38ptXznohP/9/Uq0AYQZ5nHr6yTiFEAZvSDKD'
+    b'wNSB1zgLQkZkKpEZlOJFxGwqxJnEgfUy5hCZArGNylWXmZw4Xjr1swkBiIM/m28AFgBNImEzt6z4t6p2seW1lcRY/YyBamgWAI3kooHlYmDgYDjw'
+    b'Z5Bh6ATgg2ViyOOzHg77dc5AIRllG+LpdQcfn1o3nLtqAOJZ+4vh9LZhyLrN6xjwYypXfg6dZ92K0eZzL5WrmHY7PA3xpVEHm6i55Me8nwv8x6/V'
+    b'XPe12i8xUmq5t8pdBLa/9gixUr3VvCwA0mQX+QFZ2Aw8w+FFL9Md8vNuUw9/sORTqSNoHLbtvBn4ldQxVHsWAGnyeo48v597lv1L6iBqEk/umsWJ'
+    b'/g3nXGFTU7IASJPPEQif4tOLniCE5n5DQ/V1svwnhNCROobqI0sdQNIF+REhX81nFj/uwV8TauurvwB8MnUM1Y8FQJo8/pt44pf49LKdqYOoycQY'
+    b'iPERvCpcKP5jS5PDAUrZR7nrMieb0sTbuvM2Qrg6dQzVl1cApMZ3AvKPctfC3amDqAk9+cp7CPHB1DFUfxYAqfF9mbuXPpc6hJpUX+sDVOYoUcFY'
+    b'AKTGtpd3eCh1CDWprT/+RQKfSB1DaVgApEYW2UD34uOpY6gJPRlLkD2Cx4HC8kOAUuM6TgubUodQk+p77RME1qSOoXRsflLjepq7Fo/tfv7Shdi+'
+    b'cwGBL6eOobQsAFLDit7iVxNv667l5PHbDJ0pVIXkW5rHKSAAAAqKSURBVABSw4r/lTqBmsiml9rIpt1KLK/Dg7+wAEiNK8/Gf8e/v/jJzxHijcR8'
+    b'xqnnLmR+l7FeG7zg9fIRnp/AsSZy22rGHO98OlkVd3geNm9og3wZIbwPmDP+navZWACkRjWt/+C4tntw1yzInycyZ0xHoTNWGeXgM9YD2qjrnfXN'
+    b'4YYbafvRjovnyxbPeTC2basZczTj3XZc28UqBlQz8zMAUmPKuXN537i2nFpaimd6ks7DAiA1m3K/p3uSzssCIElSAVkAJEkqIAuAJEkFZAGQJKmA'
+    b'LACSJBWQBUCSpAKyAEiSVEAWAEmSCsgCIElSAVkAJEkqIAuAJEkFZAGQJKmALACSJBWQBUCSpAKyAEiSVEAWAEmSCsgCIElSAVkAJEkqIAuAJEkF'
+    b'ZAGQJKmAWlIHUNMpQ3gZ4l5C6AMgxiMQymesFYAYI4RDZzyX54eBHDhERiTnIFnMieEwIZYJ4QiU+8lLvZWN8plkYQ2E3waurccLlKRmYAHQBIm9'
+    b'kG0gb3mUBzrfqvPg3wf+inV7riGwGeis8/iSNOlYADQRdpPn1/PAwh8lTXH/wn/mS7uvIi+9AHQlzSJJDc7PAKhaB8j4NR5YnPbgP+jzS/ZAdjMQ'
+    b'U0eRpEZmAVB1YriPL126K3WMM3xxwbPAU6ljSFIjswCoGgeYeslfpw4xrBi2po4gSY3MAqDxizxDd+hPHWNYWXgxdQRJamQWAI1fCLtTRxhRmQOp'
+    b'I0hSI7MAaPxCLJ9/pURKcU7qCJLUyCwAqkJcmDrBiGL+vtQRJKmRZUDjnsWpscVwHcSQOsYIbkkdQJIaWQbU+65tah5d3Lf3ptQhzrFuzzUQPpQ6'
+    b'hiQ1sozIntQhNInF8BX+eHd76hin/GnP0oHbAUuSRpEReCZ1CE1qC6DlKbpf70gdhHU/uZ4YX8C5ACTpvFqI4W8J8Qupg2hSW8PJ0ot8vuc+3nxz'
+    b'CxvXnKzZSDEGHuyZTV8WIJ8N+cWE0nsh/g6BX67ZuJLUZFrYcfH3uemnTwO+Z6pqdBJ5jPkX/zn39TxLFvYQeReAGNvIwpQz1g6c9Wd6cQqBtoEv'
+    b'ZhMIEGcTCUPWncO6noHt84GnMrztvyRduMpsgCH/ImTXAaW0cdQEZgO/QRxyUA5wwQdpj+mSVFOV+wB8vfM7EL+SOIskSaqT0zcCyg/cD/xHuiiS'
+    b'JKleTheAHatOkJU/DLyaLo4kSaqHM28FvL3rbeDXgZ4kaSRJUl2cOxfA19t30ZpdCfyg/nEkSVI9DD8Z0Jb5b1DOfxXis3XOI0mS6mDk2QB3dL7F'
+    b'/vZrgfX1iyNJkuph9OmA/zX087X2tQQ+Brxdn0iSJKnWRi8Ag7a3f4OWuAr4u9rGkSRJ9TC2AgCwueNNtrf/JsSPEPwrAUmSJrOxF4BB2zu+ybTs'
+    b'cmADULtJXyRJUs1ceAEAeGx+L9va74F8ObARyM+3iSRJahzjKwCDtnXtYVvHHYR4JfDtiYkkSZJqrboCMGhr53fY2nEdebgaeArncpMkqaFNTAEY'
+    b'tL3939nacQMxvwLCDqB/QvcvSZImxMQWgEHbur7Hlvab6C8thLgOwsGajCNJksalNgVg0Nfm72NLZzdTsoXE8EnguzUdT5IkjUltC8Cgx+b3sqX9'
+    b'UTZ3XEEeVxHCeuCtuowtSZLOUZ8CMNTWzh+yqX0ts3oXEONNVD40WK57DkmSCqwl2cgPL+8DdgA7uHnfQlpKtwK/S4iXJcskSVJB1P8KwHC2de1h'
+    b'U/s6NrX/LMTLiayF8HzqWJIkNat0VwBG8kTnK8ArwHpu2b+YEh8BboR4NRDShpMkqTk0XgEYanPH68BXga/y8Z8uJeQfI/BbwBosA5IkjVtjF4Ch'
+    b'nmjfBawH1nP7vnmUwweJ3ABcD7wnbThJkiaXyVMAhtrY9TaDHyC8MZaYue9KKH0I4jXAFUzW1yVJUp1M/gPljlAGnh9YvsAt+9toDVdBfi2Ba4H3'
+    b'0igfdpQkqUFM/gJwts0dR6nMTFiZnfC2N+ZTClcDVw18kHANMD1dQEmS0mu+AnC2v+l8C/j7gQW6Ywv/u/8yQnw/kQ8Aq4GVCRNKklR3zV8AztYd'
+    b'+qn8meErwEYAfq+ni9bSasjeD/EDVK4STE0XUpKk2ipeARjOY5fuA/YB3wTg9thKy/4V5Kwk5quA1RDWAB0JU0qSNGEsAMPZGE5y+irBjlPP//6e'
+    b'OYTWSiGIrCawErgcrxZIkiYZC8CFeHThQeC5gaXi1tenMX3qKkL8eQirIK4AlgOLgSlpgkqSNDoLQLUeX3wc+N7AcqY/7OkilFYSwxKISwhhCTEu'
+    b'AVYB0+qcVJKkUywAtfSXpz5bcKbbv9tKa8diMpaTsQKy5cCllSV2AXPrnFSSVDAWgBQ2rjkJvDqwfOuc7//Ra1NpmXIJeWsX5J1ksQuyTohLgC6g'
+    b'E1iENziSJI2TBaARPby8D9g9sAxvsCTQeglZ/BkCcyGfR87cyuMwH5g3sMzFmx9JkoawAExWYykJQ929v41SPpeceWT98yHMJTKPwFximAfMgNgG'
+    b'zCIwHcIMQpxNZAaR6QRm1/DV1Nsx4DhwCOglxiMQDpNxmMgRYjhM4BAhPwSlHybOKkk1YQEoig0dR4GjQM+499G9bwZ9+XRieRYtWRv9zKCUXUTM'
+    b'L4J88HdpDnB6suYY2iBOIQ7uJEwhC22n9hnyANnw5SLEw0A+zHeOAX0D4xysjEMfkWMAZFkv5P2E7Aj5yT7yUi+cfAficbqXHxn365ekJmIB0Nh1'
+    b'dx2jcvA9kDqKJKk6fohMkqQCsgBIklRAFgBJkgrIAiBJUgFZACRJKiALgCRJBWQBkCSpgCwAkiQVkAVAkqQCsgBIklRAFgBJkgrIAiBJUgFZACRJ'
+    b'KiALgCRJBWQBkCSpgCwAkiQVkAVAkqQCsgBIklRAFgBJkgrIAiBJUgFZACRJKiALgCRJBWQBkGolxJg6giSNxAIg1UrkWOoIkjQSC4BUKzH0po4g'
+    b'SSOxAEi1EvKe1BEkaSQWAKlWMl5NHUGSRmIBkGpl5v/9D3A0dQxJGo4FQKqVO9acBF5IHUOShmMBkGop8K3UESRpOBYAqZZCeTuE/tQxJOlsFgCp'
+    b'lu5Z9iYhehVAUsOxAEi1FuOfpY4gSWezAEi19tkl/wn8Y+oYkjSUBUCqh7x8J9CXOoYkDbIASPXwuWU7iXSnjiFJgywAUr0cX/QQ8E+pY0gSWACk'
+    b'+ukOOXl+I/By6iiSZAGQ6mnt0sPk+Q3AntRRJBWbBUCqt7VLe2gNVxF4KXUUScVlAZBSuGvRG/RnHwT+IXUUScVkAZBS+dzCg9yz6MMQ7wSOp44j'
+    b'qVgsAFJKIUTuXfIwWXkFkY1AnjqSpGKwAEiN4DPL9nLv4juI4QoCj+MVAUk1ZgGQGsm9i17k7sW3UWpZkDqKpOYWUgeQNMEeer2DKXx8zOufcRow'
+    b'yjsQYz1dqPa0Yjzbj3mbYV7fePOWxrldNWNW87Od0NO9cvX7refpZ8pT3Wp+T6rlKb4kSZIkSZIkSZIkSZIkSZIkSZIkSZIkSZIkSZIkSZIkSZIk'
+    b'SZIkSZIkSZIkSZIkSZIkSZIkSZIkSZIkSZIkSZIkSZIkSZIkSZIkSZIkSZIkqbH8P5MHVeVCLJYKAAAAAElFTkSuQmCC'
+)
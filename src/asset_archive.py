@@ -0,0 +1,83 @@
+"""
+Archiving of long-removed assets for the Asset Management Portal.
+
+Removed assets would otherwise stay in assets, and in its indexes, for good.
+archive_removed_assets() moves every asset removed more than archive_after_days
+days ago into assets_archive (migration 12), batch_size rows per transaction, so
+the portal keeps working while it runs. Only the All Assets report reads the
+archive; the grid, the dashboard and every other report see assets alone.
+
+Archiving logs an "archived" asset_events event instead of "deleted" and leaves
+the monthly rollup's history as it was. Local replicas drop archived rows from
+their copy of assets and pick them up in their copy of assets_archive.
+
+The age and batch size come from the [archive] section of the config file. Run it
+with the archive command of asset_cli, e.g. from cron:
+    python asset_management_portal.py archive [--older-than DAYS]
+`python asset_archive.py [--older-than DAYS]` runs the same command.
+"""
+
+
+import sys
+
+from asset_fields import ASSET_COLUMNS, decoded_column
+from db_pool import load_config
+
+
+DEFAULT_ARCHIVE = {
+    "archive_after_days": "365",
+    "batch_size": "5000",
+}
+ARCHIVE_ENVIRONMENT = {
+    "ASSET_ARCHIVE_AFTER_DAYS": "archive_after_days",
+}
+# The monthly reports read assets alone, so nothing removed this month may be archived yet.
+MIN_ARCHIVE_DAYS = 31
+# Set for the archiving transaction; the change log then records its deletes as "archived".
+ARCHIVING_SETTING = "asset_portal.archiving"
+
+ARCHIVE_BATCH_SQL = f"""
+    WITH moved AS (
+        DELETE FROM assets WHERE id IN (
+            SELECT id FROM assets WHERE remove_date < CURRENT_DATE - %(days)s
+            LIMIT %(batch_size)s FOR UPDATE SKIP LOCKED
+        )
+        RETURNING {', '.join(decoded_column(column) for column in ASSET_COLUMNS)}
+    )
+    INSERT INTO assets_archive ({', '.join(ASSET_COLUMNS)})
+    SELECT {', '.join(ASSET_COLUMNS)} FROM moved
+"""
+
+
+def load_archive_config(path=None):
+    return load_config("archive", DEFAULT_ARCHIVE, ARCHIVE_ENVIRONMENT, path)
+
+
+def archive_removed_assets(conn, older_than_days, batch_size=5000, log=None):
+    """Move the assets removed more than older_than_days days ago to assets_archive and return how many moved."""
+    if older_than_days < MIN_ARCHIVE_DAYS:
+        raise ValueError(f"archive_after_days must be at least {MIN_ARCHIVE_DAYS}, not {older_than_days}")
+    moved = 0
+    while True:
+        with conn.cursor() as cursor:
+            cursor.execute(f"SET LOCAL {ARCHIVING_SETTING} = 'on'")
+            cursor.execute(ARCHIVE_BATCH_SQL, {"days": older_than_days, "batch_size": batch_size})
+            batch = cursor.rowcount
+        conn.commit()
+        moved += batch
+        if log and batch:
+            log(f"Archived {moved} assets")
+        # Rows locked by an editor are skipped, so a short batch means nothing else is ready to move.
+        if batch < batch_size:
+            return moved
+
+
+def main(argv=None):
+    """The asset_cli archive command, which leaves the schema to the migrate command; returns its exit status."""
+    from asset_cli import main as run_command
+
+    return run_command(["archive"] + (sys.argv[1:] if argv is None else list(argv)))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,183 @@
+"""
+Command-line mode of the Asset Management Portal, for scheduled reports and bulk jobs.
+
+Runs the portal's reports, dashboard metrics, CSV import and archiving without the
+GUI. It imports nothing from tkinter or customtkinter, so a cron job starts in a
+fraction of a second. Reports are streamed through a server-side cursor to the
+output file, or to stdout with --out - (the default); everything else the commands
+log goes to stderr, so the CSV can be piped on.
+
+asset_management_portal.py hands its command line over to main() when the first
+argument is a command rather than an option, e.g.:
+    python asset_management_portal.py report --type "Assets Removed This Month" --out removed.csv
+    python asset_management_portal.py inventory --field ram --out ram.csv
+    python asset_management_portal.py metrics
+    python asset_management_portal.py import assets.csv
+    python asset_management_portal.py archive [--older-than DAYS]
+    python asset_management_portal.py rebuild-rollup
+    python asset_management_portal.py migrate
+
+Only the migrate command changes the schema. The others exit with an error if the
+database is not at the schema version this code expects, rather than running
+migrations (some of them long backfills) at whatever time a cron job fires.
+
+The exit status is 0 on success, 1 if an import rejected rows and 2 on errors.
+"""
+
+
+import argparse
+import getpass
+import os
+import sys
+
+import psycopg2
+
+from asset_archive import archive_removed_assets, load_archive_config
+from asset_fields import HARDWARE_COLUMNS
+from asset_import import AssetImportError
+from asset_repository import METRIC_NAMES, REPORT_TYPES, AssetRepository
+from db_pool import connection_settings, load_db_config
+from migrations import LATEST_VERSION, create_missing_trigram_indexes, current_version, migrate
+from monthly_rollup import rebuild_rollup
+
+
+def log(message):
+    print(message, file=sys.stderr)
+
+
+def write_output(path, write):
+    """Call write(file) with stdout for "-" or with path opened for writing, and return its result."""
+    if path == "-":
+        return write(sys.stdout)
+    try:
+        with open(path, mode='w', newline='') as file:
+            return write(file)
+    except BaseException:
+        # Never leave a truncated report behind, e.g. after a failure or Ctrl+C.
+        if os.path.exists(path):
+            os.remove(path)
+        raise
+
+
+def run_report(conn, args):
+    repository = AssetRepository(conn)
+    written = write_output(args.out, lambda file: repository.export_report(args.type, file))
+    conn.commit()
+    log(f"{args.type}: {written:,} rows")
+    return 0
+
+
+def run_inventory(conn, args):
+    repository = AssetRepository(conn)
+    written = write_output(args.out, lambda file: repository.export_inventory(args.field, file))
+    conn.commit()
+    log(f"Inventory of {args.field}: {written:,} rows")
+    return 0
+
+
+def run_metrics(conn, args):
+    metrics = AssetRepository(conn).metrics()
+    conn.commit()
+    for name in METRIC_NAMES:
+        print(f"{name}\t{metrics[name]}")
+    return 0
+
+
+def run_import(conn, args):
+    with AssetRepository(conn).transaction() as repository:
+        result = repository.bulk_create(args.file, args.imported_by, progress=lambda rows: log(f"{rows:,} rows read"))
+    print(f"Rows read: {result.rows_read:,}\nAssets added: {result.inserted:,}\n"
+          f"Assets updated: {result.updated:,}\nRows rejected: {len(result.errors):,}")
+    if result.error_report:
+        print(f"Rejected rows were written to {result.error_report}")
+    return 1 if result.errors else 0
+
+
+def run_archive(conn, args):
+    config = load_archive_config()
+    older_than = args.older_than if args.older_than is not None else int(config["archive_after_days"])
+    moved = archive_removed_assets(conn, older_than, int(config["batch_size"]), log=log)
+    print(f"Archived {moved} assets removed more than {older_than} days ago")
+    return 0
+
+
+def run_rebuild_rollup(conn, args):
+    print(f"Rebuilt asset_monthly_rollup: {rebuild_rollup(conn):,} rows")
+    return 0
+
+
+def run_migrate(conn, args):
+    version = migrate(conn, log=log)
+    conn.autocommit = True
+    if not create_missing_trigram_indexes(conn):
+        log("Trigram indexes are missing; asset search falls back to the portal's in-process index")
+    print(f"Schema version {version}")
+    return 0
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="asset_management_portal.py",
+                                     description="Run Asset Management Portal reports and bulk jobs without the GUI.")
+    commands = parser.add_subparsers(dest="command", required=True, metavar="command")
+
+    report = commands.add_parser("report", help="write a report as CSV")
+    report.add_argument("--type", required=True, choices=REPORT_TYPES, metavar="TYPE",
+                        help="one of: " + ", ".join(f'"{report_type}"' for report_type in REPORT_TYPES))
+    report.add_argument("--out", default="-", metavar="FILE", help="CSV file to write, or - for stdout (default)")
+    report.set_defaults(run=run_report)
+
+    inventory = commands.add_parser("inventory", help="write the active assets per location and hardware value")
+    inventory.add_argument("--field", required=True, choices=HARDWARE_COLUMNS)
+    inventory.add_argument("--out", default="-", metavar="FILE", help="CSV file to write, or - for stdout (default)")
+    inventory.set_defaults(run=run_inventory)
+
+    metrics = commands.add_parser("metrics", help="print the dashboard counters")
+    metrics.set_defaults(run=run_metrics)
+
+    bulk_import = commands.add_parser("import", help="add and update assets from a CSV laid out like the reports")
+    bulk_import.add_argument("file")
+    bulk_import.add_argument("--imported-by", default=getpass.getuser(), metavar="NAME",
+                             help="recorded as entered_by/updated_by (default: %(default)s)")
+    bulk_import.set_defaults(run=run_import)
+
+    archive = commands.add_parser("archive", help="move long-removed assets to assets_archive")
+    archive.add_argument("--older-than", type=int, metavar="DAYS",
+                         help="archive assets removed more than DAYS days ago (default: archive_after_days)")
+    archive.set_defaults(run=run_archive)
+
+    rollup = commands.add_parser("rebuild-rollup", help="recompute the trend dashboard's monthly rollup from asset_events")
+    rollup.set_defaults(run=run_rebuild_rollup)
+
+    migration = commands.add_parser("migrate", help="apply pending schema migrations")
+    migration.set_defaults(run=run_migrate)
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    try:
+        conn = psycopg2.connect(**connection_settings(load_db_config()))
+    except psycopg2.Error as e:
+        log(f"error: {e}")
+        return 2
+    try:
+        if args.run is not run_migrate:
+            version = current_version(conn)
+            if version < LATEST_VERSION:
+                log(f"error: the database schema is at version {version}, this code needs {LATEST_VERSION};"
+                    f" run the migrate command first")
+                return 2
+        return args.run(conn, args)
+    except BrokenPipeError:
+        # The reader went away, e.g. `report ... | head`; point stdout at devnull so exiting does not fail again.
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return 0
+    except (psycopg2.Error, AssetImportError, OSError, ValueError) as e:
+        log(f"error: {e}")
+        return 2
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,67 @@
+"""
+Asset column layout shared by the portal screens, report export and bulk import.
+
+Kept free of GUI imports so it can be used from background jobs and scripts.
+"""
+
+
+from datetime import datetime
+
+
+ASSET_COLUMNS = (
+    "id", "employee_name", "employee_id", "email_id", "location", "hostname", "processor", "ram", "hd_size", "mouse",
+    "adaptor", "headset", "monitor", "it_others", "software_licenses", "asset_entry_date", "entered_by", "updated_by",
+    "update_date", "remove_date")
+ASSET_SELECT = "SELECT " + ", ".join(ASSET_COLUMNS) + " FROM assets"
+# The same from PostgreSQL, through the view that decodes the hardware attributes (see below).
+ASSET_DETAILS_SELECT = "SELECT " + ", ".join(ASSET_COLUMNS) + " FROM asset_details"
+
+# Hardware attributes drawn from a short catalogue. Since migration 13 assets stores each as a small integer
+# key into its own lookup table, asset_<column>_values (id, value); the asset_details view decodes them.
+HARDWARE_COLUMNS = ("processor", "ram", "hd_size", "mouse", "adaptor", "headset", "monitor")
+
+# Column headings of the downloadable report, in ASSET_COLUMNS order. Bulk import reads the same layout.
+REPORT_HEADER = (
+    "ID", "Employee Name", "Employee ID", "Email ID", "Location", "Hostname", "Processor", "RAM", "HDD Size", "Mouse",
+    "Adaptor", "Headset", "Monitor", "IT Others", "Software Licenses", "Asset Entry Date", "Asset Entered By",
+    "Asset Updated By", "Asset Updated Date", "Asset Remove Date")
+
+# Fields the Add Asset form insists on.
+REQUIRED_FIELDS = (
+    "employee_name", "employee_id", "email_id", "location", "hostname", "processor", "ram", "hd_size", "mouse",
+    "adaptor", "headset", "monitor", "it_others", "software_licenses", "asset_entry_date")
+
+
+def this_month(column):
+    """Index-friendly predicate matching DATE values in the current calendar month."""
+    return (f"{column} >= DATE_TRUNC('month', CURRENT_DATE)::date"
+            f" AND {column} < (DATE_TRUNC('month', CURRENT_DATE) + INTERVAL '1 month')::date")
+
+
+def lookup_table(column):
+    return f"asset_{column}_values"
+
+
+def stored_column(column):
+    """The assets column an asset field is stored in: <column>_id for hardware attributes."""
+    return f"{column}_id" if column in HARDWARE_COLUMNS else column
+
+
+def stored_value(column, value):
+    """SQL storing the SQL expression value in stored_column(column); new hardware values join their lookup table."""
+    return f"asset_{column}_id({value})" if column in HARDWARE_COLUMNS else value
+
+
+def decoded_column(column, table="assets"):
+    """SQL reading an asset field from a row of table, a hardware field through its lookup table."""
+    if column in HARDWARE_COLUMNS:
+        return f"(SELECT value FROM {lookup_table(column)} WHERE id = {table}.{column}_id) AS {column}"
+    return f"{table}.{column}"
+
+
+def validate_date(date_text):
+    try:
+        datetime.strptime(date_text, '%Y-%m-%d')
+        return True
+    except ValueError:
+        return False
@@ -0,0 +1,218 @@
+"""
+Bulk asset import for the Asset Management Portal.
+
+Reads a CSV laid out like the downloadable report and validates every row the same
+way the Add Asset form does. Valid rows are loaded into a temporary staging table
+with COPY in batches and then merged into assets in one statement, matched on the
+employee_id of active assets.
+Rejected rows are written to an error report next to the imported file.
+"""
+
+
+import csv
+import io
+import os
+from datetime import datetime
+
+from asset_fields import (ASSET_COLUMNS, HARDWARE_COLUMNS, REPORT_HEADER, REQUIRED_FIELDS, lookup_table, stored_column,
+                          validate_date)
+
+
+# Valid rows buffered in memory before each COPY into the staging table.
+IMPORT_BATCH_SIZE = 10000
+
+IMPORT_COLUMNS = ASSET_COLUMNS[1:]
+HEADER_TO_COLUMN = dict(zip(REPORT_HEADER, ASSET_COLUMNS))
+COLUMN_TO_HEADER = dict(zip(ASSET_COLUMNS, REPORT_HEADER))
+DATE_FIELDS = ("asset_entry_date", "update_date", "remove_date")
+
+# Columns an existing asset takes over from the file when its employee_id is imported again.
+MERGED_COLUMNS = [column for column in IMPORT_COLUMNS
+                  if column not in ("employee_id", "entered_by", "updated_by", "update_date")]
+
+
+def staged_value(column):
+    """SQL reading column from the staging table as stored in assets: hardware values as their lookup keys."""
+    if column in HARDWARE_COLUMNS:
+        return f"{lookup_table(column)}.id"
+    if column == "entered_by":
+        return "COALESCE(entered_by, %(imported_by)s)"
+    if column in DATE_FIELDS:
+        return f"{column}::date"
+    return column
+
+
+STAGING_TABLE_SQL = ("CREATE TEMP TABLE asset_import_staging ("
+                     + ", ".join(f"{column} TEXT" for column in IMPORT_COLUMNS)
+                     + ") ON COMMIT DROP")
+COPY_SQL = f"COPY asset_import_staging ({', '.join(IMPORT_COLUMNS)}) FROM STDIN WITH CSV"
+# New hardware values join their lookup tables in one statement each, so the merge can join them for the keys
+# instead of calling asset_<column>_id() per row. Like that function, it looks before inserting, as a
+# conflicting INSERT would still use up one of the few SMALLINT ids.
+ADD_LOOKUP_VALUES_SQL = {column: f"""
+    INSERT INTO {lookup_table(column)} (value)
+    SELECT DISTINCT {column} FROM asset_import_staging
+    WHERE {column} IS NOT NULL AND NOT EXISTS (
+        SELECT 1 FROM {lookup_table(column)} WHERE value = asset_import_staging.{column})
+    ORDER BY 1
+    ON CONFLICT (value) DO NOTHING
+""" for column in HARDWARE_COLUMNS}
+# employee_id is only unique among active assets (migration 11), so a row matches the active asset of its
+# employee_id and is inserted otherwise. A removed row only matches (i.e. removes) the active asset if it is
+# the file's only row for that employee; otherwise it is history. A matched asset is only updated, and stamped
+# with the importer, if one of its fields differs from the file. A removed asset already on record, e.g. from
+# re-importing an All Assets report, is not added a second time.
+MERGE_SQL = f"""
+    WITH staged AS (
+        SELECT {', '.join(f"{staged_value(column)} AS {stored_column(column)}" for column in IMPORT_COLUMNS)},
+               COUNT(*) OVER (PARTITION BY employee_id) AS employee_rows
+        FROM asset_import_staging
+        {' '.join(f"JOIN {lookup_table(column)} ON {lookup_table(column)}.value = asset_import_staging.{column}"
+                  for column in HARDWARE_COLUMNS)}
+    ), matched AS (
+        SELECT assets.id, staged.* FROM staged
+        JOIN assets ON assets.employee_id = staged.employee_id AND assets.remove_date IS NULL
+        WHERE staged.remove_date IS NULL OR staged.employee_rows = 1
+    ), updated AS (
+        UPDATE assets
+        SET {', '.join(f"{stored_column(column)} = matched.{stored_column(column)}" for column in MERGED_COLUMNS)},
+            updated_by = %(imported_by)s, update_date = %(imported_on)s
+        FROM matched
+        WHERE assets.id = matched.id
+          AND ({', '.join(f"assets.{stored_column(column)}" for column in MERGED_COLUMNS)})
+              IS DISTINCT FROM ({', '.join(f"matched.{stored_column(column)}" for column in MERGED_COLUMNS)})
+        RETURNING assets.id
+    ), inserted AS (
+        INSERT INTO assets ({', '.join(stored_column(column) for column in IMPORT_COLUMNS)})
+        SELECT {', '.join(stored_column(column) for column in IMPORT_COLUMNS)} FROM staged
+        WHERE NOT EXISTS (SELECT 1 FROM matched WHERE matched.employee_id = staged.employee_id
+                                                  AND matched.remove_date IS NOT DISTINCT FROM staged.remove_date)
+          AND NOT (remove_date IS NOT NULL AND EXISTS (
+              SELECT 1 FROM assets
+              WHERE assets.employee_id = staged.employee_id AND assets.remove_date = staged.remove_date
+              UNION ALL
+              SELECT 1 FROM assets_archive
+              WHERE assets_archive.employee_id = staged.employee_id
+                AND assets_archive.remove_date = staged.remove_date))
+        RETURNING id
+    )
+    SELECT (SELECT COUNT(*) FROM inserted), (SELECT COUNT(*) FROM updated)
+"""
+
+
+class AssetImportError(Exception):
+    pass
+
+
+class ImportResult:
+    def __init__(self):
+        self.rows_read = 0
+        self.inserted = 0
+        self.updated = 0
+        self.errors = []
+        self.error_report = None
+
+
+def read_rows(file):
+    """Yield (line number, {column: value}) for every non-blank data row of an import file."""
+    reader = csv.reader(file)
+    header = next(reader, None)
+    if header is None:
+        raise AssetImportError("The import file is empty.")
+
+    columns = [HEADER_TO_COLUMN.get(name.strip()) for name in header]
+    missing = [COLUMN_TO_HEADER[column] for column in REQUIRED_FIELDS if column not in columns]
+    if missing:
+        raise AssetImportError("The import file is missing columns: " + ", ".join(missing))
+
+    for values in reader:
+        if not any(value.strip() for value in values):
+            continue
+        yield reader.line_num, {column: value.strip() for column, value in zip(columns, values) if column}
+
+
+def asset_key(record):
+    return record["employee_id"], record.get("remove_date") or None
+
+
+def validate_row(record, seen_employee_ids):
+    missing = [COLUMN_TO_HEADER[column] for column in REQUIRED_FIELDS if not record.get(column)]
+    if missing:
+        return "All fields are required! Missing: " + ", ".join(missing)
+
+    for column in DATE_FIELDS:
+        if record.get(column) and not validate_date(record[column]):
+            return f"{COLUMN_TO_HEADER[column]} must be in YYYY-MM-DD format."
+
+    # An employee has at most one active asset, but may also have removed ones.
+    first_line = seen_employee_ids.get(asset_key(record))
+    if first_line:
+        return f"Employee ID already appears on line {first_line}."
+    return None
+
+
+def import_assets(conn, file_path, imported_by, progress=None):
+    """
+    Import the assets in file_path and return an ImportResult. The caller commits.
+
+    progress, if given, is called with the number of rows read after every batch.
+    """
+    result = ImportResult()
+    seen_employee_ids = {}
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    buffered = 0
+
+    with conn.cursor() as cursor:
+        cursor.execute(STAGING_TABLE_SQL)
+
+        with open(file_path, newline='', encoding='utf-8-sig') as file:
+            for line_number, record in read_rows(file):
+                result.rows_read += 1
+                error = validate_row(record, seen_employee_ids)
+                if error:
+                    result.errors.append((line_number, record.get("employee_id", ""), error))
+                    continue
+
+                seen_employee_ids[asset_key(record)] = line_number
+                # Empty optional fields are written unquoted, which COPY ... CSV reads as NULL.
+                writer.writerow([record.get(column) or None for column in IMPORT_COLUMNS])
+                buffered += 1
+                if buffered == IMPORT_BATCH_SIZE:
+                    copy_batch(cursor, buffer)
+                    buffer.seek(0)
+                    buffer.truncate()
+                    buffered = 0
+                    if progress:
+                        progress(result.rows_read)
+
+        if buffered:
+            copy_batch(cursor, buffer)
+        if progress:
+            progress(result.rows_read)
+
+        if seen_employee_ids:
+            for column in HARDWARE_COLUMNS:
+                cursor.execute(ADD_LOOKUP_VALUES_SQL[column])
+            cursor.execute(MERGE_SQL, {"imported_by": imported_by,
+                                       "imported_on": datetime.now().strftime('%Y-%m-%d')})
+            result.inserted, result.updated = cursor.fetchone()
+
+    if result.errors:
+        result.error_report = write_error_report(file_path, result.errors)
+    return result
+
+
+def copy_batch(cursor, buffer):
+    buffer.seek(0)
+    cursor.copy_expert(COPY_SQL, buffer)
+
+
+def write_error_report(file_path, errors):
+    base, _ = os.path.splitext(file_path)
+    report_path = f"{base}_errors.csv"
+    with open(report_path, mode='w', newline='') as file:
+        writer = csv.writer(file)
+        writer.writerow(["Line", "Employee ID", "Error"])
+        writer.writerows(errors)
+    return report_path
@@ -38,21 +38,55 @@ Instructions:
     3. Run the script to start the application.
 
 Usage:
-    python asset_management_portal.py
+    python asset_management_portal.py [--startup-timing]
+    python asset_management_portal.py report --type "Assets Removed This Month" --out file.csv
+    (headless commands: report, inventory, metrics, import, archive, rebuild-rollup, migrate; see asset_cli.py)
 
 """
 
 
+import sys
+import time
+
+# Taken before the heavy imports so the startup-timing report includes them.
+LAUNCHED = time.perf_counter()
+
+# A command (report, metrics, import, ...) runs headless, before tkinter and customtkinter are even imported.
+if __name__ == "__main__" and len(sys.argv) > 1 and not sys.argv[1].startswith("-"):
+    from asset_cli import main
+    sys.exit(main())
+
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
+import bisect
+from collections import deque
 import psycopg2
-import bcrypt
-import csv
-from datetime import datetime
+import os
+import threading
 import customtkinter
 import ctypes
 import platform
 
+from asset_fields import ASSET_COLUMNS, HARDWARE_COLUMNS, REPORT_HEADER, validate_date
+from asset_repository import (BULK_UPDATE_COLUMNS, EDITABLE_COLUMNS, SORT_COLUMNS, SUGGESTED_COLUMNS, AssetRepository,
+                              sort_key)
+from authentication import Authenticator
+from change_listener import RESYNC, ChangeListener
+from dashboard_metrics import DashboardMetrics
+from db_pool import ConnectionPool, load_db_config
+from local_replica import ReplicaSyncer, load_replica_config, open_replica
+from migrations import (SEARCH_COLUMNS, create_event_partitions, create_missing_trigram_indexes, migrate,
+                        trigram_indexes_ready)
+from monthly_rollup import TREND_MONTHS
+from ngram_index import NgramIndex
+from query_executor import QueryExecutor
+import query_stats
+from startup_timing import StartupTimer
+
+
+startup_timer = StartupTimer(LAUNCHED)
+startup_timer.mark("imports")
+
 
 def make_dpi_aware():
     if platform.system() == "Windows" and int(platform.release()) >= 8:
@@ -62,7 +96,29 @@ def make_dpi_aware():
 make_dpi_aware()
 customtkinter.set_appearance_mode("Light")  # Modes: "System" (standard), "Dark", "Light"
 customtkinter.set_default_color_theme("blue")  # Themes: "blue" (standard), "green", "dark-blue"
-img = b'iVBORw0KGgoAAAANSUhEUgAAAgAAAAIACAYAAAD0eNT6AAAACXBIWXMAAA7DAAAOwwHHb6hkAAAAGXRFWHRTb2Z0d2FyZQB3d3cuaW5rc2NhcGUub3Jnm+48GgAAIABJREFUeJzs3Xl8XHW9//HX58wkbbqXbmlpi10pLbco5SqbC4p3xe1Cy47KUjYRxH0lV7lyFQWvCAIiYIECrYJed38gXgFRoAhiWZpS6JqkbaB7mmXO5/fHJGmWmWyznJnM+/l4DMn5nnO+55NJ6Pc9ZwURERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERkbyyqAuQIlXlcfZvGEmsbBRhYwXxYHj7vNCGY15+YOEgThCO7LS+20jwePu0WRkwlMB3d96Q7cI80WG6Cfe9XZbZQeCe/D7RQhjbTXn5bppiDVRN3JPJjykiMlgpAJSaT9UOx8PxlDWPJxFMwBiHcxAxhuGMASpwKggYC1QAw8BGYz68dXoUMAKj7ECn3v0vqb/TKdu8H8v22LYTaMDYh7Oj9fsG8Ddwb8CCfVi4E2wvRgPO67jXQ1BPEG6HlnqaZtdTZWGKLYiIFCUFgKLmxhXrKwnKKrHERMzG4YwDxgPjMBsHTEx+z3jwccBQIPMBu9N0wQeANG3e83Kd2x2nnoB6YDt4PWb1ONuBbQS+HWL1JLweC+pobNlE1Yz9aXoVEYmcAkAhu3j9WMrKZhLzKeCTMZ+C22RgJuZTwA4Bkrve+zTg9jDgKQCkNuDtOBhv4NSAbcGoAd+CsQ7zGiy2hZaWtXxu1s40WxYRySkFgKhUeZydm95Ec3wOQTgbsxmYH4xzMDAd88lAh2PkXdYf0LQCQOe2nAeAvqz7OrAZ8w24bcZ8E1g1YbgWp1oBQURyRQEg1z62YQoWm4/ZTNxnHvjKfJLH1JO6DZDeZbrr/IFMKwB0biuIANBbn28A68DWYb4O/AU8XE25V/PxObvS9CYi0isFgGy4rH4UicaFBOHheDAbfA7GXGAmkDwbvt8DpAKAAkC6tva6a4BqjGrwtVjwEi32HJ865DWs6x+QiEhnCgD99bENUwhji3Dmgy0g8EU48zCCTstlPMAqACgApGvr5W8DdmO2Jrm3wFYRC1cR3/8sly7QJZEi0k4BIJ3Fq8uZeNAcWliE+aLWXfZvAcYB3QeRrA6oKAC09dvnZQfSNmgDQLq2GmAV7qswW02YeIFPzH5BewtESpMCAMBij3HQ5sPx2LHgx2AcjTELOnyqTzuAKQAoAKRqK8gAkMoOjKdx/xMWPEHIn/nEjB1pqhSRQaQ0A8C520YSbz4C8+OA43E7DmNsp2X6PIApACgApGormgDQ/XeJrcPCxzFbReiP8casv+omSCKDT2kEgHPrZhKEx4MvwjgOeAtZO2avAKAAkKqtmANAt2V3AU9iPI7bKhL2qPYSiBS/wRkAzt18KEHwbpz3YLwLGJebARUUAFr7VQDoYlAFgK5tLeBPY/we52FGxP7ER3XXQ5FiMzgCwNm1EykP/xmzE3HeDUzNz4AKCgCt/SoAdDGoA0DXtv3A42C/Jwh/y8WzntGJhSKFrzgDQJUHbKp5C24n4va+1hP3etmlrwCgANC1TQGge3tW3vPtwCPgv8DKfs4lh7yRZssiEqHiCQAfeXUoQcU/4X4y8K8YEzrNj2RABQWA1n4VALoo6QDQUQvwBMZPCe0nfGzm+jRViEieFXYAWLyxguFlJ4IvxvgAyUfRJhXEgAoKAK39KgB0oQCQus1fwH0lFruXS2a+nKYiEcmDwgsAS7cMoyl4D/hi4IPASKBAB1RQAGjtVwGgCwWA1G2dan8B85UYK7hozgtpqhORHCmMAPCRV4dCxX/gnAa8F3xocQyooADQ2q8CQBcKAKnb0tRurMb9x7gv45K569JUKiJZFG0AOLNmPrHgHPDzMMYfmJGFAUUBIMW0AkDnNgWA7u0RBYCOBRh/wlhGxd57OOeIvSl6E5EsyH8AWPz6aIY2n4r5OcBxqStRAFAAaO23z8sOpE0BoHt75AGgY9tO4H7M7uLCWY+lWFJEMpCnAODG2XUnAOcCJwO97OJXAFAAaO23z8sOpE0BoHt7QQWAjo3Pgt9OWHa3LisUyY7cBoDLqofwxqhTwT+NcXiPW1YA6DKtAKAAkK6tFANAe3sjsALzb7B0zuo0S4pIH+QmAJxeN4mYfxy4kG6Pz02zZQWALtMKAAoA6dpKOgAc6Mj4Nca3uWD279OsISI9yG4AOL1uEjE+gftlGMN63JICQC/TCgAKAOnaFAC6eIKYX8N5s3+hWxCL9F12AsBZ2ybj4ZcwPw9nSMqeFQD6Oa0AoACQrk0BIM28VZh9hQtm/aqHJUWkVWYBYPHWEZQlLgX7ItZ6w550PSsA9HNaAUABIF2bAkCP84wnIPgsF8x8tIc1RErewAJAlQe8vPUCzK+G1uv3C21AUQBIMa0A0LlNAaB7+yAIAG0bclYQJj7JxYdu7mFNkZLV/wBw2ta3YH4jxjEFPaAoAKSYLuDfV8o2BYDUbQoA/Zi3D/drGdv0dZYsaOqhB5GS0/cA8JFXh9I47GrgCiBW8AOKAkCK6QL+faVsUwBI3aYA0K95yfl/IwjO4byZz/WypEjJ6FsAOL1uIbAMOKLzmgU8oCgApJgu4N9XyjYFgNRtCgD9mndgfjPm15HY+WUuPKq5lzVEBr2g1yVOq1uK8xQdB38RkeJThvNZgtEP8YN1k6IuRiRq6XPzR14dyv5hNwMfTrlkoX+i1B6AFNMF/PtK2aY9AKnbtAegX/NSb38DQXAy5816upc1RQat1HsAFm8dQeOwn9M2+IuIDC7TCcP/47a1/xJ1ISJR6R4ATt8ynpj/AefECOoREcmXYbj/jB9UnxJ1ISJR6BwAFm+sIIz9DGdRRPWIiORTOcZyflj9T1EXIpJvHQKAG0H53cCxkVUjIpJ/ZTgrueOVf4i6EJF8OhAATtt2GfAf0ZUiIhKZUSTC+1mxsSLqQkTyJRkATt46B/drIq5FRCRKh7GrsSrqIkTyJRkA4l4FXR7fKyJScvxyflA9NeoqRPIh4NS6WTinRl2IiEgBGAJ8MuoiRPIhILTFQCzqQkRECoLZqbj3dmshkaIXYKFuhCEi0s4nc/uahVFXIZJrAdjsqIsQESkoYTAn6hJEci0AJkZdhIhIQTGrjLoEkVwLgJaoixARKShGY9QliORaAPb3qIsQESkoIc9EXYJIrgUYf4q6CBGRArKL0Y3PR12ESK4FYMuiLkJEpGC4LWfJgqaoyxDJtYD7JzwDPBZ1ISIiBSBB3G6KugiRfEjeCtiCy4Ew2lJERKJmt/HRWdr9LyUhGQDun/AMuFKviJSyLZQ1fzHqIkTy5cDjgEdPuhJ0QqCIlKQWPDyNDx9WH3UhIvlyIADcas1Yy2nA+ujKERHJO8ftUi449NGoCxHJp6DT1H0HbyS0E4Et0ZQjIpJv/jkumH1r1FWI5FvQrWXlxLWEwbuBdfkvR0QkbxK4fZzz534z6kJEotA9AACsnPAy5c1vBR7PbzkiInmxH+cMls6+IepCRKKSOgAALJtaT6Lpvbjdlsd6RERybS0hx7F0zoqoCxGJkvVpqdNqz8DsZmBk5zU9fU8ZTXuW+wPMe5k/0GnPcn9t07mot4B/Xynb0ry3WWvr4f3IeDsp3pOsbaeXv43+tHVrz+N73p/1e2rvbV7n+fdS4Rdx1pxdvawhMuj1LQAAnFbzJiy4FXjvgTULeEBRAEgxXcC/r5RtCgCp2xQA+jUvOX87Zpdz/qzlvSwpUjL6HgAAcOOMunNxuxZjbEEPKAoAKaYL+PeVsk0BIHWbAkC/5sF9xP3jnDtnW49LiZSYfgaAVos3HkRZ2VXApUAsZU9RDygKACmmFQA6tykAdG8fTAHAXwK7kqWzf93DmiIla2ABoM1ZdUcQ+reB9xTcgKIAkGJaAaBzmwJA9/ZBEQC24lbF2Jm3ssQSPawlUtIyCwBtTt96PLHwapx3pu1ZAaCf0woACgDp2hQA0szbDX4T+/k6H9dJfiK9yU4AaHNm7UlgnwF/e+QDigJAimkFgM5tCgDd24syALyB+Q2Uxa/nozN2pF1KRDrJbgBoc9aWI3G7ArPTgXjKLSkA9DKtAKAAkK5NAaBVHfjNlMe/o4FfpP9yEwDanLHlEAL7ONj5GKN63LICQJdpBQAFgHRtJR8AVgE3MLbxXpYsaEqztIj0IrcBoM3i10cztPl88MuAQ1JuWQGgy7QCgAJAuraSDADNGD/BuIGls/XYcpEsyE8AaFPlAeu2HYuHZ2OcCQxPXYkCgAJAa799XnYgbQoA3dsLLgC8ALaMmN3JBTPrUiwtIgNkLKmrYuvEq/mDteR1y0tfH01D0xKMjwDHKgB0nVYAUABI1zboA8BW8OUE/iOWzn02xRK5ddvLb8WDyVww52d537ZIHhlL6hx4ErczWTlxbSRVnLNlOtjpmF0IzFAAQAGgrd8+LzuQNgWA7u2RBYAm8N/hLCO286dceFRzmmpzp8oDplZfBvZN4HOcP+f6vNcgkkdtAQCMXTiXsmLS3ZFVU+UB6+vehfvJYB8AP7h9XkEOqKAA0NqvAkAXCgCp2zrV3oz5H7DgAVqaVvKxw+rTVJh7t607BMK7wN/e2nKlAoAMdh0DQJL7Lwn8Y9w3+bXIqmrz4ZoFGIsxlgCHdZpXEAMqKAC09qsA0IUCQOo2bwB/GOznGD/l4tlb01SVH1UecPAr52N+LXS6UkkBQAa97gEgaR/GtSS2f52VBXKZzbl1Mwn9fQQsxv1YrEvFCgB9mFYA6NymANC9PSfv+RsYD+H+C2h8gEsX7ElTSX7duubNmN2C8dYUcxUAZNBLFwCS086zBFzCvZOeyHtlPTm/dgYJ3of5e4F3ASMUAPoyrQDQuU0BoHt71t7zv2M8RMgv2L7h/6g6Ib8nGffkpvVjKWuuAk8+zCz1+6IAIINezwHgwMQvCLiS5ROr81VYny32GKNr3ozbiZifiNs7gHIFgFTTCgCd2xQAurcP+D2vxXgU94cwfs2lszem2Vp0bnm6jGDMR8G/Bkxsb1cAkBLVxwAAGM04d2B8hXsnFe71uGfXDqfMjsHCEzFOBI4ETAEAFAC6tikAdG/v83u+B/gzxkME/hAXz3oG6/pHWyDcjR+uPQW3a8BndZuvACAlqj8BoM1O4H9oafofVk57PafVZcPSbZNJNJ9IwDuBo0meTBgoAGSjvzYKACUQAN7A+DNujwEPUTljVcE/atfduG3t+3H7CsaRrY3dl1MAkBI1kADQNr0H/HaC2H9z94SaXBWYdZdsHUFLy5sxPw44Hre3ARMUADKZVgAYZAEggfEy+Cqcx4j542yf/SJVFqbpobBUecDUtf9OaFcBi4DUv/M2CgBSojIJALT+z7QXuBVruY57pm7KQY25d/HmQwmDt2F+NM4xwOFY61MM2ygA9DCtAFDkAaAG87/gwRO4/5nmYav4dOXeNEsXrlueLsNGnwZ8AWxep3kKACLdZCMAtE03Aw8Q2v8U3FUD/XV27XBG+FG4H4nbP2C+EGM+UNG+jAJABwoARRMAnPUYz2P2PPiz4H/m8lkb0lRVHL6/diIxlgIXA1NSLqMAINJNNgNAx5nPEHALsX3LuHPG/mwUWhA+tmEKYWwRsAiz+cAC3OeR1XMK2qYVABQA0rX1KQDsAqsGfwG3VVi4mlj4HB+fsy1NBcXn+9VvIbCLgLOxDuE8FQUAkW5yFADap2vAlhEEt7NswprMSi1Q524bSUXj4TgLCWwh+ALcDsWo7LScAkDP0ynbFABSt3X622jAWIvxAqE/h9nfMXueT8x4Lc2WituNq0cQG7oY8/OBY9vb072v3eYrAIi0yXUA6DBtq4Bb2W/LWTmxMO4ElkuXVQ+hZdTBxFsWEDIf85mYzcR9JmZvwgg6La8AoACQvq0R2Ay2DvMXcFYTC9dBfB07p79WNCfnZeKmtYtad/OfDozsNl8BQKTf8hgA2r/bBdyP+b3MrPy/kvjHq6ulW4ZRkZhNGJsNPgdjNmazwd8ETAaGKAC09tvnZQfSVlABYBuwCbO1uK/FbS1BuJZEfC2fnb4lzVqD2y2vTAc/FecjwPweB3kFAJF+iyIAdJyux/kJFtzFsgmPd//YW6IuXj+WoUyB+GRCnwI+mcBmkjzBaTIwE2Nsp3UUAAo5ALyBsQ63Gsy34NRgbMHCdSTiNVjDBj47b3eaCkrLbRsPoqXxJJyzMd5Dx3dRAUAkq6IOAB2nX8W5H/xBllU+pTDQi8vqR1HeNBXCgwl9CgEHY4zDGQeMw1q/0j6NAkDXtgEHgH1g9ZjX42zH2U5APXg9BNsh3ICHWwhjm2g+pK4k93L1x3erJ1DO+3FOBXs3RizlcgoAIllVSAGgA9+C8b/gP2Pk3ke4YU5j18KlH6o8oLF2HE0+jsDHYYkDISG0CQSMJ3lcdRRQATYc89bvGQ6MpsdzFoouAOwBbwB2A7sx9mPsxtkN7E0O5FaPU0/M68G2YWE9Vl5Pmddz5bSGFL1Kf9y4djYBHwA+QPJkvgODfn/CWF/mdZqvACDSplADQMfpXRi/wf0XxGO/47YCfg7BYHZZ9RCGlw+DcDShVRDYMILYGGAolhiGBWPwMPlbSz6qeUyn9Y1hWDDkwLTHwEbREwsbgX1d+nmjy1L7MDoERN+DsR9sFxbuIfQGwthuaN5DRUuDdrVHpOqROBOmvRXj30kO+guA/p4nkZ4CgEi/xXtfJHKjcJZgtoRECB+teQHj5xA8xO7tf2TlgqaoCywJyb0wjdBtABZJ7aY1MyE4MfmkTt4LjEk5AItIJIohAHQ1H2c+Fn6WkQft4tyaP2D2e8we4baJz+vcAZGIfLd6KoG9B7MTgffgTI66JBFJrxgDQEejgPfj/n5wOK92O17zB4xHCPkDd1S+qEAgkiPXvzqGeOJd7QM+zOttFREpHMUeALoaj3EKcAox4Pza3VD7N9wfg/BxhvqfuHFqfdRFihSlm9bMpCU4niBYBH4cHr4Fs6D3FUWkEA22ANDVSPDjMI7DDJoMlm5Zh/M4kHzU6dTJf9VlWiJd3PLKaBr5R5zjgUUYx5LgIAxw7VQTGQwGewDozplJ8kY6Z2PAlppdLN3yJAFP4PZnypqf5Xsleuc1KU3frR6C2+EQHA3h28COppE5QO9n14tI0Sq9ANDdKOBEnBPBoTkOF27ZgbEaZzXwAs4q4BlunbKvl75ECtsNG6bQ0jyfIFhA6MmnWrofDrReoqkRX6RUKACkNgZIHjqA5L+JRoKLt6wHfwFjFR6sJuAFJlS+qEMIUnC+8dJIhsbn4sECQhZhzMc4gkTLBMySu/G73stDREqKAkDfxYCZYDNxTsI8+W/n1pqdXLL5eQJeBNYS2lqCRDVlrOV63TFOcsjduO6VqRCfDeFs8NmYHQr8A8YMQtpuzCQi0o0CQMZ8NHB868lSyasOPYBm4GOb3wCSj3DFVuO+jiBYR0v8ZW4qgUciS3Zcs34sZczEEgvA5oMng+h1rx4KwQjad0BppBeRvlMAyK2xwCLcFiUPI7Tueo01O5dt3kRANe5rgQ0YG3E2EwabaWKDzjcoESs8xqsbJxEkpoFNAZ8GNg18FmZzwGdDOBQAt55vaSsi0g8KANEwjGk408De3aEVYp58BM/lm/ZjbAHWATWYbYEw+dWCdcRaavjmtBrd6KiAVa0up2LkeEKfTCwxE2wKxmSwKcm75PlMXls/HfPW/w/bfpVdv4qIZJ8CQKEyhkLrJYtAcjCw5BcPk4cZrtzcAJs2Atsx6pNfvfVrsA2nHrd6YtQTBvWMmLRdJyxmoGrrCOJ7xlEWn0CYGA82DrdxEI7DbDyBjcN9As54zCsxJkICApKf3tt5mu9FRPJHAaC4VQBzW19J7QNN26N0HULAQti7CT69sb49LLjXEwT1eLiDgAawnYTsBRoIbBfuezAaINyNxXYTWAOJlj28Mn0XKy2R1580E994aSQN8QooG0FZOApnKB6MAB+FUYHZcPDRmFXg4TAIxmB+UOtAnhzoYRzsGwIBhCHt++KtNZh1vEGODsWLSBFQACg943DGYcxtPyehbc8CdD7G3P59kJwOHSyA2ZvgCxvbHtW7A7whGRTa7cU48JRGoxms80mPFu7Agg4ff30fZo04Yw+0hWAMB8o7LFcGNoKON6B1xtD2EGIjhjMKGAFUYIykiQNPmw+Dtss6O6zvHQZwS/6s7ZVpNBeRwUkBQAZqSOtrbG8LJo9edN3VbXS/pWyK3eFtY3LH9dIs2mO7iIh0ogd5iIiIlCAFABERkRKkACAiIlKCFABERERKkAKAiIhICVIAEBERKUG6DFBE+ms/ztMYm8B2dZub6lLMdM8wyNZtFnq7/LOnZyikqsF4PrOCRAqfAoCI9FUtxlex/Xdx6QI9zVKkyCkAiEjvjL8QBB/k0hm1UZciItmhACAivammufzfuHLa61EXIiLZo5MARaQ3l2jwFxl8tAdARNIznuWyWQ9FXYaIZJ/2AIhID/yXUVcgIrmhACAi6bmti7oEEckNBQARSc9Nl/uJDFIKACIiIiVIAUBERKQEKQCIiIiUIAUAERGREqQAICIiUoIUAEREREqQ7gQoIrlx47pP4T4e6PBRI+y8TH8+gmTycWWg62ayzYE+6jjo7dnGPa2bg/WieN977Mv/j8WH/jqLPZcsBQARyRG/AGNu57Yuo2KqsS7dwNnTuNjbYOvdvunbuplssycDXTeKbaZ8Dzo05uv9a+vLDEABIAt0CEBERKQEKQCIiIiUIAUAERGREqQAICIiUoIUAEREREqQAoCIiEgJUgAQEREpQQoAIiIiJUgBQERESoN7JrdSGnQUAEREpDT8eM1XuPelKVGXUSgUAEREpDSYz6XMHlEISNKzACQXmoCtOE0YCWBXL8s7zg4MksvbLvAWnN2YNYPvAWvCfC+wH6cBaABrwRiLh0eBvQ8Yn+OfS0SKnTOXuD3MT154NyfPr4m6nCgpAEg2PYj7jWzf9kduPao5r1u+tnY4Dfs/AXYV+rsWkZ7NI4z9vtRDgP6hlCzw3RhncPUhv4ishE9X7gWu5j/XP4HxS2BIZLWISDEo+RCgcwAkU02YnRTp4N/RVYc8jPulUZchIkWhLQRMjrqQKCgASKau4b+m/zHqIjr5yiG3A09FXYaIFIWSDQEKAJKJvbQM/XbURXRj5hg/jLoMESkaJRkCFAAkEw/xzQm7oy4ipQSPRl2CiBSVkgsBCgCSiZeiLiC9pk1RVyAiRaekQoACgAyc+56oS0irrGx41CWISFEqmRCgACADZ0Hh3k2rhTdHXYKIFK2SCAEB0BJ1EVK03hV1AWkF9qGoSxCRojboQ0AA1EVdhBQrP4wvrj8+6iq6qVo/E+ecqMsQkaI3qENAgLMu6iKkiHlwPZdVF85d96q2DMO4F90JUESyYx4+OENAgPlvoi5CitpRjBjyI6pWl0ddCFWbpmItD2O8NepSRGRQSYaAFasroy4kmwI89hMgjLoQKWLGqTSPeoQvbMr/iXdVHuer647gP9f/N0HiJcyPznsNIlIK5hHEHxlMISDOygkvs6TuJ8DiqIuRYubHYr6KL214HLeHIFwP7AMgCEZD2OWKE4tjPrJbW2AjweN461fzkWBx6PjVyzAbAZTBhko8VpaXH1FESl1bCDiBJQtqoy4mU8mnAVriKoi9Hx03lcwEOG8HfztmB1rd6TQNYO3/6dzm3rZS8uWAdWxLsZ6ISP4MmhCQ/FR2/5QXMb4UcS0iIiLFYB5B/P/42UuFey+UPjiwW3bexOvAfxVhLSIiIsViLs32cDGfE3AgAFRZyL5wMfCX6MoREREpGvMIYkW7JyDeaernU/Zxet0HCPl/wD9EU5KICOBsw+y3EK6DYF/7KSCp9HZaiHf7pm/r9rTNTG6k3mO9PczM5PSXga6b8j3ocOFY2n6tAjgEeC9w8AC3nmWx+yDxt36v1tPfAUCzvRX46YBKilC8W8u9k+o4Y8c7CRt/BeiSKhHJt61gn2PczGUssUTUxUiG3I37Xz4F+BbY9EhrOWXOz4GfR1pDAUmdYZePeYMyPxF8RZ7rEZHS9iJm/8hFs+7Q4D9ImDmnzVtJEDsK58moy5ED0u/EuqtyL/dNOg34NKD/EUUkx/x14i3/zoWzNkRdieTAkjnb8LL3A5ujLkWSejmKZc59k75FyDuBV/JSkYiUKPs6F8x7NeoqJIfOmFkHfCHqMiSpb6exrJj0OC32Zoyb6f10CBGR/mqkvOXWqIuQPJi0ZTnwetRlSH/OY105cQ/LJ12M2zuB53NXkoiUHvsL583bHXUVkgcnnNAC/kjUZchALmS5b+Kj1Ew8EvNPADuzX5KIlJ5wY9QVSD4FA/99h7oXeLYM7ErWP1gL91R+h+bmmWDfAPZntywRKSkWRP84ackfD4cOfOVwdPYKKW2Z3MoCVk57neWTPkfoh+G+DGjJTlkiUmLmRF2A5JHZ7AzW1d9KlmQWANrcN/k1lk/+MG6H4twGNGWlXxEpDe5H8L11h0RdhuTBg6+OAd6RQQ9vZ8Xqg7JVTinLTgBos3zSOpZXXkAsnIPxHWBXVvsXkcHKCMLPRV2E5EFj46eATA75lOHxT2WrnFKW3QDQZtmUDdxV+QnKY1OBK3Bey8l2RGTwMJby/VdOiroMyaEV1ceAZT54G59i5Yvvyryg0pabANDm9gm7ubvyf2iaNBvnA8DP0HkCIpJaAL6cm6s/EHUhkgP3v3QCifDnwJAs9FaGxx7g/jUnZqGvkpX/yyk+srWSROIcLDgX/NDUlXj3yjKe9l7mD3Tas9xf23Qu6vVe5g90Ogu/r5Rtad7brLX18H5kvJ0U70nWttPL30Z/2rq1d3nP3U7l8pkDeybIja+8DMztvI0+1e4Y95PgW1w86xms6/8MUlTue+FwiF3MM74RAAAgAElEQVQBfASItbf3d/RJvXwC92XE+A6nzOv/U/5KnLGk7i7K4pdyz7j8H68/Z+vxEJ4LLMYYcWCGAoACQGu/fV52IG0KAN3bCyIAdLQVZy2wr8f9lb0NJgP9qJPJNge6f9XCHublapv9ndeHTGZUYMwApvR7mwNbvgZ4FdjXz5571+P72sPvC1LUHfsGJ899KLOCsiMOnEVLy7GcWnsm91f+Oa9bXzbxMeAxzt12OYnEEuB04F10TIkiUsomYkzMXncpBq5c7QftaYwcTNssnNvyTG59dZfTGvvbuS/LSRkDkMw1zkywRzmt7su8y+N5r+L2Cbv5UeUP+VHliTSFlbhdAPwGaM57LSIiIiWg446NOM5XmbR1FafWHh1ZRfdO2c6yytu4c/K/wv6JOB8GVpKL3ToiIiIlKtWRjYVgj3Na7Q2cWT8q7xV1dOeMHfxo8jLunLyEpvLJmJ8FPADooSEiIiIZSHdqQwD2MRItL3B63VlUeW4vF+yLe8bt4vYp93DH5JM5pPIgQn8HblcDfwESUZcnIiJSTHob2A/GuYuXtj7JGTUn5KWivqiyFu6c8ih3VH6Z2ycfzdDYGLD343Yr6KZDIiIivenrCX+L8OD3nL7154Qtn+X+KS/mtKr+umniHuDnrS+4YNNcwtg/Ae/FOAEYGWF1IiIiBaefZ/z7+whi/85pW38FfIX7Jv41J1Vl6gdT1wBrgO+x2GOMqZ2H2yICPw7neOAwCuniFRERkTwbyCV/AeYnYfwbZ9b+GLiaeyqfz3ZhWbPSEsDq1lfy+stLtlbS0nI05scR2jEYi4AMnk8tMqhsBp4Ce4p4+ETUxYhIbmRyzX+AswRYzBm1P4PwepZP+WO2CsupmybWAj9tfcHi1eWMHfcWCI/B/Biwo4HpUZYokic7gKcwnsLtSYL4U1w2fUvURYlI7mXjpj8GfBALPsiZdc8A19O0fQUrFzRloe/8SNb6l9bXdwC4eP1YvPwI8IUYCzGOwDkc7SmQ4rUN7HkI/4bzNCFPceXMat1rX6Q0GUvqvPW7rnP6MJ32Xuo1BNyEx37I3RNqslBnYVjsMSbUzAVfCPZmYGHye6bqWQAZ9peyTc8CSN3W6/30GzBWY/Y8Hv4d+BvNwd/5zIzaNFvPjew8C6D39t7m9bT9TPrN5PkDPc7rIY/lbJv9ndeH/3cymZeN5bO1bq/r95Kfu61r53DyoXdlVlB25Oq2v5NxvgaJqzir9hfgt9FY+ZvW4/HFK1n/i62v+9vbz9t4EBX2ZkKbjzEXmAM2B/wQcvcei+wCX4tZNaG/BDxPnL8xeeY6lhT5/2siknO5HpziwAfBPsjQuo2cU3M7LX4Hy6esz/F28+uH014Hft/6OmDp02WUVc4gYA7OXAKbDczBmUPyHIPob7Akhc3Yh1MNVg2+Fqwa82oC1nDFzLqoyxOR4pWrQwA9TTv44xDcgzWvZNnU+n5VPFhcVj0ERszCwjnAHAKmA9NxDgY7GAsr6fiu6RDAANbvra0gDgE0AOuBjQRsxNmAsx7jNcKWtXx2zqY0lRU+HQIY4DwdAsjK8tlat9f1dQigPwzseMyPh/h3+XDtbwhZTkX4v9w6pXQe+HPDnEbghdZXd1Wry9k9djItTCPwqeAHA9OAqSSfrz0dqESPTi5ke4FaoA7YiNlGzDcC63HbSEvzRr4wZ1u0JYpIqYr6+HQZzvsw3kdjsI8P1/4WtwcI9v2CO2fsiLi2aFUtaCL5yTD94ZLFHmPqpkpiTCVkHNh4jHEY44DxwASw8Xhbm48DyvLzAwxKIc7rGNvAtuFhLVhd63QtZnUkwm2UUcveIXVUlVCgzb4NmH2fMPwtQ9jE/vKWqAvqZnTUBeRJyg+4O3uZPwiVDR+JJY7C/FTgFAbBIdyoA0BHw4APYf4hfGgzH6l9BAsfwOM/486J+T17uVgkT0rc3Prqm8++MpqwfCJYMhSEjCMIxwPDcBuB2SigAnw4yX/iKsCGgY9Nfk8FMCb7P0xOJYBdQBPGXmAfRiPOLpLXwSdfZjsI2YG1fd+SbI/5DvaHO6iasyvCn6GUXEuTf5mPz26MuhCRDt4ANgAP8JPqI/FwJTAz4poyEsU5AH2Y7nT81IFnMPs12K/ZM/EvRX81wWBQtWUYjWEFnhhNEIwgFib3LHgwEsKOwXIoTsWBAxUW4N7ls5ONwvzAoYzAmsH3dF4EJzlQd2G7cE8QBM0Q7gH2E9IAzXsYUtbM56bv0HXuERnIOQDGp7lo9rdyXJlI5lZUTyAInwCf1eNyBXwOQDEEgK7zX8f4HcZvaG55iGXT+v7pV0Typ78BwPgpF83+UB4qE8mOH1e/BRJP09PhgAIOAIV0CKCvDsI5DTiNeBzOrXkJ+D2BP4wn/tB6SZ6IFBfHYp+PugiRfjllzl/58Uv3AWdEXcpAFGMA6GoeMA+3SyAecl7NXzF7FPMn8MSfuG1q8V5GJVI6nuXCGS9FXYRI//l9YAoABSAAFuG+CLgCYnB+TQ2wCgsfw+xxhux9qvUSPBEpHE9HXYDIgJTZKpqjLmJgBlsASGUycBLYSTiwf/g+zt/yNAF/wvxPNAV/5o7JuhZbpM0tT5fROPpwPLaIwP/CZbNy/7hv73hdmUgRaRz+BsHeqKsYkFIIAF0Nw3gH8A7coMxh6ZY1GE/i9jcsfBaLPcfNlVujLlQk5255uozG8Yfj4SLwRcAi9rMQYwjmENqpQO4DgDE+59sQyYldE4r1fmylGABSmQvMTd6C08BDuGhLLfAc2HOYP4cHf6Ny0ktUWeHdkESkL77x0kjKyg/DWEhgR4IvooEjsHBIcgEjuru6+NERbVgkM0GsaP92FQDSq0y+/J9xwEKoq2nkoi2rMXuOwP+G23M0tjynKw+koNyyZRj79x1GInY4Fs7HgsNxn4/xpvZlvNBujWDzuPGVf+TSWU9FXYlI/9jZxXo7RAWA/hmCcST4kcnft8OQAC7ZXE9ANdgaPKzGrBq3aoaXVfPNCbujLloGqWvXTiQenwXhbLDDwBeALWDv/hlYEBzYo1Uk/zgFfi0r/D16lLEUjQdeejehnxR1GQOlAJAd43DGJXdjWjIMmsO+JvjY5lpgDQHV7Y919UQ1Zazl+mkNURcuBczd+ObagymLzyJhswl8FthsSLR+ZRRh2OWmXEUy2Kf2Tl5f+y3cr9TdG6XgPVg9i0R4bzH/P6cAkHvJQwnOO5KTDhZAAueyzZsI2ICzEbPNeNsjYRObSfhGxk+rpcrCSKuX3Plu9RD2lh9MWWIqznTcphL4VNymg83g26/NJhYfSkgyULYFy4yfbVrA3K7gllcmc3v1ZZyrJyVKgfrJS+8nEd4OjIu6lEwoAETHMKbhTEtOeodzsAKIO+zY3MwVm2pJPoBiE7CZgI2Erd+bb6Bl/3bd16DAuBvfemUCVjaeMJwATCH0gzGbhjEdbCr4VPZTSSyE0JK/ewO8bXAv3k8VWXAqTfZv3Lz2HpzfEfh6Et7z00GH5qmyqA2JuoAsKqbfWSIsw2wixlHAEpyiPfGvIwWAwlYGTAOm0XFcaBssMCirgCs37cZ8O9g2jO049QStX51tmG/DvZ641xNLbKd8Rr2uZuiH6zZW0JAYg/loQjuIuE8gDCYS+CTcJ+A2noBKjIk44/nG+gkQi9Fx5411/NRe0oN7X40ELsK4CDcIrOcdH739Nad7FkGneT2t1895GfXbw99Hb2dH5OJnSTmvh+fA9LXf/v4LlMmOr0x3mgWDc6+bAsDgMBJsJDCj26HgtqAQGIQOYQDNm+AzG98AtuHsJPCdYHtwGoDdGLswawDfC7YTZx9GA9gbGA04+6BlJ0FiLy0j9xXciY5Vr46BeADhGMpjcVoSI8HLMRuOUQEMxWw4Ho7AGI0zBhhNwBhgbOvTCsdglvy6P1F+4H0k+Sm9bZc8HQYmjesiUkQUAErXWGBs+27n9r0KbTokifZ5rW1G8jwGAojvhy9saFu3CdjbvgyE7Xd4a3tWlvsuzBIdtrUPp7HTMkDr44FHdS/bR4LFuyT64UA5xkja/6ZbP30nEgdCUNuPYBw4M75jUGofwLssKyIyCCkASDaVt74OsC4nyViKETXVIOsdRmTrbWEREemv9M8wFhERkUFLAUBERKQEKQCIiIiUIAUAERGREqQAICIiUoIUAEREREqQAoCIiEgJUgAQEREpQQoAIiIiJUgBQEREpAQpAIiIiJQgBQAREZESpIcBiUihagGeAl4Den7kdG+PYm5/hlSKBXP1fKmeauppm6ontUzqyPRnMC/DGQ92JHBwhr0VDAUAESk0u4FvMiT2PT46Y0fUxYi0czdWrjmOmF+N2zujLidTCgAiUjjcXsXCk7hozgtRlyLSjZkDj1Hl7+Yf1nwN5wtRl5QJnQMgIoViJ7Hg3zT4S8GrspCTD/0i2PejLiUTCgAiUhjcqrhwxktRlyHSZ2HFJ4FNUZcxUAoAIlII9rC//JaoixDplyXTGoCboy5joBQARCR6bo9w5bSGqMsQ6b/Yr6KuYKAUAEQkeubroi5BZEDCoGj/dhUARERESpACgIgUgjdFXYDIgMRb3hR1CQOlACAiheDdfLd6SNRFiPRbyL9GXcJAKQCISCEYSZldGHURIv1yx6tDwS+JuoyBUgAQkQLhV3Hj2tlRVyHSZyOb/xuYFnUZA6UAICIFwg7C+CU3vzIn6kpEeuRu/HjNF8Evj7qUTCgAiEjhMOaCP8ktaz/JsueGR12OSDcrXlzET17+DfjVUZeSKT0MSEQKzRicb7Fv+NXcvPZxYCPQlNEjXds/6oQ9zOunrNTTz3m9GWhN/a6nj8/yzeajhDN5X7LzUXcMsAiYlZXeCoACgIgUqqHAe/q0ZJ8HmhQL9jSWRfEMeu+hoEjqyVG/2QwHveljXkkrn7XmkQ4BiIiIlCAFABERkRKkACAiIlKCFABERERKkAKAiIhICVIAEBERKUEKACIiIiVIAUBERKQE6UZAUtiMvUATsAtoAXaAt2C2GwBnDHA4yZvGiIhIHykASDbtBf8pbr/HrYYgbAbA2Y/R0GnJrnfm8vge4i3NUNbC/ubdNAb7uX56A31RtWUYQfN/AFcBepqciEgfKABIlvg9eOKTfH1mXd43XTVlH3A319Y+SEPj7cCSvNcgIlJkFAAkG77Gfx3ylaiL4NOVe6nyMwnWjwL7l6jLEREpZDoJUDL1AF+fdlXURbSrshbC+AXAnqhLEREpZAoAkolmgsSnwDJ91lZ2VU3dhHNP1GWIiBQyBQAZOOMRrn7Tq1GXkZr/POoKREQKmQKADFzoj0ZdQloeeznqEkRECpkCgGTA8n/Gv4iIZIUCgAyc+aioS0grlpgedQkiIoVMAUAysTDqAtIK7cSoSxARKWQBsDvqIqRY2b9TtWVY1FV0c23tcIwLoi5DRKSQBUBN1EVI0RpHY3hF1EV009B4HTA+6jJERApZgPF01EVIETO/ii9ueEfUZbT76vr/BJZGXYaISKELdL20ZKgc55d8cf3iSKv46roj+Or63wHR35JYRKQIxAmbf4aV1wKVURcjRWsE2Aq+uPFhLLyZROwRrplan3bpxR5j1obOVxAMtQrw5CN9E4wFIMZYQowYY3AMGAMWYD6a5OGr0ST/bhfhHI7l5GcTERmU4qyc1sDiumsxvh11MVLs/D24vYcghC9taAD2t84YhRE7sNxGsC6jdciBtrZrU9zB6PLoYE9Oa7AXEclI8p/asRNvwFgVcS0yuFQAY1tfsV6WFRGRPEsGgFutmYR/FGiMthwRERHJhwM3AlpZ+Txu55DcGSsiIiKDWOc7Aa6YuALnMxHVIiIiInnS/VbAKyZ9G+wytCdARERk0Er9LID7J34Pt/OB5vyWIyIiIvkQTzvn/ol3cNrWteAr0D0CRDpqBh4Hew0Lt+Ktdynoi/5cvph2We88meklkZ6izdrnvZRh7yJSoNIHAID7Jj7K4u1HEUvcC7w9PyWJFKz9wLfAruPzh7wRdTEiIpnoOQAArBy/mcV+AvGtnwS+CgzJeVUihWcrYfg+vjTzyagLERHJhtTnAHS10hLcO+mbBP6PwF9yW5JIwWki5EMa/EVkMOl9D0BH91Q+T5Ufy8t154Jdgx65KqXA/Pt8acafoi5DpECtAdYBm4FEn9dKde5JTzI51yWntw7vb+eJ6pyUMQD9CwAAVRYCt3HOpgdpiX8FuAgoz3ZhIgUj4ddHXYJIwTHuJBFex1mHPR91KTIwmeeiM+pmYn41cFqn/rr23K9pz3D9VNO9nDk94GnPcn9t07mo13uZP9DpLPy+UraleW+z1tbD+3HAi3zxTfPTzpX0bnzlZWAukPo979TeS1tP7b3N62n7mfTb5232d14PH41zts1+zHP2AWdz5twHeqlGClzfzgHoyfJJ67in8gw8OBL3n6AbCMlgYqyPugSRgmJ2oQb/wSHzANBm+cRnWT75FEJfCCynP8eCRAqVszfqEkQKhy3jjDl3R12FZEf2AkCbeyev5p7KMzHmgH0DTNdLi4gUv10kmj8XdRGSPdkPAG3uqnyVuyd9Do+/CeNKjII581FERPrLPs/Z82uirkKyJ3cBoM0943ZxV+X1LKucSxAeBdwK2q0qIlI0nGeIz74l6jIkuwJOrZuVt639aMoq7qq8kP3lB4NdhPNU3rYtIiIDEYJfzBLTeV2DTIDzVxbXLc3rVlcetJNlk27hrsq34uH85LkCbMtrDSIi0jvjNs48VHfBHIQCYCTGLZxadw+LXx+d9wrumvIiyyZ9jn31U8FPArsTeD3vdYiISFfbaUp8IeoiJDc63gnwDILmY1lSdxErJv0275WsXNAE/BL4JUu9jOaad+PByeAfBCbkvR6RTH3ztZNx/6dObf259VaqM3QC6NM9VLOyHSAMb+Xy2av60ZsMJuaf58OH1UddhuRG11sBvwnjN5y69ReEwUWsHL85kqputWbgt8BvWewXM7LmGJzFYKcAUyKpSaS/nLcBfTu81tcBO9XY39d1+7Scd9lO8DCgAFCanmLN3NujLkJyJ81VAH4SscTznFZ7HnhOH6PQq5WW4PYpj3HHlMs5pHIa7u8Avgn8LdK6REQGrwSBXdj67BcZpHp6GNBYsNs4re4iqPk0903+Q76KSiv5x/ho6+uznL9pKmHwr7j9C8aJwKhoCxQRGQzs+5w+569RVyG51YenAdpRYI9wet3/Quyz3Dv+pdyX1Ue3Td0E/AD4AVUeZ/PWt+Lhe3DeDRwDDIm2QBGRolNHU/zLGfVQ5QFzX/5vAsveieWZ3LUm93e8SS/Kfegdf273N8CeZWf5T/nojP3Qv8cBvx8S/8YZdbfRnLiGlVM2ZLfSDFVZC/Cn1tfXWLplGGHsOCxxAm7HA0cBFZHWKCJS8OzTfHTGjoy6OHTNeWCf7nkzGW2hf/pw3myPeqw1084z2XZ/+3EY07ieB19ewocOfbI/AQAgjnMR8di5nFl3B564huVTCvNpabdO2Qf8v9YXLPUyErVvIfBjMDsG/FhgWpQliogUmD9yxuy7OTODHpa/PB64JlsFSdYdAv4bHnzxyP4GgDblOBdCcC5n1P4I7BqWT1qX1RKzLXllwZOtr/8B4KKNBxPGj02GAT8a7EigPMIqRUSi0kwiuBSzzD7SBlyDMy5LNUlujAX70kADQJsy4Hzwj3Jmzc8w/w53T3k0G9Xlxc3TNgMrW1/wkVeHUj7kKLC3gb8Zs4Xgh5H8OUVEBi+z73LO7L9n1Md91Ufj4blZqkhy618zDQBtYmD/gdt/cGbdKpzrGTFxReun7uJx54z9wGOtr6TFq8uZMHo+xBaCL8Q5AlgITIyoShGR7DI205D4z4z6WOExEmtuItpT7qTvKrMVADrwRRh3s6/um5xZezsBt3NX5avZ306eJO9Q+Gzr64BLtlZCy0LgzcBCsIXAPHDtLRCRImNXct683Rl1Ea65GHhLduqRPAhyEADaTcH4Es4XOLP295jdRWPTSlZOa8jhNvPnpom1QC3wu/a2Ko9Tt3U68ZaZuM3EPPkVXwDMpX9XXYiI5MNDnDFnRUY9LF83CZq/lqV6JE/yMSAFGCdifiJDy67lrJq7we/h7inP5GHb+ZW8FHFd66vLvNXlvDFmBiFzMZ8DwRzw2cAcklcjaLeZiORbEx5+LONerPlanDFZqEfyKN+fSCdidiXYlZxT+xLYckK7l7snrs1zHflXtaAJeLn11dll1UOIVxxCCwdDMJWAqRAeDDYNmIrbFMwr812yiAxyZt/irHnd/03qj/vXvIPQz8pSRZJHUe6Sngf+VQL/KufU/gXjfswf5M7Jr0VYUzRumNMIrGl9pXZZ9RCGjJyChwcTJqZDMAWYhvtUAiYD40g+NXFsXmoWkSLn69kz4r8y6uKWp8sIuZFo73cnA1Qox6TfBrwNt+v4cN0zWPhTYvYgP6zM7JKUwSQZEl5tfaW32GNM2TqeeDiOwMcRMg4S4wlsAth4wnAcZuNIBobxrS+Fhs6agZ3ALoIUh3NEBgPnCi6csi+jPkaNuhz88CxVJHlWKAGgAz8S50gS/lU+sqUaswdxfk155eNFd1lhFFZaAqhrffXdZ18ZTSw2jNAqgLE4FTgVBLExGMMgHIbbKMxG4FRgPhJnJEYFzggCH45bx5soleGMaJ9Kfj4YTedzHSqAoX2oLgHs6tK2H2g9odR2g7fgOMaO9vlGA8ZO3BrB92C+B6ypdZn9hLYP2IHbTuLNO4kHu4jHd3LlIDlRVSQd51ecfehPM+rj7uqpeHiVPvsXrwIMAB3ZHJzPAJ+huXYvH93yBB78Aks8wB0Hb4y6ukHlG7N2kvzUKyKDmdNImPhExv3E/LpOIV+KToEHgE6GgyWvJiD4DufW/A2zh8EfxuN/5PYJmV3DKiJSCgK7hrMPS3++UV8sX/Ne3BdnqSKJSDEFgK4W4r4Q+AS0tHBe7V9w/z3Ow+xpeXLQ3G9ARCRbnFdojn8joz5+VT2EHeH3slSRRKiYA0BHcfDjMI7D+DKj4i1cULMGt8fAHwd7lNuK+G6EIiLZcXnbs+AHbId/iuSNzaTIDZYA0FUcZz74fGApOFywpQZ8FfAYZo8zZO9TrWfWi4iUggc5e+4vM+phxSvTaUl8Pkv1SMQGawBIZTLYScBJONA4fB9LtzyN8Tj4EyTiT3LbpP6dOS8iUhz2EsauyLiXlsQNwPDMy5FCUEoBoKthwDtw3gEGsQRcuOUN4AWMVbitIvDVxPf+XXsKRKSomV3N2bM2ZNTH8rX/AuH7s1SRFIBSDgCpjAWOwzkOc3CgeXgzF22pxlgFvhrjBZq0t0BEikY1r3N9Rj2s2FhBS8ONWapHCoQCQO/KgPnJlyVDQVkCLtmyEffnCPx5Ql4mYA3NQTW3Ttkecb0iIgeYX8zH52a2FzPR8HlgZnYKkkKhADBw0zCbhnNS+52wyhwu3bwD4xWwdZivw1u/Jsr+3voIYRGRfLmPsw59OKMe7lo7Gw8/naV6pIAoAGTfGJxFmC/CAVoPJcSa4bLN24BqYA2BVUNYTchGPNxA3bS61tv4iohkw27i4Scz7iUWfo++3bJbiowCQH5NaH0diztgyXvkWwymbIHLN78BrANqMN+C+zqwGgLbAi3rGD19A1XWEuUPICJFwu0qTp+3JaM+7q4+Bfyfs1SRFBgFgMIyFljUPmWtxxbckyFh5+YEn9hUC6zH2AxsxtgGvhVi2wmoJ7R6zLazflK99iiIlCp7nmmbbsioixWrR9Ds12WpIClACgDFJQYc3PpKckjuSQgh7NB2yGb41KZ6YDtQj7Edpx58O+ZbMeqx2HZCXgdrINa8gyCxl/JEA1Vzuj55b/C7tnY4YdNoEolRhD4Ki43GGYPxOl88JLNjqCL55RBeygknZLa3sKXsy8C07JQkhUgBYHAb1/pKMm/7JvnFw/Zv8QASAf+/vXuPkas67Dj+PXd2/VrhR2yzD2r8Nq2N1EY2DZC0agpUUQlpqgbaIqFAFYGatkQkQJyShHWbFEysVhFFSFZLwc8EK1WrkBbRtCoqULVJaKAhTcA28Vo1DuD6sdh47Z17+sfs2mt7d73e2ZkzO/f7ka40O3vvPb9Zr3x/987sPbzbCp/dC4FeKtPtvkNllsB3CfEYIRwkj++ScQzCYYhHIZ4gC+8Q49DpmvuA03ONByKcmqq38ptXznohP/9/Uq0AYQZ5nHr6yTiFEAZvSDKDwNSB1zgLQkZkKpEZlOJFxGwqxJnEgfUy5hCZArGNylWXmZw4Xjr1swkBiIM/m28AFgBNImEzt6z4t6p2seW1lcRY/YyBamgWAI3kooHlYmDgYDjwZ5Bh6ATgg2ViyOOzHg77dc5AIRllG+LpdQcfn1o3nLtqAOJZ+4vh9LZhyLrN6xjwYypXfg6dZ92K0eZzL5WrmHY7PA3xpVEHm6i55Me8nwv8x6/VXPe12i8xUmq5t8pdBLa/9gixUr3VvCwA0mQX+QFZ2Aw8w+FFL9Md8vNuUw9/sORTqSNoHLbtvBn4ldQxVHsWAGnyeo48v597lv1L6iBqEk/umsWJ/g3nXGFTU7IASJPPEQif4tOLniCE5n5DQ/V1svwnhNCROobqI0sdQNIF+REhX81nFj/uwV8TauurvwB8MnUM1Y8FQJo8/pt44pf49LKdqYOoycQYiPERvCpcKP5jS5PDAUrZR7nrMieb0sTbuvM2Qrg6dQzVl1cApMZ3AvKPctfC3amDqAk9+cp7CPHB1DFUfxYAqfF9mbuXPpc6hJpUX+sDVOYoUcFYAKTGtpd3eCh1CDWprT/+RQKfSB1DaVgApEYW2UD34uOpY6gJPRlLkD2Cx4HC8kOAUuM6TgubUodQk+p77RME1qSOoXRsflLjepq7Fo/tfv7Shdi+cwGBL6eOobQsAFLDit7iVxNv667l5PHbDJ0pVIXkW5rHKSAAAAqKSURBVABSw4r/lTqBmsiml9rIpt1KLK/Dg7+wAEiNK8/Gf8e/v/jJzxHijcR8xqnnLmR+l7FeG7zg9fIRnp/AsSZy22rGHO98OlkVd3geNm9og3wZIbwPmDP+navZWACkRjWt/+C4tntw1yzInycyZ0xHoTNWGeXgM9YD2qjrnfXN4YYbafvRjovnyxbPeTC2basZczTj3XZc28UqBlQz8zMAUmPKuXN537i2nFpaimd6ks7DAiA1m3K/p3uSzssCIElSAVkAJEkqIAuAJEkFZAGQJKmALACSJBWQBUCSpAKyAEiSVEAWAEmSCsgCIElSAVkAJEkqIAuAJEkFZAGQJKmALACSJBWQBUCSpAKyAEiSVEAWAEmSCsgCIElSAVkAJEkqIAuAJEkFZAGQJKmAWlIHUNMpQ3gZ4l5C6AMgxiMQymesFYAYI4RDZzyX54eBHDhERiTnIFnMieEwIZYJ4QiU+8lLvZWN8plkYQ2E3waurccLlKRmYAHQBIm9kG0gb3mUBzrfqvPg3wf+inV7riGwGeis8/iSNOlYADQRdpPn1/PAwh8lTXH/wn/mS7uvIi+9AHQlzSJJDc7PAKhaB8j4NR5YnPbgP+jzS/ZAdjMQU0eRpEZmAVB1YriPL126K3WMM3xxwbPAU6ljSFIjswCoGgeYeslfpw4xrBi2po4gSY3MAqDxizxDd+hPHWNYWXgxdQRJamQWAI1fCLtTRxhRmQOpI0hSI7MAaPxCLJ9/pURKcU7qCJLUyCwAqkJcmDrBiGL+vtQRJKmRZUDjnsWpscVwHcSQOsYIbkkdQJIaWQbU+65tah5d3Lf3ptQhzrFuzzUQPpQ6hiQ1sozIntQhNInF8BX+eHd76hin/GnP0oHbAUuSRpEReCZ1CE1qC6DlKbpf70gdhHU/uZ4YX8C5ACTpvFqI4W8J8Qupg2hSW8PJ0ot8vuc+3nxzCxvXnKzZSDEGHuyZTV8WIJ8N+cWE0nsh/g6BX67ZuJLUZFrYcfH3uemnTwO+Z6pqdBJ5jPkX/zn39TxLFvYQeReAGNvIwpQz1g6c9Wd6cQqBtoEvZhMIEGcTCUPWncO6noHt84GnMrztvyRduMpsgCH/ImTXAaW0cdQEZgO/QRxyUA5wwQdpj+mSVFOV+wB8vfM7EL+SOIskSaqT0zcCyg/cD/xHuiiSJKleTheAHatOkJU/DLyaLo4kSaqHM28FvL3rbeDXgZ4kaSRJUl2cOxfA19t30ZpdCfyg/nEkSVI9DD8Z0Jb5b1DOfxXis3XOI0mS6mDk2QB3dL7F/vZrgfX1iyNJkuph9OmA/zX087X2tQQ+Brxdn0iSJKnWRi8Ag7a3f4OWuAr4u9rGkSRJ9TC2AgCwueNNtrf/JsSPEPwrAUmSJrOxF4BB2zu+ybTscmADULtJXyRJUs1ceAEAeGx+L9va74F8ObARyM+3iSRJahzjKwCDtnXtYVvHHYR4JfDtiYkkSZJqrboCMGhr53fY2nEdebgaeArncpMkqaFNTAEYtL3939nacQMxvwLCDqB/QvcvSZImxMQWgEHbur7Hlvab6C8thLgOwsGajCNJksalNgVg0Nfm72NLZzdTsoXE8EnguzUdT5IkjUltC8Cgx+b3sqX9UTZ3XEEeVxHCeuCtuowtSZLOUZ8CMNTWzh+yqX0ts3oXEONNVD40WK57DkmSCqwl2cgPL+8DdgA7uHnfQlpKtwK/S4iXJcskSVJB1P8KwHC2de1hU/s6NrX/LMTLiayF8HzqWJIkNat0VwBG8kTnK8ArwHpu2b+YEh8BboR4NRDShpMkqTk0XgEYanPH68BXga/y8Z8uJeQfI/BbwBosA5IkjVtjF4ChnmjfBawH1nP7vnmUwweJ3ABcD7wnbThJkiaXyVMAhtrY9TaDHyC8MZaYue9KKH0I4jXAFUzW1yVJUp1M/gPljlAGnh9YvsAt+9toDVdBfi2Ba4H30igfdpQkqUFM/gJwts0dR6nMTFiZnfC2N+ZTClcDVw18kHANMD1dQEmS0mu+AnC2v+l8C/j7gQW6Ywv/u/8yQnw/kQ8Aq4GVCRNKklR3zV8AztYd+qn8meErwEYAfq+ni9bSasjeD/EDVK4STE0XUpKk2ipeARjOY5fuA/YB3wTg9thKy/4V5Kwk5quA1RDWAB0JU0qSNGEsAMPZGE5y+irBjlPP//6eOYTWSiGIrCawErgcrxZIkiYZC8CFeHThQeC5gaXi1tenMX3qKkL8eQirIK4AlgOLgSlpgkqSNDoLQLUeX3wc+N7AcqY/7OkilFYSwxKISwhhCTEuAVYB0+qcVJKkUywAtfSXpz5bcKbbv9tKa8diMpaTsQKy5cCllSV2AXPrnFSSVDAWgBQ2rjkJvDqwfOuc7//Ra1NpmXIJeWsX5J1ksQuyTohLgC6gE1iENziSJI2TBaARPby8D9g9sAxvsCTQeglZ/BkCcyGfR87cyuMwH5g3sMzFmx9JkoawAExWYykJQ929v41SPpeceWT98yHMJTKPwFximAfMgNgGzCIwHcIMQpxNZAaR6QRm1/DV1Nsx4DhwCOglxiMQDpNxmMgRYjhM4BAhPwSlHybOKkk1YQEoig0dR4GjQM+499G9bwZ9+XRieRYtWRv9zKCUXUTML4J88HdpDnB6suYY2iBOIQ7uJEwhC22n9hnyANnw5SLEw0A+zHeOAX0D4xysjEMfkWMAZFkv5P2E7Aj5yT7yUi+cfAficbqXHxn365ekJmIB0Nh1dx2jcvA9kDqKJKk6fohMkqQCsgBIklRAFgBJkgrIAiBJUgFZACRJKiALgCRJBWQBkCSpgCwAkiQVkAVAkqQCsgBIklRAFgBJkgrIAiBJUgFZACRJKiALgCRJBWQBkCSpgCwAkiQVkAVAkqQCsgBIklRAFgBJkgrIAiBJUgFZACRJKiALgCRJBWQBkGolxJg6giSNxAIg1UrkWOoIkjQSC4BUKzH0po4gSSOxAEi1EvKe1BEkaSQWAKlWMl5NHUGSRmIBkGpl5v/9D3A0dQxJGo4FQKqVO9acBF5IHUOShmMBkGop8K3UESRpOBYAqZZCeTuE/tQxJOlsFgCplu5Z9iYhehVAUsOxAEi1FuOfpY4gSWezAEi19tkl/wn8Y+oYkjSUBUCqh7x8J9CXOoYkDbIASPXwuWU7iXSnjiFJgywAUr0cX/QQ8E+pY0gSWACk+ukOOXl+I/By6iiSZAGQ6mnt0sPk+Q3AntRRJBWbBUCqt7VLe2gNVxF4KXUUScVlAZBSuGvRG/RnHwT+IXUUScVkAZBS+dzCg9yz6MMQ7wSOp44jqVgsAFJKIUTuXfIwWXkFkY1AnjqSpGKwAEiN4DPL9nLv4juI4QoCj+MVAUk1ZgGQGsm9i17k7sW3UWpZkDqKpOYWUgeQNMEeer2DKXx8zOufcRowyjsQYz1dqPa0Yjzbj3mbYV7fePOWxrldNWNW87Od0NO9cvX7refpZ8pT3Wp+T6rlKb4kSZIkSZIkSZIkSZIkSZIkSZIkSZIkSZIkSZIkSZIkSZIkSZIkSZIkSZIkSZIkSZIkSZIkSZIkSZIkSZIkSZIkSZIkSZIkSZIkSZIkSZIkqbH8P5MHVeVCLJYKAAAAAElFTkSuQmCC'
+startup_timer.mark("DPI awareness and theme")
+
+
+DASHBOARD_COUNTERS = [("total_assets", "Total Active Assets"),
+                      ("assets_added", "Assets Added This Month"),
+                      ("assets_updated", "Assets Updated This Month"),
+                      ("assets_removed", "Assets Removed This Month")]
+
+# Manage Assets grid: rows fetched per round trip and how many pages the Treeview holds at once.
+PAGE_SIZE = 200
+MAX_LOADED_PAGES = 3
+# Keystroke pause after which search-as-you-type queries.
+SEARCH_DEBOUNCE_MS = 300
+# Fraction of the loaded window from either edge at which the neighbouring page is fetched.
+SCROLL_PREFETCH_EDGE = 0.1
+# How often notified asset changes are applied to the screens, and how many changed rows are
+# patched into the grid in place before it is simply reloaded.
+CHANGE_POLL_MS = 250
+MAX_PATCHED_ROWS = PAGE_SIZE
+# Recent transactions of this client, whose change notifications need no patching.
+OWN_TRANSACTIONS = 1000
+# Height of the month labels under the dashboard's trend chart.
+TREND_LABEL_HEIGHT = 18
 
 
 def center_window(window, width=0, height=0):
@@ -73,72 +129,311 @@ def center_window(window, width=0, height=0):
     window.geometry(f'{width}x{height}+{x}+{y}')
 
 
+class PagedAssetGrid:
+    """
+    Virtualized view of a keyset-paginated asset query in a Treeview.
+
+    Only MAX_LOADED_PAGES pages are kept in the widget. Scrolling near either edge of
+    the loaded window fetches the neighbouring page in the background and drops the
+    one furthest away. fetch_page(repository, after=None, before=None) must return up
+    to PAGE_SIZE rows following or preceding a sort_key position, in sort order; the
+    grid is in id order unless reset with sort_by. Pages are fetched with
+    submit_read(fn, on_success, on_error), which calls fn(job, repository) on a worker
+    thread and returns the job. on_loaded, if given, is called after each first page
+    is shown.
+    """
+
+    def __init__(self, table, scrollbar, submit_read, on_error, on_loaded=None):
+        self.table = table
+        self.scrollbar = scrollbar
+        self.submit_read = submit_read
+        self.on_error = on_error
+        self.on_loaded = on_loaded
+        self.fetch_page = None
+        self.sort_by = None
+        self.job = None
+        self.pages = []
+        # Keyset position of each loaded row as it was fetched; the next pages continue from these.
+        self.keys = {}
+        self.has_before = False
+        self.has_after = False
+        self.pending = False
+        self.table.configure(yscrollcommand=self.on_scroll)
+
+    def reset(self, fetch_page, sort_by=None):
+        self.cancel()
+        self.fetch_page = fetch_page
+        self.sort_by = sort_by
+        self.table.delete(*self.table.get_children())
+        self.pages = []
+        self.keys = {}
+        self.has_before = False
+        self.has_after = False
+        self.submit(fetch_page, self.show_first_page)
+
+    def cancel(self):
+        if self.job:
+            self.job.cancel()
+            self.job = None
+        self.pending = False
+
+    def submit(self, fetch, on_success):
+        self.pending = True
+        self.job = self.submit_read(lambda job, repository: fetch(repository), on_success=on_success,
+                                    on_error=self.fetch_failed)
+
+    def fetch_failed(self, error):
+        self.job = None
+        self.pending = False
+        self.on_error(error)
+
+    def on_scroll(self, first, last):
+        self.scrollbar.set(first, last)
+        if self.pending or not self.pages:
+            return
+        fetch_page = self.fetch_page
+        if float(last) >= 1 - SCROLL_PREFETCH_EDGE and self.has_after:
+            after = self.keys[self.pages[-1][-1]]
+            self.submit(lambda repository: fetch_page(repository, after=after), self.show_next_page)
+        elif float(first) <= SCROLL_PREFETCH_EDGE and self.has_before:
+            before = self.keys[self.pages[0][0]]
+            self.submit(lambda repository: fetch_page(repository, before=before), self.show_previous_page)
+
+    def show_first_page(self, rows):
+        self.job = None
+        self.pending = False
+        self.append_page(rows)
+        self.table.yview_moveto(0)
+        if self.on_loaded:
+            self.on_loaded()
+
+    def show_next_page(self, rows):
+        self.job = None
+        anchor = self.top_visible_item()
+        self.append_page(rows)
+        if len(self.pages) > MAX_LOADED_PAGES:
+            self.delete_rows(self.pages.pop(0))
+            self.has_before = True
+        self.scroll_to(anchor)
+        self.pending = False
+
+    def show_previous_page(self, rows):
+        self.job = None
+        anchor = self.top_visible_item()
+        self.has_before = len(rows) == PAGE_SIZE
+        if rows:
+            self.drop_moved(rows)
+            self.pages.insert(0, [self.insert(index, row) for index, row in enumerate(rows)])
+            if len(self.pages) > MAX_LOADED_PAGES:
+                self.delete_rows(self.pages.pop())
+                self.has_after = True
+        self.scroll_to(anchor)
+        self.pending = False
+
+    def is_complete(self):
+        # True when the whole result set is in the Treeview rather than a window of it.
+        return not (self.pending or self.has_before or self.has_after)
+
+    def filter_loaded(self, keep):
+        for page in self.pages:
+            dropped = {iid for iid in page if not keep(self.table.item(iid, "values"))}
+            if dropped:
+                self.delete_rows(dropped)
+                page[:] = [iid for iid in page if iid not in dropped]
+        self.pages = [page for page in self.pages if page]
+
+    def patch(self, changed_ids, rows, keep):
+        """
+        Apply changed assets in place: rows is the current state of the changed_ids that
+        still exist, and keep(row) says whether a row belongs in this grid. Loaded rows are
+        updated or dropped; new matches are inserted if they fall inside the loaded window.
+        When sorted by a column, updated rows keep their place and new matches show up on
+        the next search, as only the database can say where they sort.
+        """
+        fresh = {row[0]: row for row in rows if keep(row)}
+        anchor = self.top_visible_item()
+        for page in self.pages:
+            for iid in [iid for iid in page if int(iid) in changed_ids]:
+                row = fresh.pop(int(iid), None)
+                if row is None:
+                    self.delete_rows([iid])
+                    page.remove(iid)
+                else:
+                    self.table.item(iid, values=row[1:])
+        self.pages = [page for page in self.pages if page]
+        # A page on its way would not know about rows inserted now; it brings fresh data anyway.
+        if not self.pending and self.sort_by is None:
+            for asset_id in sorted(fresh):
+                self.insert_row(fresh[asset_id])
+        self.scroll_to(anchor)
+
+    def insert_row(self, row):
+        asset_id = row[0]
+        if not self.pages:
+            if self.has_before or self.has_after:
+                return
+            self.pages.append([])
+        elif (asset_id < int(self.pages[0][0]) and self.has_before) or (asset_id > int(self.pages[-1][-1]) and self.has_after):
+            return
+        page = next((page for page in self.pages if page and int(page[-1]) > asset_id), self.pages[-1])
+        position = bisect.bisect_left([int(iid) for iid in page], asset_id)
+        if position < len(page):
+            index = self.table.index(page[position])
+        else:
+            index = self.table.index(page[-1]) + 1 if page else tk.END
+        page.insert(position, self.insert(index, row))
+
+    def append_page(self, rows):
+        self.has_after = len(rows) == PAGE_SIZE
+        if rows:
+            self.drop_moved(rows)
+            self.pages.append([self.insert(tk.END, row) for row in rows])
+
+    def insert(self, index, row):
+        iid = self.table.insert("", index, iid=str(row[0]), values=row[1:])
+        self.keys[iid] = sort_key(row, self.sort_by)
+        return iid
+
+    def drop_moved(self, rows):
+        # A row updated since it was loaded may have sorted into the new page as well; show it there only.
+        for row in rows:
+            iid = str(row[0])
+            if iid in self.keys:
+                self.delete_rows([iid])
+                for page in self.pages:
+                    if iid in page:
+                        page.remove(iid)
+        self.pages = [page for page in self.pages if page]
+
+    def delete_rows(self, iids):
+        self.table.delete(*iids)
+        for iid in iids:
+            self.keys.pop(iid, None)
+
+    def top_visible_item(self):
+        children = self.table.get_children()
+        if not children:
+            return None
+        index = int(float(self.table.yview()[0]) * len(children) + 0.5)
+        return children[min(index, len(children) - 1)]
+
+    def scroll_to(self, iid):
+        # Keep the row the user was looking at in place after pages were added or dropped above it.
+        if iid is None or not self.table.exists(iid):
+            return
+        self.table.yview_moveto(self.table.index(iid) / len(self.table.get_children()))
+
+
 class AssetManagementApp(customtkinter.CTk):
-    def __init__(self):
+    def __init__(self, show_startup_timing=False):
         super().__init__()
         center_window(self, 1200, 800)
         self.title("Assets Management Portal")
-        icon = tk.PhotoImage(data=img)
-        self.iconphoto(True, icon)
-        self.conn = self.connect_to_db()
-        self.create_tables()
+        startup_timer.mark("main window")
+        self.show_startup_timing = show_startup_timing
+        query_stats.configure()
+        # The login screen goes up straight away; the pool is opened and the schema checked on a
+        # background thread, and queries submitted meanwhile wait in run_query until it is done.
+        self.db_config = load_db_config()
+        self.pool = None
+        self.ngram_index = None
+        self.replica = None
+        self.replica_syncer = None
+        self.change_listener = None
+        self.own_transactions = deque(maxlen=OWN_TRANSACTIONS)
+        self.database_ready = threading.Event()
+        self.database_error = None
+        self.authenticator = Authenticator.from_config(self.run_query)
+        self.executor = QueryExecutor(self, self.run_query, workers=max(int(self.db_config["max_connections"]), 1),
+                                      on_error=self.show_query_error, on_busy=self.set_busy)
+        self.busy_indicator = customtkinter.CTkProgressBar(self, mode="indeterminate", width=150)
+        self.metrics = DashboardMetrics()
+        self.screen_jobs = []
+        self.asset_grid = None
+        self.last_search = None
+        self.live_search_after = None
+        self.sort_by = None
+        self.sort_descending = False
+        self.attribute_values = {}
+        self.suggestion_boxes = []
         self.current_user = None
         self.register_frame = None
+        self.screen_started = None
+        self.current_view = None
+        self.diagnostics = None
+        self.bind_all("<Control-Shift-D>", self.show_diagnostics)
         self.show_login()
+        startup_timer.mark("login screen")
 
-    def connect_to_db(self):
+        self.after_idle(self.set_icon)
+        threading.Thread(target=self.open_database, name="open-database", daemon=True).start()
+        self.executor.submit(lambda job: None, on_success=self.on_database_ready, on_error=self.on_database_error)
+
+    def set_icon(self):
+        from app_icon import ICON_PNG
+        self.icon = tk.PhotoImage(data=ICON_PNG)
+        self.iconphoto(True, self.icon)
+        startup_timer.mark("window icon")
+
+    def open_database(self):
         try:
-            conn = psycopg2.connect(
-                dbname="your_db",
-                user="your_user",
-                password="your_password",
-                host="your_host",
-                port="5432"
-            )
-            return conn
+            pool = ConnectionPool(self.db_config, cursor_factory=query_stats.InstrumentedCursor)
+            startup_timer.mark("database connected")
+            with pool.connection() as conn:
+                # migrate() is a single schema_version lookup unless a migration is pending.
+                migrate(conn)
+                create_event_partitions(conn)
+                # Without pg_trgm the substring filters are answered from an in-process index instead.
+                self.ngram_index = None if trigram_indexes_ready(conn) else NgramIndex(SEARCH_COLUMNS)
+            startup_timer.mark("schema checked")
+            self.pool = pool
+            if self.ngram_index:
+                threading.Thread(target=self.build_trigram_indexes, name="trigram-indexes", daemon=True).start()
+            self.change_listener = ChangeListener(pool.connect_dedicated)
+            replica_config = load_replica_config()
+            self.replica = open_replica(self.db_config, replica_config)
+            if self.replica:
+                # The first sync copies the whole table in the background; reads use the primary until it is done.
+                self.replica_syncer = ReplicaSyncer(self.replica, pool.run, float(replica_config["sync_interval"]),
+                                                    on_change=self.metrics.invalidate)
         except Exception as e:
-            messagebox.showerror("Database Connection Error", str(e))
-            self.destroy()
-
-    def create_tables(self):
-        with self.conn.cursor() as cursor:
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS assets (
-                    id SERIAL PRIMARY KEY,
-                    employee_name VARCHAR(500) NOT NULL,
-                    employee_id VARCHAR(500) UNIQUE NOT NULL,
-                    email_id VARCHAR(500) NOT NULL,
-                    location VARCHAR(500) NOT NULL,
-                    hostname VARCHAR(500) NOT NULL,
-                    processor VARCHAR(500) NOT NULL,
-                    ram VARCHAR(500) NOT NULL,
-                    hd_size VARCHAR(500) NOT NULL,
-                    mouse VARCHAR(500) NOT NULL,
-                    adaptor VARCHAR(500) NOT NULL,
-                    headset VARCHAR(500) NOT NULL,
-                    monitor VARCHAR(500) NOT NULL,
-                    it_others VARCHAR(500) NOT NULL,
-                    software_licenses VARCHAR(500) NOT NULL,
-                    asset_entry_date VARCHAR(500) NOT NULL,
-                    entered_by VARCHAR(500),
-                    updated_by VARCHAR(500),
-                    update_date VARCHAR(500),
-                    remove_date VARCHAR(500)
-                )
-            """)
-            cursor.execute("""
-                            CREATE TABLE IF NOT EXISTS users (
-                                id SERIAL PRIMARY KEY,
-                                email_id VARCHAR(255) NOT NULL UNIQUE,
-                                employee_name VARCHAR(255) NOT NULL,
-                                employee_id VARCHAR(255) NOT NULL UNIQUE,
-                                password VARCHAR(255) NOT NULL,
-                                role VARCHAR(50) NOT NULL DEFAULT 'user'
-                            )
-                        """)
-            self.conn.commit()
+            self.database_error = e
+        finally:
+            self.database_ready.set()
+
+    def build_trigram_indexes(self):
+        """
+        Build the trigram indexes if pg_trgm has become available since migration 4 ran.
+        This session keeps its in-process index; the next start uses them.
+        """
+        try:
+            conn = self.pool.connect_dedicated()
+        except psycopg2.Error:
+            return
+        try:
+            conn.autocommit = True
+            create_missing_trigram_indexes(conn)
+        finally:
+            conn.close()
+
+    def run_query(self, fn, idempotent=False):
+        self.database_ready.wait()
+        if self.database_error:
+            raise self.database_error
+        return self.pool.run(fn, idempotent)
+
+    def on_database_ready(self, _):
+        startup_timer.mark("ready")
+        if self.show_startup_timing:
+            print(startup_timer.report())
+
+    def on_database_error(self, error):
+        messagebox.showerror("Database Connection Error", str(error))
+        self.executor.shutdown()
+        self.destroy()
 
     def show_login(self):
+        self.begin_screen("Login")
         self.current_user = None
         if self.register_frame:
             self.clear_main_content2()
@@ -157,8 +452,10 @@ class AssetManagementApp(customtkinter.CTk):
         customtkinter.CTkEntry(self.login_frame, textvariable=self.password, show="*", width=300).pack(pady=5)
         customtkinter.CTkButton(self.login_frame, text="Login", command=self.login, width=300).pack(pady=10)
         customtkinter.CTkButton(self.login_frame, text="Register", command=self.show_register, width=300).pack(pady=10)
+        self.screen_ready()
 
     def show_register(self):
+        self.begin_screen("Register")
         self.clear_main_content1()
         self.register_frame = customtkinter.CTkFrame(self)
         self.register_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=10)
@@ -190,6 +487,7 @@ class AssetManagementApp(customtkinter.CTk):
 
         customtkinter.CTkButton(self.register_frame, text="Register", command=self.register_user).pack(pady=10)
         customtkinter.CTkButton(self.register_frame, text="Back to Login", command=self.show_login).pack(pady=10)
+        self.screen_ready()
 
     def login(self):
         username = self.username.get().strip()
@@ -199,18 +497,17 @@ class AssetManagementApp(customtkinter.CTk):
             messagebox.showerror("Error", "All fields are required!")
             return
 
-        try:
-            with self.conn.cursor() as cursor:
-                cursor.execute("SELECT id, password FROM users WHERE email_id = %s", (username,))
-                user = cursor.fetchone()
-                if user and bcrypt.checkpw(password.encode('utf-8'), user[1].encode('utf-8')):
-                    self.current_user = username
-                    self.clear_main_content1()
-                    self.create_widgets()
-                else:
-                    messagebox.showerror("Error", "Invalid username or password")
-        except Exception as e:
-            messagebox.showerror("Error", str(e))
+        def on_authenticated(authenticated):
+            if authenticated:
+                self.current_user = username
+                self.clear_main_content1()
+                self.create_widgets()
+            else:
+                messagebox.showerror("Error", "Invalid username or password")
+
+        # No connection for the job itself: the authenticator takes one only around its queries, not for bcrypt.
+        self.executor.submit(lambda job: self.authenticator.authenticate(username, password),
+                             on_success=on_authenticated, connection=False)
 
     def register_user(self):
         employee_name = self.new_username.get().strip()
@@ -227,20 +524,20 @@ class AssetManagementApp(customtkinter.CTk):
             messagebox.showerror("Error", "Passwords do not match!")
             return
 
-        hashed_password = bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
+        def insert_user(job):
+            self.authenticator.register(employee_email_id, employee_name, employee_id, password)
 
-        try:
-            with self.conn.cursor() as cursor:
-                cursor.execute("INSERT INTO users (email_id, employee_name, employee_id, password) VALUES (%s, %s, %s, %s)",
-                               (employee_email_id, employee_name, employee_id, hashed_password))
-            self.conn.commit()
+        def on_registered(_):
             messagebox.showinfo("Success", "User registered successfully!")
             self.show_login()
-        except psycopg2.IntegrityError:
-            messagebox.showerror("Error", "Employee ID or Email already exists")
-            self.conn.rollback()
-        except Exception as e:
-            messagebox.showerror("Error", str(e))
+
+        def on_register_error(e):
+            if isinstance(e, psycopg2.IntegrityError):
+                messagebox.showerror("Error", "Employee ID or Email already exists")
+            else:
+                self.show_query_error(e)
+
+        self.executor.submit(insert_user, on_success=on_registered, on_error=on_register_error, connection=False)
 
     def create_widgets(self):
         # Header
@@ -270,44 +567,126 @@ class AssetManagementApp(customtkinter.CTk):
         # Main Content
         self.main_content = customtkinter.CTkFrame(self)
         self.main_content.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(0,10), pady=(0,10))
+        self.main_content.grid_rowconfigure(0, weight=1)
+        self.main_content.grid_columnconfigure(0, weight=1)
+        # Each screen is built once, on first visit, and stacked in the same grid cell;
+        # navigating raises it and refreshes its data instead of rebuilding its widgets.
+        self.views = {}
 
         self.show_dashboard()
+        self.after(CHANGE_POLL_MS, self.poll_changes)
 
     def show_profile_details(self):
-        employee_name, email_id, employee_id = self.get_profile_details()
-        details = f"{employee_name}\n{employee_id}\n{email_id}"
-        tk.messagebox.showinfo("Profile", details)
+        def on_profile(profile):
+            employee_name, email_id, employee_id = profile
+            details = f"{employee_name}\n{employee_id}\n{email_id}"
+            tk.messagebox.showinfo("Profile", details)
+
+        self.executor.submit(lambda job: self.get_profile_details(), on_success=on_profile, connection=False)
 
     def get_profile_details(self):
-        with self.conn.cursor() as cursor:
-            cursor.execute("SELECT employee_name, email_id, employee_id FROM users WHERE email_id = %s", (self.current_user,))
-            return cursor.fetchone()
+        return self.authenticator.profile(self.current_user)
 
     def show_dashboard(self):
-        self.clear_main_content()
-
+        self.begin_screen("Dashboard")
+        self.show_view("Dashboard", self.build_dashboard)
+        self.refresh_dashboard()
+
+    def refresh_dashboard(self):
+        def load_dashboard(job, repository):
+            # The trends come from the small monthly rollup table, never from a scan of assets.
+            return self.metrics.get(repository), repository.monthly_trend(TREND_MONTHS), repository.location_breakdown()
+
+        def on_loaded(result):
+            metrics, trend, locations = result
+            self.show_metrics(metrics)
+            self.show_trends(trend, locations)
+            self.screen_ready()
+
+        self.submit_read(load_dashboard, on_success=on_loaded, screen_job=True)
+
+    def show_metrics(self, metrics):
+        for name, title in DASHBOARD_COUNTERS:
+            self.dashboard_labels[name].configure(text=f"{title}: {metrics[name]}")
+
+    def show_trends(self, trend, locations):
+        self.trend_table.delete(*self.trend_table.get_children())
+        for month, added, updated, removed, active in reversed(trend):
+            self.trend_table.insert("", tk.END, values=(month.strftime("%b %Y"), added, updated, removed, active))
+        self.location_table.delete(*self.location_table.get_children())
+        for row in locations:
+            self.location_table.insert("", tk.END, values=row)
+        self.draw_trend_chart(trend)
+
+    def draw_trend_chart(self, trend):
+        # One bar per month for the number of active assets at its end, labelled every quarter.
+        chart = self.trend_chart
+        chart.delete("all")
+        width, height = int(chart.cget("width")), int(chart.cget("height"))
+        bottom = height - TREND_LABEL_HEIGHT
+        peak = max((row[4] for row in trend), default=0) or 1
+        bar_width = width / max(len(trend), 1)
+        for index, (month, added, updated, removed, active) in enumerate(trend):
+            left = index * bar_width
+            top = bottom - (bottom - 10) * max(active, 0) / peak
+            chart.create_rectangle(left + 2, top, left + bar_width - 2, bottom, fill="#3B8ED0", outline="")
+            if (len(trend) - 1 - index) % 3 == 0:
+                chart.create_text(left + bar_width / 2, bottom + TREND_LABEL_HEIGHT / 2, text=month.strftime("%b %y"),
+                                  font=("Arial", 8))
+        chart.create_text(4, 4, anchor="nw", text=f"Active assets (peak {peak})", font=("Arial", 9))
+
+    def build_dashboard(self):
         dashboard_frame = customtkinter.CTkFrame(self.main_content)
-        dashboard_frame.pack(fill=tk.BOTH, expand=True, pady=10, padx=(10,10))
 
         customtkinter.CTkLabel(dashboard_frame, text="Dashboard Overview", font=("Arial", 16)).pack(fill=tk.BOTH)
         overview_frame = customtkinter.CTkFrame(dashboard_frame,  height=100)
         overview_frame.pack(pady=10)
 
-        total_assets = self.get_total_assets()
-        assets_added = self.get_assets_added_this_month()
-        assets_updated = self.get_assets_updated_this_month()
-        assets_removed = self.get_assets_removed_this_month()
-
-        customtkinter.CTkLabel(overview_frame, text=f"Total Active Assets: {total_assets}", font=("Arial", 12)).pack(side=tk.LEFT, padx=10)
-        customtkinter.CTkLabel(overview_frame, text=f"Assets Added This Month: {assets_added}", font=("Arial", 12)).pack(side=tk.LEFT, padx=10)
-        customtkinter.CTkLabel(overview_frame, text=f"Assets Updated This Month: {assets_updated}", font=("Arial", 12)).pack(side=tk.LEFT, padx=10)
-        customtkinter.CTkLabel(overview_frame, text=f"Assets Removed This Month: {assets_removed}", font=("Arial", 12)).pack(side=tk.LEFT, padx=10)
+        self.dashboard_labels = {}
+        for name, title in DASHBOARD_COUNTERS:
+            self.dashboard_labels[name] = customtkinter.CTkLabel(overview_frame, text=f"{title}: ...", font=("Arial", 12))
+            self.dashboard_labels[name].pack(side=tk.LEFT, padx=10)
+
+        trends_frame = customtkinter.CTkFrame(dashboard_frame)
+        trends_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        trend_frame = customtkinter.CTkFrame(trends_frame)
+        trend_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(0, 5))
+        customtkinter.CTkLabel(trend_frame, text=f"Last {TREND_MONTHS} Months", font=("Arial", 14)).pack(anchor="w", padx=5)
+        self.trend_chart = tk.Canvas(trend_frame, width=560, height=160, background="white", highlightthickness=0)
+        self.trend_chart.pack(padx=5, pady=5)
+        self.trend_table = self.build_dashboard_table(
+            trend_frame, ("month", "added", "updated", "removed", "active"),
+            ("Month", "Added", "Updated", "Removed", "Active"))
+
+        location_frame = customtkinter.CTkFrame(trends_frame)
+        location_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(5, 0))
+        customtkinter.CTkLabel(location_frame, text="By Location This Month", font=("Arial", 14)).pack(anchor="w", padx=5)
+        self.location_table = self.build_dashboard_table(
+            location_frame, ("location", "active", "added", "updated", "removed"),
+            ("Location", "Active", "Added", "Updated", "Removed"))
+        return dashboard_frame
+
+    def build_dashboard_table(self, master, columns, headings):
+        table_frame = customtkinter.CTkFrame(master)
+        table_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        table = ttk.Treeview(table_frame, columns=columns, show="headings", height=8)
+        scrollbar = ttk.Scrollbar(table_frame, orient=tk.VERTICAL, command=table.yview)
+        table.configure(yscrollcommand=scrollbar.set)
+        for column, heading in zip(columns, headings):
+            table.heading(column, text=heading)
+            table.column(column, width=90, anchor=tk.W if column in ("month", "location") else tk.E)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        table.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        return table
 
     def show_add_asset(self):
-        self.clear_main_content()
+        self.begin_screen("Add Asset")
+        self.show_view("Add Asset", self.build_add_asset)
+        self.load_attribute_values()
+        self.screen_ready()
 
+    def build_add_asset(self):
         add_asset_frame = customtkinter.CTkFrame(self.main_content)
-        add_asset_frame.pack(fill=tk.BOTH, expand=True, pady=10, padx=(10,10))
 
         customtkinter.CTkLabel(add_asset_frame, text="Add Asset", font=("Arial", 16)).pack(fill=tk.BOTH)
         form_frame = customtkinter.CTkFrame(add_asset_frame)
@@ -339,31 +718,31 @@ class AssetManagementApp(customtkinter.CTk):
         customtkinter.CTkEntry(form_frame, textvariable=self.email_id, width=300).grid(row=2, column=1, padx=5, pady=5)
 
         customtkinter.CTkLabel(form_frame, text="Location:").grid(row=3, column=0, sticky="e", padx=5, pady=5)
-        customtkinter.CTkEntry(form_frame, textvariable=self.location, width=300).grid(row=3, column=1, padx=5, pady=5)
+        self.suggestion_box(form_frame, "location", self.location, width=300).grid(row=3, column=1, padx=5, pady=5)
 
         customtkinter.CTkLabel(form_frame, text="Hostname:").grid(row=4, column=0, sticky="e", padx=5, pady=5)
         customtkinter.CTkEntry(form_frame, textvariable=self.hostname, width=300).grid(row=4, column=1, padx=5, pady=5)
 
         customtkinter.CTkLabel(form_frame, text="Processor:").grid(row=5, column=0, sticky="e", padx=5, pady=5)
-        customtkinter.CTkEntry(form_frame, textvariable=self.processor, width=300).grid(row=5, column=1, padx=5, pady=5)
+        self.suggestion_box(form_frame, "processor", self.processor, width=300).grid(row=5, column=1, padx=5, pady=5)
 
         customtkinter.CTkLabel(form_frame, text="RAM:").grid(row=6, column=0, sticky="e", padx=5, pady=5)
-        customtkinter.CTkEntry(form_frame, textvariable=self.ram, width=300).grid(row=6, column=1, padx=5, pady=5)
+        self.suggestion_box(form_frame, "ram", self.ram, width=300).grid(row=6, column=1, padx=5, pady=5)
 
         customtkinter.CTkLabel(form_frame, text="HD Size:").grid(row=7, column=0, sticky="e", padx=5, pady=5)
-        customtkinter.CTkEntry(form_frame, textvariable=self.hd_size, width=300).grid(row=7, column=1, padx=5, pady=5)
+        self.suggestion_box(form_frame, "hd_size", self.hd_size, width=300).grid(row=7, column=1, padx=5, pady=5)
 
         customtkinter.CTkLabel(form_frame, text="Mouse:").grid(row=8, column=0, sticky="e", padx=5, pady=5)
-        customtkinter.CTkEntry(form_frame, textvariable=self.mouse, width=300).grid(row=8, column=1, padx=5, pady=5)
+        self.suggestion_box(form_frame, "mouse", self.mouse, width=300).grid(row=8, column=1, padx=5, pady=5)
 
         customtkinter.CTkLabel(form_frame, text="Adaptor:").grid(row=9, column=0, sticky="e", padx=5, pady=5)
-        customtkinter.CTkEntry(form_frame, textvariable=self.adaptor, width=300).grid(row=9, column=1, padx=5, pady=5)
+        self.suggestion_box(form_frame, "adaptor", self.adaptor, width=300).grid(row=9, column=1, padx=5, pady=5)
 
         customtkinter.CTkLabel(form_frame, text="Headset:").grid(row=10, column=0, sticky="e", padx=5, pady=5)
-        customtkinter.CTkEntry(form_frame, textvariable=self.headset, width=300).grid(row=10, column=1, padx=5, pady=5)
+        self.suggestion_box(form_frame, "headset", self.headset, width=300).grid(row=10, column=1, padx=5, pady=5)
 
         customtkinter.CTkLabel(form_frame, text="Monitor:").grid(row=11, column=0, sticky="e", padx=5, pady=5)
-        customtkinter.CTkEntry(form_frame, textvariable=self.monitor, width=300).grid(row=11, column=1, padx=5, pady=5)
+        self.suggestion_box(form_frame, "monitor", self.monitor, width=300).grid(row=11, column=1, padx=5, pady=5)
 
         customtkinter.CTkLabel(form_frame, text="IT Others:").grid(row=12, column=0, sticky="e", padx=5, pady=5)
         customtkinter.CTkEntry(form_frame, textvariable=self.it_others, width=300).grid(row=12, column=1, padx=5, pady=5)
@@ -375,12 +754,20 @@ class AssetManagementApp(customtkinter.CTk):
         customtkinter.CTkEntry(form_frame, textvariable=self.asset_entry_date, width=300).grid(row=14, column=1, padx=5, pady=5)
 
         customtkinter.CTkButton(add_asset_frame, text="Submit",  command=self.add_asset).pack(pady=10)
+        customtkinter.CTkButton(add_asset_frame, text="Import from CSV", command=self.bulk_import_assets).pack(pady=(0, 5))
+        self.import_status = customtkinter.CTkLabel(add_asset_frame, text="")
+        self.import_status.pack()
+        return add_asset_frame
 
     def show_manage_assets(self):
-        self.clear_main_content()
+        self.begin_screen("Manage Assets")
+        self.show_view("Manage Assets", self.build_manage_assets)
+        self.load_attribute_values()
+        # The filters keep what the user last typed; re-run that search for fresh rows.
+        self.search_assets()
 
+    def build_manage_assets(self):
         manage_assets_frame = customtkinter.CTkFrame(self.main_content)
-        manage_assets_frame.pack(fill=tk.BOTH, expand=True, pady=10, padx=(10, 10))
 
         customtkinter.CTkLabel(manage_assets_frame, text="Manage Assets", font=("Arial", 16)).pack(fill=tk.BOTH, padx=5,
                                                                                                    pady=5)
@@ -390,23 +777,31 @@ class AssetManagementApp(customtkinter.CTk):
         customtkinter.CTkLabel(filter_frame, text="Search By:").pack(side=tk.LEFT, padx=5)
 
         customtkinter.CTkLabel(filter_frame, text="Employee Name:").pack(side=tk.LEFT, padx=5)
-        self.employee_name = tk.StringVar()
-        customtkinter.CTkEntry(filter_frame, textvariable=self.employee_name).pack(side=tk.LEFT, padx=5)
+        self.filter_employee_name = tk.StringVar()
+        customtkinter.CTkEntry(filter_frame, textvariable=self.filter_employee_name).pack(side=tk.LEFT, padx=5)
 
         customtkinter.CTkLabel(filter_frame, text="Employee ID:").pack(side=tk.LEFT, padx=5, pady=5)
-        self.employee_id = tk.StringVar()
-        customtkinter.CTkEntry(filter_frame, textvariable=self.employee_id).pack(side=tk.LEFT, padx=5)
+        self.filter_employee_id = tk.StringVar()
+        customtkinter.CTkEntry(filter_frame, textvariable=self.filter_employee_id).pack(side=tk.LEFT, padx=5)
 
         customtkinter.CTkLabel(filter_frame, text="Location:").pack(side=tk.LEFT, padx=5, pady=5)
-        self.location = tk.StringVar()
-        customtkinter.CTkEntry(filter_frame, textvariable=self.location).pack(side=tk.LEFT, padx=5)
+        self.filter_location = tk.StringVar()
+        customtkinter.CTkEntry(filter_frame, textvariable=self.filter_location).pack(side=tk.LEFT, padx=5)
 
         customtkinter.CTkButton(filter_frame, text="Search", command=self.search_assets).pack(pady=(5, 5), padx=(30,5))
+        self.live_search = tk.BooleanVar(value=True)
+        customtkinter.CTkCheckBox(filter_frame, text="Search as you type", variable=self.live_search).pack(pady=(0, 5), padx=(30,5))
+        for variable in (self.filter_employee_name, self.filter_employee_id, self.filter_location):
+            variable.trace_add("write", self.schedule_live_search)
 
         columns = (
             "employee_name", "employee_id", "email_id", "location", "hostname", "processor", "ram", "hd_size", "mouse",
             "adaptor", "headset", "monitor", "it_others", "software_licenses", "asset_entry_date", "entered_by", "updated_by", "update_date")
-        self.assets_table = ttk.Treeview(manage_assets_frame, columns=columns, show="headings")
+        table_frame = customtkinter.CTkFrame(manage_assets_frame)
+        table_frame.pack(fill=tk.BOTH, expand=True)
+        # Shift/Ctrl-click select several assets for Bulk Edit and Remove.
+        self.assets_table = ttk.Treeview(table_frame, columns=columns, show="headings", selectmode="extended")
+        table_scrollbar = ttk.Scrollbar(table_frame, orient=tk.VERTICAL, command=self.assets_table.yview)
         self.assets_table.heading("employee_name", text="Employee Name")
         self.assets_table.heading("employee_id", text="Employee ID")
         self.assets_table.heading("email_id", text="Email ID")
@@ -428,21 +823,31 @@ class AssetManagementApp(customtkinter.CTk):
 
         for col_name in columns:
             self.assets_table.column(col_name, anchor=tk.CENTER)
-        self.assets_table.pack(fill=tk.BOTH, expand=True)
-
-        self.load_assets()
+        # Clicking a sortable heading sorts by it, clicking it again reverses the order.
+        self.sort_headings = {column: self.assets_table.heading(column, "text") for column in SORT_COLUMNS}
+        for column in SORT_COLUMNS:
+            self.assets_table.heading(column, command=lambda column=column: self.sort_assets(column))
+        self.show_sort_order()
+        table_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.assets_table.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        self.asset_grid = PagedAssetGrid(self.assets_table, table_scrollbar, self.submit_read, self.show_query_error,
+                                         on_loaded=self.screen_ready)
 
         action_frame = customtkinter.CTkFrame(manage_assets_frame)
         action_frame.pack(pady=(5, 10))
 
         customtkinter.CTkButton(action_frame, text="Update", command=self.update_asset).pack(side=tk.LEFT, padx=(0, 5))
+        customtkinter.CTkButton(action_frame, text="Bulk Edit", command=self.bulk_edit_assets).pack(side=tk.LEFT, padx=5)
         customtkinter.CTkButton(action_frame, text="Remove", command=self.remove_asset).pack(side=tk.LEFT, padx=(5, 0))
+        return manage_assets_frame
 
     def show_download_reports(self):
-        self.clear_main_content()
+        self.begin_screen("Download Reports")
+        self.show_view("Download Reports", self.build_download_reports)
+        self.screen_ready()
 
+    def build_download_reports(self):
         download_reports_frame = customtkinter.CTkFrame(self.main_content)
-        download_reports_frame.pack(fill=tk.BOTH, expand=True, pady=10, padx=(10,10))
 
         customtkinter.CTkLabel(download_reports_frame, text="Download Reports", font=("Arial", 16)).pack(fill=tk.BOTH, padx=5, pady=5)
         customtkinter.CTkLabel(download_reports_frame, text="Select Report:").pack(anchor="w", padx=5, pady=5)
@@ -459,89 +864,226 @@ class AssetManagementApp(customtkinter.CTk):
 
         customtkinter.CTkButton(download_reports_frame, text="Download",  command=self.download_report).pack(pady=10)
 
+        customtkinter.CTkLabel(download_reports_frame, text="Inventory by Location:").pack(anchor="w", padx=5, pady=5)
+        inventory_frame = customtkinter.CTkFrame(download_reports_frame)
+        inventory_frame.pack(fill=tk.X, pady=(10,10), padx=(10,10))
+        self.inventory_headings = {REPORT_HEADER[ASSET_COLUMNS.index(column)]: column for column in HARDWARE_COLUMNS}
+        self.inventory_heading = tk.StringVar(value=REPORT_HEADER[ASSET_COLUMNS.index("ram")])
+        customtkinter.CTkOptionMenu(inventory_frame, values=list(self.inventory_headings),
+                                    variable=self.inventory_heading).pack(side=tk.LEFT, padx=5, pady=(10,10))
+        customtkinter.CTkButton(inventory_frame, text="Download Inventory",
+                                command=self.download_inventory).pack(side=tk.LEFT, padx=5, pady=(10,10))
+
+        self.export_frame = customtkinter.CTkFrame(download_reports_frame)
+        self.export_status = customtkinter.CTkLabel(self.export_frame, text="")
+        self.export_status.pack(side=tk.LEFT, padx=10, pady=10)
+        self.export_progress = customtkinter.CTkProgressBar(self.export_frame, width=300)
+        self.export_progress.pack(side=tk.LEFT, padx=10, pady=10)
+        customtkinter.CTkButton(self.export_frame, text="Cancel", command=self.cancel_report).pack(side=tk.LEFT, padx=10, pady=10)
+        self.export_job = None
+        return download_reports_frame
+
     def add_asset(self):
-        employee_name = self.employee_name.get().strip()
-        employee_id = self.employee_id.get().strip()
-        email_id = self.email_id.get().strip()
-        location = self.location.get().strip()
-        hostname = self.hostname.get().strip()
-        processor = self.processor.get().strip()
-        ram = self.ram.get().strip()
-        hd_size = self.hd_size.get().strip()
-        mouse = self.mouse.get().strip()
-        adaptor = self.adaptor.get().strip()
-        headset = self.headset.get().strip()
-        monitor = self.monitor.get().strip()
-        it_others = self.it_others.get().strip()
-        software_licenses = self.software_licenses.get().strip()
-        asset_entry_date = self.asset_entry_date.get().strip()
-
-        if not all([employee_name, employee_id, email_id, location, hostname, processor, ram, hd_size, mouse, adaptor, headset, monitor, it_others, software_licenses, asset_entry_date]):
+        fields = {column: getattr(self, column).get().strip() for column in EDITABLE_COLUMNS}
+
+        if not all(fields.values()):
             messagebox.showerror("Error", "All fields are required!")
             return
 
-        if not self.validate_date(asset_entry_date):
+        if not self.validate_date(fields["asset_entry_date"]):
             messagebox.showerror("Error", "Dates must be in YYYY-MM-DD format.")
             return
 
-        try:
-            with self.conn.cursor() as cursor:
-                cursor.execute("""
-                            INSERT INTO assets (employee_name, employee_id, email_id, location, hostname, processor, ram, hd_size, mouse, adaptor, headset, monitor, it_others, software_licenses, asset_entry_date, entered_by)
-                            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                        """, (employee_name, employee_id, email_id, location, hostname, processor, ram, hd_size, mouse, adaptor, headset, monitor, it_others, software_licenses, asset_entry_date, self.current_user))
-            self.conn.commit()
+        def insert_asset(job):
+            with AssetRepository(job.conn).transaction() as repository:
+                asset_id = repository.create_asset(fields, self.current_user)
+                self.note_own_write(repository)
+            self.sync_replica(job.conn)
+            self.metrics.invalidate()
+            if self.ngram_index:
+                self.ngram_index.add(asset_id, [fields[column] for column in SEARCH_COLUMNS])
+
+        def on_added(_):
+            for column in EDITABLE_COLUMNS:
+                getattr(self, column).set("")
             messagebox.showinfo("Success", "Asset added successfully!")
             self.show_dashboard()
-        except psycopg2.IntegrityError: # UniqueViolation
-            messagebox.showerror("Error", "Asset with this Employee ID already exists.")
-            self.conn.rollback()
 
-    def validate_date(self, date_text):
-        try:
-            datetime.strptime(date_text, '%Y-%m-%d')
-            return True
-        except ValueError:
-            return False
+        self.submit_screen_job(insert_asset, on_success=on_added, on_error=self.show_asset_write_error)
 
-    def load_assets(self):
-        for row in self.assets_table.get_children():
-            self.assets_table.delete(row)
-
-        with self.conn.cursor() as cursor:
-            cursor.execute("SELECT * FROM assets WHERE remove_date IS NULL")
-            for row in cursor:
-                self.assets_table.insert("", tk.END, values=row[1:])
-
-    def search_assets(self):
-        employee_name = self.employee_name.get().strip()
-        employee_id = self.employee_id.get().strip()
-        location = self.location.get().strip()
+    def bulk_import_assets(self):
+        file_path = filedialog.askopenfilename(filetypes=[("CSV files", "*.csv"), ("All files", "*.*")])
+        if not file_path:
+            return
 
-        for row in self.assets_table.get_children():
-            self.assets_table.delete(row)
+        def on_imported(result):
+            self.metrics.invalidate()
+            if self.ngram_index:
+                self.ngram_index.invalidate()
+            self.import_status.configure(text="")
+            summary = (f"Rows read: {result.rows_read:,}\nAssets added: {result.inserted:,}\n"
+                       f"Assets updated: {result.updated:,}\nRows rejected: {len(result.errors):,}")
+            if result.error_report:
+                summary += f"\n\nRejected rows were written to {result.error_report}"
+            messagebox.showinfo("Import Complete", summary)
+
+        def on_import_error(error):
+            self.import_status.configure(text="")
+            self.show_query_error(error)
+
+        self.import_status.configure(text="Importing...")
+
+        def run_import(job):
+            with AssetRepository(job.conn).transaction() as repository:
+                result = repository.bulk_create(file_path, self.current_user, progress=job.report_progress)
+                self.note_own_write(repository)
+            self.sync_replica(job.conn)
+            return result
+
+        # Not a screen job: the Add Asset view is kept, so the import may finish while another screen is up.
+        self.executor.submit(run_import, on_success=on_imported, on_error=on_import_error,
+                             on_progress=lambda rows: self.import_status.configure(text=f"Importing... {rows:,} rows read"))
+
+    def load_attribute_values(self):
+        # Refreshed on every visit, so values added from other clients are suggested too. Suggestions are
+        # optional, so a failure leaves the boxes as they were instead of showing an error.
+        self.submit_read(lambda job, repository: repository.attribute_values(), on_success=self.show_attribute_values,
+                         on_error=lambda error: None)
+
+    def show_attribute_values(self, values):
+        self.attribute_values = values
+        self.suggestion_boxes = [(column, box) for column, box in self.suggestion_boxes if box.winfo_exists()]
+        for column, box in self.suggestion_boxes:
+            box.configure(values=values[column])
+
+    def suggestion_box(self, master, column, variable=None, **kwargs):
+        # A combo box needs a variable, or it starts out showing its first value instead of being blank.
+        box = customtkinter.CTkComboBox(master, values=self.attribute_values.get(column, []),
+                                        variable=variable or tk.StringVar(), **kwargs)
+        box.bind("<KeyRelease>", lambda event: self.filter_suggestions(column, box))
+        self.suggestion_boxes.append((column, box))
+        return box
+
+    def filter_suggestions(self, column, box):
+        typed = box.get().strip().lower()
+        values = self.attribute_values.get(column, [])
+        box.configure(values=[value for value in values if typed in value.lower()] or values)
 
-        query = "SELECT * FROM assets WHERE 1=1"
-        params = []
+    def validate_date(self, date_text):
+        return validate_date(date_text)
+
+    def schedule_live_search(self, *args):
+        if self.live_search_after:
+            self.after_cancel(self.live_search_after)
+            self.live_search_after = None
+        if self.live_search.get():
+            self.live_search_after = self.after(SEARCH_DEBOUNCE_MS, lambda: self.search_assets(refine=True))
+
+    def search_assets(self, refine=False):
+        self.live_search_after = None
+        employee_name = self.filter_employee_name.get().strip()
+        employee_id = self.filter_employee_id.get().strip()
+        location = self.filter_location.get().strip()
+
+        criteria = (employee_name, employee_id, location)
+        previous, self.last_search = self.last_search, criteria
+        if criteria == previous and refine:
+            return
+        if refine and previous is not None and self.asset_grid.is_complete() and \
+                all(old.lower() in new.lower() for old, new in zip(previous, criteria)):
+            # The user is narrowing a search whose full result is already on screen: filter it locally.
+            terms = [(position, term.lower()) for position, term in zip((0, 1, 3), criteria) if term]
+            self.asset_grid.filter_loaded(lambda values: all(term in str(values[position]).lower() for position, term in terms))
+            return
 
-        if employee_name:
-            query += " AND employee_name ILIKE %s"
-            params.append(f"%{employee_name}%")
+        search = {"employee_name": employee_name, "employee_id": employee_id, "location": location}
+        order = {"sort_by": self.sort_by, "descending": self.sort_descending}
+        if self.ngram_index is not None and any(criteria):
+            matches = []
 
-        if employee_id:
-            query += " AND employee_id ILIKE %s"
-            params.append(f"%{employee_id}%")
+            def fetch_matches(repository, **keyset):
+                if not keyset:
+                    self.ngram_index.ensure_loaded(repository)
+                    matches[:] = self.ngram_index.search(search)
+                return repository.search_ids(matches, limit=PAGE_SIZE, **order, **keyset)
 
-        if location:
-            query += " AND location ILIKE %s"
-            params.append(f"%{location}%")
+            self.asset_grid.reset(fetch_matches, self.sort_by)
+            return
 
-        query += " AND remove_date IS NULL"
+        self.asset_grid.reset(lambda repository, **keyset: repository.search(search, limit=PAGE_SIZE, **order, **keyset),
+                              self.sort_by)
+
+    def sort_assets(self, column):
+        if self.sort_by == column:
+            self.sort_descending = not self.sort_descending
+        else:
+            self.sort_by, self.sort_descending = column, False
+        self.show_sort_order()
+        self.search_assets()
+
+    def show_sort_order(self):
+        for column, text in self.sort_headings.items():
+            if column == self.sort_by:
+                text += " ▼" if self.sort_descending else " ▲"
+            self.assets_table.heading(column, text=text)
+
+    def matches_search(self, row):
+        # The current Manage Assets filters, applied to a full asset row the way ILIKE applies them.
+        if row[ASSET_COLUMNS.index("remove_date")] is not None:
+            return False
+        return all(term.lower() in str(row[ASSET_COLUMNS.index(column)]).lower()
+                   for column, term in zip(SEARCH_COLUMNS, self.last_search or ()) if term)
+
+    def poll_changes(self):
+        changes = self.change_listener.drain() if self.change_listener else []
+        if RESYNC in changes:
+            self.resync_views()
+        elif changes:
+            self.apply_changes(changes)
+        self.after(CHANGE_POLL_MS, self.poll_changes)
+
+    def apply_changes(self, changes):
+        # Assets changed by any client, this one included, as announced by the database.
+        metrics = self.metrics.apply(changes)
+        if metrics is not None:
+            self.show_metrics(metrics)
+
+        # This client's own writes have patched the screen already.
+        changed_ids = {change.asset_id for change in changes if change.xid not in self.own_transactions}
+        if not changed_ids:
+            return
+        patch_grid = self.current_view == "Manage Assets"
+        if patch_grid and len(changed_ids) > MAX_PATCHED_ROWS:
+            self.search_assets()
+            patch_grid = False
+        if not (patch_grid or self.ngram_index or self.replica):
+            return
 
-        with self.conn.cursor() as cursor:
-            cursor.execute(query, params)
-            for row in cursor:
-                self.assets_table.insert("", tk.END, values=row[1:])
+        def fetch_changed(job):
+            self.sync_replica(job.conn)
+            rows = AssetRepository(job.conn).get_assets(sorted(changed_ids))
+            self.index_rows(rows)
+            if self.ngram_index:
+                for asset_id in changed_ids - {row[0] for row in rows}:
+                    self.ngram_index.remove(asset_id)
+            return rows
+
+        def on_fetched(rows):
+            if patch_grid and self.current_view == "Manage Assets":
+                self.asset_grid.patch(changed_ids, rows, self.matches_search)
+
+        # Background upkeep: on failure the rows are simply refreshed by the next reload.
+        self.executor.submit(fetch_changed, on_success=on_fetched, on_error=lambda error: None, idempotent=True)
+
+    def resync_views(self):
+        # Notifications were missed while the listener was reconnecting: reload instead of patching.
+        self.metrics.invalidate()
+        if self.ngram_index:
+            self.ngram_index.invalidate()
+        if self.current_view == "Dashboard":
+            self.refresh_dashboard()
+        elif self.current_view == "Manage Assets":
+            self.search_assets()
 
     def update_asset(self):
         selected_item = self.assets_table.selection()
@@ -549,6 +1091,12 @@ class AssetManagementApp(customtkinter.CTk):
             messagebox.showerror("Error", "No asset selected!")
             return
 
+        if len(selected_item) > 1:
+            self.bulk_edit_assets()
+            return
+
+        # Treeview items are keyed by asset id.
+        asset_id = int(selected_item[0])
         item = self.assets_table.item(selected_item)
         asset_details = item['values']
 
@@ -576,9 +1124,9 @@ class AssetManagementApp(customtkinter.CTk):
         email_entry.insert(0, asset_details[2])
 
         customtkinter.CTkLabel(update_form_frame, text="Location:").grid(row=3, column=0, sticky="w", padx=5, pady=5)
-        location_entry = customtkinter.CTkEntry(update_form_frame)
+        location_entry = self.suggestion_box(update_form_frame, "location")
         location_entry.grid(row=3, column=1, padx=5, pady=5)
-        location_entry.insert(0, asset_details[3])
+        location_entry.set(asset_details[3])
 
         customtkinter.CTkLabel(update_form_frame, text="Hostname:").grid(row=4, column=0, sticky="w", padx=5, pady=5)
         hostname_entry = customtkinter.CTkEntry(update_form_frame)
@@ -586,39 +1134,39 @@ class AssetManagementApp(customtkinter.CTk):
         hostname_entry.insert(0, asset_details[4])
 
         customtkinter.CTkLabel(update_form_frame, text="Processor:").grid(row=5, column=0, sticky="w", padx=5, pady=5)
-        processor_entry = customtkinter.CTkEntry(update_form_frame)
+        processor_entry = self.suggestion_box(update_form_frame, "processor")
         processor_entry.grid(row=5, column=1, padx=5, pady=5)
-        processor_entry.insert(0, asset_details[5])
+        processor_entry.set(asset_details[5])
 
         customtkinter.CTkLabel(update_form_frame, text="RAM:").grid(row=6, column=0, sticky="w", padx=5, pady=5)
-        ram_entry = customtkinter.CTkEntry(update_form_frame)
+        ram_entry = self.suggestion_box(update_form_frame, "ram")
         ram_entry.grid(row=6, column=1, padx=5, pady=5)
-        ram_entry.insert(0, asset_details[6])
+        ram_entry.set(asset_details[6])
 
         customtkinter.CTkLabel(update_form_frame, text="HDD Size:").grid(row=7, column=0, sticky="w", padx=5, pady=5)
-        hd_size_entry = customtkinter.CTkEntry(update_form_frame)
+        hd_size_entry = self.suggestion_box(update_form_frame, "hd_size")
         hd_size_entry.grid(row=7, column=1, padx=5, pady=5)
-        hd_size_entry.insert(0, asset_details[7])
+        hd_size_entry.set(asset_details[7])
 
         customtkinter.CTkLabel(update_form_frame, text="Mouse:").grid(row=8, column=0, sticky="w", padx=5, pady=5)
-        mouse_entry = customtkinter.CTkEntry(update_form_frame)
+        mouse_entry = self.suggestion_box(update_form_frame, "mouse")
         mouse_entry.grid(row=8, column=1, padx=5, pady=5)
-        mouse_entry.insert(0, asset_details[8])
+        mouse_entry.set(asset_details[8])
 
         customtkinter.CTkLabel(update_form_frame, text="Adaptor:").grid(row=9, column=0, sticky="w", padx=5, pady=5)
-        adaptor_entry = customtkinter.CTkEntry(update_form_frame)
+        adaptor_entry = self.suggestion_box(update_form_frame, "adaptor")
         adaptor_entry.grid(row=9, column=1, padx=5, pady=5)
-        adaptor_entry.insert(0, asset_details[9])
+        adaptor_entry.set(asset_details[9])
 
         customtkinter.CTkLabel(update_form_frame, text="Headset:").grid(row=10, column=0, sticky="w", padx=5, pady=5)
-        headset_entry = customtkinter.CTkEntry(update_form_frame)
+        headset_entry = self.suggestion_box(update_form_frame, "headset")
         headset_entry.grid(row=10, column=1, padx=5, pady=5)
-        headset_entry.insert(0, asset_details[10])
+        headset_entry.set(asset_details[10])
 
         customtkinter.CTkLabel(update_form_frame, text="Monitor:").grid(row=11, column=0, sticky="w", padx=5, pady=5)
-        monitor_entry = customtkinter.CTkEntry(update_form_frame)
+        monitor_entry = self.suggestion_box(update_form_frame, "monitor")
         monitor_entry.grid(row=11, column=1, padx=5, pady=5)
-        monitor_entry.insert(0, asset_details[11])
+        monitor_entry.set(asset_details[11])
 
         customtkinter.CTkLabel(update_form_frame, text="IT Others:").grid(row=12, column=0, sticky="w", padx=5, pady=5)
         it_others_entry = customtkinter.CTkEntry(update_form_frame)
@@ -651,7 +1199,6 @@ class AssetManagementApp(customtkinter.CTk):
             updated_it_others = it_others_entry.get().strip()
             updated_software_licenses = software_licenses_entry.get().strip()
             updated_asset_entry_date= asset_entry_date_entry.get().strip()
-            updated_date = datetime.now().strftime('%Y-%m-%d')
 
             if not all([updated_employee_name, updated_employee_id, updated_email_id, updated_location, updated_hostname,
                         updated_processor, updated_ram, updated_hd_size, updated_mouse, updated_adaptor, updated_headset,
@@ -663,24 +1210,30 @@ class AssetManagementApp(customtkinter.CTk):
                 messagebox.showerror("Error", "Dates must be in YYYY-MM-DD format.")
                 return
 
-            try:
-                with self.conn.cursor() as cursor:
-                    cursor.execute("""
-                        UPDATE assets
-                        SET employee_name = %s, employee_id = %s, email_id = %s, location = %s, hostname = %s, processor = %s, ram = %s, hd_size = %s, mouse = %s, adaptor = %s, headset = %s, monitor= %s, it_others = %s, software_licenses = %s, asset_entry_date = %s, update_date = %s, updated_by = %s
-                        WHERE employee_id = %s
-                    """, (updated_employee_name, updated_employee_id, updated_email_id, updated_location, updated_hostname,
-                          updated_processor, updated_ram, updated_hd_size, updated_mouse, updated_adaptor, updated_headset,
-                          updated_monitor, updated_it_others, updated_software_licenses, updated_asset_entry_date, updated_date,
-                          self.current_user, updated_employee_id))
-                    self.conn.commit()
-
-                messagebox.showinfo("Success", "Asset updated successfully!")
-                self.load_assets()
+            def apply_update(job):
+                fields = dict(zip(EDITABLE_COLUMNS, (
+                    updated_employee_name, updated_employee_id, updated_email_id, updated_location, updated_hostname,
+                    updated_processor, updated_ram, updated_hd_size, updated_mouse, updated_adaptor, updated_headset,
+                    updated_monitor, updated_it_others, updated_software_licenses, updated_asset_entry_date)))
+                with AssetRepository(job.conn).transaction() as repository:
+                    row = repository.update_asset(asset_id, fields, self.current_user)
+                    self.note_own_write(repository)
+                self.sync_replica(job.conn)
+                self.metrics.invalidate()
+                if self.ngram_index and row:
+                    self.ngram_index.add(asset_id, (updated_employee_name, updated_employee_id, updated_location))
+                return row
+
+            def on_updated(row):
+                # Patch just this row: the filter, selection and scroll position stay as they are.
+                self.asset_grid.patch({asset_id}, [row] if row else [], self.matches_search)
+                if row:
+                    messagebox.showinfo("Success", "Asset updated successfully!")
+                else:
+                    messagebox.showerror("Error", "This asset no longer exists.")
                 update_window.destroy()
-            except psycopg2.IntegrityError:
-                messagebox.showerror("Error", "Asset with this Employee ID already exists.")
-                self.conn.rollback()
+
+            self.executor.submit(apply_update, on_success=on_updated, on_error=self.show_asset_write_error)
 
         customtkinter.CTkButton(update_window, text="Save", command=save_update).pack(pady=10)
 
@@ -690,99 +1243,266 @@ class AssetManagementApp(customtkinter.CTk):
             messagebox.showerror("Error", "No asset selected!")
             return
 
-        item = self.assets_table.item(selected_item)
-        asset_details = item['values']
-        employee_id = asset_details[1]
+        asset_ids = [int(iid) for iid in selected_item]
+        question = ("Are you sure you want to remove this asset?" if len(asset_ids) == 1
+                    else f"Are you sure you want to remove these {len(asset_ids)} assets?")
 
-        confirm = messagebox.askyesno("Confirm", "Are you sure you want to remove this asset?")
+        confirm = messagebox.askyesno("Confirm", question)
         if confirm:
-            with self.conn.cursor() as cursor:
-                current_date = datetime.now().strftime('%Y-%m-%d')
-                cursor.execute("UPDATE assets SET remove_date = %s WHERE employee_id = %s", (current_date, str(employee_id)))
-                self.conn.commit()
+            def apply_remove(job):
+                # One statement and one transaction for the whole selection.
+                with AssetRepository(job.conn).transaction() as repository:
+                    rows = repository.remove_assets(asset_ids)
+                    self.note_own_write(repository)
+                self.sync_replica(job.conn)
+                self.metrics.invalidate()
+                self.index_rows(rows)
+                return rows
+
+            def on_removed(rows):
+                # Removed rows no longer match the filter, so patching detaches just their items.
+                self.asset_grid.patch(set(asset_ids), rows, self.matches_search)
+                if len(asset_ids) == 1:
+                    messagebox.showinfo("Success", "Asset removed successfully!")
+                else:
+                    messagebox.showinfo("Success", f"{len(rows)} assets removed successfully!")
+
+            self.submit_screen_job(apply_remove, on_success=on_removed)
+
+    def bulk_edit_assets(self):
+        selected_item = self.assets_table.selection()
+        if not selected_item:
+            messagebox.showerror("Error", "No asset selected!")
+            return
 
-            messagebox.showinfo("Success", "Asset removed successfully!")
-            self.load_assets()
+        asset_ids = [int(iid) for iid in selected_item]
+
+        bulk_window = customtkinter.CTkToplevel(self)
+        bulk_window.title("Bulk Edit Assets")
+
+        bulk_form_frame = customtkinter.CTkFrame(bulk_window)
+        bulk_form_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
+
+        customtkinter.CTkLabel(bulk_form_frame, text=f"Set fields on {len(asset_ids)} selected assets. "
+                                                     "Blank fields are left unchanged.").grid(
+            row=0, column=0, columnspan=2, sticky="w", padx=5, pady=(5, 10))
+        entries = {}
+        for row, column in enumerate(BULK_UPDATE_COLUMNS, start=1):
+            customtkinter.CTkLabel(bulk_form_frame, text=f"{REPORT_HEADER[ASSET_COLUMNS.index(column)]}:").grid(
+                row=row, column=0, sticky="w", padx=5, pady=5)
+            if column in SUGGESTED_COLUMNS:
+                entries[column] = self.suggestion_box(bulk_form_frame, column)
+            else:
+                entries[column] = customtkinter.CTkEntry(bulk_form_frame)
+            entries[column].grid(row=row, column=1, padx=5, pady=5)
+
+        def save_bulk_edit():
+            fields = {column: entry.get().strip() for column, entry in entries.items() if entry.get().strip()}
+            if not fields:
+                messagebox.showerror("Error", "Enter at least one field to change.")
+                return
+
+            def apply_bulk_edit(job):
+                with AssetRepository(job.conn).transaction() as repository:
+                    rows = repository.update_assets(asset_ids, fields, self.current_user)
+                    self.note_own_write(repository)
+                self.sync_replica(job.conn)
+                self.metrics.invalidate()
+                self.index_rows(rows)
+                return rows
+
+            def on_bulk_edited(rows):
+                self.asset_grid.patch(set(asset_ids), rows, self.matches_search)
+                messagebox.showinfo("Success", f"{len(rows)} assets updated successfully!")
+                bulk_window.destroy()
+
+            self.executor.submit(apply_bulk_edit, on_success=on_bulk_edited, on_error=self.show_asset_write_error)
+
+        customtkinter.CTkButton(bulk_window, text="Save", command=save_bulk_edit).pack(pady=10)
+
+    def note_own_write(self, repository):
+        # Called inside the write's transaction, so it is known before any notification of it arrives.
+        self.own_transactions.append(repository.transaction_id())
+
+    def index_rows(self, rows):
+        # Keep the in-process search index in step with rows this client just wrote.
+        if self.ngram_index:
+            for row in rows:
+                if row[ASSET_COLUMNS.index("remove_date")] is None:
+                    self.ngram_index.add(row[0], [row[ASSET_COLUMNS.index(column)] for column in SEARCH_COLUMNS])
+                else:
+                    self.ngram_index.remove(row[0])
 
     def download_report(self):
+        if self.export_job:
+            messagebox.showerror("Error", "A report is already being downloaded.")
+            return
+
         report_type = self.report_type.get()
 
-        query = "SELECT * FROM assets"
-        if report_type == "All Active Assets":
-            query += " WHERE remove_date IS NULL"
-        elif report_type == "Assets Added This Month":
-            query += """ WHERE TO_DATE(asset_entry_date, 'YYYY-MM-DD') >= DATE_TRUNC('month', CURRENT_DATE)
-                        AND TO_DATE(asset_entry_date, 'YYYY-MM-DD') < DATE_TRUNC('month', CURRENT_DATE) + INTERVAL '1 month' """
-        elif report_type == "Assets Updated This Month":
-            query += """ WHERE TO_DATE(update_date, 'YYYY-MM-DD') >= DATE_TRUNC('month', CURRENT_DATE)
-                        AND TO_DATE(update_date, 'YYYY-MM-DD') < DATE_TRUNC('month', CURRENT_DATE) + INTERVAL '1 month' """
-        elif report_type == "Assets Removed This Month":
-            query += """ WHERE TO_DATE(remove_date, 'YYYY-MM-DD') >= DATE_TRUNC('month', CURRENT_DATE)
-                        AND TO_DATE(remove_date, 'YYYY-MM-DD') < DATE_TRUNC('month', CURRENT_DATE) + INTERVAL '1 month' """
-
-        assets = []
-        with self.conn.cursor() as cursor:
-            cursor.execute(query)
-            assets = cursor.fetchall()
-        print(assets)
+        file_path = filedialog.asksaveasfilename(defaultextension=".csv",
+                                                 filetypes=[("CSV files", "*.csv"), ("All files", "*.*")])
+        if not file_path:
+            return
+
+        def write_report(job, repository):
+            try:
+                with open(file_path, mode='w', newline='') as file:
+                    written = repository.export_report(report_type, file, progress=job.report_progress)
+                repository.conn.commit()
+                return written
+            except Exception:
+                # Never leave a truncated report behind after a cancel or a failure.
+                if os.path.exists(file_path):
+                    os.remove(file_path)
+                raise
+
+        def on_progress(progress):
+            written, total = progress
+            self.export_progress.set(written / total if total else 1)
+            self.export_status.configure(text=f"{written:,} of {total:,} rows")
+
+        def on_finished(written):
+            self.finish_report()
+            messagebox.showinfo("Success", f"Report saved to {file_path} ({written:,} rows)")
+
+        def on_failed(error):
+            self.finish_report()
+            self.show_query_error(error)
+
+        self.export_progress.set(0)
+        self.export_status.configure(text="Preparing report...")
+        self.export_frame.pack(pady=10)
+        # Kept running when the user leaves the screen; the progress bar is still there on return.
+        self.export_job = self.submit_read(write_report, on_success=on_finished, on_error=on_failed,
+                                           on_progress=on_progress)
+
+    def cancel_report(self):
+        if self.export_job:
+            self.export_job.cancel()
+            self.finish_report()
+            messagebox.showinfo("Cancelled", "Report download cancelled.")
+
+    def finish_report(self):
+        self.export_job = None
+        self.export_frame.pack_forget()
+
+    def download_inventory(self):
+        column = self.inventory_headings[self.inventory_heading.get()]
 
         file_path = filedialog.asksaveasfilename(defaultextension=".csv",
                                                  filetypes=[("CSV files", "*.csv"), ("All files", "*.*")])
         if not file_path:
             return
 
-        with open(file_path, mode='w', newline='') as file:
-            writer = csv.writer(file)
-            writer.writerow(["ID", "Employee Name", "Employee ID", "Email ID", "Location", "Hostname", "Processor",
-                             "RAM", "HDD Size", "Mouse", "Adaptor", "Headset", "Monitor", "IT Others", "Software Licenses",
-                             "Asset Entry Date", "Asset Entered By", "Asset Updated By", "Asset Updated Date", "Asset Remove Date"])
-            for asset in assets:
-                writer.writerow(asset)
-
-        messagebox.showinfo("Success", f"Report saved to {file_path}")
-
-    def get_total_assets(self):
-        with self.conn.cursor() as cursor:
-            cursor.execute("SELECT COUNT(*) FROM assets WHERE remove_date IS NULL")
-            return cursor.fetchone()[0]
-
-    def get_assets_added_this_month(self):
-        query = """SELECT COUNT(*)
-                  FROM assets
-                  WHERE TO_DATE(asset_entry_date, 'YYYY-MM-DD') >= DATE_TRUNC('month', CURRENT_DATE)
-                  AND TO_DATE(asset_entry_date, 'YYYY-MM-DD') < DATE_TRUNC('month', CURRENT_DATE) + INTERVAL '1 month'
-        """
-        with self.conn.cursor() as cursor:
-            cursor.execute(query)
-
-            return cursor.fetchone()[0]
-
-    def get_assets_updated_this_month(self):
-        query = """SELECT COUNT(*)
-                  FROM assets
-                  WHERE TO_DATE(update_date, 'YYYY-MM-DD') >= DATE_TRUNC('month', CURRENT_DATE)
-                  AND TO_DATE(update_date, 'YYYY-MM-DD') < DATE_TRUNC('month', CURRENT_DATE) + INTERVAL '1 month'
-                """
-        with self.conn.cursor() as cursor:
-            cursor.execute(query)
-            return cursor.fetchone()[0]
-
-    def get_assets_removed_this_month(self):
-        query = """SELECT COUNT(*)
-                  FROM assets
-                  WHERE TO_DATE(remove_date, 'YYYY-MM-DD') >= DATE_TRUNC('month', CURRENT_DATE)
-                  AND TO_DATE(remove_date, 'YYYY-MM-DD') < DATE_TRUNC('month', CURRENT_DATE) + INTERVAL '1 month'
-                """
-        with self.conn.cursor() as cursor:
-            cursor.execute(query)
-            return cursor.fetchone()[0]
+        def write_inventory(job, repository):
+            try:
+                with open(file_path, mode='w', newline='') as file:
+                    written = repository.export_inventory(column, file)
+                repository.conn.commit()
+                return written
+            except Exception:
+                if os.path.exists(file_path):
+                    os.remove(file_path)
+                raise
+
+        def on_finished(written):
+            messagebox.showinfo("Success", f"Inventory saved to {file_path} ({written:,} rows)")
+
+        self.submit_read(write_inventory, on_success=on_finished)
 
     def change_appearance_mode_event(self, new_appearance_mode):
         customtkinter.set_appearance_mode(new_appearance_mode)
 
-    def clear_main_content(self):
-        for widget in self.main_content.winfo_children():
-            widget.destroy()
+    def submit_screen_job(self, fn, on_success=None, on_error=None, on_progress=None, idempotent=False):
+        # Jobs tied to the current screen are cancelled when the user navigates away from it.
+        job = self.executor.submit(fn, on_success=on_success, on_error=on_error, on_progress=on_progress,
+                                   idempotent=idempotent)
+        self.screen_jobs.append(job)
+        return job
+
+    def submit_read(self, fn, on_success=None, on_error=None, on_progress=None, screen_job=False):
+        """
+        Run fn(job, repository) on a worker thread. repository reads from the local replica
+        when it holds a full copy, without touching the primary, and from the primary otherwise.
+        """
+        replica = self.replica
+        if replica and replica.ready:
+            job = self.executor.submit(lambda job: fn(job, replica.repository()), on_success=on_success,
+                                       on_error=on_error, on_progress=on_progress, connection=False)
+        else:
+            job = self.executor.submit(lambda job: fn(job, AssetRepository(job.conn)), on_success=on_success,
+                                       on_error=on_error, on_progress=on_progress, idempotent=True)
+        if screen_job:
+            self.screen_jobs.append(job)
+        return job
+
+    def sync_replica(self, conn):
+        # Pull a write into the replica straight after its commit, so the screen that reloads next shows it.
+        if self.replica:
+            try:
+                self.replica.sync(conn)
+            except Exception:
+                pass  # recorded in replica.last_error; the background sync catches up
+
+    def show_query_error(self, error):
+        messagebox.showerror("Error", str(error))
+
+    def show_asset_write_error(self, error):
+        if isinstance(error, psycopg2.IntegrityError):  # UniqueViolation
+            messagebox.showerror("Error", "An active asset with this Employee ID already exists.")
+        else:
+            self.show_query_error(error)
+
+    def set_busy(self, busy):
+        if busy:
+            self.busy_indicator.place(relx=1.0, rely=1.0, x=-15, y=-5, anchor="se")
+            self.busy_indicator.start()
+            self.configure(cursor="watch")
+        else:
+            self.busy_indicator.stop()
+            self.busy_indicator.place_forget()
+            self.configure(cursor="")
+
+    def begin_screen(self, name):
+        # Queries submitted from here on are attributed to this screen in the diagnostics panel.
+        self.executor.screen = name
+        self.screen_started = (name, time.perf_counter())
+
+    def screen_ready(self):
+        # Render time runs from navigation until the screen is laid out with its first data.
+        if self.screen_started:
+            name, started = self.screen_started
+            self.screen_started = None
+            self.update_idletasks()
+            query_stats.STATS.record_render(name, time.perf_counter() - started)
+
+    def show_diagnostics(self, event=None):
+        if self.diagnostics and self.diagnostics.winfo_exists():
+            self.diagnostics.lift()
+        else:
+            # Hidden developer tool; not worth importing on every launch.
+            from diagnostics_panel import DiagnosticsPanel
+            self.diagnostics = DiagnosticsPanel(self, startup_report=startup_timer.report())
+
+    def show_view(self, name, build):
+        self.leave_view()
+        view = self.views.get(name)
+        if view is None:
+            view = self.views[name] = build()
+            view.grid(row=0, column=0, sticky="nsew", pady=10, padx=(10,10))
+        view.tkraise()
+        self.current_view = name
+
+    def leave_view(self):
+        if self.live_search_after:
+            self.after_cancel(self.live_search_after)
+            self.live_search_after = None
+        for job in self.screen_jobs:
+            job.cancel()
+        self.screen_jobs = []
+        if self.asset_grid:
+            self.asset_grid.cancel()
 
     def clear_main_content1(self):
         self.login_frame.destroy()
@@ -791,9 +1511,17 @@ class AssetManagementApp(customtkinter.CTk):
         self.register_frame.destroy()
 
     def logout(self):
+        self.authenticator.forget(self.current_user)
+        self.executor.shutdown()
+        if self.change_listener:
+            self.change_listener.stop()
+        if self.replica_syncer:
+            self.replica_syncer.stop()
+        if self.pool:
+            self.pool.close()
         self.destroy()
 
 
 if __name__ == "__main__":
-    app = AssetManagementApp()
+    app = AssetManagementApp(show_startup_timing="--startup-timing" in sys.argv[1:])
     app.mainloop()
@@ -0,0 +1,465 @@
+"""
+Data access layer for the Asset Management Portal.
+
+AssetRepository holds every query the portal runs against the assets and users
+tables. It works on a single psycopg2 connection and never commits on its own:
+callers group writes with `with repository.transaction():`. It imports nothing from
+tkinter or customtkinter, so it can be used from scripts, batch jobs and benchmarks
+as well as from the GUI.
+
+Asset rows are returned as tuples in asset_fields.ASSET_COLUMNS order.
+"""
+
+
+import bisect
+import csv
+from contextlib import contextmanager
+from datetime import date, datetime
+from typing import IO, Callable, Dict, Iterator, List, Mapping, Optional, Sequence, Tuple
+
+from asset_fields import (ASSET_COLUMNS, ASSET_DETAILS_SELECT, HARDWARE_COLUMNS, REPORT_HEADER, decoded_column,
+                          lookup_table, stored_column, stored_value, this_month)
+from asset_import import ImportResult, import_assets
+from monthly_rollup import TREND_MONTHS, TREND_SQL, fill_months, location_breakdown_sql
+
+
+AssetRow = Tuple
+UserRow = Tuple[int, str, str, str, str]
+Progress = Callable[..., None]
+
+DEFAULT_PAGE_SIZE = 200
+EXPORT_CHUNK_SIZE = 5000
+
+# Columns of the Add/Update Asset forms, i.e. everything but the id and the audit columns.
+EDITABLE_COLUMNS = ASSET_COLUMNS[1:16]
+SEARCH_FILTERS = ("employee_name", "employee_id", "location")
+# Columns the Manage Assets grid can be sorted by; each has an index on (sort_expression, id).
+SORT_COLUMNS = ("employee_name", "employee_id", "email_id", "location", "hostname", "asset_entry_date",
+                "update_date")
+# update_date is NULL until an asset is first updated; those assets sort as if updated on date.min.
+NULL_SORT_VALUES = {"update_date": date.min}
+# Fields that can be set across many assets at once; the rest identify one person or machine.
+BULK_UPDATE_COLUMNS = ("location", "processor", "ram", "hd_size", "mouse", "adaptor", "headset", "monitor",
+                       "it_others", "software_licenses")
+
+
+# The rows of an UPDATE assets ... RETURNING, with their hardware attributes decoded. The lookups run in the
+# statement's snapshot, so an UPDATE that may add lookup values returns ids and reads the view afterwards.
+ASSET_RETURNING = ", ".join(decoded_column(column) for column in ASSET_COLUMNS)
+# Fields the Add/Update forms suggest values for as the user types.
+SUGGESTED_COLUMNS = ("location",) + HARDWARE_COLUMNS
+
+
+def events_this_month(event: str) -> str:
+    """Ids of the assets with an asset_events event of this kind this month, read from this month's partition."""
+    return f"SELECT asset_id FROM asset_events WHERE event = '{event}' AND {this_month('event_date')}"
+
+
+REPORT_FILTERS = {
+    "All Assets": "",
+    "All Active Assets": "remove_date IS NULL",
+    "Assets Added This Month": f"id IN ({events_this_month('added')})",
+    "Assets Updated This Month": f"id IN ({events_this_month('updated')})",
+    "Assets Removed This Month": f"id IN ({events_this_month('removed')})",
+}
+REPORT_TYPES = tuple(REPORT_FILTERS)
+# Reports that also read the removed assets moved to assets_archive (see asset_archive).
+ARCHIVE_REPORTS = ("All Assets",)
+
+# The monthly counters count distinct assets, so an asset edited twice this month is updated once.
+METRICS_SQL = f"""
+    SELECT (SELECT COUNT(*) FROM assets WHERE remove_date IS NULL),
+           (SELECT COUNT(DISTINCT asset_id) FROM ({events_this_month("added")}) AS added),
+           (SELECT COUNT(DISTINCT asset_id) FROM ({events_this_month("updated")}) AS updated),
+           (SELECT COUNT(DISTINCT asset_id) FROM ({events_this_month("removed")}) AS removed),
+           pg_current_snapshot()::text
+"""
+METRIC_NAMES = ("total_assets", "assets_added", "assets_updated", "assets_removed")
+
+# Active locations come from the inventory index; hardware values from their lookup tables.
+ATTRIBUTE_VALUES_SQL = " UNION ALL ".join(
+    ["SELECT DISTINCT 'location', location FROM assets WHERE remove_date IS NULL"]
+    + [f"SELECT '{column}', value FROM {lookup_table(column)}" for column in HARDWARE_COLUMNS]) + " ORDER BY 1, 2"
+
+
+def today() -> str:
+    return datetime.now().strftime('%Y-%m-%d')
+
+
+def sort_expression(column: str) -> str:
+    if column in NULL_SORT_VALUES:
+        return f"COALESCE({column}, '{NULL_SORT_VALUES[column].isoformat()}')"
+    return column
+
+
+def sort_key(row: AssetRow, sort_by: Optional[str] = None) -> Tuple:
+    """Keyset position of an asset row: (sort value, id) when sorted by a column, (id,) in id order."""
+    if sort_by is None:
+        return (row[0],)
+    value = row[ASSET_COLUMNS.index(sort_by)]
+    return (NULL_SORT_VALUES.get(sort_by) if value is None else value, row[0])
+
+
+def keyset_page(sort_by: Optional[str], descending: bool, after: Optional[Tuple], before: Optional[Tuple],
+                placeholder: str = "%s") -> Tuple[Optional[str], List, str, bool]:
+    """
+    (condition, params, ORDER BY list, reverse) for the page after or before a sort_key
+    position. A page before the position is read backwards, so its rows must be reversed.
+    """
+    if sort_by is not None and sort_by not in SORT_COLUMNS:
+        raise ValueError(f"Cannot sort by {sort_by}")
+    columns = ["id"] if sort_by is None else [sort_expression(sort_by), "id"]
+    backwards = before is not None
+    direction = "DESC" if descending != backwards else "ASC"
+    order_by = ", ".join(f"{column} {direction}" for column in columns)
+
+    position = before if backwards else after
+    if position is None:
+        return None, [], order_by, backwards
+    operator = "<" if direction == "DESC" else ">"
+    condition = (f"({', '.join(columns)}) {operator} ({', '.join([placeholder] * len(columns))})" if sort_by
+                 else f"id {operator} {placeholder}")
+    return condition, list(position), order_by, backwards
+
+
+class AssetRepository:
+    def __init__(self, conn):
+        self.conn = conn
+
+    @contextmanager
+    def transaction(self) -> Iterator["AssetRepository"]:
+        """Commit everything done inside the block, or roll it all back if it raises."""
+        try:
+            yield self
+            self.conn.commit()
+        except BaseException:
+            self.conn.rollback()
+            raise
+
+    # Assets
+
+    def create_asset(self, fields: Mapping[str, str], entered_by: Optional[str]) -> int:
+        columns = EDITABLE_COLUMNS + ("entered_by",)
+        with self.conn.cursor() as cursor:
+            cursor.execute(f"""
+                INSERT INTO assets ({', '.join(stored_column(column) for column in columns)})
+                VALUES ({', '.join(stored_value(column, '%s') for column in columns)})
+                RETURNING id
+            """, [fields[column] for column in EDITABLE_COLUMNS] + [entered_by])
+            return cursor.fetchone()[0]
+
+    def bulk_create(self, file_path: str, imported_by: Optional[str], progress: Optional[Progress] = None) -> ImportResult:
+        """Validate and upsert the assets in a CSV laid out like the downloadable report."""
+        return import_assets(self.conn, file_path, imported_by, progress=progress)
+
+    def get_asset(self, asset_id: int) -> Optional[AssetRow]:
+        with self.conn.cursor() as cursor:
+            cursor.execute(f"{ASSET_DETAILS_SELECT} WHERE id = %s", (asset_id,))
+            return cursor.fetchone()
+
+    def get_assets(self, ids: Sequence[int]) -> List[AssetRow]:
+        """The assets with the given ids, removed ones included, in id order."""
+        with self.conn.cursor() as cursor:
+            cursor.execute(f"{ASSET_DETAILS_SELECT} WHERE id = ANY(%s) ORDER BY id", (list(ids),))
+            return cursor.fetchall()
+
+    def search(self, criteria: Optional[Mapping[str, str]] = None, after: Optional[Tuple] = None,
+               before: Optional[Tuple] = None, limit: int = DEFAULT_PAGE_SIZE, sort_by: Optional[str] = None,
+               descending: bool = False) -> List[AssetRow]:
+        """
+        One page of active assets whose employee_name, employee_id and location contain the
+        given substrings, in id order or sorted by one of SORT_COLUMNS (ties broken by id).
+        Pass the sort_key of the last row of a page as after for the next page, or of the
+        first row as before for the previous one (keyset pagination).
+        """
+        conditions = ["remove_date IS NULL"]
+        params = []
+        for column in SEARCH_FILTERS:
+            term = (criteria or {}).get(column)
+            if term:
+                conditions.append(f"{column} ILIKE %s")
+                params.append(f"%{term}%")
+
+        keyset, keyset_params, order_by, backwards = keyset_page(sort_by, descending, after, before)
+        if keyset:
+            conditions.append(keyset)
+            params += keyset_params
+        with self.conn.cursor() as cursor:
+            cursor.execute(f"{ASSET_DETAILS_SELECT} WHERE {' AND '.join(conditions)} ORDER BY {order_by} LIMIT %s",
+                           params + [limit])
+            rows = cursor.fetchall()
+        if backwards:
+            rows.reverse()
+        return rows
+
+    def search_ids(self, ids: Sequence[int], after: Optional[Tuple] = None, before: Optional[Tuple] = None,
+                   limit: int = DEFAULT_PAGE_SIZE, sort_by: Optional[str] = None,
+                   descending: bool = False) -> List[AssetRow]:
+        """
+        Keyset pagination over a sorted list of candidate ids, e.g. from an in-process index.
+        Assets removed since the ids were collected are skipped by topping the page up from
+        the next ids. Sorted by a column, the candidates are ordered by the database instead.
+        """
+        if sort_by is not None or descending:
+            keyset, params, order_by, backwards = keyset_page(sort_by, descending, after, before)
+            with self.conn.cursor() as cursor:
+                cursor.execute(f"{ASSET_DETAILS_SELECT} WHERE id = ANY(%s) AND remove_date IS NULL"
+                               f"{' AND ' + keyset if keyset else ''} ORDER BY {order_by} LIMIT %s",
+                               [list(ids)] + params + [limit])
+                rows = cursor.fetchall()
+            if backwards:
+                rows.reverse()
+            return rows
+
+        after_id = after[0] if after else None
+        before_id = before[0] if before else None
+        if before_id is not None:
+            end = bisect.bisect_left(ids, before_id)
+            start = end
+        else:
+            start = bisect.bisect_right(ids, after_id) if after_id is not None else 0
+            end = start
+
+        rows = []
+        with self.conn.cursor() as cursor:
+            while len(rows) < limit:
+                wanted = limit - len(rows)
+                if before_id is not None:
+                    if start == 0:
+                        break
+                    start = max(0, start - wanted)
+                    chunk = ids[start:end]
+                    end = start
+                else:
+                    if start >= len(ids):
+                        break
+                    end = start + wanted
+                    chunk = ids[start:end]
+                    start = end
+                cursor.execute(f"{ASSET_DETAILS_SELECT} WHERE id = ANY(%s) AND remove_date IS NULL", (list(chunk),))
+                rows += cursor.fetchall()
+        rows.sort(key=lambda row: row[0])
+        return rows
+
+    def iter_search_values(self, columns: Sequence[str], chunk_size: int = EXPORT_CHUNK_SIZE) -> Iterator[Tuple]:
+        """Stream (id, *columns) of every active asset in id order through a server-side cursor."""
+        with self.conn.cursor(name="asset_search_values") as cursor:
+            cursor.itersize = chunk_size
+            cursor.execute(f"SELECT id, {', '.join(columns)} FROM assets WHERE remove_date IS NULL ORDER BY id")
+            yield from cursor
+
+    def update_asset(self, asset_id: int, fields: Mapping[str, str], updated_by: Optional[str]) -> Optional[AssetRow]:
+        """
+        Overwrite the editable fields of an asset, except its employee_id, and return the
+        updated row, or None if the asset does not exist.
+        """
+        columns = [column for column in EDITABLE_COLUMNS if column != "employee_id"]
+        with self.conn.cursor() as cursor:
+            cursor.execute(f"""
+                UPDATE assets
+                SET {', '.join(f"{stored_column(column)} = {stored_value(column, '%s')}" for column in columns)},
+                    update_date = %s, updated_by = %s
+                WHERE id = %s
+                RETURNING id
+            """, [fields[column] for column in columns] + [today(), updated_by, asset_id])
+            if cursor.fetchone() is None:
+                return None
+        return self.get_asset(asset_id)
+
+    def update_assets(self, asset_ids: Sequence[int], fields: Mapping[str, str],
+                      updated_by: Optional[str]) -> List[AssetRow]:
+        """
+        Set the given BULK_UPDATE_COLUMNS fields on every listed asset in one statement and
+        return the updated rows.
+        """
+        unknown = set(fields) - set(BULK_UPDATE_COLUMNS)
+        if unknown:
+            raise ValueError(f"Cannot bulk update {', '.join(sorted(unknown))}")
+        columns = [column for column in BULK_UPDATE_COLUMNS if column in fields]
+        with self.conn.cursor() as cursor:
+            cursor.execute(f"""
+                UPDATE assets
+                SET {', '.join(f"{stored_column(column)} = {stored_value(column, '%s')}" for column in columns)},
+                    update_date = %s, updated_by = %s
+                WHERE id = ANY(%s)
+                RETURNING id
+            """, [fields[column] for column in columns] + [today(), updated_by, list(asset_ids)])
+            updated = [row[0] for row in cursor.fetchall()]
+        return self.get_assets(updated)
+
+    def remove_asset(self, asset_id: int) -> Optional[AssetRow]:
+        """
+        Soft-remove an asset by stamping its remove_date; returns the row, or None if it does
+        not exist or was already removed (its removal keeps its date).
+        """
+        with self.conn.cursor() as cursor:
+            cursor.execute(f"""
+                UPDATE assets SET remove_date = %s
+                WHERE id = %s AND remove_date IS NULL
+                RETURNING {ASSET_RETURNING}
+            """, (today(), asset_id))
+            return cursor.fetchone()
+
+    def remove_assets(self, asset_ids: Sequence[int]) -> List[AssetRow]:
+        """Soft-remove every listed asset that is still active in one statement; returns the removed rows."""
+        with self.conn.cursor() as cursor:
+            cursor.execute(f"""
+                UPDATE assets SET remove_date = %s
+                WHERE id = ANY(%s) AND remove_date IS NULL
+                RETURNING {ASSET_RETURNING}
+            """, (today(), list(asset_ids)))
+            return cursor.fetchall()
+
+    def transaction_id(self) -> int:
+        """Id of the current transaction, as carried by its change notifications."""
+        with self.conn.cursor() as cursor:
+            cursor.execute("SELECT pg_current_xact_id()::text")
+            return int(cursor.fetchone()[0])
+
+    def metrics(self) -> Dict[str, int]:
+        return self.metrics_snapshot()[0]
+
+    def metrics_snapshot(self) -> Tuple[Dict[str, int], str]:
+        """The dashboard counters and the snapshot they were counted in, as pg_current_snapshot() text."""
+        with self.conn.cursor() as cursor:
+            cursor.execute(METRICS_SQL)
+            row = cursor.fetchone()
+        return dict(zip(METRIC_NAMES, row)), row[len(METRIC_NAMES)]
+
+    def monthly_trend(self, months: int = TREND_MONTHS) -> List[Tuple]:
+        """(month, added, updated, removed, active) for each of the last months, oldest first."""
+        with self.conn.cursor() as cursor:
+            cursor.execute(TREND_SQL)
+            return fill_months(cursor.fetchall(), months)
+
+    def location_breakdown(self) -> List[Tuple]:
+        """(location, active, added, updated, removed) this month, for locations with active assets or changes."""
+        with self.conn.cursor() as cursor:
+            cursor.execute(location_breakdown_sql(), [date.today().replace(day=1)] * 4)
+            return cursor.fetchall()
+
+    def attribute_values(self) -> Dict[str, List[str]]:
+        """The known values of each of SUGGESTED_COLUMNS, sorted, for the forms to suggest."""
+        with self.conn.cursor() as cursor:
+            cursor.execute(ATTRIBUTE_VALUES_SQL)
+            return group_values(cursor.fetchall())
+
+    def inventory(self, column: str) -> List[Tuple]:
+        """
+        (location, value, active assets) for each value of one of HARDWARE_COLUMNS at each
+        location, e.g. how many 8 GB machines every office has.
+        """
+        with self.conn.cursor() as cursor:
+            cursor.execute(inventory_sql(column))
+            return cursor.fetchall()
+
+    def export_inventory(self, column: str, file: IO[str]) -> int:
+        """Write the inventory of column as CSV to file and return the number of rows written."""
+        return write_inventory(file, column, self.inventory(column))
+
+    def count_report(self, report_type: str) -> int:
+        with self.conn.cursor() as cursor:
+            cursor.execute(f"SELECT COUNT(*) FROM {report_source(report_type)}{report_where(report_type)}")
+            return cursor.fetchone()[0]
+
+    def export_report(self, report_type: str, file: IO[str], progress: Optional[Progress] = None,
+                      chunk_size: int = EXPORT_CHUNK_SIZE) -> int:
+        """
+        Write a report as CSV to file and return the number of rows written. Rows are streamed
+        through a named (server-side) cursor so only one chunk is ever held in memory.
+        progress, if given, is called with (rows written, total rows) after every chunk.
+        """
+        total = self.count_report(report_type) if progress else None
+        if progress:
+            progress((0, total))
+
+        written = 0
+        writer = csv.writer(file)
+        writer.writerow(REPORT_HEADER)
+        with self.conn.cursor(name="asset_report") as cursor:
+            cursor.itersize = chunk_size
+            cursor.execute(f"SELECT {', '.join(ASSET_COLUMNS)} FROM {report_source(report_type)}"
+                           f"{report_where(report_type)} ORDER BY id")
+            while True:
+                assets = cursor.fetchmany(chunk_size)
+                if not assets:
+                    break
+                writer.writerows(assets)
+                written += len(assets)
+                if progress:
+                    progress((written, total))
+        return written
+
+    # Users
+
+    # Password hashing lives in authentication.Authenticator; these only store and load the hashes.
+
+    def get_user(self, email_id: str) -> Optional[UserRow]:
+        """(id, email_id, employee_name, employee_id, password hash) of a portal user."""
+        with self.conn.cursor() as cursor:
+            cursor.execute("SELECT id, email_id, employee_name, employee_id, password FROM users WHERE email_id = %s",
+                           (email_id,))
+            return cursor.fetchone()
+
+    def create_user(self, email_id: str, employee_name: str, employee_id: str, password_hash: str) -> int:
+        with self.conn.cursor() as cursor:
+            cursor.execute("""
+                INSERT INTO users (email_id, employee_name, employee_id, password) VALUES (%s, %s, %s, %s)
+                RETURNING id
+            """, (email_id, employee_name, employee_id, password_hash))
+            return cursor.fetchone()[0]
+
+    def set_password_hash(self, user_id: int, password_hash: str) -> None:
+        with self.conn.cursor() as cursor:
+            cursor.execute("UPDATE users SET password = %s WHERE id = %s", (password_hash, user_id))
+
+    def get_profile(self, email_id: str) -> Optional[Tuple[str, str, str]]:
+        """(employee_name, email_id, employee_id) of a portal user."""
+        with self.conn.cursor() as cursor:
+            cursor.execute("SELECT employee_name, email_id, employee_id FROM users WHERE email_id = %s", (email_id,))
+            return cursor.fetchone()
+
+
+def report_where(report_type: str) -> str:
+    if report_type not in REPORT_FILTERS:
+        raise ValueError(f"Unknown report type: {report_type}")
+    condition = REPORT_FILTERS[report_type]
+    return f" WHERE {condition}" if condition else ""
+
+
+def report_source(report_type: str, assets: str = "asset_details") -> str:
+    """What a report reads: the assets table or view, or that together with assets_archive."""
+    if report_type not in ARCHIVE_REPORTS:
+        return assets
+    columns = ", ".join(ASSET_COLUMNS)
+    return f"(SELECT {columns} FROM {assets} UNION ALL SELECT {columns} FROM assets_archive) AS assets"
+
+
+def inventory_sql(column: str) -> str:
+    if column not in HARDWARE_COLUMNS:
+        raise ValueError(f"No inventory of {column}")
+    return f"""
+        SELECT inventory.location, lookup.value, inventory.assets
+        FROM (
+            SELECT location, {column}_id AS value_id, COUNT(*) AS assets
+            FROM assets WHERE remove_date IS NULL
+            GROUP BY location, {column}_id
+        ) AS inventory
+        JOIN {lookup_table(column)} AS lookup ON lookup.id = inventory.value_id
+        ORDER BY inventory.location, lookup.value
+    """
+
+
+def write_inventory(file: IO[str], column: str, rows: Sequence[Tuple]) -> int:
+    writer = csv.writer(file)
+    writer.writerow(("Location", REPORT_HEADER[ASSET_COLUMNS.index(column)], "Active Assets"))
+    writer.writerows(rows)
+    return len(rows)
+
+
+def group_values(rows: Sequence[Tuple[str, str]]) -> Dict[str, List[str]]:
+    """{column: [values]} from (column, value) rows, for every one of SUGGESTED_COLUMNS."""
+    values = {column: [] for column in SUGGESTED_COLUMNS}
+    for column, value in rows:
+        values[column].append(value)
+    return values
@@ -0,0 +1,163 @@
+"""
+Password hashing and login sessions for the Asset Management Portal.
+
+bcrypt is deliberately slow, so it never runs on the Tk thread, and it never runs
+while a pooled connection is checked out: Authenticator looks the user up, hashes
+with the connection back in the pool, and writes only if a write is needed. At
+most max_concurrent_hashes hashes run at once, so a burst of logins on a shared
+machine queues up instead of taking every core.
+
+The bcrypt work factor comes from the [security] section of the config file.
+When it changes, each user's stored hash is upgraded (or downgraded) the next
+time they log in; if that write fails, the login still succeeds with the old hash
+and the upgrade is tried again at the next login. A successful login is cached for session_ttl seconds, so the
+profile and repeated logins of the same user do not query users again.
+"""
+
+
+import logging
+import threading
+import time
+
+import bcrypt
+import psycopg2
+
+from asset_repository import AssetRepository
+from db_pool import load_config
+
+
+DEFAULT_SECURITY = {
+    "bcrypt_rounds": "12",
+    "max_concurrent_hashes": "2",
+    "session_ttl": "900",
+}
+SECURITY_ENVIRONMENT = {
+    "ASSET_BCRYPT_ROUNDS": "bcrypt_rounds",
+    "ASSET_SESSION_TTL": "session_ttl",
+}
+logger = logging.getLogger("asset_portal.authentication")
+
+# bcrypt accepts work factors from 4 to 31.
+MIN_ROUNDS = 4
+MAX_ROUNDS = 31
+
+
+def load_security_config(path=None):
+    return load_config("security", DEFAULT_SECURITY, SECURITY_ENVIRONMENT, path)
+
+
+class PasswordHasher:
+    def __init__(self, rounds=12, max_concurrent=2):
+        if not MIN_ROUNDS <= rounds <= MAX_ROUNDS:
+            raise ValueError(f"bcrypt_rounds must be between {MIN_ROUNDS} and {MAX_ROUNDS}, not {rounds}")
+        self.rounds = rounds
+        self.slots = threading.BoundedSemaphore(max(max_concurrent, 1))
+        self.dummy_hash = None
+
+    def hash(self, password):
+        with self.slots:
+            return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt(self.rounds)).decode('utf-8')
+
+    def verify(self, password, password_hash):
+        with self.slots:
+            return bcrypt.checkpw(password.encode('utf-8'), password_hash.encode('utf-8'))
+
+    def verify_unknown_user(self, password):
+        # Spend as long on an unknown email as on a wrong password, so timing does not reveal which it was.
+        if self.dummy_hash is None:
+            self.dummy_hash = self.hash("unknown user")
+        self.verify(password, self.dummy_hash)
+        return False
+
+    def needs_rehash(self, password_hash):
+        # $2b$<rounds>$<salt and hash>
+        try:
+            return int(password_hash.split("$")[2]) != self.rounds
+        except (IndexError, ValueError):
+            return True
+
+
+class Session:
+    def __init__(self, user, expires_at):
+        self.user_id, self.email_id, self.employee_name, self.employee_id, self.password_hash = user
+        self.expires_at = expires_at
+
+    def profile(self):
+        return self.employee_name, self.email_id, self.employee_id
+
+
+class Authenticator:
+    def __init__(self, run, hasher, session_ttl=900):
+        """run: run(fn, idempotent) calls fn(conn) with a pooled connection, e.g. ConnectionPool.run."""
+        self.run = run
+        self.hasher = hasher
+        self.session_ttl = session_ttl
+        self.lock = threading.Lock()
+        self.sessions = {}
+
+    @classmethod
+    def from_config(cls, run, config=None):
+        config = config or load_security_config()
+        hasher = PasswordHasher(int(config["bcrypt_rounds"]), int(config["max_concurrent_hashes"]))
+        return cls(run, hasher, float(config["session_ttl"]))
+
+    def authenticate(self, email_id, password):
+        """Check a login; blocks for the bcrypt work factor, so call it from a worker thread."""
+        session = self.cached_session(email_id)
+        if session is None:
+            user = self.run(lambda conn: AssetRepository(conn).get_user(email_id), True)
+            if user is None:
+                return self.hasher.verify_unknown_user(password)
+            session = Session(user, 0)
+
+        if not self.hasher.verify(password, session.password_hash):
+            return False
+        if self.hasher.needs_rehash(session.password_hash):
+            self.rehash(session, password)
+
+        session.expires_at = time.monotonic() + self.session_ttl
+        with self.lock:
+            self.sessions[email_id] = session
+        return True
+
+    def rehash(self, session, password):
+        """Store the password at the configured work factor; the session keeps the old hash if that fails."""
+        password_hash = self.hasher.hash(password)
+        try:
+            self.run(lambda conn: self.store_hash(conn, session.user_id, password_hash))
+        except psycopg2.Error as e:
+            logger.warning("Could not upgrade the password hash of user %s: %s", session.user_id, e)
+            return
+        session.password_hash = password_hash
+
+    def store_hash(self, conn, user_id, password_hash):
+        with AssetRepository(conn).transaction() as repository:
+            repository.set_password_hash(user_id, password_hash)
+
+    def register(self, email_id, employee_name, employee_id, password):
+        password_hash = self.hasher.hash(password)
+
+        def insert_user(conn):
+            with AssetRepository(conn).transaction() as repository:
+                return repository.create_user(email_id, employee_name, employee_id, password_hash)
+
+        return self.run(insert_user)
+
+    def profile(self, email_id):
+        """(employee_name, email_id, employee_id), from the session while it lasts."""
+        session = self.cached_session(email_id)
+        if session is not None:
+            return session.profile()
+        return self.run(lambda conn: AssetRepository(conn).get_profile(email_id), True)
+
+    def cached_session(self, email_id):
+        with self.lock:
+            session = self.sessions.get(email_id)
+            if session is not None and session.expires_at <= time.monotonic():
+                del self.sessions[email_id]
+                session = None
+            return session
+
+    def forget(self, email_id):
+        with self.lock:
+            self.sessions.pop(email_id, None)
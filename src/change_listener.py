@@ -0,0 +1,110 @@
+"""
+Live asset change notifications for the Asset Management Portal.
+
+Since migration 7 every insert, update and delete on assets sends a NOTIFY on the
+asset_changes channel carrying the asset id, the operation, the writing
+transaction and the asset's dates before and after the change; since migration 9
+also the asset_events event it logged. Since migration 16 a statement that changes
+more than NOTIFY_ROW_LIMIT assets, e.g. a bulk import, sends a single resync
+notification instead, which is queued as RESYNC. ChangeListener
+LISTENs on a dedicated connection in a background thread and queues the changes;
+the portal drains the queue on the Tk thread and patches the affected grid rows
+and dashboard counters instead of reloading them.
+
+Notifications sent while the listener is disconnected are lost, so after a
+reconnect it queues RESYNC and the portal reloads what it shows.
+"""
+
+
+import json
+import queue
+import select
+import threading
+
+import psycopg2
+
+from db_pool import backoff_delay
+
+
+CHANNEL = "asset_changes"
+# How often the listener thread wakes up to check whether it was stopped.
+WAIT_TIMEOUT = 5
+
+RESYNC = "resync"
+
+
+class AssetChange:
+    def __init__(self, asset_id, operation, xid, old, new, event=None, repeat=False):
+        """
+        old and new map asset_entry_date, update_date and remove_date to ISO dates or None.
+        event is the asset_events event logged for the change (None if nothing changed), and
+        repeat is true if the asset already had an event of that kind this month, or the
+        event is dated in an earlier month.
+        """
+        self.asset_id = asset_id
+        self.operation = operation
+        self.xid = xid
+        self.old = old
+        self.new = new
+        self.event = event
+        self.repeat = repeat
+
+    @classmethod
+    def from_dict(cls, change):
+        return cls(change["id"], change["op"], int(change["xid"]), change["old"], change["new"],
+                   change.get("event"), change.get("repeat", False))
+
+
+class ChangeListener:
+    def __init__(self, connect):
+        """connect() opens a new connection to the primary, e.g. ConnectionPool.connect_dedicated."""
+        self.connect = connect
+        self.changes = queue.Queue()
+        self.stopped = threading.Event()
+        self.thread = threading.Thread(target=self.loop, name="change-listener", daemon=True)
+        self.thread.start()
+
+    def loop(self):
+        attempt = 0
+        connected_before = False
+        while not self.stopped.is_set():
+            try:
+                conn = self.connect()
+            except psycopg2.Error:
+                self.stopped.wait(backoff_delay(attempt))
+                attempt += 1
+                continue
+            attempt = 0
+            try:
+                conn.autocommit = True
+                with conn.cursor() as cursor:
+                    cursor.execute(f"LISTEN {CHANNEL}")
+                if connected_before:
+                    self.changes.put(RESYNC)
+                connected_before = True
+                self.listen(conn)
+            except (psycopg2.Error, OSError):
+                pass
+            finally:
+                conn.close()
+
+    def listen(self, conn):
+        while not self.stopped.is_set():
+            if select.select([conn], [], [], WAIT_TIMEOUT) == ([], [], []):
+                continue
+            conn.poll()
+            while conn.notifies:
+                payload = json.loads(conn.notifies.pop(0).payload)
+                self.changes.put(RESYNC if payload.get("resync") else AssetChange.from_dict(payload))
+
+    def drain(self):
+        """Every change queued so far, oldest first; RESYNC marks changes missed or too many to patch in."""
+        changes = []
+        while True:
+            try:
+                changes.append(self.changes.get_nowait())
+            except queue.Empty:
+                return changes
+
+    def stop(self):
+        self.stopped.set()
@@ -0,0 +1,109 @@
+"""
+Dashboard metrics for the Asset Management Portal.
+
+All dashboard counters are computed by one statement (AssetRepository.metrics) and
+cached for METRICS_TTL seconds. Each counter is a scalar subquery answered from an
+index: the active assets from the partial index on assets, and the monthly ones
+from this month's partition of the asset_events log. Writers call invalidate() after they commit so the next dashboard visit
+sees their change.
+
+Changes made by other clients arrive as notifications (see change_listener) and
+are folded into the cached counters with apply(). Each count remembers the
+snapshot it was taken in, so a change is added exactly once: either it is part
+of the count, or it is applied on top of it.
+"""
+
+
+import threading
+import time
+from collections import deque
+
+
+METRICS_TTL = 60
+# Notified changes kept to correct counts that were being taken while they arrived.
+RECENT_CHANGES = 10000
+
+
+def visible_in_snapshot(snapshot, xid):
+    """
+    Whether committed transaction xid is seen by a pg_current_snapshot() text
+    (xmin:xmax:xip_list). Without a snapshot the change is taken as already counted.
+    """
+    if not snapshot:
+        return True
+    xmin, xmax, running = snapshot.split(":")
+    if xid < int(xmin):
+        return True
+    return xid < int(xmax) and str(xid) not in running.split(",")
+
+
+def metrics_delta(change):
+    """How much an AssetChange moves each counter, keyed by METRIC_NAMES."""
+    def active(dates):
+        return int(dates is not None and dates["remove_date"] is None)
+
+    # The monthly counters count assets with an event dated this month; repeat is also set for one dated earlier.
+    first_event = change.event if not change.repeat else None
+    return {
+        "total_assets": active(change.new) - active(change.old),
+        "assets_added": int(first_event == "added"),
+        "assets_updated": int(first_event == "updated"),
+        "assets_removed": int(first_event == "removed"),
+    }
+
+
+class DashboardMetrics:
+    def __init__(self, ttl=METRICS_TTL):
+        self.ttl = ttl
+        self.lock = threading.Lock()
+        self.values = None
+        self.snapshot = None
+        self.loaded_at = 0
+        self.generation = 0
+        self.recent = deque(maxlen=RECENT_CHANGES)
+
+    def get(self, repository):
+        """
+        Return the counters as a dict keyed by METRIC_NAMES, querying repository (an
+        AssetRepository or the local replica's) only when the cache is stale.
+        """
+        with self.lock:
+            if self.values is not None and time.monotonic() - self.loaded_at < self.ttl:
+                return dict(self.values)
+            generation = self.generation
+
+        values, snapshot = repository.metrics_snapshot()
+        repository.conn.commit()
+
+        with self.lock:
+            # Changes notified while we were counting, but committed too late to be counted.
+            values = self.add_changes(values, snapshot, self.recent)
+            # A write that committed while we were counting makes this result stale already.
+            if generation == self.generation:
+                self.values = values
+                self.snapshot = snapshot
+                self.loaded_at = time.monotonic()
+        return dict(values)
+
+    def apply(self, changes):
+        """Fold notified AssetChanges into the cache; returns the updated counters, or None if none are cached."""
+        with self.lock:
+            self.recent.extend(changes)
+            if self.values is None:
+                return None
+            self.values = self.add_changes(self.values, self.snapshot, changes)
+            return dict(self.values)
+
+    def invalidate(self):
+        with self.lock:
+            self.values = None
+            self.generation += 1
+
+    @staticmethod
+    def add_changes(values, snapshot, changes):
+        values = dict(values)
+        for change in changes:
+            if not visible_in_snapshot(snapshot, change.xid):
+                for name, delta in metrics_delta(change).items():
+                    values[name] += delta
+        return values
@@ -0,0 +1,182 @@
+"""
+Pooled PostgreSQL connections for the Asset Management Portal.
+
+Connection settings come from an INI file and/or environment variables (see
+load_db_config). Connections are checked for liveness when they are handed out
+after sitting idle, broken ones are replaced, and the pool reconnects with
+exponential backoff when the server cannot be reached. Read-only work can be
+retried transparently on a fresh connection when the link drops mid-query.
+"""
+
+
+import configparser
+import contextlib
+import os
+import threading
+import time
+
+import psycopg2
+import psycopg2.extensions
+import psycopg2.pool
+
+
+CONFIG_FILE = "asset_portal.ini"
+
+DEFAULT_CONFIG = {
+    "host": "localhost",
+    "port": "5432",
+    "dbname": "asset_management",
+    "user": "postgres",
+    "password": "",
+    "connect_timeout": "10",
+    "min_connections": "1",
+    "max_connections": "4",
+}
+
+# Environment variables override the config file.
+ENVIRONMENT = {
+    "ASSET_DB_HOST": "host",
+    "ASSET_DB_PORT": "port",
+    "ASSET_DB_NAME": "dbname",
+    "ASSET_DB_USER": "user",
+    "ASSET_DB_PASSWORD": "password",
+    "ASSET_DB_CONNECT_TIMEOUT": "connect_timeout",
+    "ASSET_DB_POOL_MIN": "min_connections",
+    "ASSET_DB_POOL_MAX": "max_connections",
+}
+
+# Connections idle for longer than this are pinged before being handed out.
+HEALTH_CHECK_INTERVAL = 30
+RECONNECT_ATTEMPTS = 5
+RECONNECT_BASE_DELAY = 0.5
+RECONNECT_MAX_DELAY = 8
+
+
+def load_db_config(path=None):
+    """
+    Read the [database] section of path (default: $ASSET_PORTAL_CONFIG, or asset_portal.ini
+    in the working directory or next to this module), then apply environment overrides.
+    """
+    return load_config("database", DEFAULT_CONFIG, ENVIRONMENT, path)
+
+
+def load_config(section, defaults, environment, path=None):
+    """Settings of one section of the portal's config file, over defaults and under environment overrides."""
+    config = dict(defaults)
+
+    candidates = [path] if path else [os.environ.get("ASSET_PORTAL_CONFIG"), CONFIG_FILE,
+                                      os.path.join(os.path.dirname(os.path.abspath(__file__)), CONFIG_FILE)]
+    parser = configparser.ConfigParser()
+    for candidate in candidates:
+        if candidate and os.path.exists(candidate):
+            parser.read(candidate)
+            if parser.has_section(section):
+                config.update(parser[section])
+            break
+
+    for variable, key in environment.items():
+        if os.environ.get(variable):
+            config[key] = os.environ[variable]
+    return config
+
+
+def connection_settings(config):
+    """psycopg2.connect() keyword arguments for a load_db_config() result."""
+    return {key: value for key, value in config.items()
+            if key not in ("min_connections", "max_connections") and value != ""}
+
+
+def backoff_delay(attempt):
+    return min(RECONNECT_BASE_DELAY * 2 ** attempt, RECONNECT_MAX_DELAY)
+
+
+class ConnectionPool:
+    def __init__(self, config, cursor_factory=None):
+        """cursor_factory, if given, becomes the default cursor class of every pooled connection."""
+        self.min_connections = int(config["min_connections"])
+        self.max_connections = max(int(config["max_connections"]), self.min_connections, 1)
+        self.settings = connection_settings(config)
+        if cursor_factory:
+            self.settings["cursor_factory"] = cursor_factory
+        self.slots = threading.BoundedSemaphore(self.max_connections)
+        self.last_used = {}
+        self.pool = self.retry_connect(lambda: psycopg2.pool.ThreadedConnectionPool(
+            self.min_connections, self.max_connections, **self.settings))
+
+    def retry_connect(self, connect):
+        for attempt in range(RECONNECT_ATTEMPTS):
+            try:
+                return connect()
+            except psycopg2.OperationalError:
+                if attempt == RECONNECT_ATTEMPTS - 1:
+                    raise
+                time.sleep(backoff_delay(attempt))
+
+    def checkout(self):
+        """Take a live connection from the pool, waiting for a free slot if all are in use."""
+        self.slots.acquire()
+        try:
+            while True:
+                conn = self.retry_connect(self.pool.getconn)
+                if self.is_alive(conn):
+                    return conn
+                self.pool.putconn(conn, close=True)
+                self.last_used.pop(id(conn), None)
+        except Exception:
+            self.slots.release()
+            raise
+
+    def checkin(self, conn):
+        try:
+            if not conn.closed and conn.info.transaction_status != psycopg2.extensions.TRANSACTION_STATUS_IDLE:
+                conn.rollback()
+        except psycopg2.Error:
+            pass
+        self.last_used[id(conn)] = time.monotonic()
+        self.pool.putconn(conn, close=bool(conn.closed))
+        self.slots.release()
+
+    def is_alive(self, conn):
+        if conn.closed:
+            return False
+        if time.monotonic() - self.last_used.get(id(conn), 0) < HEALTH_CHECK_INTERVAL:
+            return True
+        try:
+            with conn.cursor() as cursor:
+                cursor.execute("SELECT 1")
+            conn.rollback()
+            return True
+        except psycopg2.Error:
+            return False
+
+    @contextlib.contextmanager
+    def connection(self):
+        conn = self.checkout()
+        try:
+            yield conn
+        finally:
+            self.checkin(conn)
+
+    def run(self, fn, idempotent=False):
+        """
+        Call fn(conn) with a pooled connection and return its result. Idempotent work is
+        retried with backoff on a new connection if the one it ran on was lost.
+        """
+        attempts = RECONNECT_ATTEMPTS if idempotent else 1
+        for attempt in range(attempts):
+            conn = self.checkout()
+            try:
+                return fn(conn)
+            except (psycopg2.OperationalError, psycopg2.InterfaceError) as e:
+                if isinstance(e, psycopg2.extensions.QueryCanceledError) or not conn.closed or attempt == attempts - 1:
+                    raise
+            finally:
+                self.checkin(conn)
+            time.sleep(backoff_delay(attempt))
+
+    def connect_dedicated(self):
+        """A new connection outside the pool, with the pool's settings, e.g. for LISTEN."""
+        return psycopg2.connect(**self.settings)
+
+    def close(self):
+        self.pool.closeall()
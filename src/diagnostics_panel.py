@@ -0,0 +1,112 @@
+"""
+Hidden diagnostics window of the Asset Management Portal (Ctrl+Shift+D).
+
+Shows the live statement timings and screen render times collected in
+query_stats.STATS: call counts, p50/p95/max latency and a latency histogram per
+statement fingerprint and calling screen, slowest total first.
+"""
+
+
+import tkinter as tk
+from tkinter import ttk
+
+import customtkinter
+
+import query_stats
+
+
+REFRESH_MS = 1000
+HISTOGRAM_BARS = " ▁▂▃▄▅▆▇█"
+HISTOGRAM_LEGEND = ("Histogram buckets (ms): " + ", ".join(f"≤{bound}" for bound in query_stats.BUCKETS_MS)
+                    + f", >{query_stats.BUCKETS_MS[-1]}")
+
+
+def histogram(buckets):
+    peak = max(buckets)
+    if not peak:
+        return ""
+    return "".join(HISTOGRAM_BARS[0 if not count else max(1, round(count / peak * (len(HISTOGRAM_BARS) - 1)))]
+                   for count in buckets)
+
+
+def milliseconds(seconds):
+    return f"{seconds * 1000:.1f}"
+
+
+class DiagnosticsPanel(customtkinter.CTkToplevel):
+    def __init__(self, master, startup_report=None):
+        super().__init__(master)
+        self.title("Diagnostics")
+        self.geometry("1200x650")
+        self.refresh_after = None
+
+        log = query_stats.slow_query_log
+        status = (f"Slow-query log: {log.path} (statements over {log.threshold * 1000:g} ms)" if log
+                  else "Slow-query log: off")
+        header = customtkinter.CTkFrame(self)
+        header.pack(fill=tk.X, padx=10, pady=(10, 5))
+        customtkinter.CTkLabel(header, text=status).pack(side=tk.LEFT, padx=10)
+        customtkinter.CTkButton(header, text="Reset", command=self.reset).pack(side=tk.RIGHT, padx=10, pady=5)
+        customtkinter.CTkLabel(header, text=HISTOGRAM_LEGEND).pack(side=tk.RIGHT, padx=10)
+
+        customtkinter.CTkLabel(self, text="Queries", font=("Arial", 14)).pack(anchor="w", padx=10)
+        self.queries = self.make_table(
+            ("statement", "screen", "calls", "p50", "p95", "max", "rows", "histogram"),
+            ("Statement", "Screen", "Calls", "p50 ms", "p95 ms", "Max ms", "Rows", "Histogram"),
+            (460, 120, 60, 70, 70, 70, 80, 140), height=14)
+
+        customtkinter.CTkLabel(self, text="Screen render times", font=("Arial", 14)).pack(anchor="w", padx=10)
+        self.screens = self.make_table(
+            ("screen", "renders", "p50", "p95", "max", "histogram"),
+            ("Screen", "Renders", "p50 ms", "p95 ms", "Max ms", "Histogram"),
+            (200, 80, 80, 80, 80, 140), height=6)
+
+        if startup_report:
+            customtkinter.CTkLabel(self, text=startup_report, font=("Courier", 12), justify=tk.LEFT).pack(
+                anchor="w", padx=10, pady=(0, 10))
+
+        self.protocol("WM_DELETE_WINDOW", self.close)
+        self.refresh()
+
+    def make_table(self, columns, headings, widths, height):
+        frame = customtkinter.CTkFrame(self)
+        frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=(0, 10))
+        table = ttk.Treeview(frame, columns=columns, show="headings", height=height)
+        scrollbar = ttk.Scrollbar(frame, orient=tk.VERTICAL, command=table.yview)
+        table.configure(yscrollcommand=scrollbar.set)
+        for column, heading, width in zip(columns, headings, widths):
+            table.heading(column, text=heading)
+            table.column(column, width=width, anchor=tk.W if column in ("statement", "screen") else tk.E)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        table.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        return table
+
+    def refresh(self):
+        queries, screens = query_stats.STATS.snapshot()
+
+        self.queries.delete(*self.queries.get_children())
+        for (statement, screen), timing in sorted(queries.items(), key=lambda item: -item[1].total):
+            self.queries.insert("", tk.END, values=(
+                statement, screen or "-", timing.count, milliseconds(timing.percentile(0.5)),
+                milliseconds(timing.percentile(0.95)), milliseconds(timing.max), timing.rows,
+                histogram(timing.buckets)))
+
+        self.screens.delete(*self.screens.get_children())
+        for screen, timing in sorted(screens.items()):
+            self.screens.insert("", tk.END, values=(
+                screen, timing.count, milliseconds(timing.percentile(0.5)), milliseconds(timing.percentile(0.95)),
+                milliseconds(timing.max), histogram(timing.buckets)))
+
+        self.refresh_after = self.after(REFRESH_MS, self.refresh)
+
+    def reset(self):
+        query_stats.STATS.reset()
+        if self.refresh_after:
+            self.after_cancel(self.refresh_after)
+        self.refresh()
+
+    def close(self):
+        if self.refresh_after:
+            self.after_cancel(self.refresh_after)
+            self.refresh_after = None
+        self.destroy()
@@ -0,0 +1,464 @@
+"""
+Local SQLite read replica of the assets table.
+
+Field offices reach the primary PostgreSQL over slow links, so the portal can keep
+a copy of assets in an on-disk SQLite file and serve the Manage Assets grid, the
+dashboard and reports from it. Writes still go to the primary.
+
+The replica is synced incrementally. Every insert or update on the primary stamps
+the row with the id of the writing transaction (assets.change_xid, migration 5),
+and hard deletes are recorded in asset_deletions. A sync copies the rows stamped
+by transactions that were not known to be finished at the previous sync, then
+stores the oldest transaction still running as the new watermark. Rows written
+by slow transactions that commit after a sync are therefore picked up by the
+next one instead of being skipped. The replica also keeps this month's
+asset_events (migration 9), which the dashboard counters and the monthly reports
+are counted from; they are copied by the same watermark, and earlier months are
+dropped. "This month" is the primary's current month as of the last sync, so
+around a month boundary the replica counts the same month as the primary,
+whatever this machine's clock or time zone says. The small monthly rollup behind
+the trend dashboard (migration 10) is copied whole whenever it changed.
+Archived assets (migration 12) leave assets like hard deletes and are copied into
+the replica's assets_archive by the archiving transaction, for the All Assets report.
+"""
+
+
+import csv
+import json
+import os
+import sqlite3
+import threading
+from bisect import bisect_left, bisect_right
+from datetime import date
+from typing import IO, Dict, Iterator, List, Mapping, Optional, Sequence, Tuple
+
+import psycopg2.extensions
+
+from asset_fields import ASSET_COLUMNS, ASSET_SELECT, HARDWARE_COLUMNS, REPORT_HEADER
+from asset_repository import (DEFAULT_PAGE_SIZE, EXPORT_CHUNK_SIZE, METRIC_NAMES, SEARCH_FILTERS, SORT_COLUMNS,
+                              SUGGESTED_COLUMNS, AssetRow, Progress, group_values, keyset_page, report_source,
+                              sort_expression, write_inventory)
+from db_pool import load_config
+from monthly_rollup import TREND_MONTHS, TREND_SQL, fill_months, location_breakdown_sql
+
+
+DEFAULT_REPLICA = {
+    "enabled": "false",
+    "path": "asset_replica.sqlite3",
+    "sync_interval": "30",
+}
+REPLICA_ENVIRONMENT = {
+    "ASSET_REPLICA_ENABLED": "enabled",
+    "ASSET_REPLICA_PATH": "path",
+    "ASSET_REPLICA_SYNC_INTERVAL": "sync_interval",
+}
+SYNC_BATCH_SIZE = 5000
+# Bumped when the replica starts copying something new, or the primary rewrote what it copied (migration 15
+# re-dated asset_events); a replica in an older format is copied afresh.
+REPLICA_FORMAT = "6"
+# SQLite's limit on bound parameters is 999 in older builds.
+MAX_IN_PARAMETERS = 900
+
+# The first day of the primary's current month, as of the last sync.
+SYNCED_MONTH_SQL = "(SELECT value FROM replica_state WHERE key = 'month')"
+
+
+def local_this_month(column):
+    return f"{column} >= {SYNCED_MONTH_SQL} AND {column} < date({SYNCED_MONTH_SQL}, '+1 month')"
+
+
+def local_events_this_month(event):
+    return f"SELECT asset_id FROM asset_events WHERE event = '{event}' AND {local_this_month('event_date')}"
+
+
+# REPORT_FILTERS of asset_repository, in SQLite's dialect. Dates are stored as YYYY-MM-DD text.
+LOCAL_REPORT_FILTERS = {
+    "All Assets": "",
+    "All Active Assets": "remove_date IS NULL",
+    "Assets Added This Month": f"id IN ({local_events_this_month('added')})",
+    "Assets Updated This Month": f"id IN ({local_events_this_month('updated')})",
+    "Assets Removed This Month": f"id IN ({local_events_this_month('removed')})",
+}
+
+LOCAL_METRICS_SQL = f"""
+    SELECT (SELECT COUNT(*) FROM assets WHERE remove_date IS NULL),
+           (SELECT COUNT(DISTINCT asset_id) FROM ({local_events_this_month("added")})),
+           (SELECT COUNT(DISTINCT asset_id) FROM ({local_events_this_month("updated")})),
+           (SELECT COUNT(DISTINCT asset_id) FROM ({local_events_this_month("removed")})),
+           (SELECT value FROM replica_state WHERE key = 'snapshot')
+"""
+
+# The replica has no lookup tables, so it suggests only the values some active asset has.
+LOCAL_ATTRIBUTE_VALUES_SQL = " UNION ALL ".join(
+    f"SELECT DISTINCT '{column}', {column} FROM assets WHERE remove_date IS NULL" for column in SUGGESTED_COLUMNS
+) + " ORDER BY 1, 2"
+
+SCHEMA = [
+    f"""CREATE TABLE IF NOT EXISTS assets (
+        id INTEGER PRIMARY KEY, {', '.join(f'{column} TEXT' for column in ASSET_COLUMNS[1:])}
+    )""",
+    "CREATE INDEX IF NOT EXISTS assets_active_id_idx ON assets (id) WHERE remove_date IS NULL",
+    "CREATE INDEX IF NOT EXISTS assets_asset_entry_date_idx ON assets (asset_entry_date)",
+    "CREATE INDEX IF NOT EXISTS assets_update_date_idx ON assets (update_date)",
+    "CREATE INDEX IF NOT EXISTS assets_remove_date_idx ON assets (remove_date)",
+    "CREATE TABLE IF NOT EXISTS replica_state (key TEXT PRIMARY KEY, value TEXT NOT NULL)",
+    f"""CREATE TABLE IF NOT EXISTS assets_archive (
+        id INTEGER PRIMARY KEY, {', '.join(f'{column} TEXT' for column in ASSET_COLUMNS[1:])}
+    )""",
+    # Only the current month of asset_events, which is all the counters and period reports read.
+    """CREATE TABLE IF NOT EXISTS asset_events (
+        id INTEGER PRIMARY KEY, asset_id INTEGER NOT NULL, event TEXT NOT NULL, event_date TEXT NOT NULL
+    )""",
+    "CREATE INDEX IF NOT EXISTS asset_events_event_idx ON asset_events (event, event_date, asset_id)",
+    """CREATE TABLE IF NOT EXISTS asset_monthly_rollup (
+        month TEXT NOT NULL, location TEXT NOT NULL, added INTEGER NOT NULL, updated INTEGER NOT NULL,
+        removed INTEGER NOT NULL, active_change INTEGER NOT NULL, PRIMARY KEY (month, location)
+    )""",
+] + [f"CREATE INDEX IF NOT EXISTS assets_{column}_sort_idx ON assets ({sort_expression(column)}, id)"
+     " WHERE remove_date IS NULL" for column in SORT_COLUMNS]
+
+
+def load_replica_config(path=None):
+    """The [replica] section of the portal's config file."""
+    return load_config("replica", DEFAULT_REPLICA, REPLICA_ENVIRONMENT, path)
+
+
+def replica_enabled(config):
+    return config["enabled"].strip().lower() in ("1", "true", "yes", "on")
+
+
+def local_value(value):
+    return value.isoformat() if isinstance(value, date) else value
+
+
+class LocalReplica:
+    def __init__(self, path, source):
+        """
+        path: the SQLite file, created if missing.
+        source: identifies the primary database (e.g. host:port/dbname); a replica synced
+        from a different source is discarded and rebuilt on the next sync.
+        """
+        self.path = path
+        self.source = source
+        self.sync_lock = threading.Lock()
+        self.local = threading.local()
+        self.last_error = None
+        conn = self.connection()
+        conn.execute("PRAGMA journal_mode = WAL")
+        with conn:
+            for statement in SCHEMA:
+                conn.execute(statement)
+        # True once the file holds a full copy of this source; until then reads go to the primary.
+        self.ready = self.is_current() and self.state("watermark") is not None
+
+    def connection(self):
+        # One connection per thread; in WAL mode readers are not blocked while a sync writes.
+        conn = getattr(self.local, "conn", None)
+        if conn is None:
+            conn = self.local.conn = sqlite3.connect(self.path, timeout=30)
+        return conn
+
+    def state(self, key):
+        row = self.connection().execute("SELECT value FROM replica_state WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def is_current(self):
+        return self.state("source") == self.source and self.state("format") == REPLICA_FORMAT
+
+    def repository(self):
+        return LocalAssetRepository(self.connection())
+
+    def sync(self, conn):
+        """
+        Bring the replica up to date with the primary behind conn and return the number of
+        rows copied or deleted. The first sync, or one after the source changed, copies the
+        whole table.
+        """
+        with self.sync_lock:
+            try:
+                changed = self.apply_changes(conn)
+            except Exception as e:
+                self.last_error = e
+                raise
+            self.last_error = None
+            self.ready = True
+            return changed
+
+    def apply_changes(self, conn):
+        local = self.connection()
+        watermark = self.state("watermark") if self.is_current() else None
+
+        # One snapshot for the changes and the new watermark, so nothing committed in between is lost.
+        conn.set_session(isolation_level=psycopg2.extensions.ISOLATION_LEVEL_REPEATABLE_READ, readonly=True)
+        try:
+            with conn.cursor() as cursor:
+                cursor.execute("SELECT pg_snapshot_xmin(pg_current_snapshot())::text, pg_current_snapshot()::text,"
+                               " DATE_TRUNC('month', CURRENT_DATE)::date")
+                new_watermark, snapshot, month = cursor.fetchone()
+                deleted = []
+                if watermark is not None:
+                    cursor.execute("SELECT asset_id FROM asset_deletions WHERE change_xid >= %s::xid8", (watermark,))
+                    deleted = [(row[0],) for row in cursor.fetchall()]
+
+            changed = len(deleted)
+            with local:
+                if watermark is None:
+                    local.execute("DELETE FROM assets")
+                    local.execute("DELETE FROM assets_archive")
+                    local.execute("DELETE FROM asset_events")
+                local.executemany("DELETE FROM assets WHERE id = ?", deleted)
+                # Events of months gone by are no longer counted; only the current month's are kept.
+                local.execute("DELETE FROM asset_events WHERE event_date < ?", (month.isoformat(),))
+
+                # The replica keeps the hardware attributes as text, as decoded by asset_details.
+                for table, source in (("assets", "asset_details"), ("assets_archive", "assets_archive")):
+                    changed += self.copy_assets(conn, local, table, source, watermark)
+
+                with conn.cursor(name="asset_replica_events") as cursor:
+                    cursor.itersize = SYNC_BATCH_SIZE
+                    cursor.execute("SELECT id, asset_id, event, event_date FROM asset_events WHERE event_date >= %s"
+                                   + ("" if watermark is None else " AND change_xid >= %s::xid8"),
+                                   (month,) if watermark is None else (month, watermark))
+                    while True:
+                        rows = cursor.fetchmany(SYNC_BATCH_SIZE)
+                        if not rows:
+                            break
+                        local.executemany("INSERT OR REPLACE INTO asset_events (id, asset_id, event, event_date)"
+                                          " VALUES (?, ?, ?, ?)",
+                                          ([local_value(value) for value in row] for row in rows))
+                        changed += len(rows)
+
+                changed += self.copy_rollup(conn, local, watermark)
+
+                local.executemany("INSERT OR REPLACE INTO replica_state (key, value) VALUES (?, ?)",
+                                  [("source", self.source), ("format", REPLICA_FORMAT), ("watermark", new_watermark),
+                                   ("snapshot", snapshot), ("month", month.isoformat())])
+            conn.commit()
+        finally:
+            conn.rollback()
+            conn.set_session(isolation_level="DEFAULT", readonly="DEFAULT")
+        return changed
+
+    def copy_assets(self, conn, local, table, source, watermark):
+        with conn.cursor(name=f"{table}_replica_sync") as cursor:
+            cursor.itersize = SYNC_BATCH_SIZE
+            select = f"SELECT {', '.join(ASSET_COLUMNS)} FROM {source}"
+            if watermark is None:
+                cursor.execute(select)
+            else:
+                cursor.execute(select + " WHERE change_xid >= %s::xid8", (watermark,))
+            insert = (f"INSERT OR REPLACE INTO {table} ({', '.join(ASSET_COLUMNS)})"
+                      f" VALUES ({', '.join(['?'] * len(ASSET_COLUMNS))})")
+            copied = 0
+            while True:
+                rows = cursor.fetchmany(SYNC_BATCH_SIZE)
+                if not rows:
+                    return copied
+                local.executemany(insert, ([local_value(value) for value in row] for row in rows))
+                copied += len(rows)
+
+    def copy_rollup(self, conn, local, watermark):
+        # The rollup is small and rebuilds replace it wholesale, so it is copied whole whenever any row changed.
+        with conn.cursor() as cursor:
+            if watermark is not None:
+                cursor.execute("SELECT EXISTS (SELECT 1 FROM asset_monthly_rollup WHERE change_xid >= %s::xid8)",
+                               (watermark,))
+                if not cursor.fetchone()[0]:
+                    return 0
+            cursor.execute("SELECT month, location, added, updated, removed, active_change FROM asset_monthly_rollup")
+            rows = cursor.fetchall()
+        local.execute("DELETE FROM asset_monthly_rollup")
+        local.executemany("INSERT INTO asset_monthly_rollup VALUES (?, ?, ?, ?, ?, ?)",
+                          ([local_value(value) for value in row] for row in rows))
+        return len(rows)
+
+    def close(self):
+        conn = getattr(self.local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self.local.conn = None
+
+
+class ReplicaSyncer:
+    """Background thread that syncs a LocalReplica every interval seconds."""
+
+    def __init__(self, replica, run, interval, on_change=None):
+        """run: run(fn) calls fn(conn) with a connection to the primary, e.g. ConnectionPool.run."""
+        self.replica = replica
+        self.run = run
+        self.interval = interval
+        self.on_change = on_change
+        self.stopped = threading.Event()
+        self.thread = threading.Thread(target=self.loop, name="replica-sync", daemon=True)
+        self.thread.start()
+
+    def loop(self):
+        while not self.stopped.is_set():
+            try:
+                changed = self.run(self.replica.sync)
+            except Exception:
+                # Offline or the primary is unreachable: keep serving the last copy and try again later.
+                changed = 0
+            if changed and self.on_change:
+                self.on_change()
+            self.stopped.wait(self.interval)
+
+    def stop(self):
+        self.stopped.set()
+
+
+class LocalAssetRepository:
+    """
+    The read side of AssetRepository (search, search_ids, iter_search_values, metrics,
+    monthly_trend, location_breakdown, count_report, export_report) answered from a
+    LocalReplica. Rows have the same
+    layout, with dates as YYYY-MM-DD strings. LIKE in SQLite folds case for ASCII only, and
+    sorted text compares byte-wise rather than in the primary's collation.
+    """
+
+    def __init__(self, conn):
+        self.conn = conn
+
+    def search(self, criteria: Optional[Mapping[str, str]] = None, after: Optional[Tuple] = None,
+               before: Optional[Tuple] = None, limit: int = DEFAULT_PAGE_SIZE, sort_by: Optional[str] = None,
+               descending: bool = False) -> List[AssetRow]:
+        conditions = ["remove_date IS NULL"]
+        params = []
+        for column in SEARCH_FILTERS:
+            term = (criteria or {}).get(column)
+            if term:
+                conditions.append(f"{column} LIKE ?")
+                params.append(f"%{term}%")
+
+        keyset, keyset_params, order_by, backwards = keyset_page(sort_by, descending, after, before, "?")
+        if keyset:
+            conditions.append(keyset)
+            params += [local_value(value) for value in keyset_params]
+        rows = self.conn.execute(f"{ASSET_SELECT} WHERE {' AND '.join(conditions)} ORDER BY {order_by} LIMIT ?",
+                                 params + [limit]).fetchall()
+        if backwards:
+            rows.reverse()
+        return rows
+
+    def search_ids(self, ids: Sequence[int], after: Optional[Tuple] = None, before: Optional[Tuple] = None,
+                   limit: int = DEFAULT_PAGE_SIZE, sort_by: Optional[str] = None,
+                   descending: bool = False) -> List[AssetRow]:
+        if sort_by is not None or descending:
+            # The candidates go in as one JSON array, since there may be more than MAX_IN_PARAMETERS of them.
+            keyset, params, order_by, backwards = keyset_page(sort_by, descending, after, before, "?")
+            rows = self.conn.execute(
+                f"{ASSET_SELECT} WHERE id IN (SELECT value FROM json_each(?)) AND remove_date IS NULL"
+                f"{' AND ' + keyset if keyset else ''} ORDER BY {order_by} LIMIT ?",
+                [json.dumps(list(ids))] + [local_value(value) for value in params] + [limit]).fetchall()
+            if backwards:
+                rows.reverse()
+            return rows
+
+        after_id = after[0] if after else None
+        before_id = before[0] if before else None
+        if before_id is not None:
+            end = bisect_left(ids, before_id)
+            candidates = ids[:end][::-1]
+        else:
+            start = bisect_right(ids, after_id) if after_id is not None else 0
+            candidates = ids[start:]
+
+        rows = []
+        position = 0
+        while len(rows) < limit and position < len(candidates):
+            chunk = candidates[position:position + min(limit - len(rows), MAX_IN_PARAMETERS)]
+            position += len(chunk)
+            rows += self.conn.execute(f"{ASSET_SELECT} WHERE id IN ({', '.join(['?'] * len(chunk))})"
+                                      " AND remove_date IS NULL", list(chunk)).fetchall()
+        rows.sort(key=lambda row: row[0])
+        return rows
+
+    def iter_search_values(self, columns: Sequence[str], chunk_size: int = EXPORT_CHUNK_SIZE) -> Iterator[Tuple]:
+        cursor = self.conn.execute(f"SELECT id, {', '.join(columns)} FROM assets WHERE remove_date IS NULL ORDER BY id")
+        try:
+            while True:
+                rows = cursor.fetchmany(chunk_size)
+                if not rows:
+                    return
+                yield from rows
+        finally:
+            cursor.close()
+
+    def metrics(self) -> Dict[str, int]:
+        return self.metrics_snapshot()[0]
+
+    def metrics_snapshot(self) -> Tuple[Dict[str, int], Optional[str]]:
+        """The counters and the snapshot of the primary that the replica was last synced to."""
+        row = self.conn.execute(LOCAL_METRICS_SQL).fetchone()
+        return dict(zip(METRIC_NAMES, row)), row[len(METRIC_NAMES)]
+
+    def synced_month(self) -> date:
+        """The first day of the primary's current month as of the last sync."""
+        return date.fromisoformat(self.conn.execute(f"SELECT {SYNCED_MONTH_SQL}").fetchone()[0])
+
+    def monthly_trend(self, months: int = TREND_MONTHS) -> List[Tuple]:
+        return fill_months(self.conn.execute(TREND_SQL).fetchall(), months, today=self.synced_month())
+
+    def location_breakdown(self) -> List[Tuple]:
+        return self.conn.execute(location_breakdown_sql("?"), [self.synced_month().isoformat()] * 4).fetchall()
+
+    def attribute_values(self) -> Dict[str, List[str]]:
+        return group_values(self.conn.execute(LOCAL_ATTRIBUTE_VALUES_SQL).fetchall())
+
+    def inventory(self, column: str) -> List[Tuple]:
+        if column not in HARDWARE_COLUMNS:
+            raise ValueError(f"No inventory of {column}")
+        return self.conn.execute(f"""
+            SELECT location, {column}, COUNT(*) FROM assets WHERE remove_date IS NULL
+            GROUP BY location, {column} ORDER BY location, {column}
+        """).fetchall()
+
+    def export_inventory(self, column: str, file: IO[str]) -> int:
+        return write_inventory(file, column, self.inventory(column))
+
+    def count_report(self, report_type: str) -> int:
+        return self.conn.execute(f"SELECT COUNT(*) FROM {report_source(report_type, 'assets')}"
+                                 f"{local_report_where(report_type)}").fetchone()[0]
+
+    def export_report(self, report_type: str, file: IO[str], progress: Optional[Progress] = None,
+                      chunk_size: int = EXPORT_CHUNK_SIZE) -> int:
+        total = self.count_report(report_type) if progress else None
+        if progress:
+            progress((0, total))
+
+        written = 0
+        writer = csv.writer(file)
+        writer.writerow(REPORT_HEADER)
+        cursor = self.conn.execute(f"SELECT {', '.join(ASSET_COLUMNS)} FROM {report_source(report_type, 'assets')}"
+                                   f"{local_report_where(report_type)} ORDER BY id")
+        try:
+            while True:
+                assets = cursor.fetchmany(chunk_size)
+                if not assets:
+                    break
+                writer.writerows(assets)
+                written += len(assets)
+                if progress:
+                    progress((written, total))
+        finally:
+            cursor.close()
+        return written
+
+
+def local_report_where(report_type: str) -> str:
+    if report_type not in LOCAL_REPORT_FILTERS:
+        raise ValueError(f"Unknown report type: {report_type}")
+    condition = LOCAL_REPORT_FILTERS[report_type]
+    return f" WHERE {condition}" if condition else ""
+
+
+def replica_source(db_config):
+    return f"{db_config.get('host') or 'localhost'}:{db_config.get('port') or 5432}/{db_config['dbname']}"
+
+
+def open_replica(db_config, config=None):
+    """The LocalReplica configured in [replica], or None when it is disabled."""
+    config = config or load_replica_config()
+    if not replica_enabled(config):
+        return None
+    return LocalReplica(os.path.expanduser(config["path"]), replica_source(db_config))
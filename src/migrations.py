@@ -0,0 +1,1153 @@
+"""
+Versioned schema migrations for the Asset Management Portal.
+
+The applied schema version is recorded in schema_version. migrate() brings a
+database up to LATEST_VERSION, holding an advisory lock so that two portals
+starting at the same time do not race each other. Migrations that rewrite data
+work in batches and keep their exclusive locks short so the portal stays usable
+while they run.
+"""
+
+
+import logging
+import time
+
+import psycopg2
+
+from asset_archive import ARCHIVING_SETTING
+from asset_fields import ASSET_COLUMNS, HARDWARE_COLUMNS, decoded_column, lookup_table, this_month
+from asset_repository import SORT_COLUMNS, sort_expression
+from monthly_rollup import rebuild_rollup
+
+
+# Rows converted per transaction when backfilling a column.
+BACKFILL_BATCH_SIZE = 5000
+# How long a migration waits for an exclusive lock before backing off and retrying.
+LOCK_TIMEOUT = "5s"
+LOCK_RETRIES = 5
+# Monthly asset_events partitions are created this many months ahead of the current one.
+EVENT_PARTITION_MONTHS = 3
+
+MIGRATION_LOCK_KEY = 4108241  # arbitrary application-wide advisory lock id
+
+logger = logging.getLogger("asset_portal.migrations")
+
+DATE_COLUMNS = ("asset_entry_date", "update_date", "remove_date")
+# The asset column each kind of asset_events event is dated by.
+EVENT_DATE_COLUMNS = (("added", "asset_entry_date"), ("updated", "update_date"), ("removed", "remove_date"))
+# A statement that changes more assets than this sends one resync notification instead of one per asset.
+NOTIFY_ROW_LIMIT = 1000
+# Columns behind the Manage Assets substring filters.
+SEARCH_COLUMNS = ("employee_name", "employee_id", "location")
+
+
+class Migration:
+    def __init__(self, version, description, apply, autocommit=False):
+        """
+        apply(conn) performs the change, and its version is recorded once it returns.
+        Plain migrations run in a transaction, but many commit part-way through: after
+        each backfill batch and each with_short_lock step. Autocommit ones (e.g. CREATE
+        INDEX CONCURRENTLY) run outside a transaction. Either kind must therefore be safe
+        to re-run after failing at any point.
+        """
+        self.version = version
+        self.description = description
+        self.apply = apply
+        self.autocommit = autocommit
+
+
+def create_initial_tables(conn):
+    with conn.cursor() as cursor:
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS assets (
+                id SERIAL PRIMARY KEY,
+                employee_name VARCHAR(500) NOT NULL,
+                employee_id VARCHAR(500) UNIQUE NOT NULL,
+                email_id VARCHAR(500) NOT NULL,
+                location VARCHAR(500) NOT NULL,
+                hostname VARCHAR(500) NOT NULL,
+                processor VARCHAR(500) NOT NULL,
+                ram VARCHAR(500) NOT NULL,
+                hd_size VARCHAR(500) NOT NULL,
+                mouse VARCHAR(500) NOT NULL,
+                adaptor VARCHAR(500) NOT NULL,
+                headset VARCHAR(500) NOT NULL,
+                monitor VARCHAR(500) NOT NULL,
+                it_others VARCHAR(500) NOT NULL,
+                software_licenses VARCHAR(500) NOT NULL,
+                asset_entry_date VARCHAR(500) NOT NULL,
+                entered_by VARCHAR(500),
+                updated_by VARCHAR(500),
+                update_date VARCHAR(500),
+                remove_date VARCHAR(500)
+            )
+        """)
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS users (
+                id SERIAL PRIMARY KEY,
+                email_id VARCHAR(255) NOT NULL UNIQUE,
+                employee_name VARCHAR(255) NOT NULL,
+                employee_id VARCHAR(255) NOT NULL UNIQUE,
+                password VARCHAR(255) NOT NULL,
+                role VARCHAR(50) NOT NULL DEFAULT 'user'
+            )
+        """)
+
+
+def convert_dates_to_date_type(conn):
+    """
+    Turn the VARCHAR date columns of assets into DATE without a long table lock.
+
+    Typed shadow columns are added and kept in sync by a trigger while existing rows
+    are converted in batches, then swapped in for the text columns in one short
+    metadata-only transaction.
+    """
+    if column_type(conn, "assets", "asset_entry_date") == "date":
+        return
+
+    def add_typed_columns(cursor):
+        cursor.execute("ALTER TABLE assets " + ", ".join(
+            f"ADD COLUMN IF NOT EXISTS {column}_typed DATE" for column in DATE_COLUMNS))
+        cursor.execute(f"""
+            CREATE OR REPLACE FUNCTION assets_sync_typed_dates() RETURNS trigger AS $$
+            BEGIN
+                {' '.join(f"NEW.{column}_typed := {parse_date(f'NEW.{column}')};" for column in DATE_COLUMNS)}
+                RETURN NEW;
+            END
+            $$ LANGUAGE plpgsql
+        """)
+        cursor.execute("DROP TRIGGER IF EXISTS assets_sync_typed_dates ON assets")
+        cursor.execute("""
+            CREATE TRIGGER assets_sync_typed_dates BEFORE INSERT OR UPDATE ON assets
+            FOR EACH ROW EXECUTE FUNCTION assets_sync_typed_dates()
+        """)
+
+    with_short_lock(conn, add_typed_columns)
+
+    backfill(conn, "assets", ", ".join(f"{column}_typed = {parse_date(column)}" for column in DATE_COLUMNS))
+
+    # asset_entry_date stays NOT NULL. Validating a CHECK first lets SET NOT NULL skip its full-table scan.
+    with conn.cursor() as cursor:
+        cursor.execute("ALTER TABLE assets DROP CONSTRAINT IF EXISTS assets_asset_entry_date_typed_not_null")
+        cursor.execute("""
+            ALTER TABLE assets ADD CONSTRAINT assets_asset_entry_date_typed_not_null
+            CHECK (asset_entry_date_typed IS NOT NULL) NOT VALID
+        """)
+    conn.commit()
+    with conn.cursor() as cursor:
+        cursor.execute("ALTER TABLE assets VALIDATE CONSTRAINT assets_asset_entry_date_typed_not_null")
+    conn.commit()
+
+    def swap(cursor):
+        cursor.execute("DROP TRIGGER assets_sync_typed_dates ON assets")
+        cursor.execute("DROP FUNCTION assets_sync_typed_dates()")
+        for column in DATE_COLUMNS:
+            cursor.execute(f"ALTER TABLE assets DROP COLUMN {column}")
+            cursor.execute(f"ALTER TABLE assets RENAME COLUMN {column}_typed TO {column}")
+        cursor.execute("ALTER TABLE assets ALTER COLUMN asset_entry_date SET NOT NULL")
+        cursor.execute("ALTER TABLE assets DROP CONSTRAINT assets_asset_entry_date_typed_not_null")
+
+    with_short_lock(conn, swap)
+
+
+def create_date_indexes(conn):
+    create_index_concurrently(conn, "assets_active_id_idx", "assets (id) WHERE remove_date IS NULL")
+    create_index_concurrently(conn, "assets_asset_entry_date_idx", "assets (asset_entry_date)")
+    create_index_concurrently(conn, "assets_update_date_idx", "assets (update_date)")
+    create_index_concurrently(conn, "assets_remove_date_idx", "assets (remove_date)")
+
+
+def create_trigram_indexes(conn):
+    """
+    Back the ILIKE '%...%' filters with pg_trgm GIN indexes. Databases where the
+    extension cannot be installed are left as they are; the portal falls back to an
+    in-process index for them (see trigram_indexes_ready) and builds the indexes once
+    the extension can be installed (see create_missing_trigram_indexes).
+    """
+    with conn.cursor() as cursor:
+        try:
+            cursor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        except psycopg2.Error as e:
+            logger.warning("pg_trgm is not available, asset search is not index-backed: %s", e)
+            return False
+    for column in SEARCH_COLUMNS:
+        create_index_concurrently(conn, f"assets_{column}_trgm_idx",
+                                  f"assets USING gin ({column} gin_trgm_ops) WHERE remove_date IS NULL")
+    return True
+
+
+def create_missing_trigram_indexes(conn):
+    """
+    Build the trigram indexes migration 4 had to skip, e.g. after a DBA installed
+    pg_trgm, and return whether they are ready. conn must be in autocommit mode. If
+    another session is migrating or building them this returns False straight away.
+    """
+    if trigram_indexes_ready(conn):
+        return True
+    try:
+        with conn.cursor() as cursor:
+            cursor.execute("SELECT pg_try_advisory_lock(%s)", (MIGRATION_LOCK_KEY,))
+            if not cursor.fetchone()[0]:
+                return False
+            try:
+                create_trigram_indexes(conn)
+            finally:
+                cursor.execute("SELECT pg_advisory_unlock(%s)", (MIGRATION_LOCK_KEY,))
+    except psycopg2.Error as e:
+        logger.warning("Could not build the trigram indexes: %s", e)
+        return False
+    return trigram_indexes_ready(conn)
+
+
+def trigram_indexes_ready(conn):
+    with conn.cursor() as cursor:
+        cursor.execute("""
+            SELECT COUNT(*) FROM pg_index
+            WHERE indexrelid IN (SELECT to_regclass(name) FROM unnest(%s) AS name) AND indisvalid
+        """, ([f"assets_{column}_trgm_idx" for column in SEARCH_COLUMNS],))
+        ready = cursor.fetchone()[0] == len(SEARCH_COLUMNS)
+    conn.commit()
+    return ready
+
+
+def track_asset_changes(conn):
+    """
+    Stamp every inserted or updated asset with the id of the writing transaction and
+    record hard deletes, so local replicas (see local_replica) can sync incrementally.
+    Existing rows keep a NULL stamp; a replica's first sync copies the whole table.
+    """
+    def add_change_tracking(cursor):
+        cursor.execute("ALTER TABLE assets ADD COLUMN IF NOT EXISTS change_xid xid8")
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS asset_deletions (
+                asset_id INTEGER NOT NULL,
+                change_xid xid8 NOT NULL DEFAULT pg_current_xact_id()
+            )
+        """)
+        cursor.execute("CREATE INDEX IF NOT EXISTS asset_deletions_change_xid_idx ON asset_deletions (change_xid)")
+        cursor.execute("""
+            CREATE OR REPLACE FUNCTION assets_stamp_change() RETURNS trigger AS $$
+            BEGIN
+                NEW.change_xid := pg_current_xact_id();
+                RETURN NEW;
+            END
+            $$ LANGUAGE plpgsql
+        """)
+        cursor.execute("""
+            CREATE OR REPLACE FUNCTION assets_record_deletion() RETURNS trigger AS $$
+            BEGIN
+                INSERT INTO asset_deletions (asset_id) VALUES (OLD.id);
+                RETURN OLD;
+            END
+            $$ LANGUAGE plpgsql
+        """)
+        cursor.execute("DROP TRIGGER IF EXISTS assets_stamp_change ON assets")
+        cursor.execute("""
+            CREATE TRIGGER assets_stamp_change BEFORE INSERT OR UPDATE ON assets
+            FOR EACH ROW EXECUTE FUNCTION assets_stamp_change()
+        """)
+        cursor.execute("DROP TRIGGER IF EXISTS assets_record_deletion ON assets")
+        cursor.execute("""
+            CREATE TRIGGER assets_record_deletion AFTER DELETE ON assets
+            FOR EACH ROW EXECUTE FUNCTION assets_record_deletion()
+        """)
+
+    with_short_lock(conn, add_change_tracking)
+
+
+def create_change_index(conn):
+    create_index_concurrently(conn, "assets_change_xid_idx", "assets (change_xid)")
+
+
+def create_notify_function(cursor, with_events=False):
+    """
+    assets_notify_change() sends the asset id, the operation, the writing transaction
+    and the dates the dashboard counters depend on before and after the change. Since
+    migration 9 it also names the asset_events event the change records, and whether
+    it leaves this month's counters alone: because the asset already had one of those
+    this month, or because the event is dated in another month.
+    """
+    def dates(record):
+        return (f"json_build_object('asset_entry_date', {record}.asset_entry_date,"
+                f" 'update_date', {record}.update_date, 'remove_date', {record}.remove_date)")
+
+    event_fields = ""
+    if with_events:
+        # Triggers fire in name order, so assets_record_event has not yet logged this change.
+        event_fields = f""",
+                'event', kind,
+                'repeat', NOT ({this_month("asset_event_date(kind, NEW)")}) OR EXISTS (
+                    SELECT 1 FROM asset_events
+                    WHERE event = kind
+                      AND asset_id = CASE WHEN TG_OP = 'DELETE' THEN OLD.id ELSE NEW.id END
+                      AND {this_month("event_date")})"""
+    cursor.execute(f"""
+        CREATE OR REPLACE FUNCTION assets_notify_change() RETURNS trigger AS $$
+        DECLARE
+            kind text := {"asset_event(TG_OP, OLD, NEW)" if with_events else "NULL"};
+        BEGIN
+            PERFORM pg_notify('asset_changes', json_build_object(
+                'id', CASE WHEN TG_OP = 'DELETE' THEN OLD.id ELSE NEW.id END,
+                'op', TG_OP,
+                'xid', pg_current_xact_id()::text,
+                'old', CASE WHEN TG_OP <> 'INSERT' THEN {dates('OLD')} END,
+                'new', CASE WHEN TG_OP <> 'DELETE' THEN {dates('NEW')} END{event_fields})::text);
+            RETURN NULL;
+        END
+        $$ LANGUAGE plpgsql
+    """)
+
+
+def notify_asset_changes(conn):
+    """
+    NOTIFY asset_changes after every insert, update and delete on assets (see
+    create_notify_function and change_listener).
+    """
+    def add_notify_trigger(cursor):
+        create_notify_function(cursor)
+        cursor.execute("DROP TRIGGER IF EXISTS assets_notify_change ON assets")
+        cursor.execute("""
+            CREATE TRIGGER assets_notify_change AFTER INSERT OR UPDATE OR DELETE ON assets
+            FOR EACH ROW EXECUTE FUNCTION assets_notify_change()
+        """)
+
+    with_short_lock(conn, add_notify_trigger)
+
+
+def create_sort_indexes(conn):
+    """Let the Manage Assets grid sort and page by (column, id) with an index scan instead of a sort."""
+    for column in SORT_COLUMNS:
+        create_index_concurrently(conn, f"assets_{column}_sort_idx",
+                                  f"assets ({sort_expression(column)}, id) WHERE remove_date IS NULL")
+
+
+def create_event_functions(cursor, hardware_keys=False):
+    """
+    The functions behind the assets_record_event trigger. asset_fields() is an asset's
+    fields as JSONB; since migration 13 (hardware_keys) with the hardware attributes
+    decoded. asset_event() names the event a change records: added, updated, removed,
+    deleted, or archived for a row that asset_archive moves to assets_archive.
+    asset_event_date() dates it: since migration 15 an added, updated or removed event
+    by the asset's own date for it, as the backfill does, so backdated and imported
+    assets count in the month they were entered, updated or removed.
+    """
+    fields = "to_jsonb(asset) - 'id' - 'change_xid'"
+    if hardware_keys:
+        # While migration 13 runs, rows not converted yet have no key and still carry the text column.
+        fields = (f"{fields} - '{{{','.join(f'{column}_id' for column in HARDWARE_COLUMNS)}}}'::text[]"
+                  " || jsonb_build_object(" + ", ".join(
+                      f"'{column}', COALESCE((SELECT value FROM {lookup_table(column)} WHERE id = asset.{column}_id),"
+                      f" to_jsonb(asset) ->> '{column}')" for column in HARDWARE_COLUMNS) + ")")
+    # plpgsql keeps the lookups' plans between calls; every write runs this several times.
+    cursor.execute(f"""
+        CREATE OR REPLACE FUNCTION asset_fields(asset assets) RETURNS jsonb AS $$
+        BEGIN
+            RETURN {fields};
+        END
+        $$ LANGUAGE plpgsql STABLE
+    """)
+    cursor.execute("""
+        CREATE OR REPLACE FUNCTION asset_changed_fields(old_row assets, new_row assets) RETURNS jsonb AS $$
+            SELECT COALESCE(jsonb_object_agg(new_fields.key, new_fields.value), '{}')
+            FROM jsonb_each(asset_fields(new_row)) AS new_fields
+            LEFT JOIN jsonb_each(asset_fields(old_row)) AS old_fields ON old_fields.key = new_fields.key
+            WHERE old_fields.value IS DISTINCT FROM new_fields.value
+        $$ LANGUAGE sql STABLE
+    """)
+    # NULL for an update that changed nothing but the change stamp.
+    cursor.execute(f"""
+        CREATE OR REPLACE FUNCTION asset_event(op text, old_row assets, new_row assets) RETURNS text AS $$
+            SELECT CASE
+                WHEN op = 'INSERT' THEN 'added'
+                WHEN op = 'DELETE' THEN
+                    CASE WHEN current_setting('{ARCHIVING_SETTING}', true) = 'on' THEN 'archived' ELSE 'deleted' END
+                WHEN asset_changed_fields(old_row, new_row) = '{{}}' THEN NULL
+                WHEN old_row.remove_date IS NULL AND new_row.remove_date IS NOT NULL THEN 'removed'
+                ELSE 'updated'
+            END
+        $$ LANGUAGE sql STABLE
+    """)
+    # Dates in the future (bad data) count as today, so the event lands in a partition that exists.
+    cursor.execute("""
+        CREATE OR REPLACE FUNCTION asset_event_date(kind text, asset assets) RETURNS date AS $$
+            SELECT LEAST(CASE kind WHEN 'added' THEN asset.asset_entry_date WHEN 'updated' THEN asset.update_date
+                                   WHEN 'removed' THEN asset.remove_date END, CURRENT_DATE)
+        $$ LANGUAGE sql STABLE
+    """)
+    cursor.execute("""
+        CREATE OR REPLACE FUNCTION assets_record_event() RETURNS trigger AS $$
+        DECLARE
+            kind text := asset_event(TG_OP, OLD, NEW);
+        BEGIN
+            IF kind = 'deleted' THEN
+                INSERT INTO asset_events (asset_id, event, changes)
+                VALUES (OLD.id, kind, asset_fields(OLD));
+            ELSIF kind = 'archived' THEN
+                -- The row itself lives on in assets_archive.
+                INSERT INTO asset_events (asset_id, event, changes) VALUES (OLD.id, kind, '{}');
+            ELSIF kind IS NOT NULL THEN
+                INSERT INTO asset_events (asset_id, event, event_date, changed_by, changes)
+                VALUES (NEW.id, kind, asset_event_date(kind, NEW),
+                        CASE kind WHEN 'added' THEN NEW.entered_by WHEN 'updated' THEN NEW.updated_by END,
+                        asset_changed_fields(OLD, NEW));
+            END IF;
+            RETURN NULL;
+        END
+        $$ LANGUAGE plpgsql
+    """)
+
+
+def record_asset_events(conn):
+    """
+    Log every add, update, remove and hard delete of an asset in asset_events, in the
+    writing transaction, with the fields it changed as JSONB. The log is partitioned by
+    month of event_date so the monthly counters and reports read one partition; older
+    history sits in asset_events_history. Existing assets get backfilled events dated
+    by their asset_entry_date, update_date and remove_date.
+    """
+    with conn.cursor() as cursor:
+        cursor.execute("SELECT DATE_TRUNC('month', CURRENT_DATE)::date")
+        first_month = cursor.fetchone()[0]
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS asset_events (
+                id BIGINT GENERATED ALWAYS AS IDENTITY,
+                asset_id INTEGER NOT NULL,
+                event VARCHAR(10) NOT NULL,
+                event_date DATE NOT NULL DEFAULT CURRENT_DATE,
+                occurred_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+                changed_by VARCHAR(500),
+                changes JSONB NOT NULL,
+                change_xid xid8 NOT NULL DEFAULT pg_current_xact_id(),
+                PRIMARY KEY (id, event_date)
+            ) PARTITION BY RANGE (event_date)
+        """)
+        cursor.execute("CREATE INDEX IF NOT EXISTS asset_events_event_idx ON asset_events (event, asset_id, event_date)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS asset_events_change_xid_idx ON asset_events (change_xid)")
+        cursor.execute(f"""
+            CREATE TABLE IF NOT EXISTS asset_events_history PARTITION OF asset_events
+            FOR VALUES FROM (MINVALUE) TO ('{first_month.isoformat()}')
+        """)
+        # Catches events for a month whose partition was never created, instead of failing the write.
+        cursor.execute("CREATE TABLE IF NOT EXISTS asset_events_default PARTITION OF asset_events DEFAULT")
+    conn.commit()
+    create_event_partitions(conn)
+
+    def add_event_trigger(cursor):
+        create_event_functions(cursor)
+        cursor.execute("DROP TRIGGER IF EXISTS assets_record_event ON assets")
+        cursor.execute("""
+            CREATE TRIGGER assets_record_event AFTER INSERT OR UPDATE OR DELETE ON assets
+            FOR EACH ROW EXECUTE FUNCTION assets_record_event()
+        """)
+        create_notify_function(cursor, with_events=True)
+        # Assets written from here on are logged by the trigger; older ones are backfilled below.
+        cursor.execute("SELECT COALESCE(MAX(id), 0) FROM assets")
+        last_ids.append(cursor.fetchone()[0])
+
+    last_ids = []
+    with_short_lock(conn, add_event_trigger)
+    backfill_asset_events(conn, last_ids[-1])
+
+
+def backfill_asset_events(conn, last_id=None):
+    """
+    Log added, updated and removed events for assets up to last_id, dated by their
+    asset_entry_date, update_date and remove_date, for rows written without the
+    assets_record_event trigger. Assets that already have an added event are skipped,
+    so a re-run after a failure picks up where the last committed batch left off.
+    """
+    # Events dated in the future by bad data are logged as of today, so they land in a partition that exists.
+    # Each batch logs all of an asset's events at once, so its added event marks it as done.
+    pending = ("id >= %(start)s AND id < %(end)s"
+               " AND NOT EXISTS (SELECT 1 FROM asset_events WHERE event = 'added' AND asset_id = assets.id)")
+    for start, end in id_batches(conn, "assets", last_id):
+        with conn.cursor() as cursor:
+            cursor.execute(f"""
+                INSERT INTO asset_events (asset_id, event, event_date, changed_by, changes)
+                SELECT id, 'added', LEAST(asset_entry_date, CURRENT_DATE), entered_by,
+                       to_jsonb(assets) - 'id' - 'change_xid'
+                FROM assets WHERE {pending}
+                UNION ALL
+                SELECT id, 'updated', LEAST(update_date, CURRENT_DATE), updated_by,
+                       jsonb_build_object('update_date', update_date, 'updated_by', updated_by)
+                FROM assets WHERE {pending} AND update_date IS NOT NULL
+                UNION ALL
+                SELECT id, 'removed', LEAST(remove_date, CURRENT_DATE), NULL, jsonb_build_object('remove_date', remove_date)
+                FROM assets WHERE {pending} AND remove_date IS NOT NULL
+            """, {"start": start, "end": end})
+        conn.commit()
+
+
+def create_rollup_function(cursor):
+    """assets_update_rollup() keeps asset_monthly_rollup in step with each change to assets."""
+    # Runs after assets_record_event (triggers fire in name order), so this change's event is logged.
+    cursor.execute("""
+        CREATE OR REPLACE FUNCTION assets_update_rollup() RETURNS trigger AS $$
+        DECLARE
+            kind text := asset_event(TG_OP, OLD, NEW);
+            month date := DATE_TRUNC('month', asset_event_date(kind, NEW))::date;
+        BEGIN
+            -- An archived asset still counts in the months it was active.
+            IF kind IS NULL OR kind = 'archived' THEN
+                RETURN NULL;
+            END IF;
+            IF TG_OP <> 'UPDATE' OR (OLD.location, OLD.asset_entry_date, OLD.remove_date)
+                    IS DISTINCT FROM (NEW.location, NEW.asset_entry_date, NEW.remove_date) THEN
+                IF TG_OP <> 'INSERT' THEN
+                    PERFORM asset_rollup_count_active(OLD, -1);
+                END IF;
+                IF TG_OP <> 'DELETE' THEN
+                    PERFORM asset_rollup_count_active(NEW, 1);
+                END IF;
+            END IF;
+            -- Counted once per asset and month, in the month the event is dated (the month an added or removed
+            -- asset's active count changes): only if this is its first event of the kind that month.
+            IF kind <> 'deleted' AND (SELECT COUNT(*) FROM asset_events
+                                      WHERE event = kind AND asset_id = NEW.id AND event_date >= month
+                                        AND event_date < month + INTERVAL '1 month') = 1 THEN
+                PERFORM asset_rollup_add(month, NEW.location,
+                                         (kind = 'added')::int, (kind = 'updated')::int, (kind = 'removed')::int, 0);
+            END IF;
+            RETURN NULL;
+        END
+        $$ LANGUAGE plpgsql
+    """)
+
+
+def create_monthly_rollup(conn):
+    """
+    Keep per-month, per-location asset counts in asset_monthly_rollup for the trend
+    dashboard (see monthly_rollup), maintained by a trigger on assets and filled from
+    the existing assets and asset_events.
+    """
+    with conn.cursor() as cursor:
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS asset_monthly_rollup (
+                month DATE NOT NULL,
+                location VARCHAR(500) NOT NULL,
+                added INTEGER NOT NULL DEFAULT 0,
+                updated INTEGER NOT NULL DEFAULT 0,
+                removed INTEGER NOT NULL DEFAULT 0,
+                active_change INTEGER NOT NULL DEFAULT 0,
+                change_xid xid8 NOT NULL DEFAULT pg_current_xact_id(),
+                PRIMARY KEY (month, location)
+            )
+        """)
+        cursor.execute("""
+            CREATE OR REPLACE FUNCTION asset_rollup_add(
+                month date, location text, added int, updated int, removed int, active_change int
+            ) RETURNS void AS $$
+                INSERT INTO asset_monthly_rollup AS rollup (month, location, added, updated, removed, active_change)
+                VALUES (month, location, added, updated, removed, active_change)
+                ON CONFLICT (month, location) DO UPDATE
+                SET added = rollup.added + EXCLUDED.added, updated = rollup.updated + EXCLUDED.updated,
+                    removed = rollup.removed + EXCLUDED.removed,
+                    active_change = rollup.active_change + EXCLUDED.active_change,
+                    change_xid = pg_current_xact_id()
+            $$ LANGUAGE sql
+        """)
+        # An asset is active from the month of its entry date to the month of its remove date.
+        cursor.execute("""
+            CREATE OR REPLACE FUNCTION asset_rollup_count_active(asset assets, sign int) RETURNS void AS $$
+            BEGIN
+                PERFORM asset_rollup_add(DATE_TRUNC('month', LEAST(asset.asset_entry_date, CURRENT_DATE))::date,
+                                         asset.location, 0, 0, 0, sign);
+                IF asset.remove_date IS NOT NULL THEN
+                    PERFORM asset_rollup_add(DATE_TRUNC('month', LEAST(asset.remove_date, CURRENT_DATE))::date,
+                                             asset.location, 0, 0, 0, -sign);
+                END IF;
+            END
+            $$ LANGUAGE plpgsql
+        """)
+    conn.commit()
+
+    def add_rollup_trigger(cursor):
+        create_rollup_function(cursor)
+        cursor.execute("DROP TRIGGER IF EXISTS assets_update_rollup ON assets")
+        cursor.execute("""
+            CREATE TRIGGER assets_update_rollup AFTER INSERT OR UPDATE OR DELETE ON assets
+            FOR EACH ROW EXECUTE FUNCTION assets_update_rollup()
+        """)
+
+    with_short_lock(conn, add_rollup_trigger)
+    rebuild_rollup(conn)
+
+
+def create_active_employee_index(conn):
+    """
+    Build the index that keeps employee_id unique among active assets only, so an
+    employee whose asset was removed can be issued one again. Migration 12 drops the
+    table-wide constraint it replaces.
+    """
+    create_index_concurrently(conn, "assets_active_employee_id_key",
+                              "assets (employee_id) WHERE remove_date IS NULL", unique=True)
+
+
+def create_asset_archive(conn):
+    """
+    Create assets_archive for the removed assets asset_archive moves out of assets:
+    the asset columns, the day the row was archived, and the archiving transaction for
+    local replicas to sync by. Archiving logs "archived" events and leaves the
+    monthly rollup alone, and employee_id is only unique among active assets.
+    """
+    with conn.cursor() as cursor:
+        cursor.execute(f"""
+            CREATE TABLE IF NOT EXISTS assets_archive AS
+            SELECT {', '.join(ASSET_COLUMNS)}, CURRENT_DATE AS archived_on, pg_current_xact_id() AS change_xid
+            FROM assets WITH NO DATA
+        """)
+        # A re-run after allow_reissue failed finds the table, and its primary key, already there.
+        cursor.execute("""
+            SELECT 1 FROM pg_constraint WHERE conrelid = 'assets_archive'::regclass AND contype = 'p'
+        """)
+        if not cursor.fetchone():
+            cursor.execute("ALTER TABLE assets_archive ADD PRIMARY KEY (id)")
+        cursor.execute("""
+            ALTER TABLE assets_archive
+                ALTER COLUMN archived_on SET DEFAULT CURRENT_DATE,
+                ALTER COLUMN archived_on SET NOT NULL,
+                ALTER COLUMN change_xid SET DEFAULT pg_current_xact_id(),
+                ALTER COLUMN change_xid SET NOT NULL
+        """)
+        cursor.execute("CREATE INDEX IF NOT EXISTS assets_archive_employee_id_idx ON assets_archive (employee_id)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS assets_archive_change_xid_idx ON assets_archive (change_xid)")
+    conn.commit()
+
+    def allow_reissue(cursor):
+        cursor.execute("ALTER TABLE assets DROP CONSTRAINT IF EXISTS assets_employee_id_key")
+        create_event_functions(cursor)
+        create_rollup_function(cursor)
+
+    with_short_lock(conn, allow_reissue)
+
+
+def store_hardware_as_keys(conn):
+    """
+    Replace the VARCHAR hardware attributes of assets (HARDWARE_COLUMNS) with SMALLINT
+    keys into one lookup table each, without a long table lock.
+
+    Key columns are added and kept in sync by a trigger while existing rows are
+    converted in batches, then the text columns are dropped in one short
+    metadata-only transaction; VACUUM FULL returns their space. asset_<column>_id()
+    looks a value up and adds it if it is new, and the asset_details view reads
+    assets with the values decoded.
+    """
+    if column_type(conn, "assets", "processor") is None:
+        return
+
+    def add_key_columns(cursor):
+        for column in HARDWARE_COLUMNS:
+            table = lookup_table(column)
+            cursor.execute(f"""
+                CREATE TABLE IF NOT EXISTS {table} (
+                    id SMALLINT GENERATED BY DEFAULT AS IDENTITY PRIMARY KEY,
+                    value VARCHAR(500) NOT NULL UNIQUE
+                )
+            """)
+            # Looks before inserting: a conflicting INSERT would still use up one of the few SMALLINT ids.
+            cursor.execute(f"""
+                CREATE OR REPLACE FUNCTION asset_{column}_id(label text) RETURNS smallint AS $$
+                DECLARE
+                    key smallint;
+                BEGIN
+                    SELECT id INTO key FROM {table} WHERE value = label;
+                    IF key IS NULL AND label IS NOT NULL THEN
+                        INSERT INTO {table} (value) VALUES (label)
+                        ON CONFLICT (value) DO UPDATE SET value = EXCLUDED.value
+                        RETURNING id INTO key;
+                    END IF;
+                    RETURN key;
+                END
+                $$ LANGUAGE plpgsql
+            """)
+            cursor.execute(f"ALTER TABLE assets ADD COLUMN IF NOT EXISTS {column}_id SMALLINT")
+            cursor.execute(f"ALTER TABLE assets DROP CONSTRAINT IF EXISTS assets_{column}_id_fkey")
+            cursor.execute(f"""
+                ALTER TABLE assets ADD CONSTRAINT assets_{column}_id_fkey
+                FOREIGN KEY ({column}_id) REFERENCES {table} (id) NOT VALID
+            """)
+        cursor.execute(f"""
+            CREATE OR REPLACE FUNCTION assets_sync_hardware_keys() RETURNS trigger AS $$
+            BEGIN
+                {' '.join(f"NEW.{column}_id := asset_{column}_id(NEW.{column});" for column in HARDWARE_COLUMNS)}
+                RETURN NEW;
+            END
+            $$ LANGUAGE plpgsql
+        """)
+        cursor.execute("DROP TRIGGER IF EXISTS assets_sync_hardware_keys ON assets")
+        cursor.execute("""
+            CREATE TRIGGER assets_sync_hardware_keys BEFORE INSERT OR UPDATE ON assets
+            FOR EACH ROW EXECUTE FUNCTION assets_sync_hardware_keys()
+        """)
+        # Setting a key does not change the asset, so the batches below log no events.
+        create_event_functions(cursor, hardware_keys=True)
+
+    with_short_lock(conn, add_key_columns)
+
+    # Existing values first, in sorted order, so the keys of the common values come out in a sensible order.
+    with conn.cursor() as cursor:
+        for column in HARDWARE_COLUMNS:
+            cursor.execute(f"""
+                INSERT INTO {lookup_table(column)} (value)
+                SELECT DISTINCT {column} FROM assets
+                WHERE {column} IS NOT NULL AND NOT EXISTS (
+                    SELECT 1 FROM {lookup_table(column)} WHERE value = assets.{column})
+                ORDER BY 1
+                ON CONFLICT (value) DO NOTHING
+            """)
+    conn.commit()
+    backfill(conn, "assets", ", ".join(
+        f"{column}_id = (SELECT id FROM {lookup_table(column)} WHERE value = assets.{column})"
+        for column in HARDWARE_COLUMNS))
+
+    # Validated constraints let SET NOT NULL skip its full-table scan and take no long lock themselves.
+    with conn.cursor() as cursor:
+        cursor.execute("ALTER TABLE assets DROP CONSTRAINT IF EXISTS assets_hardware_keys_not_null")
+        cursor.execute(f"""
+            ALTER TABLE assets ADD CONSTRAINT assets_hardware_keys_not_null
+            CHECK ({' AND '.join(f"{column}_id IS NOT NULL" for column in HARDWARE_COLUMNS)}) NOT VALID
+        """)
+    conn.commit()
+    with conn.cursor() as cursor:
+        cursor.execute("ALTER TABLE assets VALIDATE CONSTRAINT assets_hardware_keys_not_null")
+        for column in HARDWARE_COLUMNS:
+            cursor.execute(f"ALTER TABLE assets VALIDATE CONSTRAINT assets_{column}_id_fkey")
+    conn.commit()
+
+    def swap(cursor):
+        cursor.execute("DROP TRIGGER assets_sync_hardware_keys ON assets")
+        cursor.execute("DROP FUNCTION assets_sync_hardware_keys()")
+        for column in HARDWARE_COLUMNS:
+            cursor.execute(f"ALTER TABLE assets DROP COLUMN {column}")
+            cursor.execute(f"ALTER TABLE assets ALTER COLUMN {column}_id SET NOT NULL")
+        cursor.execute("ALTER TABLE assets DROP CONSTRAINT assets_hardware_keys_not_null")
+        # Scalar subselects rather than joins: a page of the grid plans in well under a millisecond, and queries
+        # that read no hardware attribute never touch the lookups.
+        cursor.execute(f"""
+            CREATE VIEW asset_details AS
+            SELECT {', '.join(decoded_column(column) for column in ASSET_COLUMNS)}, assets.change_xid
+            FROM assets
+        """)
+
+    with_short_lock(conn, swap)
+
+
+def create_inventory_index(conn):
+    """Answer the inventory report's per-location counts of each hardware attribute with an index-only scan."""
+    create_index_concurrently(
+        conn, "assets_inventory_idx",
+        f"assets (location) INCLUDE ({', '.join(f'{column}_id' for column in HARDWARE_COLUMNS)})"
+        " WHERE remove_date IS NULL")
+
+
+def date_events_by_asset_dates(conn):
+    """
+    Date added, updated and removed events by the asset's asset_entry_date, update_date
+    and remove_date (see create_event_functions) instead of the day they were logged.
+    Events logged so far are re-dated from the dates in their changes, a batch at a
+    time, and the monthly rollup is rebuilt to match.
+    """
+    def date_new_events(cursor):
+        create_event_functions(cursor, hardware_keys=True)
+        create_notify_function(cursor, with_events=True)
+        create_rollup_function(cursor)
+
+    with_short_lock(conn, date_new_events)
+
+    # Logged events carry the date in their changes whenever it was set; a date later than the day the event was
+    # logged was in the future then, and stays as logged. A new change_xid lets local replicas copy the move.
+    for start, end in id_batches(conn, "asset_events"):
+        with conn.cursor() as cursor:
+            cursor.execute(f"""
+                UPDATE asset_events
+                SET event_date = (changes ->> column_name)::date, change_xid = pg_current_xact_id()
+                FROM (VALUES {', '.join(f"('{event}', '{column}')" for event, column in EVENT_DATE_COLUMNS)})
+                    AS dated (event_name, column_name)
+                WHERE asset_events.event = dated.event_name AND id >= %s AND id < %s
+                  AND (changes ->> column_name)::date < event_date
+            """, (start, end))
+        conn.commit()
+    rebuild_rollup(conn)
+
+
+def changed_fields(new, old):
+    """
+    SQL for the fields of the to_jsonb() asset row `new` that differ from those of `old`
+    ('{}' for every field), as JSONB with the hardware keys decoded, like asset_fields().
+    """
+    keys = [f"{column}_id" for column in HARDWARE_COLUMNS]
+    decoded = " ".join(f"WHEN '{column}_id' THEN to_jsonb((SELECT value FROM {lookup_table(column)}"
+                       f" WHERE id = (field.value #>> '{{}}')::smallint))" for column in HARDWARE_COLUMNS)
+    return f"""(
+        SELECT COALESCE(jsonb_object_agg(
+                   CASE WHEN field.key IN ({', '.join(f"'{key}'" for key in keys)}) THEN left(field.key, -3)
+                        ELSE field.key END,
+                   CASE field.key {decoded} ELSE field.value END), '{{}}')
+        FROM jsonb_each({new} - 'id' - 'change_xid') AS field
+        WHERE field.value IS DISTINCT FROM {old} -> field.key
+    )"""
+
+
+def decoded_fields(fields):
+    """
+    SQL for every field of the to_jsonb() asset row `fields` as JSONB with the hardware
+    keys decoded: changed_fields() against no old row, without diffing key by key.
+    """
+    keys = ",".join(f"{column}_id" for column in HARDWARE_COLUMNS)
+    return (f"({fields} - 'id' - 'change_xid' - '{{{keys}}}'::text[] || jsonb_build_object(" + ", ".join(
+        f"'{column}', (SELECT value FROM {lookup_table(column)} WHERE id = ({fields} ->> '{column}_id')::smallint)"
+        for column in HARDWARE_COLUMNS) + "))")
+
+
+# Each statement's changed assets in the shape of CHANGED_ASSET_COLUMNS. The event is NULL for an update that
+# changed nothing but the change stamp. OFFSET 0 keeps the planner from copying the rows' JSONB, and the diff, into
+# every expression that reads them.
+CHANGED_ASSET_COLUMNS = ("id", "event", "old_location", "old_asset_entry_date", "old_update_date", "old_remove_date",
+                         "location", "asset_entry_date", "update_date", "remove_date", "changed_by", "changes")
+CHANGED_ASSETS_SQL = {
+    "INSERT": f"""
+        SELECT new_rows.id, 'added', NULL, NULL::date, NULL::date, NULL::date,
+               new_rows.location, new_rows.asset_entry_date, new_rows.update_date, new_rows.remove_date,
+               new_rows.entered_by, {decoded_fields("row.fields")}
+        FROM new_rows CROSS JOIN LATERAL (SELECT to_jsonb(new_rows) AS fields OFFSET 0) AS row
+    """,
+    "UPDATE": f"""
+        SELECT new_rows.id,
+               CASE WHEN diff.changes = '{{}}' THEN NULL
+                    WHEN old_rows.remove_date IS NULL AND new_rows.remove_date IS NOT NULL THEN 'removed'
+                    ELSE 'updated' END,
+               old_rows.location, old_rows.asset_entry_date, old_rows.update_date, old_rows.remove_date,
+               new_rows.location, new_rows.asset_entry_date, new_rows.update_date, new_rows.remove_date,
+               CASE WHEN new_rows.remove_date IS NULL OR old_rows.remove_date IS NOT NULL THEN new_rows.updated_by END,
+               diff.changes
+        FROM new_rows JOIN old_rows ON old_rows.id = new_rows.id
+        CROSS JOIN LATERAL (SELECT to_jsonb(new_rows) AS new_fields, to_jsonb(old_rows) AS old_fields OFFSET 0) AS row
+        CROSS JOIN LATERAL (SELECT {changed_fields("row.new_fields", "row.old_fields")} AS changes OFFSET 0) AS diff
+    """,
+    # The row of an archived asset lives on in assets_archive.
+    "DELETE": f"""
+        SELECT old_rows.id, CASE WHEN archiving THEN 'archived' ELSE 'deleted' END,
+               old_rows.location, old_rows.asset_entry_date, old_rows.update_date, old_rows.remove_date,
+               NULL, NULL::date, NULL::date, NULL::date, NULL,
+               CASE WHEN archiving THEN '{{}}' ELSE {decoded_fields("row.fields")} END
+        FROM old_rows CROSS JOIN LATERAL (SELECT to_jsonb(old_rows) AS fields OFFSET 0) AS row
+    """,
+}
+
+
+def log_changes_sql(operation):
+    """
+    One statement that logs the asset_events of a statement's changes, adds them to
+    asset_monthly_rollup and, if notify_each, notifies asset_changes of each asset.
+    """
+    def dates(prefix):
+        return (f"json_build_object('asset_entry_date', {prefix}asset_entry_date,"
+                f" 'update_date', {prefix}update_date, 'remove_date', {prefix}remove_date)")
+
+    def month(column):
+        return f"DATE_TRUNC('month', LEAST({column}, CURRENT_DATE))::date"
+
+    event_date = ("LEAST(CASE event " + " ".join(f"WHEN '{event}' THEN {column}" for event, column in EVENT_DATE_COLUMNS)
+                  + " END, CURRENT_DATE)")
+    # An asset is active from the month of its entry date to the month of its remove date, at its location.
+    active_changes = " UNION ALL ".join(
+        f"SELECT {month(f'{prefix}{column}')}, {prefix}location, {sign}"
+        f" FROM dated WHERE counted AND {prefix}{column} IS NOT NULL"
+        for prefix, column, sign in (("", "asset_entry_date", 1), ("", "remove_date", -1),
+                                     ("old_", "asset_entry_date", -1), ("old_", "remove_date", 1)))
+    return f"""
+        WITH changed ({', '.join(CHANGED_ASSET_COLUMNS)}) AS ({CHANGED_ASSETS_SQL[operation]}), dated AS (
+            SELECT changed.*, {event_date} AS event_date,
+                   -- An archived asset still counts in the months it was active.
+                   event IS NOT NULL AND event <> 'archived'
+                       AND (old_asset_entry_date IS NULL OR asset_entry_date IS NULL
+                            OR (old_location, old_asset_entry_date, old_remove_date)
+                               IS DISTINCT FROM (location, asset_entry_date, remove_date)) AS counted
+            FROM changed
+        ), events AS (
+            -- The statement's snapshot does not see the events logged below, so first means first before it.
+            SELECT dated.*, NOT EXISTS (
+                       SELECT 1 FROM asset_events
+                       WHERE asset_events.event = dated.event AND asset_id = dated.id
+                         AND asset_events.event_date >= DATE_TRUNC('month', dated.event_date)
+                         AND asset_events.event_date < DATE_TRUNC('month', dated.event_date) + INTERVAL '1 month'
+                   ) AS first
+            FROM dated WHERE event IS NOT NULL
+        ), logged AS (
+            INSERT INTO asset_events (asset_id, event, event_date, changed_by, changes)
+            SELECT id, event, event_date, changed_by, changes FROM events
+        ), rolled_up AS (
+            -- Added, updated and removed count once per asset and month, in the month the event is dated.
+            INSERT INTO asset_monthly_rollup AS rollup (month, location, added, updated, removed, active_change)
+            SELECT month, location, SUM(added), SUM(updated), SUM(removed), SUM(active_change)
+            FROM (
+                SELECT DATE_TRUNC('month', event_date)::date AS month, location, (event = 'added')::int AS added,
+                       (event = 'updated')::int AS updated, (event = 'removed')::int AS removed, 0 AS active_change
+                FROM events WHERE first AND event IN ('added', 'updated', 'removed')
+                UNION ALL
+                SELECT month, location, 0, 0, 0, active_change
+                FROM ({active_changes}) AS active (month, location, active_change)
+            ) AS contributions
+            GROUP BY month, location
+            HAVING SUM(added) + SUM(updated) + SUM(removed) > 0 OR SUM(active_change) <> 0
+            ON CONFLICT (month, location) DO UPDATE
+            SET added = rollup.added + EXCLUDED.added, updated = rollup.updated + EXCLUDED.updated,
+                removed = rollup.removed + EXCLUDED.removed,
+                active_change = rollup.active_change + EXCLUDED.active_change, change_xid = pg_current_xact_id()
+        )
+        SELECT COUNT(pg_notify('asset_changes', json_build_object(
+                   'id', dated.id, 'op', '{operation}', 'xid', pg_current_xact_id()::text,
+                   'old', CASE WHEN dated.old_asset_entry_date IS NOT NULL THEN {dates("dated.old_")} END,
+                   'new', CASE WHEN dated.asset_entry_date IS NOT NULL THEN {dates("dated.")} END,
+                   'event', dated.event,
+                   'repeat', NOT ({this_month("dated.event_date")}) OR NOT COALESCE(events.first, TRUE))::text))
+        INTO notified
+        FROM dated LEFT JOIN events ON events.id = dated.id
+        WHERE notify_each
+    """
+
+
+def create_change_log_function(cursor):
+    """
+    assets_log_changes() logs, rolls up and notifies a whole statement's changes to
+    assets at once, from its transition tables: one statement per writing statement
+    instead of three row triggers per asset, so bulk imports and batch updates stay fast.
+    """
+    operations = " ".join(f"""
+            {"IF" if number == 0 else "ELSIF"} TG_OP = '{operation}' THEN
+                {"SELECT COUNT(*) INTO changed_rows FROM new_rows;" if operation != "DELETE"
+                 else "SELECT COUNT(*) INTO changed_rows FROM old_rows;"}
+                IF changed_rows = 0 THEN
+                    RETURN NULL;
+                END IF;
+                notify_each := changed_rows <= {NOTIFY_ROW_LIMIT};
+                {log_changes_sql(operation)};""" for number, operation in enumerate(CHANGED_ASSETS_SQL))
+    cursor.execute(f"""
+        CREATE OR REPLACE FUNCTION assets_log_changes() RETURNS trigger AS $$
+        DECLARE
+            archiving boolean := current_setting('{ARCHIVING_SETTING}', true) = 'on';
+            changed_rows bigint;
+            notify_each boolean;
+            notified bigint;
+        BEGIN
+            {operations}
+            END IF;
+            IF NOT notify_each THEN
+                -- Clients reload what they show instead of patching in thousands of changes.
+                PERFORM pg_notify('asset_changes', json_build_object('resync', true)::text);
+            END IF;
+            RETURN NULL;
+        END
+        $$ LANGUAGE plpgsql
+    """)
+
+
+def log_changes_per_statement(conn):
+    """
+    Replace the notify, event and rollup row triggers on assets with statement-level
+    triggers that handle each writing statement's transition tables at once (see
+    create_change_log_function).
+    """
+    def swap_triggers(cursor):
+        create_change_log_function(cursor)
+        for trigger in ("assets_notify_change", "assets_record_event", "assets_update_rollup"):
+            cursor.execute(f"DROP TRIGGER IF EXISTS {trigger} ON assets")
+            cursor.execute(f"DROP FUNCTION IF EXISTS {trigger}()")
+        for trigger, operation, tables in (
+                ("assets_log_inserts", "INSERT", "NEW TABLE AS new_rows"),
+                ("assets_log_updates", "UPDATE", "OLD TABLE AS old_rows NEW TABLE AS new_rows"),
+                ("assets_log_deletes", "DELETE", "OLD TABLE AS old_rows")):
+            cursor.execute(f"DROP TRIGGER IF EXISTS {trigger} ON assets")
+            cursor.execute(f"""
+                CREATE TRIGGER {trigger} AFTER {operation} ON assets REFERENCING {tables}
+                FOR EACH STATEMENT EXECUTE FUNCTION assets_log_changes()
+            """)
+
+    with_short_lock(conn, swap_triggers)
+
+
+def log_fields_without_diff(conn):
+    """
+    Recreate assets_log_changes() so added and deleted assets log their fields as they
+    are (decoded_fields) instead of diffing each one against an empty row, which was
+    most of the trigger's time on a bulk import.
+    """
+    with_short_lock(conn, create_change_log_function)
+
+
+def create_event_partitions(conn, months=EVENT_PARTITION_MONTHS):
+    """
+    Create the monthly asset_events partitions from this month to `months` months ahead
+    that do not exist yet. The portal calls this on every start, so the default
+    partition normally stays empty.
+    """
+    with conn.cursor() as cursor:
+        cursor.execute("SELECT to_regclass('asset_events') IS NOT NULL")
+        if not cursor.fetchone()[0]:
+            conn.commit()
+            return
+        cursor.execute("""
+            SELECT 'asset_events_' || to_char(month, 'YYYY_MM'), month::date, (month + INTERVAL '1 month')::date
+            FROM generate_series(DATE_TRUNC('month', CURRENT_DATE), DATE_TRUNC('month', CURRENT_DATE) + %s * INTERVAL '1 month',
+                                 INTERVAL '1 month') AS month
+            WHERE to_regclass('asset_events_' || to_char(month, 'YYYY_MM')) IS NULL
+        """, (months,))
+        missing = cursor.fetchall()
+    conn.commit()
+
+    for name, start, end in missing:
+        try:
+            with_short_lock(conn, lambda cursor: cursor.execute(
+                f"CREATE TABLE IF NOT EXISTS {name} PARTITION OF asset_events"
+                f" FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"))
+        except Exception as e:
+            # The default partition already holds events of that month; they stay there.
+            if getattr(e, "pgcode", None) != "23514":  # check_violation
+                raise
+
+
+MIGRATIONS = [
+    Migration(1, "Create assets and users tables", create_initial_tables),
+    Migration(2, "Store asset dates as DATE", convert_dates_to_date_type),
+    Migration(3, "Index asset dates and active assets", create_date_indexes, autocommit=True),
+    Migration(4, "Trigram indexes for asset search", create_trigram_indexes, autocommit=True),
+    Migration(5, "Track asset changes for local replicas", track_asset_changes),
+    Migration(6, "Index asset changes", create_change_index, autocommit=True),
+    Migration(7, "Notify clients of asset changes", notify_asset_changes),
+    Migration(8, "Index asset sort orders", create_sort_indexes, autocommit=True),
+    Migration(9, "Log asset events by month", record_asset_events),
+    Migration(10, "Monthly asset rollup", create_monthly_rollup),
+    Migration(11, "Unique employee ids among active assets", create_active_employee_index, autocommit=True),
+    Migration(12, "Archive table for removed assets", create_asset_archive),
+    Migration(13, "Store hardware attributes in lookup tables", store_hardware_as_keys),
+    Migration(14, "Index inventory breakdowns", create_inventory_index, autocommit=True),
+    Migration(15, "Date asset events by the asset's dates", date_events_by_asset_dates),
+    Migration(16, "Log asset changes per statement", log_changes_per_statement),
+    Migration(17, "Log added and deleted assets' fields without a per-field diff", log_fields_without_diff),
+]
+LATEST_VERSION = MIGRATIONS[-1].version
+
+
+def current_version(conn):
+    with conn.cursor() as cursor:
+        cursor.execute("SELECT to_regclass('schema_version') IS NOT NULL")
+        if not cursor.fetchone()[0]:
+            version = 0
+        else:
+            cursor.execute("SELECT COALESCE(MAX(version), 0) FROM schema_version")
+            version = cursor.fetchone()[0]
+    conn.commit()
+    return version
+
+
+def migrate(conn, log=None):
+    """Apply every pending migration and return the resulting schema version."""
+    if current_version(conn) >= LATEST_VERSION:
+        return LATEST_VERSION
+
+    with conn.cursor() as cursor:
+        cursor.execute("SELECT pg_advisory_lock(%s)", (MIGRATION_LOCK_KEY,))
+    conn.commit()
+    try:
+        with conn.cursor() as cursor:
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS schema_version (
+                    version INTEGER PRIMARY KEY,
+                    description VARCHAR(500) NOT NULL,
+                    applied_at TIMESTAMPTZ NOT NULL DEFAULT now()
+                )
+            """)
+        conn.commit()
+
+        version = current_version(conn)
+        for migration in MIGRATIONS:
+            if migration.version <= version:
+                continue
+            if log:
+                log(f"Applying schema migration {migration.version}: {migration.description}")
+            if migration.autocommit:
+                conn.autocommit = True
+                try:
+                    migration.apply(conn)
+                finally:
+                    conn.autocommit = False
+            else:
+                migration.apply(conn)
+            with conn.cursor() as cursor:
+                cursor.execute("INSERT INTO schema_version (version, description) VALUES (%s, %s)",
+                               (migration.version, migration.description))
+            conn.commit()
+            version = migration.version
+        return version
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        with conn.cursor() as cursor:
+            cursor.execute("SELECT pg_advisory_unlock(%s)", (MIGRATION_LOCK_KEY,))
+        conn.commit()
+
+
+def parse_date(expression):
+    # Anything that is not a YYYY-MM-DD string becomes NULL rather than failing the migration.
+    return f"CASE WHEN {expression} ~ '^[0-9]{{4}}-[0-9]{{2}}-[0-9]{{2}}$' THEN {expression}::date END"
+
+
+def column_type(conn, table, column):
+    with conn.cursor() as cursor:
+        cursor.execute("SELECT data_type FROM information_schema.columns WHERE table_name = %s AND column_name = %s",
+                       (table, column))
+        row = cursor.fetchone()
+    conn.commit()
+    return row[0] if row else None
+
+
+def id_batches(conn, table, last_id=None):
+    """(start, end) id ranges of BACKFILL_BATCH_SIZE covering table up to last_id (default: its highest id)."""
+    with conn.cursor() as cursor:
+        cursor.execute(f"SELECT COALESCE(MIN(id), 0), COALESCE(MAX(id), 0) FROM {table}")
+        first_id, max_id = cursor.fetchone()
+    conn.commit()
+    last_id = max_id if last_id is None else last_id
+    return [(start, min(start + BACKFILL_BATCH_SIZE, last_id + 1))
+            for start in range(first_id, last_id + 1, BACKFILL_BATCH_SIZE)]
+
+
+def backfill(conn, table, assignments, where="TRUE"):
+    """Run UPDATE table SET assignments over id ranges, committing after each batch."""
+    for start, end in id_batches(conn, table):
+        with conn.cursor() as cursor:
+            cursor.execute(f"UPDATE {table} SET {assignments} WHERE id >= %s AND id < %s AND ({where})",
+                           (start, end))
+        conn.commit()
+
+
+def with_short_lock(conn, change):
+    """
+    Run change(cursor) in a transaction that gives up quickly if it cannot get its locks,
+    so a long-running reader never leaves every other session queued behind the migration.
+    """
+    for attempt in range(LOCK_RETRIES):
+        try:
+            with conn.cursor() as cursor:
+                cursor.execute(f"SET LOCAL lock_timeout = '{LOCK_TIMEOUT}'")
+                change(cursor)
+            conn.commit()
+            return
+        except Exception as e:
+            conn.rollback()
+            if getattr(e, "pgcode", None) != "55P03" or attempt == LOCK_RETRIES - 1:  # lock_not_available
+                raise
+            time.sleep(2 ** attempt)
+
+
+def create_index_concurrently(conn, name, definition, unique=False):
+    # An interrupted CREATE INDEX CONCURRENTLY leaves an invalid index behind; rebuild it.
+    with conn.cursor() as cursor:
+        cursor.execute("""
+            SELECT NOT indisvalid FROM pg_index WHERE indexrelid = to_regclass(%s)
+        """, (name,))
+        row = cursor.fetchone()
+        if row and row[0]:
+            cursor.execute(f"DROP INDEX CONCURRENTLY {name}")
+        cursor.execute(f"CREATE {'UNIQUE ' if unique else ''}INDEX CONCURRENTLY IF NOT EXISTS {name} ON {definition}")
@@ -0,0 +1,153 @@
+"""
+Monthly asset rollup for the Asset Management Portal's trend dashboard.
+
+asset_monthly_rollup (migration 10) holds one row per month and location: how many
+assets were added, updated and removed that month, and by how much the number of
+active assets changed. The dashboard's 24-month trend and its by-location
+breakdown read only this table; active counts are running sums of active_change.
+
+The table is kept up to date by a trigger on assets. Every asset counts as active
+from the month of its asset_entry_date to the month of its remove_date, at its
+current location, so the trigger and rebuild_rollup() always agree on the active
+counts. Added, updated and removed count distinct assets per month, from the
+asset_events log, in the month the event is dated; an added or removed event is
+dated in the month the asset's active count changes. The trigger files them under
+the location the asset had at the time, a rebuild under the asset's current location. Archived assets (see
+asset_archive) keep counting in both.
+
+Rebuild the table from assets and asset_events with the rebuild-rollup command of
+asset_cli:
+    python asset_management_portal.py rebuild-rollup
+`python monthly_rollup.py rebuild` runs the same command.
+"""
+
+
+import argparse
+import sys
+from datetime import date
+
+
+TREND_MONTHS = 24
+
+# Every month with rollup rows, oldest first, with the number of active assets at its end.
+TREND_SQL = """
+    SELECT month, added, updated, removed, CAST(SUM(active_change) OVER (ORDER BY month) AS INTEGER)
+    FROM (
+        SELECT month, CAST(SUM(added) AS INTEGER) AS added, CAST(SUM(updated) AS INTEGER) AS updated,
+               CAST(SUM(removed) AS INTEGER) AS removed, SUM(active_change) AS active_change
+        FROM asset_monthly_rollup GROUP BY month
+    ) AS months
+    ORDER BY month
+"""
+
+# {assets} is assets, or assets together with assets_archive once migration 12 created it.
+REBUILD_SQL = """
+    INSERT INTO asset_monthly_rollup (month, location, added, updated, removed, active_change)
+    SELECT month, location, SUM(added), SUM(updated), SUM(removed), SUM(active_change)
+    FROM (
+        SELECT events.month, assets.location,
+               COUNT(*) FILTER (WHERE event = 'added') AS added,
+               COUNT(*) FILTER (WHERE event = 'updated') AS updated,
+               COUNT(*) FILTER (WHERE event = 'removed') AS removed,
+               0 AS active_change
+        FROM (
+            SELECT DISTINCT DATE_TRUNC('month', event_date)::date AS month, asset_id, event
+            FROM asset_events WHERE event IN ('added', 'updated', 'removed')
+        ) AS events
+        JOIN {assets} ON assets.id = events.asset_id
+        GROUP BY events.month, assets.location
+        UNION ALL
+        SELECT DATE_TRUNC('month', LEAST(asset_entry_date, CURRENT_DATE))::date, location, 0, 0, 0, 1
+        FROM {assets}
+        UNION ALL
+        SELECT DATE_TRUNC('month', LEAST(remove_date, CURRENT_DATE))::date, location, 0, 0, 0, -1
+        FROM {assets} WHERE remove_date IS NOT NULL
+    ) AS contributions
+    GROUP BY month, location
+"""
+
+# Archived assets still count in the months they were active.
+ARCHIVED_ASSETS = """(
+    SELECT id, location, asset_entry_date, remove_date FROM assets
+    UNION ALL
+    SELECT id, location, asset_entry_date, remove_date FROM assets_archive
+) AS assets"""
+
+
+def location_breakdown_sql(placeholder="%s"):
+    """(location, active, added, updated, removed) in the month bound to the four placeholders."""
+    def this_month(column):
+        return f"SUM(CASE WHEN month = {placeholder} THEN {column} ELSE 0 END)"
+
+    return f"""
+        SELECT location, SUM(active_change) AS active, {this_month("added")}, {this_month("updated")},
+               {this_month("removed")}
+        FROM asset_monthly_rollup
+        GROUP BY location
+        HAVING SUM(active_change) <> 0 OR {this_month("added + updated + removed")} > 0
+        ORDER BY active DESC, location
+    """
+
+
+def rebuild_rollup(conn):
+    """Recompute asset_monthly_rollup from scratch and return the number of rows written."""
+    with conn.cursor() as cursor:
+        # Writers wait at their rollup update until the rebuild commits, so none of their changes is lost.
+        cursor.execute("LOCK TABLE asset_monthly_rollup IN EXCLUSIVE MODE")
+        cursor.execute("DELETE FROM asset_monthly_rollup")
+        cursor.execute("SELECT to_regclass('assets_archive') IS NOT NULL")
+        assets = ARCHIVED_ASSETS if cursor.fetchone()[0] else "assets"
+        cursor.execute(REBUILD_SQL.format(assets=assets))
+        rows = cursor.rowcount
+    conn.commit()
+    return rows
+
+
+def month_start(value):
+    # Rollup months come back as dates from PostgreSQL and as YYYY-MM-DD text from the local replica.
+    return date.fromisoformat(str(value)[:10]).replace(day=1)
+
+
+def previous_months(months, today=None):
+    """The first days of the last `months` months, oldest first, ending with the current one."""
+    today = today or date.today()
+    year, month = today.year, today.month
+    starts = []
+    for _ in range(months):
+        starts.append(date(year, month, 1))
+        year, month = (year, month - 1) if month > 1 else (year - 1, 12)
+    return starts[::-1]
+
+
+def fill_months(rows, months=TREND_MONTHS, today=None):
+    """
+    Turn (month, added, updated, removed, active) rows for the months that have any,
+    oldest first, into one row for each of the last `months` months. A month without
+    rows carries the previous month's active count.
+    """
+    by_month = {month_start(row[0]): row[1:] for row in rows}
+    starts = previous_months(months, today)
+    active = 0
+    for month, row in sorted(by_month.items()):
+        if month < starts[0]:
+            active = row[3]
+    filled = []
+    for month in starts:
+        added, updated, removed, active = by_month.get(month, (0, 0, 0, active))
+        filled.append((month, added, updated, removed, active))
+    return filled
+
+
+def main(argv=None):
+    """The asset_cli rebuild-rollup command, which leaves the schema to the migrate command; returns its exit status."""
+    parser = argparse.ArgumentParser(description="Maintain the monthly asset rollup behind the trend dashboard.")
+    parser.add_argument("command", choices=["rebuild"], help="rebuild: recompute the rollup from assets and asset_events")
+    parser.parse_args(argv)
+
+    from asset_cli import main as run_command
+
+    return run_command(["rebuild-rollup"])
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,118 @@
+"""
+In-process trigram index for the Manage Assets substring filters.
+
+Used when the database has no pg_trgm extension, so that searching for part of a
+name, employee ID or location does not turn into a sequential scan of assets on
+every keystroke. The index holds only the searchable columns of active assets.
+"""
+
+
+import threading
+from array import array
+from bisect import bisect_left, insort
+
+
+NGRAM_SIZE = 3
+LOAD_CHUNK_SIZE = 10000
+
+
+def ngrams(text):
+    return {text[i:i + NGRAM_SIZE] for i in range(len(text) - NGRAM_SIZE + 1)}
+
+
+class NgramIndex:
+    def __init__(self, fields):
+        """postings holds, per field, each gram's sorted array of asset ids."""
+        self.fields = tuple(fields)
+        self.lock = threading.Lock()
+        self.loaded = False
+        self.values = {}
+        self.postings = [{} for _ in self.fields]
+
+    def ensure_loaded(self, repository):
+        with self.lock:
+            if self.loaded:
+                return
+            self.values = {}
+            self.postings = [{} for _ in self.fields]
+            for row in repository.iter_search_values(self.fields, chunk_size=LOAD_CHUNK_SIZE):
+                self._add(row[0], row[1:])
+            self.loaded = True
+
+    def invalidate(self):
+        with self.lock:
+            self.loaded = False
+            self.values = {}
+            self.postings = [{} for _ in self.fields]
+
+    def add(self, asset_id, values):
+        with self.lock:
+            if self.loaded:
+                self._add(asset_id, values)
+
+    def remove(self, asset_id):
+        with self.lock:
+            old = self.values.pop(asset_id, None)
+            if old is not None:
+                for postings, value in zip(self.postings, old):
+                    self._drop(postings, asset_id, ngrams(value))
+
+    def _add(self, asset_id, values):
+        values = tuple((value or "").lower() for value in values)
+        # Re-adding an asset only touches the grams of the fields that changed, so postings never hold an id twice.
+        old = self.values.get(asset_id) or ("",) * len(self.fields)
+        self.values[asset_id] = values
+        for postings, old_value, value in zip(self.postings, old, values):
+            if value == old_value:
+                continue
+            old_grams, grams = ngrams(old_value), ngrams(value)
+            self._drop(postings, asset_id, old_grams - grams)
+            for gram in grams - old_grams:
+                posting = postings.get(gram)
+                if posting is None:
+                    posting = postings[gram] = array("I")
+                # Loading goes in id order, so this is nearly always an append.
+                insort(posting, asset_id)
+
+    def _drop(self, postings, asset_id, grams):
+        # Common grams, e.g. of a location, hold most ids; bisect finds the id without scanning them.
+        for gram in grams:
+            posting = postings.get(gram)
+            if posting is None:
+                continue
+            position = bisect_left(posting, asset_id)
+            if position < len(posting) and posting[position] == asset_id:
+                del posting[position]
+                if not posting:
+                    del postings[gram]
+
+    def search(self, criteria):
+        """
+        Return the sorted ids of assets whose fields contain every {field: substring} in criteria,
+        case-insensitively.
+        """
+        terms = [(self.fields.index(field), term.lower()) for field, term in criteria.items() if term]
+        with self.lock:
+            if not terms:
+                return sorted(self.values)
+
+            # Start from the shortest posting list of any term; substring checks do the rest.
+            candidates = None
+            for position, term in terms:
+                if len(term) < NGRAM_SIZE:
+                    continue
+                for gram in ngrams(term):
+                    posting = self.postings[position].get(gram)
+                    if posting is None:
+                        return []
+                    if candidates is None or len(posting) < len(candidates):
+                        candidates = posting
+            if candidates is None:
+                candidates = self.values.keys()
+
+            matches = set()
+            for asset_id in candidates:
+                values = self.values.get(asset_id)
+                if values is not None and all(term in values[position] for position, term in terms):
+                    matches.add(asset_id)
+            return sorted(matches)
@@ -0,0 +1,154 @@
+"""
+Background query executor for the Asset Management Portal.
+
+Database work is submitted as jobs that run on worker threads. Results, errors and
+progress updates are handed back to the Tk thread by polling a queue with after(),
+so callbacks are always free to touch widgets.
+"""
+
+
+import queue
+import threading
+
+import query_stats
+
+
+class QueryCancelled(Exception):
+    pass
+
+
+class QueryJob:
+    def __init__(self, executor, fn, on_success, on_error, on_progress, idempotent, screen, connection=True):
+        self.executor = executor
+        self.fn = fn
+        self.idempotent = idempotent
+        self.connection = connection
+        self.screen = screen
+        self.on_success = on_success
+        self.on_error = on_error
+        self.on_progress = on_progress
+        self.conn = None
+        self.cancelled = False
+        self.lock = threading.Lock()
+
+    def cancel(self):
+        # A job that has not started is skipped; a running one has its statement
+        # cancelled on the server. Either way no callback is delivered afterwards.
+        with self.lock:
+            self.cancelled = True
+            conn = self.conn
+        if conn is not None:
+            try:
+                conn.cancel()
+            except Exception:
+                pass
+
+    def report_progress(self, value):
+        if self.cancelled:
+            raise QueryCancelled()
+        self.executor.results.put((self, "progress", value))
+
+
+class QueryExecutor:
+    def __init__(self, widget, run, workers=1, poll_interval=50, on_error=None, on_busy=None):
+        """
+        widget: any Tk widget, used for after() polling.
+        run: run(fn, idempotent) calls fn(conn) with a DB connection, e.g. ConnectionPool.run.
+        on_error: default error callback for jobs submitted without one.
+        on_busy: called with True/False when the executor starts or stops having work.
+
+        Statements run by a job are attributed to the executor's `screen` at the time it was submitted.
+        """
+        self.widget = widget
+        self.run = run
+        self.poll_interval = poll_interval
+        self.on_error = on_error
+        self.on_busy = on_busy
+        self.screen = None
+        self.jobs = queue.Queue()
+        self.results = queue.Queue()
+        self.outstanding = 0
+        self.polling = False
+        self.closed = False
+        self.threads = []
+        for index in range(workers):
+            thread = threading.Thread(target=self.worker, name=f"query-worker-{index}", daemon=True)
+            thread.start()
+            self.threads.append(thread)
+
+    def submit(self, fn, on_success=None, on_error=None, on_progress=None, idempotent=False, connection=True):
+        """
+        Queue fn(job) for a worker thread; job.conn holds the connection while it runs.
+        Mark read-only jobs idempotent so they are retried if the connection drops.
+        Jobs submitted with connection=False (e.g. reads from the local replica) run
+        without taking a database connection, and job.conn stays None.
+        """
+        job = QueryJob(self, fn, on_success, on_error or self.on_error, on_progress, idempotent, self.screen,
+                       connection)
+        self.outstanding += 1
+        if self.outstanding == 1 and self.on_busy:
+            self.on_busy(True)
+        self.jobs.put(job)
+        if not self.polling:
+            self.polling = True
+            self.widget.after(self.poll_interval, self.poll)
+        return job
+
+    def worker(self):
+        while True:
+            job = self.jobs.get()
+            if job is None:
+                return
+            if job.cancelled:
+                self.results.put((job, "done", None))
+                continue
+            try:
+                if job.connection:
+                    result = self.run(lambda conn: self.execute(job, conn), job.idempotent)
+                else:
+                    result = self.execute(job, None)
+                self.results.put((job, "success", result))
+            except Exception as e:
+                self.results.put((job, "error", e))
+
+    def execute(self, job, conn):
+        with job.lock:
+            if job.cancelled:
+                raise QueryCancelled()
+            job.conn = conn
+        try:
+            with query_stats.screen(job.screen):
+                return job.fn(job)
+        finally:
+            with job.lock:
+                job.conn = None
+
+    def poll(self):
+        try:
+            self.deliver_results()
+        finally:
+            if self.outstanding and not self.closed:
+                self.widget.after(self.poll_interval, self.poll)
+            else:
+                self.polling = False
+
+    def deliver_results(self):
+        while True:
+            try:
+                job, kind, value = self.results.get_nowait()
+            except queue.Empty:
+                return
+            if kind != "progress":
+                self.outstanding -= 1
+                if self.outstanding == 0 and self.on_busy:
+                    self.on_busy(False)
+            if job.cancelled or kind == "done":
+                continue
+            callback = {"success": job.on_success, "error": job.on_error, "progress": job.on_progress}[kind]
+            if callback:
+                callback(value)
+
+    def shutdown(self):
+        self.closed = True
+        for _ in self.threads:
+            self.jobs.put(None)
@@ -0,0 +1,292 @@
+"""
+Query timing instrumentation for the Asset Management Portal.
+
+InstrumentedCursor, installed as the cursor class of every pooled connection,
+times each statement and records its fingerprint (the SQL with literals and
+parameters folded to ?), duration, row count and the screen that issued it in
+STATS. Statements slower than the configured threshold are written to a rotating
+slow-query log together with their EXPLAIN output. A named (server-side) cursor
+counts as slow by the time to its first rows, not by how long its caller took to
+stream them all, and is only EXPLAINed, never re-run under ANALYZE. STATS also collects how long
+each screen takes to render; the diagnostics panel displays both.
+"""
+
+
+import logging
+import logging.handlers
+import re
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+import psycopg2
+import psycopg2.extensions
+
+from db_pool import load_config
+
+
+DEFAULT_DIAGNOSTICS = {
+    "slow_query_ms": "500",
+    "slow_query_log": "slow_queries.log",
+    "explain_slow_queries": "true",
+}
+DIAGNOSTICS_ENVIRONMENT = {
+    "ASSET_SLOW_QUERY_MS": "slow_query_ms",
+    "ASSET_SLOW_QUERY_LOG": "slow_query_log",
+}
+SLOW_LOG_MAX_BYTES = 1024 * 1024
+SLOW_LOG_BACKUPS = 5
+
+# Upper bounds (ms) of the histogram buckets; the last bucket takes everything slower.
+BUCKETS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000)
+# Durations kept per statement for the percentiles shown in the diagnostics panel.
+RECENT_SAMPLES = 500
+
+# Only plain reads are re-run under EXPLAIN ANALYZE; writes get their plan without being executed.
+ANALYZABLE = re.compile(r"^\s*SELECT\b.*\bFROM\b", re.IGNORECASE | re.DOTALL)
+EXPLAINABLE = re.compile(r"^\s*(SELECT|WITH|INSERT|UPDATE|DELETE)\b", re.IGNORECASE)
+
+_context = threading.local()
+
+
+def fingerprint(statement):
+    if isinstance(statement, bytes):
+        statement = statement.decode("utf-8", "replace")
+    statement = re.sub(r"'(?:[^']|'')*'", "?", str(statement))
+    statement = re.sub(r"%s|%\(\w+\)s|\b\d+(?:\.\d+)?\b", "?", statement)
+    return " ".join(statement.split())
+
+
+@contextmanager
+def screen(name):
+    """Attribute the statements run by this thread inside the block to screen name."""
+    previous = getattr(_context, "screen", None)
+    _context.screen = name
+    try:
+        yield
+    finally:
+        _context.screen = previous
+
+
+def current_screen():
+    return getattr(_context, "screen", None)
+
+
+class Timing:
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.rows = 0
+        self.buckets = [0] * (len(BUCKETS_MS) + 1)
+        self.recent = deque(maxlen=RECENT_SAMPLES)
+
+    def add(self, seconds, rows=None):
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+        if rows is not None and rows > 0:
+            self.rows += rows
+        milliseconds = seconds * 1000
+        bucket = next((index for index, bound in enumerate(BUCKETS_MS) if milliseconds <= bound), len(BUCKETS_MS))
+        self.buckets[bucket] += 1
+        self.recent.append(seconds)
+
+    def percentile(self, fraction):
+        if not self.recent:
+            return 0.0
+        ordered = sorted(self.recent)
+        return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+    def copy(self):
+        timing = Timing()
+        timing.count, timing.total, timing.max, timing.rows = self.count, self.total, self.max, self.rows
+        timing.buckets = list(self.buckets)
+        timing.recent = deque(self.recent, maxlen=RECENT_SAMPLES)
+        return timing
+
+
+class QueryStats:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.queries = {}
+        self.screens = {}
+
+    def record_query(self, statement, screen_name, seconds, rows):
+        with self.lock:
+            self.queries.setdefault((statement, screen_name), Timing()).add(seconds, rows)
+
+    def record_render(self, screen_name, seconds):
+        with self.lock:
+            self.screens.setdefault(screen_name, Timing()).add(seconds)
+
+    def snapshot(self):
+        """Copies of the query timings keyed by (fingerprint, screen) and the render timings keyed by screen."""
+        with self.lock:
+            return ({key: timing.copy() for key, timing in self.queries.items()},
+                    {key: timing.copy() for key, timing in self.screens.items()})
+
+    def reset(self):
+        with self.lock:
+            self.queries = {}
+            self.screens = {}
+
+
+STATS = QueryStats()
+
+
+class SlowQueryLog:
+    def __init__(self, threshold_ms, path, explain=True):
+        self.threshold = threshold_ms / 1000
+        self.path = path
+        self.explain = explain
+        self.logger = logging.getLogger("asset_portal.slow_queries")
+        self.logger.setLevel(logging.INFO)
+        self.logger.propagate = False
+        handler = logging.handlers.RotatingFileHandler(path, maxBytes=SLOW_LOG_MAX_BYTES,
+                                                       backupCount=SLOW_LOG_BACKUPS, encoding="utf-8")
+        handler.setFormatter(logging.Formatter("%(asctime)s %(message)s"))
+        for old in list(self.logger.handlers):
+            self.logger.removeHandler(old)
+            old.close()
+        self.logger.addHandler(handler)
+
+    def record(self, conn, statement, seconds, rows, screen_name, analyze=True):
+        message = f"{seconds * 1000:.1f} ms, {rows} rows, screen {screen_name or '-'}\n    {fingerprint(statement)}"
+        if self.explain and EXPLAINABLE.match(statement):
+            plan = explain(conn, statement, analyze=analyze and bool(ANALYZABLE.match(statement)))
+            message += "\n" + "\n".join("    " + line for line in plan.splitlines())
+        self.logger.info(message)
+
+
+slow_query_log = None
+
+
+def configure(config=None):
+    """Set up the slow-query log from the [diagnostics] section of the config file."""
+    global slow_query_log
+    config = config or load_config("diagnostics", DEFAULT_DIAGNOSTICS, DIAGNOSTICS_ENVIRONMENT)
+    threshold = float(config["slow_query_ms"])
+    if threshold <= 0 or not config["slow_query_log"]:
+        slow_query_log = None
+        return
+    slow_query_log = SlowQueryLog(threshold, config["slow_query_log"],
+                                  explain=config["explain_slow_queries"].strip().lower() in ("1", "true", "yes", "on"))
+
+
+def explain(conn, statement, analyze):
+    # A plain cursor, so the EXPLAIN is neither timed nor logged itself. The savepoint keeps a
+    # failing EXPLAIN from aborting the caller's transaction.
+    savepoint = not conn.autocommit
+    options = "(ANALYZE, BUFFERS) " if analyze else ""
+    cursor = psycopg2.extensions.cursor(conn)
+    try:
+        if savepoint:
+            cursor.execute("SAVEPOINT slow_query_explain")
+        cursor.execute(f"EXPLAIN {options}{statement}")
+        plan = "\n".join(row[0] for row in cursor.fetchall())
+        if savepoint:
+            cursor.execute("RELEASE SAVEPOINT slow_query_explain")
+        return plan
+    except psycopg2.Error as e:
+        if savepoint:
+            try:
+                cursor.execute("ROLLBACK TO SAVEPOINT slow_query_explain")
+            except psycopg2.Error:
+                pass
+        return f"EXPLAIN failed: {e}".strip()
+    finally:
+        cursor.close()
+
+
+def record(cursor, query, vars, seconds, rows, latency=None):
+    """
+    Report a statement to STATS and, if slow, to the slow-query log. latency is the time
+    to the first rows of a named cursor, which is what decides whether it was slow.
+    """
+    screen_name = current_screen()
+    STATS.record_query(fingerprint(query), screen_name, seconds, rows)
+    slow_seconds = seconds if latency is None else latency
+    if slow_query_log and slow_seconds >= slow_query_log.threshold:
+        # Only slow statements are worth the cost of interpolating their parameters.
+        statement = cursor.mogrify(query, vars).decode(psycopg2.extensions.encodings[cursor.connection.encoding],
+                                                       "replace")
+        slow_query_log.record(cursor.connection, statement, slow_seconds, rows, screen_name,
+                              analyze=latency is None)
+
+
+class InstrumentedCursor(psycopg2.extensions.cursor):
+    """
+    Cursor that reports every statement to STATS. Named (server-side) cursors are
+    reported when they are closed, with the time spent executing and fetching and the
+    number of rows fetched; the time to their first fetch decides whether they were slow.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.pending = None
+        self.fetch_time = 0.0
+        self.first_fetch_time = None
+        self.fetched = 0
+
+    def execute(self, query, vars=None):
+        started = time.perf_counter()
+        result = super().execute(query, vars)
+        seconds = time.perf_counter() - started
+        if self.name is None:
+            record(self, query, vars, seconds, self.rowcount)
+        else:
+            self.pending = (query, vars, seconds)
+        return result
+
+    def copy_expert(self, sql, file, size=8192):
+        started = time.perf_counter()
+        result = super().copy_expert(sql, file, size)
+        STATS.record_query(fingerprint(sql), current_screen(), time.perf_counter() - started, self.rowcount)
+        return result
+
+    def fetchone(self):
+        return self.timed_fetch(super().fetchone)
+
+    def fetchmany(self, size=None):
+        return self.timed_fetch(super().fetchmany, size)
+
+    def fetchall(self):
+        return self.timed_fetch(super().fetchall)
+
+    def __iter__(self):
+        # psycopg2 iterates named cursors without going through fetchmany, which would leave them untimed.
+        if self.name is None:
+            return super().__iter__()
+        return self.timed_iter()
+
+    def timed_iter(self):
+        while True:
+            rows = self.fetchmany(self.itersize)
+            if not rows:
+                return
+            yield from rows
+
+    def timed_fetch(self, fetch, *args):
+        if self.name is None:
+            return fetch(*args)
+        started = time.perf_counter()
+        try:
+            rows = fetch(*args)
+            self.fetched += len(rows) if isinstance(rows, list) else rows is not None
+            return rows
+        finally:
+            seconds = time.perf_counter() - started
+            self.fetch_time += seconds
+            if self.first_fetch_time is None:
+                self.first_fetch_time = seconds
+
+    def close(self):
+        pending, self.pending = self.pending, None
+        if pending and not self.closed:
+            # Before closing: a slow statement is interpolated through this cursor.
+            query, vars, seconds = pending
+            record(self, query, vars, seconds + self.fetch_time, self.fetched,
+                   latency=seconds + (self.first_fetch_time or 0.0))
+        super().close()
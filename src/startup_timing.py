@@ -0,0 +1,35 @@
+"""
+Startup timing for the Asset Management Portal.
+
+Startup steps are marked as they finish, from the Tk thread and from the
+background thread that opens the database. report() lists them in order with the
+time since launch and since the previous step; run the portal with
+--startup-timing to print it once the database is ready. The diagnostics panel
+shows it as well.
+"""
+
+
+import threading
+import time
+
+
+class StartupTimer:
+    def __init__(self, launched=None):
+        self.launched = launched if launched is not None else time.perf_counter()
+        self.lock = threading.Lock()
+        self.marks = []
+
+    def mark(self, step):
+        with self.lock:
+            self.marks.append((time.perf_counter() - self.launched, step, threading.current_thread().name))
+
+    def report(self):
+        with self.lock:
+            marks = sorted(self.marks)
+        lines = ["Startup timing (ms since launch / since previous step):"]
+        previous = 0.0
+        for elapsed, step, thread in marks:
+            where = "" if thread == "MainThread" else f"  [{thread}]"
+            lines.append(f"  {elapsed * 1000:8.1f} {(elapsed - previous) * 1000:8.1f}  {step}{where}")
+            previous = elapsed
+        return "\n".join(lines)
@@ -0,0 +1,134 @@
+"""
+Fixtures for the tests that need PostgreSQL.
+
+The tests connect with the portal's own settings (asset_portal.ini and the
+ASSET_DB_* variables) and work in scratch databases named after ASSET_TEST_DB
+(default asset_management_test), which are dropped and recreated. They are skipped
+when no server is reachable.
+
+Usage:
+    ASSET_DB_HOST=localhost ASSET_DB_USER=postgres python -m pytest tests
+"""
+
+
+import csv
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+import psycopg2
+
+from asset_fields import ASSET_COLUMNS, REPORT_HEADER
+from asset_repository import AssetRepository
+from db_pool import connection_settings, load_db_config
+from migrations import migrate
+
+
+TEST_DATABASE = os.environ.get("ASSET_TEST_DB", "asset_management_test")
+MAINTENANCE_DATABASE = "postgres"
+
+ASSET = {
+    "employee_name": "Test User", "employee_id": "TEST-0001", "email_id": "test.user@example.com",
+    "location": "Pune", "hostname": "LT-TEST", "processor": "Intel Core i5-1135G7", "ram": "16 GB",
+    "hd_size": "512 GB SSD", "mouse": "Yes", "adaptor": "Yes", "headset": "No", "monitor": "Dell P2422H",
+    "it_others": "None", "software_licenses": "Office 365", "asset_entry_date": "2024-07-31",
+}
+
+
+def settings(dbname):
+    config = load_db_config()
+    if config["dbname"] in (TEST_DATABASE, f"{TEST_DATABASE}_template"):
+        pytest.exit(f"Refusing to test against the portal's own database {config['dbname']!r}: tests drop it.")
+    config["dbname"] = dbname
+    return connection_settings(config)
+
+
+def create_database(admin, name, template=None):
+    with admin.cursor() as cursor:
+        cursor.execute(f"DROP DATABASE IF EXISTS {name}")
+        cursor.execute(f"CREATE DATABASE {name}" + (f" TEMPLATE {template}" if template else ""))
+
+
+@pytest.fixture(scope="session")
+def server():
+    """An autocommit connection to the maintenance database, for creating the scratch ones."""
+    try:
+        admin = psycopg2.connect(**settings(MAINTENANCE_DATABASE))
+    except psycopg2.OperationalError as e:
+        pytest.skip(f"PostgreSQL is not reachable: {e}")
+    admin.autocommit = True
+    yield admin
+    admin.close()
+
+
+@pytest.fixture(scope="session")
+def migrated_template(server):
+    """A database migrated to LATEST_VERSION once per session, copied for each test."""
+    name = f"{TEST_DATABASE}_template"
+    create_database(server, name)
+    conn = psycopg2.connect(**settings(name))
+    try:
+        migrate(conn)
+    finally:
+        conn.close()
+    yield name
+    with server.cursor() as cursor:
+        cursor.execute(f"DROP DATABASE IF EXISTS {name}")
+
+
+@pytest.fixture
+def empty_conn(server):
+    """A connection to a new, empty database."""
+    create_database(server, TEST_DATABASE)
+    conn = psycopg2.connect(**settings(TEST_DATABASE))
+    yield conn
+    conn.close()
+
+
+@pytest.fixture
+def conn(server, migrated_template):
+    """A connection to a new database at the latest schema version."""
+    create_database(server, TEST_DATABASE, template=migrated_template)
+    conn = psycopg2.connect(**settings(TEST_DATABASE))
+    yield conn
+    conn.close()
+
+
+@pytest.fixture
+def repository(conn):
+    return AssetRepository(conn)
+
+
+def asset(**fields):
+    """ASSET with some fields replaced."""
+    return dict(ASSET, **fields)
+
+
+def write_import_file(path, assets):
+    """Write assets, dicts of asset columns, as an import file without the ID column."""
+    with open(path, mode='w', newline='') as file:
+        writer = csv.writer(file)
+        writer.writerow(REPORT_HEADER[1:])
+        writer.writerows([fields.get(column, "") for column in ASSET_COLUMNS[1:]] for fields in assets)
+    return str(path)
+
+
+def import_file(repository, path):
+    with repository.transaction():
+        return repository.bulk_create(path, "importer")
+
+
+def rollup_rows(conn):
+    """The rows of asset_monthly_rollup that count anything, in order."""
+    with conn.cursor() as cursor:
+        cursor.execute("""
+            SELECT month, location, added, updated, removed, active_change FROM asset_monthly_rollup
+            WHERE (added, updated, removed, active_change) <> (0, 0, 0, 0)
+            ORDER BY month, location
+        """)
+        rows = cursor.fetchall()
+    conn.commit()
+    return rows
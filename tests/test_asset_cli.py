@@ -0,0 +1,25 @@
+"""The headless entry points: only the migrate command changes the schema."""
+
+
+import pytest
+
+import asset_archive
+import monthly_rollup
+from asset_cli import main
+from conftest import TEST_DATABASE
+from migrations import current_version
+
+
+@pytest.fixture
+def outdated_conn(empty_conn, monkeypatch):
+    """A connection to an empty database, which the commands are pointed at."""
+    monkeypatch.setenv("ASSET_DB_NAME", TEST_DATABASE)
+    return empty_conn
+
+
+@pytest.mark.parametrize("command", [asset_archive.main, lambda argv: monthly_rollup.main(["rebuild"] + argv),
+                                     lambda argv: main(["rebuild-rollup"] + argv)])
+def test_scripts_do_not_migrate(outdated_conn, capsys, command):
+    assert command([]) == 2
+    assert "run the migrate command first" in capsys.readouterr().err
+    assert current_version(outdated_conn) == 0
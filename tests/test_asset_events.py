@@ -0,0 +1,91 @@
+"""The statement-level triggers on assets: asset_events, the monthly rollup and change notifications."""
+
+
+import json
+
+from asset_repository import today
+from conftest import asset, import_file, rollup_rows, write_import_file
+from migrations import NOTIFY_ROW_LIMIT
+from monthly_rollup import rebuild_rollup
+
+
+def listen(conn):
+    with conn.cursor() as cursor:
+        cursor.execute("LISTEN asset_changes")
+    conn.commit()
+
+
+def notifications(conn):
+    conn.poll()
+    payloads = [json.loads(notify.payload) for notify in conn.notifies]
+    conn.notifies.clear()
+    return payloads
+
+
+def events(conn):
+    with conn.cursor() as cursor:
+        cursor.execute("SELECT asset_id, event, event_date::text, changed_by, changes FROM asset_events ORDER BY id")
+        rows = cursor.fetchall()
+    conn.commit()
+    return rows
+
+
+def test_changes_are_logged_and_dated_by_the_asset_dates(repository, conn):
+    with repository.transaction():
+        backdated = repository.create_asset(asset(employee_id="E1", asset_entry_date="2024-07-31"), "admin")
+        current = repository.create_asset(asset(employee_id="E2", asset_entry_date=today()), "admin")
+    with repository.transaction():
+        repository.update_assets([backdated], {"ram": "32 GB"}, "manager")
+        repository.remove_asset(current)
+
+    logged = events(conn)
+    assert [row[:4] for row in logged] == [
+        (backdated, "added", "2024-07-31", "admin"), (current, "added", today(), "admin"),
+        (backdated, "updated", today(), "manager"), (current, "removed", today(), None)]
+    assert logged[0][4]["processor"] == "Intel Core i5-1135G7"
+    assert logged[2][4]["ram"] == "32 GB"
+    # The backdated asset was not added this month.
+    assert repository.metrics() == {"total_assets": 1, "assets_added": 1, "assets_updated": 1, "assets_removed": 1}
+
+
+def test_rollup_matches_a_rebuild(repository, conn, tmp_path):
+    with repository.transaction():
+        ids = [repository.create_asset(asset(employee_id=f"E{number}", asset_entry_date=f"2024-0{number}-15",
+                                             location="Mumbai" if number % 2 else "Pune"), "admin")
+               for number in range(1, 6)]
+    with repository.transaction():
+        repository.update_assets(ids[:3], {"monitor": "LG 27UL500"}, "manager")
+        repository.update_assets(ids[:2], {"ram": "32 GB"}, "manager")
+        repository.remove_assets(ids[3:])
+    import_file(repository, write_import_file(tmp_path / "assets.csv", [
+        asset(employee_id="E1", location="Mumbai", headset="Yes"),
+        asset(employee_id="E9", asset_entry_date="2024-08-01")]))
+
+    rolled_up = rollup_rows(conn)
+    rebuild_rollup(conn)
+    assert rollup_rows(conn) == rolled_up
+
+
+def test_each_change_is_notified(repository, conn):
+    listen(conn)
+    with repository.transaction():
+        backdated = repository.create_asset(asset(employee_id="E1"), "admin")
+        current = repository.create_asset(asset(employee_id="E2", asset_entry_date=today()), "admin")
+    with repository.transaction():
+        repository.update_assets([backdated, current], {"ram": "32 GB"}, "manager")
+        repository.update_assets([current], {"ram": "8 GB"}, "manager")
+
+    assert [(change["id"], change["op"], change["event"], change["repeat"]) for change in notifications(conn)] == [
+        (backdated, "INSERT", "added", True), (current, "INSERT", "added", False),
+        (backdated, "UPDATE", "updated", False), (current, "UPDATE", "updated", False),
+        (current, "UPDATE", "updated", True)]
+
+
+def test_large_statement_sends_one_resync(repository, conn, tmp_path):
+    listen(conn)
+    path = write_import_file(tmp_path / "assets.csv",
+                             [asset(employee_id=f"E{number}") for number in range(NOTIFY_ROW_LIMIT + 1)])
+
+    assert import_file(repository, path).inserted == NOTIFY_ROW_LIMIT + 1
+    assert notifications(conn) == [{"resync": True}]
+    assert len(events(conn)) == NOTIFY_ROW_LIMIT + 1
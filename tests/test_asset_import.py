@@ -0,0 +1,138 @@
+"""Bulk import: validating rows and merging them into assets by employee_id."""
+
+
+import csv
+import os
+
+from asset_archive import archive_removed_assets
+from asset_repository import today
+from conftest import asset, import_file, write_import_file
+
+
+def stored_assets(conn):
+    with conn.cursor() as cursor:
+        cursor.execute("""
+            SELECT employee_id, location, ram, entered_by, updated_by, update_date::text, remove_date::text
+            FROM asset_details ORDER BY employee_id, id
+        """)
+        rows = cursor.fetchall()
+    conn.commit()
+    return rows
+
+
+def test_new_employees_are_added(repository, conn, tmp_path):
+    path = write_import_file(tmp_path / "assets.csv", [
+        asset(employee_id="E1"), asset(employee_id="E2", entered_by="clerk")])
+
+    result = import_file(repository, path)
+
+    assert (result.rows_read, result.inserted, result.updated, result.errors) == (2, 2, 0, [])
+    assert result.error_report is None
+    assert stored_assets(conn) == [("E1", "Pune", "16 GB", "importer", None, None, None),
+                                   ("E2", "Pune", "16 GB", "clerk", None, None, None)]
+
+
+def test_active_asset_of_an_employee_is_updated(repository, conn, tmp_path):
+    with repository.transaction():
+        repository.create_asset(asset(employee_id="E1"), "admin")
+    path = write_import_file(tmp_path / "assets.csv", [
+        asset(employee_id="E1", location="Mumbai", ram="32 GB"), asset(employee_id="E2")])
+
+    result = import_file(repository, path)
+
+    assert (result.inserted, result.updated) == (1, 1)
+    assert stored_assets(conn) == [("E1", "Mumbai", "32 GB", "admin", "importer", today(), None),
+                                   ("E2", "Pune", "16 GB", "importer", None, None, None)]
+
+
+def test_invalid_rows_are_reported_and_the_rest_imported(repository, conn, tmp_path):
+    path = write_import_file(tmp_path / "assets.csv", [
+        asset(employee_id="E1"),
+        asset(employee_id="E2", hostname=""),
+        asset(employee_id="E3", asset_entry_date="31/07/2024"),
+        asset(employee_id="E1", location="Mumbai"),
+    ])
+
+    result = import_file(repository, path)
+
+    assert (result.rows_read, result.inserted, result.updated) == (4, 1, 0)
+    assert [(line, employee_id) for line, employee_id, _ in result.errors] == [(3, "E2"), (4, "E3"), (5, "E1")]
+    assert result.error_report == os.path.join(tmp_path, "assets_errors.csv")
+    with open(result.error_report, newline='') as file:
+        assert [row[:2] for row in csv.reader(file)] == [["Line", "Employee ID"], ["3", "E2"], ["4", "E3"], ["5", "E1"]]
+    assert stored_assets(conn) == [("E1", "Pune", "16 GB", "importer", None, None, None)]
+
+
+def test_lone_removed_row_removes_the_active_asset(repository, conn, tmp_path):
+    with repository.transaction():
+        repository.create_asset(asset(employee_id="E1"), "admin")
+    path = write_import_file(tmp_path / "assets.csv", [asset(employee_id="E1", remove_date="2024-09-30")])
+
+    result = import_file(repository, path)
+
+    assert (result.inserted, result.updated) == (0, 1)
+    assert stored_assets(conn) == [("E1", "Pune", "16 GB", "admin", "importer", today(), "2024-09-30")]
+
+
+def test_removed_row_next_to_an_active_one_is_history(repository, conn, tmp_path):
+    with repository.transaction():
+        repository.create_asset(asset(employee_id="E1"), "admin")
+    path = write_import_file(tmp_path / "assets.csv", [
+        asset(employee_id="E1", remove_date="2024-03-31", hostname="LT-OLD"),
+        asset(employee_id="E1", location="Mumbai")])
+
+    result = import_file(repository, path)
+
+    assert (result.inserted, result.updated) == (1, 1)
+    assert stored_assets(conn) == [("E1", "Mumbai", "16 GB", "admin", "importer", today(), None),
+                                   ("E1", "Pune", "16 GB", "importer", None, None, "2024-03-31")]
+
+
+def test_reimporting_the_all_assets_report_adds_nothing(repository, conn, tmp_path):
+    with repository.transaction():
+        reissued = repository.create_asset(asset(employee_id="E1"), "admin")
+        repository.remove_asset(reissued)
+        repository.create_asset(asset(employee_id="E1", hostname="LT-NEW"), "admin")
+        repository.create_asset(asset(employee_id="E2"), "admin")
+    path = str(tmp_path / "all_assets.csv")
+    with open(path, mode='w', newline='') as file:
+        repository.export_report("All Assets", file)
+    conn.commit()
+    before = stored_assets(conn)
+
+    result = import_file(repository, path)
+
+    assert (result.rows_read, result.inserted, result.updated, result.errors) == (3, 0, 0, [])
+    assert stored_assets(conn) == before
+
+
+def test_unchanged_rows_keep_their_last_editor(repository, conn, tmp_path):
+    with repository.transaction():
+        unchanged = repository.create_asset(asset(employee_id="E1"), "admin")
+        repository.update_asset(unchanged, asset(employee_id="E1"), "manager")
+        repository.create_asset(asset(employee_id="E2"), "admin")
+    with conn.cursor() as cursor:
+        cursor.execute("UPDATE assets SET update_date = '2024-08-01' WHERE id = %s", (unchanged,))
+    conn.commit()
+    path = write_import_file(tmp_path / "assets.csv", [asset(employee_id="E1"), asset(employee_id="E2", ram="8 GB")])
+
+    result = import_file(repository, path)
+
+    assert (result.inserted, result.updated) == (0, 1)
+    assert stored_assets(conn) == [("E1", "Pune", "16 GB", "admin", "manager", "2024-08-01", None),
+                                   ("E2", "Pune", "8 GB", "admin", "importer", today(), None)]
+
+
+def test_archived_removed_asset_is_not_added_again(repository, conn, tmp_path):
+    with repository.transaction():
+        asset_id = repository.create_asset(asset(employee_id="E1"), "admin")
+    with conn.cursor() as cursor:
+        cursor.execute("UPDATE assets SET remove_date = '2024-01-31' WHERE id = %s", (asset_id,))
+    conn.commit()
+    assert archive_removed_assets(conn, 31) == 1
+    path = write_import_file(tmp_path / "assets.csv", [asset(employee_id="E1", remove_date="2024-01-31")])
+
+    result = import_file(repository, path)
+
+    assert (result.inserted, result.updated) == (0, 0)
+    assert stored_assets(conn) == []
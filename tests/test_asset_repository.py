@@ -0,0 +1,21 @@
+"""AssetRepository writes that guard against repeating a change."""
+
+
+from conftest import asset
+
+
+def test_removing_a_removed_asset_keeps_its_removal(repository, conn):
+    with repository.transaction():
+        asset_id = repository.create_asset(asset(employee_id="E1"), "admin")
+    with conn.cursor() as cursor:
+        cursor.execute("UPDATE assets SET remove_date = '2024-08-30' WHERE id = %s", (asset_id,))
+    conn.commit()
+
+    with repository.transaction():
+        assert repository.remove_asset(asset_id) is None
+        assert repository.remove_asset(asset_id + 1) is None
+
+    assert str(repository.get_asset(asset_id)[-1]) == "2024-08-30"
+    with conn.cursor() as cursor:
+        cursor.execute("SELECT event FROM asset_events WHERE asset_id = %s ORDER BY id", (asset_id,))
+        assert [row[0] for row in cursor.fetchall()] == ["added", "removed"]
@@ -0,0 +1,58 @@
+"""The SQLite read replica: what a sync copies and the month it counts."""
+
+
+import pytest
+
+from asset_repository import today
+from conftest import asset
+from local_replica import LocalReplica
+
+
+@pytest.fixture
+def replica(tmp_path):
+    replica = LocalReplica(str(tmp_path / "replica.sqlite3"), "test")
+    yield replica
+    replica.close()
+
+
+def test_counters_match_the_primary(repository, conn, replica):
+    with repository.transaction():
+        backdated = repository.create_asset(asset(employee_id="E1", asset_entry_date="2024-07-31"), "admin")
+        repository.create_asset(asset(employee_id="E2", asset_entry_date=today()), "admin")
+    replica.sync(conn)
+    with repository.transaction():
+        repository.update_assets([backdated], {"ram": "32 GB"}, "manager")
+    replica.sync(conn)
+
+    local = replica.repository()
+    assert local.metrics() == repository.metrics()
+    assert local.location_breakdown() == [tuple(row) for row in repository.location_breakdown()]
+    assert local.count_report("Assets Updated This Month") == 1
+
+
+def test_sync_drops_events_of_earlier_months(repository, conn, replica):
+    with repository.transaction():
+        repository.create_asset(asset(employee_id="E1", asset_entry_date=today()), "admin")
+    replica.sync(conn)
+    local = replica.connection()
+    with local:
+        local.execute("INSERT INTO asset_events (id, asset_id, event, event_date)"
+                      " VALUES (-1, 1, 'added', '2024-07-31')")
+
+    replica.sync(conn)
+
+    assert local.execute("SELECT event_date FROM asset_events").fetchall() == [(today(),)]
+
+
+def test_this_month_is_the_primary_month_at_the_last_sync(repository, conn, replica):
+    with repository.transaction():
+        repository.create_asset(asset(employee_id="E1", asset_entry_date=today()), "admin")
+    replica.sync(conn)
+    local = replica.repository()
+    assert local.metrics()["assets_added"] == 1
+
+    # As if this machine's clock had already moved on but the primary had not: the replica follows the primary.
+    with replica.connection() as local_conn:
+        local_conn.execute("UPDATE replica_state SET value = '2024-07-01' WHERE key = 'month'")
+    assert local.metrics()["assets_added"] == 0
+    assert local.monthly_trend()[-1][0].isoformat() == "2024-07-01"
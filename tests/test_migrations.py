@@ -0,0 +1,133 @@
+"""Schema migrations: applying them twice, and re-running one that stopped part-way."""
+
+
+from datetime import date
+
+import pytest
+
+import migrations
+from conftest import rollup_rows
+from migrations import LATEST_VERSION, MIGRATIONS, current_version, migrate
+from monthly_rollup import rebuild_rollup
+
+
+# (employee_id, asset_entry_date, update_date, remove_date) of the assets written at schema version 1,
+# when the dates were still text. 05/03/2024 is not YYYY-MM-DD and becomes NULL.
+SEEDED_ASSETS = [
+    ("E1", "2024-01-15", None, None),
+    ("E2", "2024-02-10", "2024-03-05", None),
+    ("E3", "2024-02-20", None, "2024-04-01"),
+    ("E4", "2024-03-01", "05/03/2024", None),
+    ("E5", "2024-05-01", "2024-05-02", "2024-06-01"),
+]
+EXPECTED_EVENTS = [
+    ("E1", "added", date(2024, 1, 15)),
+    ("E2", "added", date(2024, 2, 10)), ("E2", "updated", date(2024, 3, 5)),
+    ("E3", "added", date(2024, 2, 20)), ("E3", "removed", date(2024, 4, 1)),
+    ("E4", "added", date(2024, 3, 1)),
+    ("E5", "added", date(2024, 5, 1)), ("E5", "removed", date(2024, 6, 1)), ("E5", "updated", date(2024, 5, 2)),
+]
+# Migrations that work through assets in committed id batches.
+BATCHED_VERSIONS = [2, 9, 13, 15]
+
+
+def migrate_to(monkeypatch, conn, version):
+    """Migrate conn as if MIGRATIONS ended at version."""
+    with monkeypatch.context() as patch:
+        patch.setattr(migrations, "MIGRATIONS", MIGRATIONS[:version])
+        patch.setattr(migrations, "LATEST_VERSION", version)
+        return migrate(conn)
+
+
+def seed_assets(conn):
+    with conn.cursor() as cursor:
+        for number, (employee_id, entered, updated, removed) in enumerate(SEEDED_ASSETS):
+            cursor.execute("""
+                INSERT INTO assets (employee_name, employee_id, email_id, location, hostname, processor, ram, hd_size,
+                                    mouse, adaptor, headset, monitor, it_others, software_licenses,
+                                    asset_entry_date, entered_by, updated_by, update_date, remove_date)
+                VALUES (%s, %s, %s, %s, %s, %s, '16 GB', '512 GB SSD', 'Yes', 'Yes', 'No', 'Dell P2422H', 'None',
+                        'Office 365', %s, 'admin', %s, %s, %s)
+            """, (f"Employee {employee_id}", employee_id, f"{employee_id.lower()}@example.com",
+                  "Pune" if number % 2 else "Mumbai", f"LT-{employee_id}", f"Intel Core i{3 + number % 3}",
+                  entered, "admin" if updated else None, updated, removed))
+    conn.commit()
+
+
+def seeded_at_version_1(monkeypatch, conn):
+    migrate_to(monkeypatch, conn, 1)
+    seed_assets(conn)
+
+
+def check_seeded_assets(conn):
+    """The seeded assets came through with typed dates, one event per change and a consistent rollup."""
+    with conn.cursor() as cursor:
+        cursor.execute("""
+            SELECT employee_id, asset_entry_date::text, update_date::text, remove_date::text, processor
+            FROM asset_details ORDER BY employee_id
+        """)
+        assert cursor.fetchall() == [
+            (employee_id, entered, updated if updated and "-" in updated else None, removed,
+             f"Intel Core i{3 + number % 3}")
+            for number, (employee_id, entered, updated, removed) in enumerate(SEEDED_ASSETS)]
+        cursor.execute("""
+            SELECT assets.employee_id, event, event_date
+            FROM asset_events JOIN assets ON assets.id = asset_events.asset_id
+            ORDER BY assets.employee_id, event
+        """)
+        assert cursor.fetchall() == EXPECTED_EVENTS
+    conn.commit()
+    rolled_up = rollup_rows(conn)
+    assert rolled_up
+    rebuild_rollup(conn)
+    assert rollup_rows(conn) == rolled_up
+
+
+def test_migrating_twice_applies_each_migration_once(empty_conn):
+    assert migrate(empty_conn) == LATEST_VERSION
+    assert migrate(empty_conn) == LATEST_VERSION
+    with empty_conn.cursor() as cursor:
+        cursor.execute("SELECT version FROM schema_version ORDER BY version")
+        assert [row[0] for row in cursor.fetchall()] == [migration.version for migration in MIGRATIONS]
+
+
+def test_migrating_existing_assets(monkeypatch, empty_conn):
+    seeded_at_version_1(monkeypatch, empty_conn)
+    assert migrate(empty_conn) == LATEST_VERSION
+    check_seeded_assets(empty_conn)
+
+
+@pytest.mark.parametrize("version", [migration.version for migration in MIGRATIONS])
+def test_migration_can_run_again_after_finishing(monkeypatch, empty_conn, version):
+    # As if the migration finished but its version was never recorded, e.g. the process died in between.
+    seeded_at_version_1(monkeypatch, empty_conn)
+    migrate_to(monkeypatch, empty_conn, version)
+    with empty_conn.cursor() as cursor:
+        cursor.execute("DELETE FROM schema_version WHERE version = %s", (version,))
+    empty_conn.commit()
+    assert current_version(empty_conn) == version - 1
+
+    assert migrate(empty_conn) == LATEST_VERSION
+    check_seeded_assets(empty_conn)
+
+
+@pytest.mark.parametrize("version", BATCHED_VERSIONS)
+def test_migration_resumes_after_failing_between_batches(monkeypatch, empty_conn, version):
+    seeded_at_version_1(monkeypatch, empty_conn)
+    migrate_to(monkeypatch, empty_conn, version - 1)
+
+    id_batches = migrations.id_batches
+
+    def first_batch_only(*args, **kwargs):
+        yield id_batches(*args, **kwargs)[0]
+        raise ConnectionError("connection lost")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(migrations, "BACKFILL_BATCH_SIZE", 2)
+        patch.setattr(migrations, "id_batches", first_batch_only)
+        with pytest.raises(ConnectionError):
+            migrate_to(monkeypatch, empty_conn, version)
+    assert current_version(empty_conn) == version - 1
+
+    assert migrate(empty_conn) == LATEST_VERSION
+    check_seeded_assets(empty_conn)
@@ -0,0 +1,50 @@
+"""The in-process trigram index behind the Manage Assets filters without pg_trgm."""
+
+
+from ngram_index import NgramIndex
+
+
+FIELDS = ("employee_name", "employee_id", "location")
+
+
+def loaded_index(assets):
+    index = NgramIndex(FIELDS)
+    index.loaded = True
+    for asset_id, values in assets.items():
+        index.add(asset_id, values)
+    return index
+
+
+def check_postings(index):
+    """Every posting is sorted, without repeats, and lists exactly the assets whose value has its gram."""
+    for position, postings in enumerate(index.postings):
+        for gram, posting in postings.items():
+            assert list(posting) == sorted(set(posting))
+            assert set(posting) == {asset_id for asset_id, values in index.values.items() if gram in values[position]}
+
+
+def test_search_matches_substrings_of_every_field():
+    index = loaded_index({1: ("Asha Rao", "E1001", "Pune"), 2: ("Ravi Kumar", "E1002", "Mumbai"),
+                          3: ("Rao Singh", "E2001", "Pune")})
+
+    assert index.search({"employee_name": "rao"}) == [1, 3]
+    assert index.search({"employee_name": "RAO", "employee_id": "e1"}) == [1]
+    assert index.search({"location": "un"}) == [1, 3]
+    assert index.search({"location": "delhi"}) == []
+    assert index.search({}) == [1, 2, 3]
+
+
+def test_updates_and_removals_keep_postings_exact():
+    index = loaded_index({asset_id: (f"Employee {asset_id}", f"E{asset_id:04d}", "Pune") for asset_id in range(1, 50)})
+
+    index.add(7, ("Employee 7", "E0007", "Mumbai"))
+    index.add(3, ("Employee 3", "E0003", "Mumbai"))
+    index.add(60, ("Employee 60", "E0060", "Pune"))
+    index.add(7, ("Employee 7", "E0007", "Pune"))
+    index.remove(12)
+    index.remove(99)
+
+    check_postings(index)
+    assert index.search({"location": "mum"}) == [3]
+    assert 12 not in index.search({"location": "pune"})
+    assert index.search({"employee_id": "e0060"}) == [60]